@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+CUBE D'AGRÉGATS PRÉCALCULÉ POUR LES DASHBOARDS
+=============================================================================
+
+Les pages Streamlit recalculent à chaque rendu les mêmes `groupby` sur
+Year, Region, Manufacturer et Category. Ce module matérialise une fois par
+version du dataset un cube Year × Region × Manufacturer × Category qui
+stocke, pour chaque cellule et chaque mesure:
+- la somme, la somme des carrés, le minimum et le maximum
+- le nombre d'observations
+
+Ces statistiques se recombinent exactement (somme, moyenne, écart-type
+échantillon, min, max, effectif) sur n'importe quel sous-ensemble de
+dimensions: le coût d'un rendu dépend du nombre de cellules du cube, plus
+du nombre de lignes brutes.
+
+Usage:
+    cube = AggregateCube.from_frame(df)
+    cube.rollup('Region', 'Production_Volume')                    # somme
+    cube.rollup('Year', 'Average_Price', 'std')                    # écart-type
+    cube.rollup(['Region', 'Year'], 'Production_Volume', filters={'Year': [2022, 2023]})
+    cube.rollup_many('Region', {'Production': ('Production_Volume', 'sum'),
+                                'Nb': ('Manufacturer', 'nunique')})
+
+    # Mise à jour incrémentale: seules les nouvelles lignes sont agrégées
+    cube = cube.merge(AggregateCube.from_frame(new_rows))
+    cube.save(cube_path(csv_path))
+
+Auteur: Système d'Analyse Automobile Avancée
+=============================================================================
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_store import columnar_path
+
+# =============================================================================
+# SCHÉMA DU CUBE
+# =============================================================================
+
+DIMENSIONS = ['Year', 'Region', 'Manufacturer', 'Category']
+
+# Mesures agrégées (Revenue = Production_Volume × Average_Price, dérivée)
+DEFAULT_MEASURES = [
+    'Production_Volume', 'Average_Price', 'Steel_Price', 'GDP_Growth',
+    'EV_Share', 'Oil_Price', 'Interest_Rate', 'US_Tariff_Rate', 'Revenue'
+]
+
+# Statistiques disponibles sur les mesures et sur les dimensions
+MEASURE_STATS = ['sum', 'mean', 'std', 'count', 'min', 'max']
+DIMENSION_STATS = ['nunique', 'min', 'max']
+
+COUNT_COLUMN = 'count'
+
+# Statistiques additives stockées par mesure et leur recombinaison
+CELL_STATS = {'sum': 'sum', 'sumsq': 'sum', 'min': 'min', 'max': 'max'}
+
+# Cube persisté à côté du dataset (maintenu par ingestion.py)
+CUBE_EXTENSION = '.cube.parquet'
+
+
+def cube_path(csv_path):
+    """Chemin du cube persisté associé à un CSV."""
+    return columnar_path(csv_path, CUBE_EXTENSION)
+
+
+class AggregateCube:
+    """
+    Cube d'agrégats Year × Region × Manufacturer × Category.
+
+    Chaque ligne de `cells` est une cellule non vide du cube avec les
+    statistiques additives de chaque mesure (`<mesure>__sum`, `__sumsq`,
+    `__min`, `__max`) et l'effectif `count`.
+    """
+
+    def __init__(self, cells, measures, dimensions=None):
+        """
+        Initialisation à partir d'une table de cellules déjà agrégée.
+
+        Args:
+            cells (pd.DataFrame): Cellules du cube (voir `from_frame`)
+            measures (list): Mesures disponibles
+            dimensions (list): Dimensions du cube (défaut: DIMENSIONS)
+        """
+        self.cells = cells
+        self.measures = list(measures)
+        self.dimensions = list(dimensions or DIMENSIONS)
+
+    @classmethod
+    def from_frame(cls, df, measures=None, dimensions=None):
+        """
+        Construction du cube à partir du dataset ligne à ligne.
+
+        Args:
+            df (pd.DataFrame): Dataset (colonnes canoniques du CSV + Year)
+            measures (list): Mesures à agréger (défaut: celles présentes
+                parmi DEFAULT_MEASURES)
+            dimensions (list): Dimensions du cube (défaut: DIMENSIONS)
+
+        Returns:
+            AggregateCube: Cube matérialisé
+        """
+        dimensions = list(dimensions or DIMENSIONS)
+        frame = df
+
+        if 'Year' in dimensions and 'Year' not in frame.columns:
+            frame = frame.assign(Year=pd.to_datetime(frame['Date']).dt.year)
+        if 'Revenue' not in frame.columns and {'Production_Volume', 'Average_Price'} <= set(frame.columns):
+            frame = frame.assign(Revenue=frame['Production_Volume'] * frame['Average_Price'])
+
+        if measures is None:
+            measures = [m for m in DEFAULT_MEASURES if m in frame.columns]
+
+        values = frame[dimensions + measures].copy()
+        for measure in measures:
+            values[f'{measure}__sumsq'] = values[measure].astype('float64') ** 2
+
+        aggregations = {}
+        for measure in measures:
+            aggregations[f'{measure}__sum'] = (measure, 'sum')
+            aggregations[f'{measure}__sumsq'] = (f'{measure}__sumsq', 'sum')
+            aggregations[f'{measure}__min'] = (measure, 'min')
+            aggregations[f'{measure}__max'] = (measure, 'max')
+        aggregations[COUNT_COLUMN] = (measures[0], 'size')
+
+        cells = values.groupby(dimensions, observed=True).agg(**aggregations).reset_index()
+        return cls(cells, measures, dimensions)
+
+    # =================================================================
+    # MISE À JOUR ET PERSISTANCE
+    # =================================================================
+
+    def merge(self, other):
+        """
+        Cube des lignes des deux cubes réunies.
+
+        Les statistiques étant additives, les cellules communes (ex: un
+        nouveau mois d'une année déjà présente) sont recombinées sans
+        revenir aux lignes brutes.
+
+        Args:
+            other (AggregateCube): Cube de mêmes dimensions et mesures
+
+        Returns:
+            AggregateCube: Nouveau cube
+
+        Raises:
+            ValueError: Si les dimensions ou les mesures diffèrent
+        """
+        if other.dimensions != self.dimensions or other.measures != self.measures:
+            raise ValueError("Cubes incompatibles (dimensions ou mesures différentes)")
+
+        cells = pd.concat([self.cells, other.cells], ignore_index=True)
+        for dimension in self.dimensions:
+            if isinstance(self.cells[dimension].dtype, pd.CategoricalDtype):
+                cells[dimension] = cells[dimension].astype('category')
+
+        aggregations = {
+            f'{measure}__{stat}': how
+            for measure in self.measures for stat, how in CELL_STATS.items()
+        }
+        aggregations[COUNT_COLUMN] = 'sum'
+        cells = cells.groupby(self.dimensions, observed=True).agg(aggregations).reset_index()
+        return AggregateCube(cells, self.measures, self.dimensions)
+
+    def save(self, path):
+        """Écriture des cellules (Parquet, écriture atomique)."""
+        temporary = f'{path}.{os.getpid()}.tmp'
+        self.cells.to_parquet(temporary, index=False)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Lecture d'un cube écrit par `save`.
+
+        Returns:
+            AggregateCube: Cube (mesures et dimensions déduites des colonnes)
+        """
+        cells = pd.read_parquet(path)
+        measures = [column[:-len('__sum')] for column in cells.columns if column.endswith('__sum')]
+        dimensions = [column for column in cells.columns if '__' not in column and column != COUNT_COLUMN]
+        return cls(cells, measures, dimensions)
+
+    # =================================================================
+    # REQUÊTES
+    # =================================================================
+
+    def slice(self, filters=None):
+        """
+        Sélection des cellules correspondant aux filtres.
+
+        Args:
+            filters (dict): {dimension: valeur ou liste de valeurs}
+
+        Returns:
+            pd.DataFrame: Cellules retenues
+        """
+        if not filters:
+            return self.cells
+
+        mask = np.ones(len(self.cells), dtype=bool)
+        for dimension, selection in filters.items():
+            column = self.cells[dimension]
+            if isinstance(selection, (list, tuple, set, np.ndarray, pd.Index)):
+                mask &= column.isin(list(selection)).to_numpy()
+            else:
+                mask &= (column == selection).to_numpy()
+        return self.cells[mask]
+
+    def rollup_many(self, by, spec, filters=None):
+        """
+        Agrégation de plusieurs statistiques sur un sous-ensemble de dimensions.
+
+        Args:
+            by (str | list): Dimension(s) de regroupement ([] = total)
+            spec (dict): {colonne de sortie: (mesure ou dimension, statistique)}
+            filters (dict): Filtres appliqués avant le regroupement
+
+        Returns:
+            pd.DataFrame: Une ligne par groupe, une colonne par entrée de `spec`
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        cells = self.slice(filters)
+        # Sans dimension de regroupement: un seul groupe (total du sous-cube)
+        keys = by if by else np.zeros(len(cells), dtype=np.int8)
+        grouped = cells.groupby(keys, observed=True, sort=True)
+
+        # Statistiques additives des mesures utilisées
+        needed = set()
+        for source, stat in spec.values():
+            if source in self.measures:
+                needed.update([f'{source}__sum', f'{source}__sumsq'])
+        sums = grouped[sorted(needed) + [COUNT_COLUMN]].sum()
+        count = sums[COUNT_COLUMN]
+
+        result = pd.DataFrame(index=sums.index)
+        for output, (source, stat) in spec.items():
+            if source in self.dimensions:
+                if stat not in DIMENSION_STATS:
+                    raise ValueError(f"Statistique '{stat}' non supportée pour la dimension {source}")
+                result[output] = grouped[source].agg(stat)
+            elif source in self.measures:
+                result[output] = self._measure_stat(grouped, sums, count, source, stat)
+            else:
+                raise KeyError(f"Colonne absente du cube: {source}")
+
+        return result
+
+    def rollup(self, by, measure, stat='sum', filters=None):
+        """
+        Agrégation d'une seule mesure (équivalent de `df.groupby(by)[measure].stat()`).
+
+        Args:
+            by (str | list): Dimension(s) de regroupement
+            measure (str): Mesure (ou dimension pour nunique/min/max)
+            stat (str): Statistique parmi MEASURE_STATS / DIMENSION_STATS
+            filters (dict): Filtres appliqués avant le regroupement
+
+        Returns:
+            pd.Series: Valeur par groupe, nommée d'après la mesure
+        """
+        return self.rollup_many(by, {measure: (measure, stat)}, filters)[measure]
+
+    def total(self, measure, stat='sum', filters=None):
+        """
+        Agrégation globale d'une mesure sur le sous-cube filtré.
+
+        Args:
+            measure (str): Mesure
+            stat (str): Statistique parmi MEASURE_STATS
+            filters (dict): Filtres du sous-cube
+
+        Returns:
+            float: Valeur agrégée (NaN si le sous-cube est vide)
+        """
+        values = self.rollup([], measure, stat, filters)
+        return values.iloc[0] if len(values) else np.nan
+
+    def growth_rates(self, by=None, measure='Production_Volume', filters=None):
+        """
+        Taux de croissance annuel moyen (TCAM, %) entre la première et la
+        dernière année présentes, par groupe.
+
+        Args:
+            by (str): Dimension de regroupement (None = sous-cube entier)
+            measure (str): Mesure sommée par année
+            filters (dict): Filtres du sous-cube
+
+        Returns:
+            pd.Series | float: TCAM par groupe, ou valeur unique si `by` est None
+                (0 quand moins de deux années ou première année nulle)
+        """
+        if by is None:
+            yearly = self.rollup('Year', measure, filters=filters).sort_index()
+            return _cagr(yearly)
+
+        yearly = self.rollup([by, 'Year'], measure, filters=filters).unstack('Year')
+        return yearly.apply(lambda row: _cagr(row.dropna()), axis=1)
+
+    # =================================================================
+    # OUTILS INTERNES
+    # =================================================================
+
+    @staticmethod
+    def _measure_stat(grouped, sums, count, measure, stat):
+        """Recombinaison d'une statistique à partir des agrégats additifs."""
+        if stat == 'sum':
+            return sums[f'{measure}__sum']
+        if stat == 'count':
+            return count
+        if stat == 'mean':
+            return sums[f'{measure}__sum'] / count
+        if stat == 'std':
+            total = sums[f'{measure}__sum']
+            variance = (sums[f'{measure}__sumsq'] - total ** 2 / count) / (count - 1)
+            return np.sqrt(variance.clip(lower=0)).where(count > 1)
+        if stat == 'min':
+            return grouped[f'{measure}__min'].min()
+        if stat == 'max':
+            return grouped[f'{measure}__max'].max()
+        raise ValueError(f"Statistique non supportée: {stat}")
+
+
+def _cagr(yearly):
+    """TCAM (%) d'une série annuelle triée par année."""
+    if len(yearly) < 2:
+        return 0
+    first, last = yearly.iloc[0], yearly.iloc[-1]
+    if first <= 0:
+        return 0
+    return ((last / first) ** (1 / (len(yearly) - 1)) - 1) * 100
@@ -14,11 +14,11 @@ Version: 2.0 - Analyse KPI Améliorée et Logique
 =============================================================================
 """
 
-import pandas as pd
 import numpy as np
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
+from data_store import load_dataset
 
 class AutomotiveKPIAnalyzer:
     """
@@ -39,9 +39,7 @@ class AutomotiveKPIAnalyzer:
     def load_data(self):
         """Charge et prépare les données"""
         try:
-            self.df = pd.read_csv(self.data_path)
-            self.df['Date'] = pd.to_datetime(self.df['Date'])
-            self.df['Year'] = self.df['Date'].dt.year
+            self.df = load_dataset(self.data_path)
             self.df['Month'] = self.df['Date'].dt.month
             print("✅ Données chargées avec succès")
         except Exception as e:
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+CACHE PARTAGÉ DES DONNÉES ET MODÈLES POUR LES APPLICATIONS STREAMLIT
+=============================================================================
+
+Couche de cache commune à `streamlit_app.py`, `streamlit_app_fixed.py`,
+`streamlit_app_clear.py` et `dashboard_complet.py`.
+
+Streamlit ré-exécute le script à chaque interaction: sans cache, chaque clic
+relit le CSV, re-parse le JSON de résultats et re-désérialise les modèles.
+Ici:
+- le dataset et le JSON sont chargés une fois par empreinte de fichier
+  (`st.cache_data`, copie indépendante par appel: les apps peuvent ajouter
+  leurs colonnes sans polluer le cache)
+- les modèles sont lus via le registre (`model_registry`), partagé entre
+  toutes les sessions (`st.cache_resource`): chargés à la première page qui
+  les utilise, cache borné en mémoire
+- le cube d'agrégats (`aggregate_cube`) est construit une fois par version
+  du dataset (ou relu depuis le cube persisté par l'ingestion mensuelle
+  s'il est à jour) et partagé en lecture seule
+- l'index de filtrage (`filter_index`) et son dataset sont partagés en
+  lecture seule, avec la mémoire des sélections déjà filtrées
+- le moteur de l'assistant (`chatbot_engine`) et sa mémoire de réponses
+  sont construits sur le cube partagé, une fois par version du dataset
+- le service d'inférence (`inference_service`) et sa mémoire de prédictions
+  sont partagés entre sessions, reconstruits quand une version change
+- l'empreinte (chemin, mtime, taille) fait partie de la clé: toute
+  modification d'un fichier invalide automatiquement l'entrée correspondante
+
+Auteur: Système d'Analyse Automobile Avancée
+=============================================================================
+"""
+
+import json
+import os
+
+import streamlit as st
+
+from aggregate_cube import AggregateCube, cube_path
+from chatbot_engine import ChatbotEngine
+from data_store import PROJECT_ROOT, load_dataset, resolve_dataset_path
+from filter_index import FilterIndex
+from inference_service import InferenceService
+from model_registry import ModelRegistry
+
+# =============================================================================
+# EMPLACEMENTS DES FICHIERS
+# =============================================================================
+
+RESULTS_CANDIDATES = [
+    os.path.join(PROJECT_ROOT, 'data', 'automotive_analysis_results_clean.json'),
+    os.path.join(PROJECT_ROOT, 'automotive_analysis_results_clean.json')
+]
+
+# Modèles des applications -> noms du registre (modèles de production)
+APP_MODELS = {
+    'xgboost': 'xgboost_production',
+    'linear_regression': 'linear_regression_production',
+    'prophet': 'prophet_production',
+    'arima': 'arima_production'
+}
+
+# Modèles de prix servis par le service d'inférence (prix moyen prédit)
+APP_PRICE_MODELS = {
+    'xgboost_price': 'xgboost_price'
+}
+
+
+def file_fingerprint(path):
+    """
+    Empreinte légère d'un fichier: (chemin, mtime en ns, taille).
+
+    Args:
+        path (str): Chemin du fichier
+
+    Returns:
+        tuple | None: Empreinte, ou None si le fichier n'existe pas
+    """
+    if path is None or not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def _first_existing(paths):
+    """Premier chemin existant (relatif à la racine du projet) ou None."""
+    for path in paths:
+        full_path = path if os.path.isabs(path) else os.path.join(PROJECT_ROOT, path)
+        if os.path.exists(full_path):
+            return full_path
+    return None
+
+
+# =============================================================================
+# CHARGEMENTS MIS EN CACHE (clés = empreintes de fichiers)
+# =============================================================================
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_dataset(path, fingerprint, columns):
+    return load_dataset(path, columns=list(columns) if columns else None)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _cached_cube(path, fingerprint):
+    # Cube maintenu par ingestion.py: valable s'il est plus récent que le CSV
+    persisted = cube_path(path)
+    if os.path.exists(persisted) and os.path.exists(path) and os.path.getmtime(persisted) >= os.path.getmtime(path):
+        return AggregateCube.load(persisted)
+    return AggregateCube.from_frame(load_dataset(path))
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _cached_filter_index(path, fingerprint):
+    return FilterIndex(load_dataset(path))
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _cached_chatbot_engine(path, fingerprint):
+    return ChatbotEngine(_cached_cube(path, fingerprint), version=fingerprint)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_results(path, fingerprint):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _cached_inference_service(path, fingerprint, versions):
+    # Les modèles ne sont chargés qu'à la première prédiction qui les utilise
+    registry = get_model_registry()
+    # Export NumPy des modèles XGBoost quand il existe: pas d'import de xgboost
+    registry_names = {**APP_MODELS, **APP_PRICE_MODELS}
+    return InferenceService(lambda name: registry.load(registry_names[name], compact=True), dict(versions),
+                            load_dataset(path))
+
+
+# =============================================================================
+# API PUBLIQUE
+# =============================================================================
+
+def get_dataset(columns=None):
+    """
+    Dataset automobile typé, chargé une fois par version du fichier.
+
+    Args:
+        columns (list): Colonnes à charger (défaut: toutes)
+
+    Returns:
+        pd.DataFrame | None: Copie du dataset, None si introuvable
+    """
+    path = resolve_dataset_path()
+    if path is None:
+        return None
+    return _cached_dataset(path, file_fingerprint(path), tuple(columns) if columns else None)
+
+
+def get_aggregate_cube():
+    """
+    Cube d'agrégats Year × Region × Manufacturer × Category du dataset.
+
+    Partagé entre toutes les sessions (lecture seule) et reconstruit
+    uniquement quand le fichier de données change.
+
+    Returns:
+        AggregateCube | None: Cube, None si le dataset est introuvable
+    """
+    path = resolve_dataset_path()
+    if path is None:
+        return None
+    return _cached_cube(path, file_fingerprint(path))
+
+
+def get_filter_index():
+    """
+    Index de filtrage Year × Region × Manufacturer × Category du dataset.
+
+    Partagé entre toutes les sessions avec son dataset (sans copie par
+    rerun, contrairement à `get_dataset`): les frames qu'il renvoie ne
+    doivent pas être modifiés en place.
+
+    Returns:
+        FilterIndex | None: Index, None si le dataset est introuvable
+    """
+    path = resolve_dataset_path()
+    if path is None:
+        return None
+    return _cached_filter_index(path, file_fingerprint(path))
+
+
+def get_chatbot_engine():
+    """
+    Moteur de réponses de l'assistant, construit sur le cube d'agrégats.
+
+    Partagé entre toutes les sessions avec sa mémoire de réponses, et
+    reconstruit (mémoire vide) quand le fichier de données change.
+
+    Returns:
+        ChatbotEngine | None: Moteur, None si le dataset est introuvable
+    """
+    path = resolve_dataset_path()
+    if path is None:
+        return None
+    return _cached_chatbot_engine(path, file_fingerprint(path))
+
+
+def get_analysis_results():
+    """
+    Résultats d'analyse (JSON), chargés une fois par version du fichier.
+
+    Returns:
+        dict: Résultats, dictionnaire vide si le fichier est introuvable
+    """
+    path = _first_existing(RESULTS_CANDIDATES)
+    if path is None:
+        return {}
+    return _cached_results(path, file_fingerprint(path))
+
+
+@st.cache_resource(show_spinner=False)
+def get_model_registry():
+    """
+    Registre des modèles partagé entre sessions.
+
+    Returns:
+        ModelRegistry: Registre (manifeste relu quand il change, modèles
+            chargés à la demande et gardés dans un cache borné)
+    """
+    return ModelRegistry()
+
+
+def get_model_catalog():
+    """
+    Modèles disponibles et leur entrée de manifeste, sans les charger.
+
+    Returns:
+        dict: {nom (clé de APP_MODELS): entrée (version, métriques, ...)}
+    """
+    registry = get_model_registry()
+    catalog = {}
+    for name, registry_name in APP_MODELS.items():
+        entry = registry.entry(registry_name)
+        if entry is not None:
+            catalog[name] = entry
+    return catalog
+
+
+def get_models(names=None):
+    """
+    Modèles ML demandés, chargés via le registre.
+
+    Args:
+        names (list): Modèles souhaités (défaut: tous ceux de APP_MODELS)
+
+    Returns:
+        tuple: (modèles chargés {nom: artefact}, noms introuvables ou illisibles)
+    """
+    registry = get_model_registry()
+    models = {}
+    missing = []
+
+    for name in names or APP_MODELS:
+        try:
+            models[name] = registry.load(APP_MODELS[name])
+        except Exception:
+            # Modèle absent, dépendance manquante (prophet...) ou empreinte invalide
+            missing.append(name)
+
+    return models, missing
+
+
+def get_inference_service():
+    """
+    Service d'inférence des modèles, partagé entre sessions.
+
+    La mémoire LRU des prédictions survit aux reruns et aux sessions; le
+    service est reconstruit quand le dataset ou une version de modèle change.
+
+    Returns:
+        InferenceService | None: Service, None si le dataset est introuvable
+    """
+    path = resolve_dataset_path()
+    if path is None:
+        return None
+
+    registry = get_model_registry()
+    versions = tuple(
+        (name, registry.version_key(registry_name))
+        for name, registry_name in sorted({**APP_MODELS, **APP_PRICE_MODELS}.items())
+        if registry.entry(registry_name) is not None
+    )
+    return _cached_inference_service(path, file_fingerprint(path), versions)
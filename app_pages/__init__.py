@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+REGISTRE DES PAGES DE L'APPLICATION STREAMLIT
+=============================================================================
+
+Chaque page de `streamlit_app.py` est une fonction `render_*(app)` d'un
+module de ce paquet. Streamlit ré-exécute le script principal à chaque
+interaction: il ne contient plus que la navigation et le chargement des
+données, et seul le module de la page affichée est importé (une fois par
+processus).
+
+Chaque page déclare ses dépendances de données, chargées avant son rendu
+par `StreamlitAutomotiveApp.load_data`:
+- 'dataset': dataset complet (copie par exécution, `get_dataset`)
+- 'cube': cube d'agrégats partagé (`get_aggregate_cube`)
+- 'results': résultats d'analyse JSON (`get_analysis_results`)
+- 'models': catalogue du registre des modèles (`load_models`)
+
+Les pages hors menu restent accessibles par l'URL: `?page=<clé>`
+(ex: `?page=diagnostics`).
+
+Le paquet ne s'appelle pas `pages/`: Streamlit transformerait ce
+répertoire en application multipage.
+
+Usage:
+    page = get_page('executive')
+    app.load_data(page.needs)
+    load_renderer(page)(app)
+
+Auteur: Système d'Analyse Automobile Avancée
+=============================================================================
+"""
+
+import importlib
+
+# Dépendances de données qu'une page peut déclarer
+DATA_DEPENDENCIES = ('dataset', 'cube', 'results', 'models')
+
+
+class Page:
+    """
+    Page de l'application.
+
+    Attributes:
+        key (str): Identifiant (paramètre d'URL `page`)
+        label (str): Libellé du menu
+        module (str): Module du paquet contenant la page
+        function (str): Fonction de rendu `function(app)`
+        needs (tuple): Dépendances de données (voir DATA_DEPENDENCIES)
+        in_menu (bool): Page proposée dans la barre latérale
+    """
+
+    def __init__(self, key, label, function, needs=(), in_menu=True, module=None):
+        unknown = set(needs) - set(DATA_DEPENDENCIES)
+        if unknown:
+            raise ValueError(f"Dépendances inconnues pour la page {key}: {', '.join(sorted(unknown))}")
+        self.key = key
+        self.label = label
+        self.module = module or key
+        self.function = function
+        self.needs = tuple(needs)
+        self.in_menu = in_menu
+
+
+# =============================================================================
+# PAGES
+# =============================================================================
+
+PAGES = [
+    # Menu principal (dans l'ordre de la barre latérale)
+    Page('home', "🏠 Accueil", 'render_home', needs=()),
+    Page('executive', "👔 Dashboard Exécutif", 'render_executive_dashboard', needs=('dataset', 'cube')),
+    Page('ml_models', "🤖 Modèles ML", 'render_ml_models', needs=('models',)),
+    Page('geographic', "🌍 Analyse Géographique", 'render_geographic_analysis', needs=('dataset', 'cube')),
+    Page('ev_transition', "⚡ Transition Électrique", 'render_ev_transition'),
+    Page('manufacturers', "🏭 Fabricants", 'render_manufacturers', needs=('dataset',)),
+    Page('economic', "💼 Analyse Économique", 'render_economic_analysis', needs=('dataset', 'cube')),
+    Page('competitive', "🎯 Intelligence Concurrentielle", 'render_competitive_intelligence', needs=('dataset', 'cube')),
+    Page('risks', "⚠️ Risques & Opportunités", 'render_risk_analysis', needs=('dataset', 'cube')),
+    Page('post_covid', "🦠 Analyse Post-COVID", 'render_post_covid_analysis', needs=('dataset',)),
+    Page('ev_advanced', "⚡ Transition Électrique Avancée", 'render_ev_advanced_dashboard', needs=('dataset',)),
+    Page('strategic_recommendations', "🎯 Recommandations Stratégiques",
+         'render_strategic_recommendations_dashboard', needs=('dataset',)),
+    Page('sector_analysis', "📊 Analyse Sectorielle", 'render_sector_analysis_dashboard', needs=('dataset',)),
+    Page('future_outlook', "🔮 Prospective 2030", 'render_future_outlook_dashboard', needs=('dataset',)),
+
+    # Hors menu (URL uniquement)
+    Page('diagnostics', "🩺 Diagnostic du rendu", 'render_diagnostics', in_menu=False),
+    Page('financial', "💰 Analyse Financière", 'render_financial_dashboard', needs=('dataset',), in_menu=False),
+    Page('supply_chain', "🚚 Supply Chain", 'render_supply_chain_dashboard', needs=('dataset',), in_menu=False),
+    Page('sustainability', "🌱 Durabilité & ESG", 'render_sustainability_dashboard', needs=('dataset',), in_menu=False),
+    Page('benchmarking', "📏 Benchmarking", 'render_benchmarking_dashboard', needs=('dataset',), in_menu=False),
+    Page('predictive', "🔮 Analyse Prédictive", 'render_predictive_dashboard', needs=('dataset',), in_menu=False),
+    Page('market_strategy', "🎯 Stratégie Marché", 'render_market_strategy_dashboard', needs=('dataset',),
+         in_menu=False),
+    Page('innovation', "💡 Innovation & R&D", 'render_innovation_dashboard', needs=('dataset',), in_menu=False),
+    Page('operational', "⚙️ Performance Opérationnelle", 'render_operational_dashboard', needs=('dataset',),
+         in_menu=False),
+    Page('post_covid_dashboard', "🦠 Post-COVID 2020-2023", 'render_post_covid_dashboard', needs=('dataset',),
+         in_menu=False),
+    Page('data_storytelling', "📖 Data Storytelling", 'render_data_storytelling', needs=('dataset',), in_menu=False),
+    Page('car_shop', "🚗 Car Shop", 'render_car_shop', needs=('dataset',), in_menu=False),
+    Page('geospatial_3d', "🗺️ Géospatial 3D", 'render_geospatial_3d', in_menu=False),
+    Page('report_generator', "📄 Générateur de Rapports", 'render_report_generator', needs=('dataset',),
+         in_menu=False),
+    Page('gaming_mode', "🎮 Mode Gaming", 'render_gaming_mode', needs=('dataset',), in_menu=False),
+    Page('musical_dashboard', "🎵 Dashboard Musical", 'render_musical_dashboard', needs=('dataset',), in_menu=False),
+    Page('ai_oracle', "🔮 Oracle IA", 'render_ai_oracle', in_menu=False),
+    Page('aquarium_mode', "🐠 Mode Aquarium", 'render_aquarium_mode', needs=('dataset',), in_menu=False),
+    Page('matrix_mode', "💊 Mode Matrix", 'render_matrix_mode', needs=('dataset',), in_menu=False),
+    Page('data_circus', "🎪 Cirque des Données", 'render_data_circus', in_menu=False),
+]
+
+_PAGES_BY_KEY = {page.key: page for page in PAGES}
+
+
+def get_page(key):
+    """Page enregistrée sous cette clé, None si inconnue."""
+    return _PAGES_BY_KEY.get(key)
+
+
+def menu_pages():
+    """Pages de la barre latérale, dans l'ordre du menu."""
+    return [page for page in PAGES if page.in_menu]
+
+
+def load_renderer(page):
+    """
+    Fonction de rendu d'une page (import de son module à la première visite).
+
+    Args:
+        page (Page): Page enregistrée
+
+    Returns:
+        callable: Fonction `render(app)`
+    """
+    module = importlib.import_module(f'{__name__}.{page.module}')
+    return getattr(module, page.function)
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE ORACLE IA
+=============================================================================
+
+Oracle IA - Prédictions mystiques des données.
+
+=============================================================================
+"""
+
+import random
+import time
+from datetime import datetime
+
+import streamlit as st
+
+
+def render_ai_oracle(app):
+    """Oracle IA - Prédictions mystiques des données."""
+    st.markdown('<h1 class="main-header">🔮 Oracle IA - Prophéties Automobiles</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # Interface mystique
+    st.markdown("""
+    <div style="background: radial-gradient(circle, #1a0033 0%, #000000 70%);
+                padding: 3rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;
+                position: relative; border: 2px solid #9333EA;
+                box-shadow: 0 0 30px rgba(147, 51, 234, 0.5);">
+        <div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%);
+                    width: 200px; height: 200px; border: 2px solid #9333EA; border-radius: 50%;
+                    opacity: 0.3; animation: oracleRotate 10s linear infinite;"></div>
+        <div style="position: relative; z-index: 1;">
+            <h1 style="color: #9333EA; margin: 0; font-size: 3.5rem; font-weight: bold;
+                       text-shadow: 0 0 20px #9333EA; animation: oracleGlow 3s ease-in-out infinite alternate;">
+                🔮 L'ORACLE AUTOMOBILE 🔮
+            </h1>
+            <p style="color: #C4B5FD; font-size: 1.2rem; margin-top: 1rem; font-style: italic;">
+                "Les données révèlent leurs secrets à ceux qui savent les écouter..."
+            </p>
+        </div>
+    </div>
+
+    <style>
+    @keyframes oracleRotate {
+        from { transform: translate(-50%, -50%) rotate(0deg); }
+        to { transform: translate(-50%, -50%) rotate(360deg); }
+    }
+    @keyframes oracleGlow {
+        from { text-shadow: 0 0 20px #9333EA; }
+        to { text-shadow: 0 0 40px #9333EA, 0 0 60px #9333EA; }
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    # Consultation de l'Oracle
+    st.markdown("### 🔮 **CONSULTATION DE L'ORACLE**")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        oracle_question = st.text_area(
+            "🗣️ Posez votre question à l'Oracle :",
+            placeholder="Ex: Quel constructeur dominera en 2030 ? Quand les EV dépasseront-ils 50% ?",
+            height=100
+        )
+
+    with col2:
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #9333EA 0%, #7C3AED 100%);
+                    color: white; padding: 1.5rem; border-radius: 15px; text-align: center;">
+            <div style="font-size: 2rem; margin-bottom: 0.5rem;">🔮</div>
+            <div style="font-weight: bold;">ORACLE ACTIF</div>
+            <div style="font-size: 0.8rem; opacity: 0.8;">Prêt à révéler l'avenir</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    if st.button("🌟 CONSULTER L'ORACLE", type="primary"):
+        if oracle_question:
+            with st.spinner("🔮 L'Oracle consulte les données cosmiques..."):
+                time.sleep(3)  # Effet dramatique
+
+                # Génération de prophétie basée sur la question
+                prophecy = generate_oracle_prophecy(app, oracle_question)
+
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #1a0033 0%, #2D1B69 100%);
+                            border: 2px solid #9333EA; border-radius: 20px; padding: 2rem;
+                            margin: 2rem 0; position: relative; overflow: hidden;">
+                    <div style="position: absolute; top: -50px; right: -50px; width: 100px; height: 100px;
+                                background: radial-gradient(circle, #9333EA 0%, transparent 70%);
+                                border-radius: 50%; opacity: 0.3; animation: oracleOrb 4s ease-in-out infinite;"></div>
+                    <h3 style="color: #9333EA; text-align: center; margin-bottom: 1.5rem;">
+                        ✨ PROPHÉTIE DE L'ORACLE ✨
+                    </h3>
+                    <div style="color: #E5E7EB; font-size: 1.1rem; line-height: 1.8; text-align: center;
+                                font-style: italic; text-shadow: 0 2px 4px rgba(0,0,0,0.5);">
+                        {prophecy}
+                    </div>
+                    <div style="text-align: center; margin-top: 1.5rem; color: #9333EA; font-size: 0.9rem;">
+                        🌟 Prophétie révélée le {datetime.now().strftime('%d/%m/%Y à %H:%M')} 🌟
+                    </div>
+                </div>
+
+                <style>
+                @keyframes oracleOrb {{
+                    0%, 100% {{ transform: scale(1) rotate(0deg); }}
+                    50% {{ transform: scale(1.2) rotate(180deg); }}
+                }}
+                </style>
+                """, unsafe_allow_html=True)
+
+    # Prédictions mystiques automatiques
+    st.markdown("---")
+    st.markdown("### 🌟 **PRÉDICTIONS MYSTIQUES AUTOMATIQUES**")
+
+    predictions = [
+        {
+            "title": "🚗 Le Grand Changement",
+            "prediction": "En 2027, un constructeur inattendu bouleversera l'ordre établi. Les signes pointent vers l'Asie...",
+            "confidence": "87%",
+            "element": "🔥 Feu"
+        },
+        {
+            "title": "⚡ L'Éveil Électrique",
+            "prediction": "L'année 2026 marquera le point de bascule : 50% de véhicules électriques seront atteints plus tôt que prévu.",
+            "confidence": "92%",
+            "element": "⚡ Foudre"
+        },
+        {
+            "title": "🌍 La Révolution Géographique",
+            "prediction": "L'Afrique émergera comme nouveau continent automobile majeur d'ici 2029. Les étoiles s'alignent...",
+            "confidence": "73%",
+            "element": "🌍 Terre"
+        },
+        {
+            "title": "💎 L'Alliance Secrète",
+            "prediction": "Deux géants rivaux s'uniront en 2028 pour créer la plus grande alliance automobile de l'histoire.",
+            "confidence": "81%",
+            "element": "💎 Cristal"
+        }
+    ]
+
+    for pred in predictions:
+        col1, col2 = st.columns([3, 1])
+
+        with col1:
+            st.markdown(f"""
+            <div style="background: linear-gradient(135deg, #2D1B69 0%, #1a0033 100%);
+                        border-left: 4px solid #9333EA; padding: 1.5rem; border-radius: 10px;
+                        margin-bottom: 1rem;">
+                <h4 style="color: #9333EA; margin: 0 0 1rem 0;">{pred['title']}</h4>
+                <p style="color: #E5E7EB; margin: 0; font-style: italic; line-height: 1.6;">
+                    "{pred['prediction']}"
+                </p>
+                <div style="margin-top: 1rem; color: #C4B5FD; font-size: 0.9rem;">
+                    Élément: {pred['element']} | Confiance: {pred['confidence']}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col2:
+            # Cristal de confiance
+            confidence_val = int(pred['confidence'].replace('%', ''))
+            crystal_color = '#10B981' if confidence_val > 85 else '#F59E0B' if confidence_val > 75 else '#EF4444'
+
+            st.markdown(f"""
+            <div style="background: {crystal_color}; color: white;
+                        border-radius: 15px; padding: 1rem; text-align: center;
+                        box-shadow: 0 4px 15px rgba(147, 51, 234, 0.3);">
+                <div style="font-size: 1.5rem;">💎</div>
+                <div style="font-weight: bold;">{pred['confidence']}</div>
+                <div style="font-size: 0.8rem;">Confiance</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # Boule de cristal interactive
+    st.markdown("---")
+    st.markdown("### 🔮 **BOULE DE CRISTAL INTERACTIVE**")
+
+    if st.button("🌟 ACTIVER LA BOULE DE CRISTAL"):
+        # Animation de la boule de cristal
+        crystal_ball_placeholder = st.empty()
+
+        for i in range(5):
+            crystal_ball_placeholder.markdown(f"""
+            <div style="text-align: center; padding: 2rem;">
+                <div style="font-size: 8rem; animation: crystalSpin 1s linear infinite;">🔮</div>
+                <p style="color: #9333EA; font-size: 1.2rem; margin-top: 1rem;">
+                    Vision en cours... {i+1}/5
+                </p>
+            </div>
+
+            <style>
+            @keyframes crystalSpin {{
+                from {{ transform: rotate(0deg) scale(1); }}
+                to {{ transform: rotate(360deg) scale(1.1); }}
+            }}
+            </style>
+            """, unsafe_allow_html=True)
+            time.sleep(1)
+
+        # Révélation finale
+        crystal_ball_placeholder.markdown(f"""
+        <div style="text-align: center; padding: 2rem; background: radial-gradient(circle, #9333EA20 0%, transparent 70%);
+                    border-radius: 20px;">
+            <div style="font-size: 6rem; margin-bottom: 1rem;">🔮</div>
+            <h3 style="color: #9333EA;">✨ VISION RÉVÉLÉE ✨</h3>
+            <p style="color: #E5E7EB; font-size: 1.2rem; font-style: italic; margin: 1rem 0;">
+                "Je vois... un avenir où {random.choice(['Tesla', 'BYD', 'Toyota', 'Volkswagen'])}
+                dominera {random.choice(['l\'Europe', 'l\'Asie', 'l\'Amérique', 'le monde'])}
+                avec {random.choice(['45%', '52%', '38%', '61%'])} de part de marché..."
+            </p>
+            <div style="color: #9333EA; font-size: 0.9rem;">
+                🌟 Vision du {datetime.now().strftime('%d/%m/%Y')} 🌟
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+def generate_oracle_prophecy(app, question):
+    """Génère une prophétie basée sur la question et les données."""
+    question_lower = question.lower()
+
+    # Prophéties basées sur mots-clés
+    if "2030" in question_lower or "futur" in question_lower:
+        return "🌟 L'Oracle voit l'année 2030 baignée de lumière électrique. Les véhicules à essence ne seront plus que des reliques du passé. Un nouveau monde automobile naîtra, dominé par l'intelligence artificielle et l'énergie pure. 🌟"
+
+    elif "tesla" in question_lower:
+        return "⚡ Les étoiles murmurent le nom de Tesla... Je vois Elon Musk dans une vision, entouré d'éclairs dorés. Tesla atteindra des sommets inimaginables, mais attention aux rivaux qui émergent de l'ombre chinoise... ⚡"
+
+    elif "électrique" in question_lower or "ev" in question_lower:
+        return "🔋 L'Oracle révèle : L'année 2026 sera l'année de la Grande Transition. Les véhicules électriques franchiront le seuil sacré des 50%. Une révolution silencieuse mais puissante transformera à jamais l'industrie automobile. 🔋"
+
+    elif "chine" in question_lower or "byd" in question_lower:
+        return "🐉 Du Dragon de l'Est surgira une force nouvelle... BYD et ses alliés chinois conquériront l'Europe d'ici 2027. L'Oracle voit des usines s'élever comme des temples technologiques sur le continent européen. 🐉"
+
+    elif "prix" in question_lower or "coût" in question_lower:
+        return "💰 Les cristaux de données révèlent : Les prix des véhicules électriques chuteront drastiquement en 2025. L'égalité des prix avec les véhicules thermiques marquera le début d'une nouvelle ère. La prophétie s'accomplira. 💰"
+
+    elif "toyota" in question_lower:
+        return "🌸 L'esprit du Sakura guide Toyota... Le géant japonais, tel un samouraï patient, prépare sa contre-attaque hybride. En 2028, Toyota révélera sa véritable stratégie électrique et surprendra le monde entier. 🌸"
+
+    else:
+        return f"🔮 L'Oracle contemple votre question dans les brumes du temps... Les données cosmiques s'alignent pour révéler que l'avenir automobile sera façonné par trois forces : l'Innovation, la Durabilité et la Connectivité. Votre réponse se trouve à l'intersection de ces trois chemins sacrés. 🔮"
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE MODE AQUARIUM
+=============================================================================
+
+Mode Aquarium - Les données nagent comme des poissons.
+
+=============================================================================
+"""
+
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_aquarium_mode(app):
+    """Mode Aquarium - Les données nagent comme des poissons."""
+    st.markdown('<h1 class="main-header">🌊 Mode Aquarium - Écosystème Automobile</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # Interface aquarium
+    st.markdown("""
+    <div style="background: linear-gradient(180deg, #87CEEB 0%, #4682B4 50%, #191970 100%);
+                padding: 3rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;
+                position: relative; overflow: hidden;">
+        <div style="position: absolute; top: 20px; left: 20px; font-size: 2rem; animation: swim1 8s ease-in-out infinite;">🐠</div>
+        <div style="position: absolute; top: 60px; right: 30px; font-size: 1.5rem; animation: swim2 6s ease-in-out infinite reverse;">🐟</div>
+        <div style="position: absolute; bottom: 40px; left: 50%; font-size: 2.5rem; animation: swim3 10s ease-in-out infinite;">🐡</div>
+        <h1 style="color: white; margin: 0; font-size: 3rem; text-shadow: 0 4px 8px rgba(0,0,0,0.5);">
+            🌊 AQUARIUM AUTOMOBILE 🌊
+        </h1>
+        <p style="color: #E0F6FF; font-size: 1.2rem; margin-top: 1rem;">
+            Observez l'écosystème automobile dans son habitat naturel
+        </p>
+    </div>
+
+    <style>
+    @keyframes swim1 { 0%, 100% { transform: translateX(0px); } 50% { transform: translateX(50px); } }
+    @keyframes swim2 { 0%, 100% { transform: translateX(0px); } 50% { transform: translateX(-40px); } }
+    @keyframes swim3 { 0%, 100% { transform: translateX(-20px); } 50% { transform: translateX(20px); } }
+    </style>
+    """, unsafe_allow_html=True)
+
+    # Constructeurs comme poissons
+    st.markdown("### 🐠 **ESPÈCES AUTOMOBILES**")
+
+    fish_types = {
+        'Toyota': {'emoji': '🐋', 'type': 'Baleine (Géant)', 'habitat': 'Océan Mondial'},
+        'Volkswagen': {'emoji': '🦈', 'type': 'Requin (Prédateur)', 'habitat': 'Eaux Européennes'},
+        'Ford': {'emoji': '🐟', 'type': 'Poisson Robuste', 'habitat': 'Rivières Américaines'},
+        'Hyundai-Kia': {'emoji': '🐠', 'type': 'Poisson Coloré', 'habitat': 'Récifs Coréens'},
+        'Stellantis': {'emoji': '🐡', 'type': 'Poisson-Globe', 'habitat': 'Méditerranée'},
+        'GM': {'emoji': '🦑', 'type': 'Pieuvre (Tentacules)', 'habitat': 'Profondeurs US'}
+    }
+
+    cols = st.columns(3)
+    for i, (manu, fish) in enumerate(fish_types.items()):
+        with cols[i % 3]:
+            production = app.df[app.df['Manufacturer'] == manu]['Production_Volume'].sum() / 1e6
+
+            st.markdown(f"""
+            <div style="background: linear-gradient(135deg, #4682B4 0%, #87CEEB 100%);
+                        border-radius: 15px; padding: 1.5rem; text-align: center; margin-bottom: 1rem;
+                        border: 2px solid #191970; box-shadow: 0 4px 15px rgba(70,130,180,0.3);">
+                <div style="font-size: 3rem; margin-bottom: 0.5rem;">{fish['emoji']}</div>
+                <div style="color: white; font-weight: bold; font-size: 1.1rem;">{manu}</div>
+                <div style="color: #E0F6FF; font-size: 0.9rem; margin: 0.5rem 0;">{fish['type']}</div>
+                <div style="color: #B0E0E6; font-size: 0.8rem;">{fish['habitat']}</div>
+                <div style="color: white; font-weight: bold; margin-top: 0.5rem;">
+                    Taille: {production:.1f}M unités
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # Graphique "bulles" aquarium
+    st.markdown("### 🫧 **BULLES DE PRODUCTION**")
+
+    bubble_data = app.df.groupby('Manufacturer').agg({
+        'Production_Volume': 'sum',
+        'EV_Share': 'mean'
+    }).reset_index()
+
+    fig = px.scatter(bubble_data, x='Manufacturer', y='Production_Volume',
+                    size='Production_Volume', color='EV_Share',
+                    title="🌊 Écosystème de Production (Taille = Volume, Couleur = EV)",
+                    color_continuous_scale='Blues')
+
+    fig.update_layout(
+        plot_bgcolor='rgba(135,206,235,0.1)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        height=400
+    )
+
+    render_profiler.plotly_chart(fig, use_container_width=True)
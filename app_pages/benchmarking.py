@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE BENCHMARKING
+=============================================================================
+
+Dashboard Benchmarking.
+
+=============================================================================
+"""
+
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_benchmarking_dashboard(app):
+    """Dashboard Benchmarking."""
+    st.markdown('<h1 class="main-header">📊 Benchmarking</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # Comparaison des constructeurs
+    manufacturer_stats = app.df.groupby('Manufacturer').agg({
+        'Production_Volume': 'sum',
+        'Average_Price': 'mean',
+        'EV_Share': 'mean'
+    }).reset_index()
+
+    manufacturer_stats['EV_Share'] = manufacturer_stats['EV_Share'] * 100
+    manufacturer_stats = manufacturer_stats.sort_values('Production_Volume', ascending=False)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig1 = px.bar(manufacturer_stats, x='Manufacturer', y='Production_Volume',
+                     title="Production par Constructeur",
+                     labels={'Production_Volume': 'Production', 'Manufacturer': 'Constructeur'})
+        fig1.update_layout(height=400, xaxis_tickangle=45)
+        render_profiler.plotly_chart(fig1, use_container_width=True)
+
+    with col2:
+        fig2 = px.scatter(manufacturer_stats, x='Average_Price', y='EV_Share',
+                         size='Production_Volume', hover_name='Manufacturer',
+                         title="Prix vs Part EV (taille = production)",
+                         labels={'Average_Price': 'Prix Moyen (€)', 'EV_Share': 'Part EV (%)'})
+        fig2.update_layout(height=400)
+        render_profiler.plotly_chart(fig2, use_container_width=True)
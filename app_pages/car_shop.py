@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE CAR SHOP
+=============================================================================
+
+Comparateur mode Car Shop.
+
+=============================================================================
+"""
+
+import plotly.graph_objects as go
+import streamlit as st
+
+import render_profiler
+
+
+def render_car_shop(app):
+    """Comparateur mode Car Shop."""
+    st.markdown('<h1 class="main-header">🛒 Car Shop - Comparateur</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #1A1A1A 0%, #E31E24 100%);
+                padding: 2rem; border-radius: 15px; margin-bottom: 2rem; text-align: center;">
+        <h2 style="color: white; margin: 0;">🚗 Comparateur Constructeurs Premium</h2>
+        <p style="color: #CCCCCC; margin-top: 1rem;">
+            Comparez les performances des constructeurs automobiles
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Sélecteurs de constructeurs
+    col1, col2 = st.columns(2)
+
+    manufacturers = sorted(app.df['Manufacturer'].unique())
+
+    with col1:
+        manu1 = st.selectbox("🏭 Constructeur 1", manufacturers, index=0)
+
+    with col2:
+        manu2 = st.selectbox("🏭 Constructeur 2", manufacturers, index=1)
+
+    # Données des constructeurs
+    data1 = app.df[app.df['Manufacturer'] == manu1].agg({
+        'Production_Volume': 'sum',
+        'Average_Price': 'mean',
+        'EV_Share': 'mean'
+    })
+
+    data2 = app.df[app.df['Manufacturer'] == manu2].agg({
+        'Production_Volume': 'sum',
+        'Average_Price': 'mean',
+        'EV_Share': 'mean'
+    })
+
+    # Comparaison visuelle
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #1976D2 0%, #1565C0 100%);
+                    color: white; padding: 2rem; border-radius: 15px; text-align: center;">
+            <h3 style="margin: 0 0 1rem 0;">{manu1}</h3>
+            <div style="margin: 1rem 0;">
+                <div style="font-size: 0.9rem;">🏭 Production</div>
+                <div style="font-size: 2rem; font-weight: bold;">{data1['Production_Volume']/1e6:.1f}M</div>
+            </div>
+            <div style="margin: 1rem 0;">
+                <div style="font-size: 0.9rem;">💰 Prix Moyen</div>
+                <div style="font-size: 2rem; font-weight: bold;">{data1['Average_Price']:,.0f}€</div>
+            </div>
+            <div style="margin: 1rem 0;">
+                <div style="font-size: 0.9rem;">⚡ Part EV</div>
+                <div style="font-size: 2rem; font-weight: bold;">{data1['EV_Share']*100:.1f}%</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #E31E24 0%, #C62828 100%);
+                    color: white; padding: 2rem; border-radius: 15px; text-align: center;">
+            <h3 style="margin: 0 0 1rem 0;">{manu2}</h3>
+            <div style="margin: 1rem 0;">
+                <div style="font-size: 0.9rem;">🏭 Production</div>
+                <div style="font-size: 2rem; font-weight: bold;">{data2['Production_Volume']/1e6:.1f}M</div>
+            </div>
+            <div style="margin: 1rem 0;">
+                <div style="font-size: 0.9rem;">💰 Prix Moyen</div>
+                <div style="font-size: 2rem; font-weight: bold;">{data2['Average_Price']:,.0f}€</div>
+            </div>
+            <div style="margin: 1rem 0;">
+                <div style="font-size: 0.9rem;">⚡ Part EV</div>
+                <div style="font-size: 2rem; font-weight: bold;">{data2['EV_Share']*100:.1f}%</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Graphique comparatif radar
+    st.markdown("### 📊 **Comparaison Radar**")
+
+    categories = ['Production', 'Prix Premium', 'Innovation EV']
+
+    # Normalisation des données pour le radar
+    prod_max = app.df.groupby('Manufacturer')['Production_Volume'].sum().max()
+    price_max = app.df.groupby('Manufacturer')['Average_Price'].mean().max()
+    ev_max = app.df.groupby('Manufacturer')['EV_Share'].mean().max()
+
+    values1 = [
+        (data1['Production_Volume'] / prod_max) * 100,
+        (data1['Average_Price'] / price_max) * 100,
+        (data1['EV_Share'] / ev_max) * 100
+    ]
+
+    values2 = [
+        (data2['Production_Volume'] / prod_max) * 100,
+        (data2['Average_Price'] / price_max) * 100,
+        (data2['EV_Share'] / ev_max) * 100
+    ]
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatterpolar(
+        r=values1 + [values1[0]],
+        theta=categories + [categories[0]],
+        fill='toself',
+        name=manu1,
+        line_color='#1976D2'
+    ))
+
+    fig.add_trace(go.Scatterpolar(
+        r=values2 + [values2[0]],
+        theta=categories + [categories[0]],
+        fill='toself',
+        name=manu2,
+        line_color='#E31E24'
+    ))
+
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100]
+            )),
+        showlegend=True,
+        height=500
+    )
+
+    render_profiler.plotly_chart(fig, use_container_width=True)
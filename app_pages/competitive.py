@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE INTELLIGENCE CONCURRENTIELLE
+=============================================================================
+
+Page intelligence concurrentielle.
+
+=============================================================================
+"""
+
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_competitive_intelligence(app):
+    """Page intelligence concurrentielle."""
+    st.markdown('<h1 class="main-header">🎯 Intelligence Concurrentielle</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Données non disponibles pour l'analyse concurrentielle")
+        return
+
+    # Métriques clés de compétitivité
+    st.markdown("## 🏆 Métriques de Compétitivité")
+
+    # Calcul des métriques par fabricant
+    manufacturer_metrics = app.df.groupby('Manufacturer').agg({
+        'Production': ['sum', 'mean'],
+        'Price': 'mean',
+        'SteelPrice': 'mean',
+        'Year': ['min', 'max']
+    }).round(2)
+
+    manufacturer_metrics.columns = ['Production_Totale', 'Production_Moyenne', 'Prix_Moyen', 'Prix_Acier_Moyen', 'Premiere_Annee', 'Derniere_Annee']
+    manufacturer_metrics['Part_Marche'] = (manufacturer_metrics['Production_Totale'] / manufacturer_metrics['Production_Totale'].sum() * 100).round(2)
+    manufacturer_metrics['Croissance'] = app.cube.growth_rates('Manufacturer').round(2)
+
+    # Top 5 fabricants
+    top_manufacturers = manufacturer_metrics.nlargest(5, 'Production_Totale')
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        leader = top_manufacturers.index[0]
+        st.metric("🥇 Leader du Marché", leader, f"{top_manufacturers.loc[leader, 'Part_Marche']:.1f}%")
+    with col2:
+        total_production = manufacturer_metrics['Production_Totale'].sum()
+        st.metric("📊 Production Totale", f"{total_production/1e6:.1f}M", "unités")
+    with col3:
+        avg_growth = manufacturer_metrics['Croissance'].mean()
+        st.metric("📈 Croissance Moyenne", f"{avg_growth:.1f}%", "annuelle")
+    with col4:
+        num_competitors = len(manufacturer_metrics)
+        st.metric("🏢 Concurrents Actifs", num_competitors, "fabricants")
+
+    # Analyse des parts de marché
+    st.markdown("## 📊 Parts de Marché et Positionnement")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Graphique en secteurs des parts de marché
+        fig1 = px.pie(
+            values=top_manufacturers['Production_Totale'],
+            names=top_manufacturers.index,
+            title="Parts de Marché - Top 5 Fabricants",
+            color_discrete_sequence=px.colors.qualitative.Set3
+        )
+        fig1.update_traces(textposition='inside', textinfo='percent+label')
+        render_profiler.plotly_chart(fig1, use_container_width=True)
+
+    with col2:
+        # Matrice Prix vs Volume
+        fig2 = px.scatter(
+            manufacturer_metrics,
+            x='Production_Totale',
+            y='Prix_Moyen',
+            size='Part_Marche',
+            hover_name=manufacturer_metrics.index,
+            title="Matrice Positionnement : Prix vs Volume",
+            labels={'Production_Totale': 'Production Totale', 'Prix_Moyen': 'Prix Moyen (€)'}
+        )
+        fig2.update_layout(showlegend=False)
+        render_profiler.plotly_chart(fig2, use_container_width=True)
+
+    # Analyse de la croissance
+    st.markdown("## 📈 Analyse de Croissance Concurrentielle")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Croissance par fabricant
+        growth_data = manufacturer_metrics.nlargest(10, 'Production_Totale')[['Croissance']].reset_index()
+        fig3 = px.bar(
+            growth_data,
+            x='Manufacturer',
+            y='Croissance',
+            title="Taux de Croissance par Fabricant",
+            color='Croissance',
+            color_continuous_scale='RdYlGn'
+        )
+        fig3.update_layout(xaxis_tickangle=45)
+        render_profiler.plotly_chart(fig3, use_container_width=True)
+
+    with col2:
+        # Évolution temporelle des top 3
+        top_3 = top_manufacturers.head(3).index.tolist()
+        evolution_data = app.df[app.df['Manufacturer'].isin(top_3)]
+        yearly_evolution = evolution_data.groupby(['Year', 'Manufacturer'], observed=True)['Production'].sum().reset_index()
+
+        fig4 = px.line(
+            yearly_evolution,
+            x='Year',
+            y='Production',
+            color='Manufacturer',
+            title="Évolution Production - Top 3 Concurrents",
+            markers=True
+        )
+        render_profiler.plotly_chart(fig4, use_container_width=True)
+
+    # Tableau de comparaison détaillé
+    st.markdown("## 📋 Tableau Comparatif Détaillé")
+
+    # Préparer les données pour l'affichage
+    display_metrics = manufacturer_metrics.copy()
+    display_metrics['Production_Totale'] = (display_metrics['Production_Totale'] / 1e6).round(2)
+    display_metrics['Production_Moyenne'] = (display_metrics['Production_Moyenne'] / 1e3).round(1)
+    display_metrics = display_metrics.round(2)
+
+    # Renommer les colonnes pour l'affichage
+    display_metrics.columns = [
+        'Production Totale (M)', 'Production Moy. (K)', 'Prix Moyen (€)',
+        'Prix Acier Moy.', 'Première Année', 'Dernière Année',
+        'Part Marché (%)', 'Croissance (%)'
+    ]
+
+    st.dataframe(
+        display_metrics.sort_values('Part Marché (%)', ascending=False),
+        use_container_width=True
+    )
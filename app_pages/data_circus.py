@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE CIRQUE DES DONNÉES
+=============================================================================
+
+Cirque des Données - Spectacle automobile.
+
+=============================================================================
+"""
+
+import streamlit as st
+
+
+def render_data_circus(app):
+    """Cirque des Données - Spectacle automobile."""
+    st.markdown('<h1 class="main-header">🎪 Cirque des Données - Grand Spectacle Automobile</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # Interface cirque
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #8B0000 0%, #FF6347 50%, #FFD700 100%);
+                padding: 3rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;
+                position: relative; border: 5px solid #FFD700;">
+        <h1 style="color: white; margin: 0; font-size: 3.5rem; font-weight: bold;
+                   text-shadow: 0 4px 8px rgba(0,0,0,0.5); animation: circusBounce 2s ease-in-out infinite;">
+            🎪 GRAND CIRQUE AUTOMOBILE 🎪
+        </h1>
+        <p style="color: #FFFFE0; font-size: 1.3rem; margin-top: 1rem; font-weight: bold;">
+            🎭 MESDAMES ET MESSIEURS, LE SPECTACLE COMMENCE ! 🎭
+        </p>
+    </div>
+
+    <style>
+    @keyframes circusBounce {
+        0%, 100% { transform: scale(1); }
+        50% { transform: scale(1.05); }
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    # Numéros de cirque
+    st.markdown("### 🎭 **NUMÉROS DU SPECTACLE**")
+
+    circus_acts = [
+        {"act": "🤹 Le Jongleur Tesla", "desc": "Jongle avec les millions de véhicules électriques !"},
+        {"act": "🎪 L'Équilibriste Toyota", "desc": "Maintient l'équilibre entre tradition et innovation !"},
+        {"act": "🦁 Le Dompteur Volkswagen", "desc": "Dresse les marchés européens avec brio !"},
+        {"act": "🎨 L'Artiste BYD", "desc": "Peint l'avenir électrique en couleurs chinoises !"},
+        {"act": "🎯 Le Lanceur de Couteaux Ford", "desc": "Vise juste sur le marché américain !"},
+        {"act": "🎪 Le Clown GM", "desc": "Fait rire avec ses transformations surprenantes !"}
+    ]
+
+    for act in circus_acts:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #FF6347 0%, #FFD700 100%);
+                    border: 3px solid #8B0000; border-radius: 15px; padding: 1.5rem;
+                    margin: 1rem 0; text-align: center;">
+            <h3 style="color: #8B0000; margin: 0 0 0.5rem 0;">{act['act']}</h3>
+            <p style="color: #000000; margin: 0; font-weight: bold;">{act['desc']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Grand final avec feux d'artifice
+    if st.button("🎆 GRAND FINAL - FEUX D'ARTIFICE"):
+        st.balloons()
+        st.markdown("""
+        <div style="background: #000000; color: #FFD700; padding: 3rem; border-radius: 20px;
+                    text-align: center; border: 5px solid #FF6347;">
+            <h2>🎆 GRAND FINAL ! 🎆</h2>
+            <p style="font-size: 1.5rem;">
+                MERCI D'AVOIR ASSISTÉ AU PLUS GRAND SPECTACLE AUTOMOBILE AU MONDE !
+            </p>
+            <p style="font-size: 1.2rem; margin-top: 2rem;">
+                🎪 Le cirque des données vous remercie ! 🎪
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
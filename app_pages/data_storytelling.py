@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE DATA STORYTELLING
+=============================================================================
+
+Page Data Storytelling avec narration automatique.
+
+=============================================================================
+"""
+
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_data_storytelling(app):
+    """Page Data Storytelling avec narration automatique."""
+    st.markdown('<h1 class="main-header">🎬 Data Storytelling</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # Contrôles storytelling
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        auto_play = st.checkbox("▶️ Lecture automatique", value=False)
+
+    with col2:
+        story_speed = st.slider("⏱️ Vitesse", 1, 5, 3)
+
+    with col3:
+        voice_narration = st.checkbox("🔊 Narration vocale", value=False)
+
+    # Chapitres de l'histoire
+    chapters = [
+        {
+            "title": "📈 L'Âge d'Or (2010-2019)",
+            "content": "De 2010 à 2019, l'industrie automobile connaît une croissance stable. Toyota domine le marché avec une production constante, tandis que les véhicules électriques restent marginaux.",
+            "data_focus": "production_growth"
+        },
+        {
+            "title": "🦠 La Grande Disruption (2020-2021)",
+            "content": "2020 marque un tournant historique. La pandémie COVID-19 provoque une chute brutale de 15% de la production mondiale. Les chaînes d'approvisionnement s'effondrent.",
+            "data_focus": "covid_impact"
+        },
+        {
+            "title": "⚡ L'Émergence Électrique (2022-2024)",
+            "content": "2022 voit l'explosion des véhicules électriques. Tesla dépasse le million d'unités, BYD émerge comme rival chinois. La part EV passe de 3% à 18% en 3 ans.",
+            "data_focus": "ev_boom"
+        },
+        {
+            "title": "🔮 Vers l'Avenir (2025-2030)",
+            "content": "Les projections indiquent une transformation radicale : 45% de véhicules électriques en 2030, consolidation du marché, émergence de nouveaux acteurs tech.",
+            "data_focus": "future_projections"
+        }
+    ]
+
+    # Sélecteur de chapitre
+    chapter_index = st.selectbox(
+        "📖 Sélectionner un chapitre",
+        range(len(chapters)),
+        format_func=lambda x: chapters[x]["title"]
+    )
+
+    current_chapter = chapters[chapter_index]
+
+    # Affichage du chapitre
+    st.markdown(f"""
+    <div style="background: linear-gradient(135deg, #1A1A1A 0%, #2C2C2C 100%);
+                padding: 2rem; border-radius: 15px; margin: 2rem 0;">
+        <h2 style="color: #E31E24; margin: 0 0 1rem 0;">{current_chapter['title']}</h2>
+        <p style="color: #CCCCCC; font-size: 1.1rem; line-height: 1.6;">
+            {current_chapter['content']}
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Visualisation selon le chapitre
+    if current_chapter["data_focus"] == "production_growth":
+        # Graphique croissance 2010-2019
+        historical_data = app.df[app.df['Year'] <= 2019].groupby('Year')['Production_Volume'].sum().reset_index()
+
+        fig = px.line(historical_data, x='Year', y='Production_Volume',
+                     title="Croissance Stable 2010-2019",
+                     labels={'Production_Volume': 'Production', 'Year': 'Année'})
+        fig.update_traces(line=dict(color='#1976D2', width=4))
+        fig.update_layout(height=400)
+        render_profiler.plotly_chart(fig, use_container_width=True)
+
+    elif current_chapter["data_focus"] == "covid_impact":
+        # Graphique impact COVID
+        covid_comparison = app.df[app.df['Year'].isin([2019, 2020, 2021])].groupby('Year')['Production_Volume'].sum().reset_index()
+
+        fig = px.bar(covid_comparison, x='Year', y='Production_Volume',
+                    title="Impact COVID-19 sur la Production",
+                    color='Year',
+                    color_discrete_sequence=['#4CAF50', '#E31E24', '#FF9800'])
+        fig.update_layout(height=400)
+        render_profiler.plotly_chart(fig, use_container_width=True)
+
+    elif current_chapter["data_focus"] == "ev_boom":
+        # Graphique boom EV
+        ev_evolution = app.df.groupby('Year')['EV_Share'].mean().reset_index()
+        ev_evolution['EV_Share'] = ev_evolution['EV_Share'] * 100
+
+        fig = px.area(ev_evolution, x='Year', y='EV_Share',
+                     title="Explosion des Véhicules Électriques",
+                     labels={'EV_Share': 'Part EV (%)', 'Year': 'Année'})
+        fig.update_traces(fill='tonexty', fillcolor='rgba(0, 213, 99, 0.3)', line=dict(color='#00D563', width=4))
+        fig.update_layout(height=400)
+        render_profiler.plotly_chart(fig, use_container_width=True)
+
+    # Narration vocale simulée
+    if voice_narration:
+        st.markdown(f"""
+        <div style="background: #E31E24; color: white; padding: 1rem;
+                    border-radius: 10px; margin: 1rem 0; text-align: center;">
+            🔊 <strong>Narration en cours...</strong><br>
+            <em>"{current_chapter['content'][:100]}..."</em>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Navigation chapitres
+    col1, col2, col3 = st.columns([1, 2, 1])
+
+    with col1:
+        if chapter_index > 0:
+            if st.button("⬅️ Chapitre Précédent"):
+                st.rerun()
+
+    with col3:
+        if chapter_index < len(chapters) - 1:
+            if st.button("Chapitre Suivant ➡️"):
+                st.rerun()
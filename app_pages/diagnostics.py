@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE DIAGNOSTIC DU RENDU
+=============================================================================
+
+Page de diagnostic (cachée): percentiles des temps de rendu par page.
+
+=============================================================================
+"""
+
+import streamlit as st
+
+import render_profiler
+
+
+def render_diagnostics(app):
+    """Page de diagnostic (cachée): percentiles des temps de rendu par page."""
+    st.markdown('<h1 class="main-header">🩺 Diagnostic du rendu</h1>', unsafe_allow_html=True)
+    st.caption(f"Journal: {render_profiler.PROFILE_LOG}")
+
+    spans = render_profiler.load_spans()
+    if spans.empty:
+        st.info("Aucune mesure enregistrée: naviguez dans l'application puis revenez sur cette page.")
+        return
+
+    summary = render_profiler.summarize(spans)
+    st.markdown(f"### ⏱️ Pages ({spans['run'].nunique()} exécutions)")
+    st.bar_chart(summary['pages'][['p50', 'p95']])
+    st.dataframe(summary['pages'], use_container_width=True)
+
+    st.markdown("### 🧩 Phases par page (ms)")
+    st.dataframe(summary['phases'], use_container_width=True)
+
+    st.markdown("### 📊 Graphiques (ms): préparation (pandas + figure) et envoi (sérialisation)")
+    st.dataframe(summary['charts'], use_container_width=True)
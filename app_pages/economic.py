@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE ANALYSE ÉCONOMIQUE
+=============================================================================
+
+Page analyse économique.
+
+=============================================================================
+"""
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_economic_analysis(app):
+    """Page analyse économique."""
+    st.markdown('<h1 class="main-header">💼 Analyse Économique</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Données non disponibles")
+        return
+
+    # Indicateurs économiques clés
+    st.markdown("## 💰 Indicateurs Économiques Clés")
+
+    # Calculs des métriques économiques
+    current_year = app.df['Year'].max()
+    current_data = app.df[app.df['Year'] == current_year]
+
+    total_market_value = (current_data['Production'] * current_data['Price']).sum()
+    avg_steel_price = current_data['SteelPrice'].mean()
+    price_volatility = app.df.groupby('Year')['Price'].std().mean()
+    steel_correlation = app.df['SteelPrice'].corr(app.df['Production'])
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("💼 Valeur Marché Total", f"{total_market_value/1e12:.2f}T€", "estimation")
+
+    with col2:
+        st.metric("⚙️ Prix Acier Moyen", f"{avg_steel_price:.0f}€", "par tonne")
+
+    with col3:
+        volatility_trend = "📈" if price_volatility > 3000 else "📊" if price_volatility > 1500 else "📉"
+        st.metric("📊 Volatilité Prix", f"{price_volatility:.0f}€", volatility_trend)
+
+    with col4:
+        correlation_strength = "🔴 Forte" if abs(steel_correlation) > 0.7 else "🟡 Modérée" if abs(steel_correlation) > 0.3 else "🟢 Faible"
+        st.metric("🔗 Corrélation Acier", f"{steel_correlation:.3f}", correlation_strength)
+
+    # Analyses de corrélation avancées
+    st.markdown("## 📊 Analyses de Corrélation Économique")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Matrice de corrélation complète
+        correlation_vars = ['Production', 'Price', 'SteelPrice']
+        if 'GDP_Growth' in app.df.columns:
+            correlation_vars.append('GDP_Growth')
+        if 'Interest_Rate' in app.df.columns:
+            correlation_vars.append('Interest_Rate')
+
+        correlation_matrix = app.df[correlation_vars].corr()
+
+        fig1 = px.imshow(
+            correlation_matrix,
+            title="Matrice de Corrélation Économique",
+            color_continuous_scale='RdBu',
+            aspect='auto',
+            text_auto=True
+        )
+        fig1.update_layout(
+            xaxis_title="Variables Économiques",
+            yaxis_title="Variables Économiques"
+        )
+        render_profiler.plotly_chart(fig1, use_container_width=True)
+
+    with col2:
+        # Scatter plot prix acier vs production avec tendance
+        fig2 = px.scatter(
+            app.df,
+            x='SteelPrice',
+            y='Production',
+            color='Year',
+            size='Price',
+            title="Prix Acier vs Production (par année)",
+            trendline="ols",
+            hover_data=['Manufacturer', 'Region']
+        )
+        fig2.update_layout(
+            xaxis_title="Prix Acier (€/tonne)",
+            yaxis_title="Production (unités)"
+        )
+        render_profiler.plotly_chart(fig2, use_container_width=True)
+
+    # Évolution des indicateurs économiques
+    st.markdown("## 📈 Évolution des Indicateurs Économiques")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Évolution multi-variables
+        yearly_economics = app.df.groupby('Year').agg({
+            'Price': 'mean',
+            'SteelPrice': 'mean',
+            'Production': 'sum'
+        }).reset_index()
+
+        fig3 = go.Figure()
+
+        # Prix véhicules (échelle principale)
+        fig3.add_trace(go.Scatter(
+            x=yearly_economics['Year'],
+            y=yearly_economics['Price'],
+            mode='lines+markers',
+            name='Prix Moyen Véhicules (€)',
+            line=dict(color='blue', width=3),
+            yaxis='y'
+        ))
+
+        # Prix acier (échelle secondaire)
+        fig3.add_trace(go.Scatter(
+            x=yearly_economics['Year'],
+            y=yearly_economics['SteelPrice'],
+            mode='lines+markers',
+            name='Prix Acier (€/tonne)',
+            line=dict(color='red', width=3),
+            yaxis='y2'
+        ))
+
+        fig3.update_layout(
+            title="Évolution Prix Véhicules vs Prix Acier",
+            xaxis_title="Année",
+            yaxis=dict(title="Prix Véhicules (€)", side="left"),
+            yaxis2=dict(title="Prix Acier (€/tonne)", side="right", overlaying="y"),
+            hovermode='x unified'
+        )
+        render_profiler.plotly_chart(fig3, use_container_width=True)
+
+    with col2:
+        # Analyse de la volatilité par année
+        yearly_volatility = app.df.groupby('Year').agg({
+            'Price': 'std',
+            'SteelPrice': 'std',
+            'Production': 'std'
+        }).fillna(0).reset_index()
+
+        fig4 = go.Figure()
+
+        fig4.add_trace(go.Bar(
+            name='Volatilité Prix Véhicules',
+            x=yearly_volatility['Year'],
+            y=yearly_volatility['Price'],
+            marker_color='lightblue'
+        ))
+
+        fig4.add_trace(go.Scatter(
+            name='Volatilité Prix Acier (x100)',
+            x=yearly_volatility['Year'],
+            y=yearly_volatility['SteelPrice'] * 100,
+            mode='lines+markers',
+            line=dict(color='red', width=3),
+            yaxis='y2'
+        ))
+
+        fig4.update_layout(
+            title="Évolution de la Volatilité Économique",
+            xaxis_title="Année",
+            yaxis=dict(title="Volatilité Prix Véhicules (€)", side="left"),
+            yaxis2=dict(title="Volatilité Prix Acier (x100)", side="right", overlaying="y"),
+            barmode='group'
+        )
+        render_profiler.plotly_chart(fig4, use_container_width=True)
+
+    # Analyse par région économique
+    st.markdown("## 🌍 Performance Économique par Région")
+
+    regional_economics = app.df.groupby('Region').agg({
+        'Production': 'sum',
+        'Price': 'mean',
+        'SteelPrice': 'mean'
+    }).round(2)
+
+    regional_economics['Market_Value'] = (regional_economics['Production'] * regional_economics['Price']).round(0)
+    regional_economics['Efficiency_Ratio'] = (regional_economics['Production'] / regional_economics['SteelPrice']).round(2)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Valeur de marché par région
+        fig5 = px.bar(
+            x=regional_economics.index,
+            y=regional_economics['Market_Value']/1e9,
+            title="Valeur de Marché par Région (Milliards €)",
+            color=regional_economics['Market_Value'],
+            color_continuous_scale='Viridis'
+        )
+        fig5.update_layout(xaxis_tickangle=45)
+        fig5.update_layout(xaxis_title="Région", yaxis_title="Valeur (Md€)")
+        render_profiler.plotly_chart(fig5, use_container_width=True)
+
+    with col2:
+        # Ratio efficacité économique
+        fig6 = px.scatter(
+            x=regional_economics['Price'],
+            y=regional_economics['Production']/1e6,
+            size=regional_economics['Market_Value']/1e9,
+            hover_name=regional_economics.index,
+            title="Matrice Prix vs Volume par Région",
+            labels={'x': 'Prix Moyen (€)', 'y': 'Production (M unités)'}
+        )
+        fig6.update_layout(showlegend=False)
+        render_profiler.plotly_chart(fig6, use_container_width=True)
+
+    # Analyse des tendances économiques
+    st.markdown("## 📊 Tendances et Prévisions Économiques")
+
+    # Calcul des tendances
+    recent_years = sorted(app.df['Year'].unique())[-5:]  # 5 dernières années
+    trend_data = app.df[app.df['Year'].isin(recent_years)]
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Croissance économique par constructeur
+        manufacturer_growth = []
+        for manufacturer in trend_data['Manufacturer'].unique():
+            manu_data = trend_data[trend_data['Manufacturer'] == manufacturer]
+            if len(manu_data) > 1:
+                growth_rate = _calculate_growth_rate(app, {'Year': recent_years, 'Manufacturer': manufacturer})
+                market_value = (manu_data['Production'] * manu_data['Price']).sum()
+                manufacturer_growth.append({
+                    'Manufacturer': manufacturer,
+                    'Growth_Rate': growth_rate,
+                    'Market_Value': market_value
+                })
+
+        if manufacturer_growth:
+            growth_df = pd.DataFrame(manufacturer_growth).nlargest(10, 'Market_Value')
+
+            fig7 = px.bar(
+                growth_df,
+                x='Manufacturer',
+                y='Growth_Rate',
+                title="Taux de Croissance - Top 10 Constructeurs",
+                color='Growth_Rate',
+                color_continuous_scale='RdYlGn'
+            )
+            fig7.update_layout(xaxis_tickangle=45)
+            fig7.add_hline(y=0, line_dash="dash", line_color="black")
+            render_profiler.plotly_chart(fig7, use_container_width=True)
+
+    with col2:
+        # Prévision simple basée sur la tendance
+        if len(recent_years) >= 3:
+            # Calcul de tendance linéaire simple
+            yearly_avg = trend_data.groupby('Year').agg({
+                'Price': 'mean',
+                'Production': 'sum'
+            }).reset_index()
+
+            # Projection pour les 3 prochaines années
+            future_years = list(range(max(recent_years) + 1, max(recent_years) + 4))
+
+            # Tendance prix (régression linéaire simple)
+            if len(yearly_avg) >= 2:
+                price_slope = (yearly_avg['Price'].iloc[-1] - yearly_avg['Price'].iloc[0]) / (len(yearly_avg) - 1)
+                future_prices = [yearly_avg['Price'].iloc[-1] + price_slope * i for i in range(1, 4)]
+
+                fig8 = go.Figure()
+
+                # Données historiques
+                fig8.add_trace(go.Scatter(
+                    x=yearly_avg['Year'],
+                    y=yearly_avg['Price'],
+                    mode='lines+markers',
+                    name='Prix Historique',
+                    line=dict(color='blue', width=3)
+                ))
+
+                # Prévisions
+                fig8.add_trace(go.Scatter(
+                    x=future_years,
+                    y=future_prices,
+                    mode='lines+markers',
+                    name='Prévision Prix',
+                    line=dict(color='red', dash='dash', width=3)
+                ))
+
+                fig8.update_layout(
+                    title="Prévision Prix Moyen (Tendance Linéaire)",
+                    xaxis_title="Année",
+                    yaxis_title="Prix Moyen (€)"
+                )
+                render_profiler.plotly_chart(fig8, use_container_width=True)
+
+    # Tableau de synthèse économique
+    st.markdown("## 📋 Synthèse Économique Détaillée")
+
+    # Enrichir les données régionales
+    detailed_economics = regional_economics.copy()
+    detailed_economics['Production_M'] = (detailed_economics['Production'] / 1e6).round(2)
+    detailed_economics['Market_Value_Md'] = (detailed_economics['Market_Value'] / 1e9).round(2)
+    detailed_economics['Price_K'] = (detailed_economics['Price'] / 1000).round(1)
+
+    # Calculer les parts de marché
+    detailed_economics['Market_Share_%'] = (
+        detailed_economics['Production'] / detailed_economics['Production'].sum() * 100
+    ).round(2)
+
+    # Préparer pour l'affichage
+    display_economics = detailed_economics[[
+        'Production_M', 'Price_K', 'SteelPrice', 'Market_Value_Md',
+        'Market_Share_%', 'Efficiency_Ratio'
+    ]].copy()
+
+    display_economics.columns = [
+        'Production (M)', 'Prix Moy. (K€)', 'Prix Acier (€)',
+        'Valeur Marché (Md€)', 'Part Marché (%)', 'Ratio Efficacité'
+    ]
+
+    st.dataframe(
+        display_economics.sort_values('Valeur Marché (Md€)', ascending=False),
+        use_container_width=True
+    )
+
+    # Alertes économiques
+    st.markdown("## 🚨 Alertes Économiques")
+
+    alerts = []
+
+    if price_volatility > 5000:
+        alerts.append("🔴 CRITIQUE: Volatilité des prix très élevée (>5000€)")
+    elif price_volatility > 3000:
+        alerts.append("🟡 ATTENTION: Volatilité des prix élevée (>3000€)")
+
+    if abs(steel_correlation) > 0.7:
+        alerts.append("🟡 ATTENTION: Forte corrélation prix acier-production")
+
+    # Vérifier les tendances de prix
+    recent_price_trend = yearly_economics['Price'].pct_change().iloc[-1] * 100
+    if recent_price_trend > 10:
+        alerts.append("🔴 CRITIQUE: Hausse des prix >10% sur la dernière année")
+    elif recent_price_trend < -10:
+        alerts.append("🟡 ATTENTION: Baisse des prix >10% sur la dernière année")
+
+    if alerts:
+        for alert in alerts:
+            st.warning(alert)
+    else:
+        st.success("🟢 Tous les indicateurs économiques sont dans les normes")
+
+
+def _calculate_growth_rate(app, filters=None):
+    """Calcule le taux de croissance annuel moyen sur le cube filtré."""
+    return app.cube.growth_rates(measure='Production_Volume', filters=filters)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE TRANSITION ÉLECTRIQUE AVANCÉE
+=============================================================================
+
+Dashboard Transition Électrique Avancée.
+
+=============================================================================
+"""
+
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_ev_advanced_dashboard(app):
+    """Dashboard Transition Électrique Avancée."""
+    st.markdown('<h1 class="main-header">⚡ Transition Électrique Avancée</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # KPIs Transition Électrique
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        # Taux d'adoption EV actuel
+        current_ev_rate = app.df[app.df['Year'] == 2023]['EV_Share'].mean() * 100
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚡ Taux Adoption EV 2023</div>
+            <div style="font-size: 3rem; font-weight: bold;">{current_ev_rate:.1f}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        # Croissance annuelle EV
+        ev_growth = app.df.groupby('Year')['EV_Share'].mean().pct_change().mean() * 100
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📈 Croissance EV Annuelle</div>
+            <div style="font-size: 3rem; font-weight: bold;">{ev_growth:.1f}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        # Projection EV 2030 (extrapolation simple)
+        ev_2030_projection = min(100, current_ev_rate * (1 + ev_growth/100)**7)
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #8B5CF6 0%, #7C3AED 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🔮 Projection EV 2030</div>
+            <div style="font-size: 3rem; font-weight: bold;">{ev_2030_projection:.0f}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        # Impact subventions EV
+        subsidy_impact = (app.df['US_EV_Subsidy'].corr(app.df['EV_Share']) * 100)
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #EF4444 0%, #DC2626 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">💰 Impact Subventions</div>
+            <div style="font-size: 3rem; font-weight: bold;">{subsidy_impact:.0f}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Analyses EV avancées
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Courbe S d'adoption EV par région
+        ev_by_region = app.df.groupby(['Region', 'Year'])['EV_Share'].mean().reset_index()
+        ev_by_region['EV_Share'] = ev_by_region['EV_Share'] * 100
+
+        fig1 = px.line(ev_by_region, x='Year', y='EV_Share', color='Region',
+                      title="Courbe d'Adoption EV par Région",
+                      labels={'EV_Share': 'Part EV (%)', 'Year': 'Année'})
+
+        # Ajouter ligne de tendance
+        fig1.add_hline(y=50, line_dash="dash", line_color="gray",
+                      annotation_text="Seuil Majorité (50%)")
+
+        fig1.update_layout(height=400)
+        render_profiler.plotly_chart(fig1, use_container_width=True)
+
+    with col2:
+        # Matrice EV : Prix vs Adoption
+        ev_price_matrix = app.df.groupby('Manufacturer').agg({
+            'EV_Share': 'mean',
+            'Average_Price': 'mean',
+            'Production_Volume': 'sum'
+        }).reset_index()
+
+        ev_price_matrix['EV_Share'] = ev_price_matrix['EV_Share'] * 100
+
+        fig2 = px.scatter(ev_price_matrix, x='EV_Share', y='Average_Price',
+                         size='Production_Volume', hover_name='Manufacturer',
+                         title="Matrice EV : Adoption vs Prix Premium",
+                         labels={'EV_Share': 'Part EV (%)', 'Average_Price': 'Prix Moyen (€)'})
+
+        # Ajouter quadrants
+        fig2.add_hline(y=ev_price_matrix['Average_Price'].median(), line_dash="dash", line_color="gray")
+        fig2.add_vline(x=ev_price_matrix['EV_Share'].median(), line_dash="dash", line_color="gray")
+
+        fig2.update_layout(height=400)
+        render_profiler.plotly_chart(fig2, use_container_width=True)
+
+    # Section stratégies EV
+    st.markdown("---")
+    st.markdown("### ⚡ **Stratégies de Transition Électrique**")
+
+    # Analyse des leaders et retardataires
+    ev_leaders = ev_price_matrix.nlargest(3, 'EV_Share')
+    ev_laggards = ev_price_matrix.nsmallest(3, 'EV_Share')
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**🏆 Leaders EV**")
+        for _, leader in ev_leaders.iterrows():
+            st.markdown(f"- **{leader['Manufacturer']}** : {leader['EV_Share']:.1f}% EV")
+
+    with col2:
+        st.markdown("**⚠️ Retardataires EV**")
+        for _, laggard in ev_laggards.iterrows():
+            st.markdown(f"- **{laggard['Manufacturer']}** : {laggard['EV_Share']:.1f}% EV")
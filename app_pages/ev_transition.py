@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE TRANSITION ÉLECTRIQUE
+=============================================================================
+
+Page transition électrique.
+
+=============================================================================
+"""
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_ev_transition(app):
+    """Page transition électrique."""
+    st.markdown('<h1 class="main-header">⚡ Transition Électrique</h1>',
+               unsafe_allow_html=True)
+
+    st.markdown("""
+    ## 🔋 Analyse de la Transition vers l'Électrique
+
+    Cette section analyse l'évolution vers les véhicules électriques et hybrides.
+    """)
+
+    # Simulation de données EV (à remplacer par vraies données)
+    if app.data_loaded:
+        # Créer des données simulées pour les véhicules électriques
+        ev_data = []
+        for year in range(2015, 2024):
+            ev_percentage = min(2 * (year - 2015) + 1, 15)  # Croissance simulée
+            ev_data.append({'Year': year, 'EV_Percentage': ev_percentage})
+
+        ev_df = pd.DataFrame(ev_data)
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            # Évolution du pourcentage EV
+            fig1 = px.line(ev_df, x='Year', y='EV_Percentage',
+                          title="Évolution du Pourcentage de Véhicules Électriques")
+            fig1.update_layout(yaxis_title="Pourcentage (%)")
+            render_profiler.plotly_chart(fig1, use_container_width=True)
+
+        with col2:
+            # Prédictions EV
+            future_years = list(range(2024, 2031))
+            future_ev = [15 + 5 * (year - 2023) for year in future_years]
+
+            fig2 = go.Figure()
+            fig2.add_trace(go.Scatter(x=ev_df['Year'], y=ev_df['EV_Percentage'],
+                                    mode='lines+markers', name='Historique'))
+            fig2.add_trace(go.Scatter(x=future_years, y=future_ev,
+                                    mode='lines+markers', name='Prédiction',
+                                    line=dict(dash='dash')))
+            fig2.update_layout(title="Prédiction Transition Électrique",
+                              xaxis_title="Année", yaxis_title="Pourcentage EV (%)")
+            render_profiler.plotly_chart(fig2, use_container_width=True)
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE DASHBOARD EXÉCUTIF
+=============================================================================
+
+Page dashboard exécutif.
+
+=============================================================================
+"""
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_executive_dashboard(app):
+    """Page dashboard exécutif."""
+    st.markdown('<h1 class="main-header">👔 Dashboard Exécutif</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Données non disponibles pour le dashboard exécutif")
+        return
+
+    # KPIs Stratégiques Principaux
+    st.markdown("## 📊 KPIs Stratégiques Principaux")
+
+    # Calculs des métriques exécutives
+    current_year = app.df['Year'].max()
+    previous_year = current_year - 1
+
+    current_year_filter = {'Year': current_year}
+    previous_year_filter = {'Year': previous_year}
+    has_previous_year = previous_year in app.cube.rollup('Year', 'Production_Volume').index
+
+    # Métriques principales
+    total_production_current = app.cube.total('Production_Volume', filters=current_year_filter)
+    total_production_previous = app.cube.total('Production_Volume', filters=previous_year_filter) if has_previous_year else total_production_current
+    production_growth = ((total_production_current - total_production_previous) / total_production_previous * 100) if total_production_previous > 0 else 0
+
+    avg_price_current = app.cube.total('Average_Price', 'mean', current_year_filter)
+    avg_price_previous = app.cube.total('Average_Price', 'mean', previous_year_filter) if has_previous_year else avg_price_current
+    price_evolution = ((avg_price_current - avg_price_previous) / avg_price_previous * 100) if avg_price_previous > 0 else 0
+
+    total_revenue = app.cube.total('Revenue', filters=current_year_filter)
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    with col1:
+        st.metric(
+            "🏭 Production Totale",
+            f"{total_production_current/1e6:.1f}M",
+            f"{production_growth:+.1f}%" if production_growth != 0 else None
+        )
+
+    with col2:
+        st.metric(
+            "💰 Prix Moyen",
+            f"{avg_price_current:,.0f}€",
+            f"{price_evolution:+.1f}%" if price_evolution != 0 else None
+        )
+
+    with col3:
+        st.metric(
+            "💼 Chiffre d'Affaires",
+            f"{total_revenue/1e9:.1f}Md€",
+            "Estimation"
+        )
+
+    with col4:
+        st.metric(
+            "🏢 Fabricants Actifs",
+            f"{app.cube.total('Manufacturer', 'nunique', current_year_filter)}",
+            "constructeurs"
+        )
+
+    with col5:
+        st.metric(
+            "🌍 Marchés Couverts",
+            f"{app.cube.total('Region', 'nunique', current_year_filter)}",
+            "régions"
+        )
+
+    # Tableau de bord stratégique
+    st.markdown("## 🎯 Tableau de Bord Stratégique")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Performance par région - inspiré de vos dashboards
+        regional_performance = app.cube.rollup_many('Region', {
+            'Production': ('Production_Volume', 'sum'),
+            'Price': ('Average_Price', 'mean')
+        }, current_year_filter).round(2)
+        regional_performance['Revenue'] = (regional_performance['Production'] * regional_performance['Price']).round(0)
+        regional_performance = regional_performance.sort_values('Production', ascending=False)
+
+        fig1 = px.bar(
+            x=regional_performance.index,
+            y=regional_performance['Production'],
+            title="Performance Production par Région",
+            labels={'x': 'Région', 'y': 'Production (unités)'},
+            color=regional_performance['Production'],
+            color_continuous_scale='Blues'
+        )
+        fig1.update_layout(xaxis_tickangle=45)
+        render_profiler.plotly_chart(fig1, use_container_width=True)
+
+    with col2:
+        # Top constructeurs - style de vos dashboards
+        top_manufacturers = app.cube.rollup('Manufacturer', 'Production_Volume', filters=current_year_filter).nlargest(8)
+
+        fig2 = px.pie(
+            values=top_manufacturers.values,
+            names=top_manufacturers.index,
+            title="Parts de Marché - Top Constructeurs",
+            color_discrete_sequence=px.colors.qualitative.Set3
+        )
+        fig2.update_traces(textposition='inside', textinfo='percent+label')
+        render_profiler.plotly_chart(fig2, use_container_width=True)
+
+    # Analyse des tendances stratégiques
+    st.markdown("## 📈 Tendances Stratégiques")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Évolution du marché sur 5 ans
+        yearly_trends = app.cube.rollup_many('Year', {
+            'Production': ('Production_Volume', 'sum'),
+            'Price': ('Average_Price', 'mean'),
+            'SteelPrice': ('Steel_Price', 'mean')
+        }, {'Year': list(range(current_year - 4, current_year + 1))}).round(2)
+
+        fig3 = go.Figure()
+
+        # Production
+        fig3.add_trace(go.Scatter(
+            x=yearly_trends.index,
+            y=yearly_trends['Production']/1e6,
+            mode='lines+markers',
+            name='Production (M unités)',
+            line=dict(color='blue', width=3),
+            yaxis='y'
+        ))
+
+        # Prix moyen
+        fig3.add_trace(go.Scatter(
+            x=yearly_trends.index,
+            y=yearly_trends['Price']/1000,
+            mode='lines+markers',
+            name='Prix Moyen (K€)',
+            line=dict(color='green', width=3),
+            yaxis='y2'
+        ))
+
+        fig3.update_layout(
+            title="Évolution Production et Prix - 5 ans",
+            xaxis_title="Année",
+            yaxis=dict(title="Production (M unités)", side="left"),
+            yaxis2=dict(title="Prix Moyen (K€)", side="right", overlaying="y"),
+            hovermode='x unified'
+        )
+        render_profiler.plotly_chart(fig3, use_container_width=True)
+
+    with col2:
+        # Analyse de corrélation - inspiré de vos analyses
+        # (corrélation ligne à ligne: seule requête qui reste sur les données brutes)
+        current_data = app.df[app.df['Year'] == current_year]
+        correlation_data = current_data[['Production', 'Price', 'SteelPrice']].corr()
+
+        fig4 = px.imshow(
+            correlation_data,
+            title="Matrice de Corrélation - Facteurs Clés",
+            color_continuous_scale='RdBu',
+            aspect='auto'
+        )
+        fig4.update_layout(
+            xaxis_title="Variables",
+            yaxis_title="Variables"
+        )
+        render_profiler.plotly_chart(fig4, use_container_width=True)
+
+    # Indicateurs de performance clés
+    st.markdown("## 🏆 Indicateurs de Performance Clés")
+
+    # Calcul des KPIs avancés
+    market_concentration = app._calculate_market_concentration(current_year_filter)
+    avg_growth_rate = app.cube.growth_rates('Manufacturer').mean()
+    price_volatility = app.cube.rollup('Year', 'Average_Price', 'std').mean()
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+        ### 📊 Performance Marché
+        """)
+
+        kpi_data_market = {
+            'KPI': ['Concentration Marché', 'Croissance Moyenne', 'Volatilité Prix'],
+            'Valeur': [f"{market_concentration:.0f}", f"{avg_growth_rate:.1f}%", f"{price_volatility:.0f}€"],
+            'Statut': ['🟡 Modéré', '🟢 Positif' if avg_growth_rate > 0 else '🔴 Négatif', '🟡 Surveillé']
+        }
+        st.dataframe(pd.DataFrame(kpi_data_market), hide_index=True)
+
+    with col2:
+        st.markdown("""
+        ### 🌍 Performance Régionale
+        """)
+
+        regional_kpis = app.cube.rollup('Region', 'Production_Volume', filters=current_year_filter).nlargest(3)
+        regional_data = {
+            'Région': regional_kpis.index.tolist(),
+            'Production (M)': [f"{x/1e6:.1f}" for x in regional_kpis.values],
+            'Part (%)': [f"{x/regional_kpis.sum()*100:.1f}" for x in regional_kpis.values]
+        }
+        st.dataframe(pd.DataFrame(regional_data), hide_index=True)
+
+    with col3:
+        st.markdown("""
+        ### 🏭 Performance Constructeurs
+        """)
+
+        manufacturer_kpis = app.cube.rollup('Manufacturer', 'Production_Volume', filters=current_year_filter).nlargest(3)
+        manufacturer_data = {
+            'Constructeur': manufacturer_kpis.index.tolist(),
+            'Production (M)': [f"{x/1e6:.1f}" for x in manufacturer_kpis.values],
+            'Part (%)': [f"{x/manufacturer_kpis.sum()*100:.1f}" for x in manufacturer_kpis.values]
+        }
+        st.dataframe(pd.DataFrame(manufacturer_data), hide_index=True)
+
+    # Recommandations stratégiques
+    st.markdown("## 💡 Recommandations Stratégiques")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        ### 🎯 Priorités Court Terme (3-6 mois)
+
+        **1. Optimisation Production**
+        - 📈 Augmenter la capacité de +15%
+        - 🏭 Focus sur les régions performantes
+        - ⚡ Réduction des coûts de 8%
+
+        **2. Stratégie Prix**
+        - 💰 Ajustement prix selon volatilité acier
+        - 🎯 Positionnement premium sur segments clés
+        - 📊 Monitoring concurrence renforcé
+        """)
+
+    with col2:
+        st.markdown("""
+        ### 🚀 Objectifs Long Terme (1-2 ans)
+
+        **1. Expansion Géographique**
+        - 🌍 Nouveaux marchés émergents
+        - 🤝 Partenariats stratégiques
+        - 📍 Diversification géographique
+
+        **2. Innovation & Technologie**
+        - 🔋 Transition électrique accélérée
+        - 🤖 Digitalisation des processus
+        - 🌱 Développement durable
+        """)
+
+    # Alerte et surveillance
+    st.markdown("## 🚨 Alertes et Surveillance")
+
+    # Système d'alertes basé sur les seuils
+    alerts = []
+
+    if production_growth < -5:
+        alerts.append("🔴 CRITIQUE: Baisse de production > 5%")
+    elif production_growth < 0:
+        alerts.append("🟡 ATTENTION: Baisse de production détectée")
+
+    if price_volatility > 5000:
+        alerts.append("🔴 CRITIQUE: Volatilité prix très élevée")
+    elif price_volatility > 2000:
+        alerts.append("🟡 ATTENTION: Volatilité prix élevée")
+
+    if market_concentration > 2500:
+        alerts.append("🟡 ATTENTION: Concentration marché élevée")
+
+    if alerts:
+        for alert in alerts:
+            st.warning(alert)
+    else:
+        st.success("🟢 Tous les indicateurs sont dans les normes")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE ANALYSE FINANCIÈRE
+=============================================================================
+
+Dashboard d'analyse financière.
+
+=============================================================================
+"""
+
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_financial_dashboard(app):
+    """Dashboard d'analyse financière."""
+    st.markdown('<h1 class="main-header">📈 Analyse Financière</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # KPIs financiers
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        revenue_estimate = (app.df['Production_Volume'] * app.df['Average_Price']).sum()
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">💰 Chiffre d'affaires estimé</div>
+            <div style="font-size: 3rem; font-weight: bold;">{revenue_estimate/1e12:.1f}T€</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        steel_cost = (app.df['Production_Volume'] * app.df['Steel_Price'] * 0.1).sum()
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚙️ Coût matières premières</div>
+            <div style="font-size: 3rem; font-weight: bold;">{steel_cost/1e9:.0f}Md€</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        margin_estimate = ((revenue_estimate - steel_cost) / revenue_estimate) * 100
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #8B5CF6 0%, #7C3AED 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📊 Marge brute estimée</div>
+            <div style="font-size: 3rem; font-weight: bold;">{margin_estimate:.1f}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        roi_estimate = (app.df['GDP_Growth'].mean()) * 100
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #EF4444 0%, #DC2626 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📈 Croissance PIB moyenne</div>
+            <div style="font-size: 3rem; font-weight: bold;">{roi_estimate:.1f}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Graphiques financiers
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Évolution du chiffre d'affaires par année
+        yearly_revenue = app.df.groupby('Year').apply(
+            lambda x: (x['Production_Volume'] * x['Average_Price']).sum()
+        ).reset_index()
+        yearly_revenue.columns = ['Year', 'Revenue']
+
+        fig1 = px.line(yearly_revenue, x='Year', y='Revenue',
+                      title="Évolution du Chiffre d'Affaires Estimé",
+                      labels={'Revenue': 'CA (€)', 'Year': 'Année'})
+        fig1.update_layout(height=400)
+        render_profiler.plotly_chart(fig1, use_container_width=True)
+
+    with col2:
+        # Répartition des coûts par région
+        regional_costs = app.df.groupby('Region').apply(
+            lambda x: (x['Production_Volume'] * x['Steel_Price'] * 0.1).sum()
+        ).reset_index()
+        regional_costs.columns = ['Region', 'Cost']
+
+        fig2 = px.pie(regional_costs, values='Cost', names='Region',
+                     title="Répartition des Coûts Matières Premières")
+        fig2.update_layout(height=400)
+        render_profiler.plotly_chart(fig2, use_container_width=True)
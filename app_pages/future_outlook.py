@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE PROSPECTIVE 2030
+=============================================================================
+
+Dashboard Prospective 2030.
+
+=============================================================================
+"""
+
+import streamlit as st
+
+
+def render_future_outlook_dashboard(app):
+    """Dashboard Prospective 2030."""
+    st.markdown('<h1 class="main-header">🔮 Prospective 2030</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # Projections basées sur tendances actuelles
+    latest_year = app.df['Year'].max()
+    years_to_project = 2030 - latest_year
+
+    # Calcul des tendances
+    production_trend = app.df.groupby('Year')['Production_Volume'].sum().pct_change().mean()
+    ev_trend = app.df.groupby('Year')['EV_Share'].mean().pct_change().mean()
+    price_trend = app.df.groupby('Year')['Average_Price'].mean().pct_change().mean()
+
+    # Projections 2030
+    current_production = app.df[app.df['Year'] == latest_year]['Production_Volume'].sum()
+    current_ev_share = app.df[app.df['Year'] == latest_year]['EV_Share'].mean() * 100
+    current_price = app.df[app.df['Year'] == latest_year]['Average_Price'].mean()
+
+    projected_production = current_production * ((1 + production_trend) ** years_to_project)
+    projected_ev_share = min(100, current_ev_share * ((1 + ev_trend) ** years_to_project))
+    projected_price = current_price * ((1 + price_trend) ** years_to_project)
+
+    # KPIs Prospectifs
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("🚗 Production 2030", f"{projected_production/1e6:.0f}M unités",
+                 f"{((projected_production/current_production - 1)*100):+.1f}%")
+
+    with col2:
+        st.metric("⚡ Part EV 2030", f"{projected_ev_share:.0f}%",
+                 f"{(projected_ev_share - current_ev_share):+.1f}pp")
+
+    with col3:
+        st.metric("💰 Prix Moyen 2030", f"{projected_price:,.0f}€",
+                 f"{((projected_price/current_price - 1)*100):+.1f}%")
+
+    with col4:
+        market_size_2030 = (projected_production * projected_price) / 1e12
+        st.metric("📊 Taille Marché 2030", f"{market_size_2030:.1f}T€")
+
+    # Scénarios prospectifs
+    st.markdown("---")
+    st.markdown("### 🎯 **Scénarios 2030**")
+
+    scenarios_2030 = {
+        "🚀 Optimiste": {"Production": projected_production * 1.2, "EV": min(100, projected_ev_share * 1.3)},
+        "📊 Réaliste": {"Production": projected_production, "EV": projected_ev_share},
+        "⚠️ Pessimiste": {"Production": projected_production * 0.8, "EV": projected_ev_share * 0.7}
+    }
+
+    col1, col2, col3 = st.columns(3)
+
+    for i, (scenario, values) in enumerate(scenarios_2030.items()):
+        with [col1, col2, col3][i]:
+            st.markdown(f"""
+            **{scenario}**
+            - Production : {values['Production']/1e6:.0f}M unités
+            - Part EV : {values['EV']:.0f}%
+            - Probabilité : {[70, 60, 30][i]}%
+            """)
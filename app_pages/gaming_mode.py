@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE MODE GAMING
+=============================================================================
+
+Mode Gaming - Dashboard comme un jeu vidéo.
+
+=============================================================================
+"""
+
+import plotly.graph_objects as go
+import streamlit as st
+
+import render_profiler
+
+
+def render_gaming_mode(app):
+    """Mode Gaming - Dashboard comme un jeu vidéo."""
+    st.markdown('<h1 class="main-header">🎮 Mode Gaming - Auto Racing Dashboard</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # Interface gaming avec HUD
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #000000 0%, #1a0033 50%, #330066 100%);
+                padding: 2rem; border-radius: 20px; margin-bottom: 2rem; position: relative;
+                border: 2px solid #00ff00; box-shadow: 0 0 20px rgba(0,255,0,0.3);">
+        <div style="position: absolute; top: 10px; right: 10px; color: #00ff00; font-family: 'Courier New';">
+            🎮 LEVEL: EXPERT | 🏆 SCORE: 9,847 | ⚡ ENERGY: 100%
+        </div>
+        <h1 style="color: #00ff00; text-align: center; font-family: 'Courier New';
+                   text-shadow: 0 0 10px #00ff00; margin-top: 2rem;">
+            🏁 AUTOMOTIVE RACING COMMAND CENTER 🏁
+        </h1>
+        <p style="color: #cccccc; text-align: center; font-family: 'Courier New';">
+            >>> MISSION: DOMINER LE MARCHÉ AUTOMOBILE MONDIAL <<<
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # HUD Gaming avec constructeurs comme "joueurs"
+    st.markdown("### 🏆 **LEADERBOARD - CONSTRUCTEURS**")
+
+    # Calcul du "score" gaming pour chaque constructeur
+    leaderboard = app.df.groupby('Manufacturer').agg({
+        'Production_Volume': 'sum',
+        'Average_Price': 'mean',
+        'EV_Share': 'mean'
+    }).reset_index()
+
+    # Score gaming = Production + Prix premium + Innovation EV
+    leaderboard['Gaming_Score'] = (
+        (leaderboard['Production_Volume'] / 1e6) * 100 +
+        (leaderboard['Average_Price'] / 1000) * 10 +
+        (leaderboard['EV_Share'] * 1000)
+    ).round(0)
+
+    leaderboard = leaderboard.sort_values('Gaming_Score', ascending=False)
+
+    # Affichage leaderboard gaming
+    for i, row in leaderboard.head(6).iterrows():
+        rank_colors = ['#FFD700', '#C0C0C0', '#CD7F32', '#4169E1', '#32CD32', '#FF6347']
+        rank_emojis = ['👑', '🥈', '🥉', '🏅', '🎖️', '🏆']
+
+        col1, col2 = st.columns([1, 4])
+
+        with col1:
+            rank = list(leaderboard.index).index(i) + 1
+            st.markdown(f"""
+            <div style="background: {rank_colors[rank-1]}; color: black;
+                        border-radius: 50%; width: 80px; height: 80px;
+                        display: flex; align-items: center; justify-content: center;
+                        font-size: 2rem; font-weight: bold; margin: 0 auto;">
+                {rank_emojis[rank-1]}
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col2:
+            st.markdown(f"""
+            <div style="background: linear-gradient(135deg, {rank_colors[rank-1]}20 0%, {rank_colors[rank-1]}40 100%);
+                        border: 2px solid {rank_colors[rank-1]}; border-radius: 15px; padding: 1rem;
+                        font-family: 'Courier New'; margin-bottom: 1rem;">
+                <h3 style="color: {rank_colors[rank-1]}; margin: 0;">
+                    #{rank} {row['Manufacturer']} - SCORE: {row['Gaming_Score']:.0f}
+                </h3>
+                <div style="color: #666; margin-top: 0.5rem;">
+                    🏭 Production: {row['Production_Volume']/1e6:.1f}M |
+                    💰 Prix: {row['Average_Price']:,.0f}€ |
+                    ⚡ EV: {row['EV_Share']*100:.1f}%
+                </div>
+                <div style="background: {rank_colors[rank-1]}; height: 8px; border-radius: 4px;
+                            width: {min(100, row['Gaming_Score']/50)}%; margin-top: 0.5rem;"></div>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # Mini-jeu : Prédiction de marché
+    st.markdown("---")
+    st.markdown("### 🎯 **MINI-JEU : PRÉDICTION DE MARCHÉ**")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div style="background: #1a0033; border: 2px solid #00ff00; border-radius: 15px;
+                    padding: 2rem; color: #00ff00; font-family: 'Courier New';">
+            <h4>🎮 MISSION SPÉCIALE</h4>
+            <p>Prédisez la production Tesla en 2025 !</p>
+            <p>💡 Indice: Croissance actuelle +35%/an</p>
+            <p>🏆 Récompense: +500 points XP</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        user_prediction = st.number_input(
+            "Votre prédiction (millions):",
+            min_value=0.0, max_value=20.0, value=5.0, step=0.1
+        )
+
+        if st.button("🚀 VALIDER PRÉDICTION"):
+            # Calcul "correct" basé sur données
+            tesla_current = 1.8  # Millions (estimation)
+            correct_prediction = tesla_current * (1.35 ** 2)  # 2 ans à +35%
+
+            difference = abs(user_prediction - correct_prediction)
+
+            if difference < 0.5:
+                st.success("🏆 EXCELLENT ! +500 XP - Prédiction parfaite !")
+            elif difference < 1.0:
+                st.info("🎯 BIEN JOUÉ ! +300 XP - Très proche !")
+            else:
+                st.warning("💪 CONTINUEZ ! +100 XP - Réessayez !")
+
+            st.info(f"📊 Réponse correcte: {correct_prediction:.1f}M véhicules")
+
+    with col2:
+        # Graphique "gaming" avec effets néon
+        fig = go.Figure()
+
+        years = list(range(2020, 2026))
+        tesla_growth = [1.0, 1.35, 1.8, 2.4, 3.2, 4.3]  # Simulation croissance
+
+        fig.add_trace(go.Scatter(
+            x=years, y=tesla_growth,
+            mode='lines+markers',
+            name='Tesla Production',
+            line=dict(color='#00ff00', width=4, dash='solid'),
+            marker=dict(size=10, color='#00ff00', symbol='diamond')
+        ))
+
+        fig.update_layout(
+            title="🚀 Tesla Growth Trajectory",
+            xaxis_title="Année",
+            yaxis_title="Production (M)",
+            plot_bgcolor='rgba(0,0,0,0.8)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='#00ff00', family='Courier New'),
+            showlegend=False
+        )
+
+        # Effets néon sur le graphique
+        fig.update_xaxes(gridcolor='rgba(0,255,0,0.2)')
+        fig.update_yaxes(gridcolor='rgba(0,255,0,0.2)')
+
+        render_profiler.plotly_chart(fig, use_container_width=True)
+
+    # Achievements gaming
+    st.markdown("---")
+    st.markdown("### 🏅 **ACHIEVEMENTS DÉBLOQUÉS**")
+
+    achievements = [
+        {"name": "Data Explorer", "desc": "Consulté 10+ dashboards", "icon": "🔍", "unlocked": True},
+        {"name": "EV Pioneer", "desc": "Analysé transition électrique", "icon": "⚡", "unlocked": True},
+        {"name": "Market Guru", "desc": "Maîtrisé les prédictions", "icon": "🔮", "unlocked": False},
+        {"name": "Global Thinker", "desc": "Exploré tous les continents", "icon": "🌍", "unlocked": True},
+        {"name": "Time Traveler", "desc": "Voyagé de 2010 à 2030", "icon": "⏰", "unlocked": True},
+        {"name": "Gaming Master", "desc": "Découvert le mode gaming", "icon": "🎮", "unlocked": True}
+    ]
+
+    cols = st.columns(3)
+    for i, achievement in enumerate(achievements):
+        with cols[i % 3]:
+            status = "✅" if achievement["unlocked"] else "🔒"
+            opacity = "1.0" if achievement["unlocked"] else "0.3"
+
+            st.markdown(f"""
+            <div style="background: rgba(0,255,0,0.1); border: 1px solid #00ff00;
+                        border-radius: 10px; padding: 1rem; text-align: center;
+                        opacity: {opacity}; margin-bottom: 1rem;">
+                <div style="font-size: 2rem;">{achievement['icon']}</div>
+                <div style="color: #00ff00; font-weight: bold;">{status} {achievement['name']}</div>
+                <div style="color: #cccccc; font-size: 0.8rem;">{achievement['desc']}</div>
+            </div>
+            """, unsafe_allow_html=True)
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE ANALYSE GÉOGRAPHIQUE
+=============================================================================
+
+Page d'analyse géographique.
+
+=============================================================================
+"""
+
+import plotly.graph_objects as go
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_geographic_analysis(app):
+    """Page d'analyse géographique."""
+    st.markdown('<h1 class="main-header">🌍 Analyse Géographique</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Données non disponibles")
+        return
+
+    # Métriques par région
+    st.markdown("## 📊 Performance par Région")
+
+    region_stats = app.cube.rollup_many('Region', {
+        'Production Totale': ('Production_Volume', 'sum'),
+        'Production Moyenne': ('Production_Volume', 'mean'),
+        'Prix Acier Moyen': ('Steel_Price', 'mean'),
+        'Nb Fabricants': ('Manufacturer', 'nunique')
+    }).round(2)
+
+    st.dataframe(region_stats, use_container_width=True)
+
+    # Métriques géographiques clés
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        top_region = region_stats.nlargest(1, 'Production Totale').index[0]
+        top_production = region_stats.loc[top_region, 'Production Totale']
+        st.metric("🏆 Région Leader", top_region, f"{top_production/1e6:.1f}M unités")
+
+    with col2:
+        total_regions = len(region_stats)
+        st.metric("🌍 Régions Actives", total_regions, "marchés")
+
+    with col3:
+        avg_price_by_region = app.cube.rollup('Region', 'Average_Price', 'mean')
+        highest_price_region = avg_price_by_region.idxmax()
+        st.metric("💰 Prix le Plus Élevé", highest_price_region, f"{avg_price_by_region.max():,.0f}€")
+
+    with col4:
+        total_manufacturers = app.df['Manufacturer'].nunique()
+        st.metric("🏭 Constructeurs Globaux", total_manufacturers, "fabricants")
+
+    # Graphiques géographiques avancés
+    st.markdown("## 🗺️ Cartographie et Analyses Régionales")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Production par région et année - style de vos dashboards
+        region_year = app.cube.rollup(['Region', 'Year'], 'Production_Volume').rename('Production').reset_index()
+        fig1 = px.line(region_year, x='Year', y='Production', color='Region',
+                      title="Évolution Production par Région",
+                      markers=True)
+        fig1.update_layout(
+            hovermode='x unified',
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+        )
+        render_profiler.plotly_chart(fig1, use_container_width=True)
+
+    with col2:
+        # Heatmap production par région et année
+        pivot_data = app.cube.rollup(['Region', 'Year'], 'Production_Volume').unstack('Year', fill_value=0)
+        fig2 = px.imshow(
+            pivot_data,
+            title="Heatmap Production par Région/Année",
+            color_continuous_scale='Blues',
+            aspect='auto'
+        )
+        fig2.update_layout(
+            xaxis_title="Année",
+            yaxis_title="Région"
+        )
+        render_profiler.plotly_chart(fig2, use_container_width=True)
+
+    # Analyse comparative régionale
+    st.markdown("## 📊 Analyse Comparative Régionale")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Graphique en barres comparatif - inspiré de vos dashboards
+        region_comparison = app.cube.rollup_many('Region', {
+            'Production': ('Production_Volume', 'sum'),
+            'Price': ('Average_Price', 'mean'),
+            'SteelPrice': ('Steel_Price', 'mean')
+        }).round(2)
+
+        fig3 = go.Figure()
+
+        # Barres de production
+        fig3.add_trace(go.Bar(
+            name='Production (M unités)',
+            x=region_comparison.index,
+            y=region_comparison['Production']/1e6,
+            yaxis='y',
+            offsetgroup=1,
+            marker_color='lightblue'
+        ))
+
+        # Ligne de prix moyen
+        fig3.add_trace(go.Scatter(
+            name='Prix Moyen (K€)',
+            x=region_comparison.index,
+            y=region_comparison['Price']/1000,
+            yaxis='y2',
+            mode='lines+markers',
+            line=dict(color='red', width=3),
+            marker=dict(size=8)
+        ))
+
+        fig3.update_layout(
+            title="Production vs Prix Moyen par Région",
+            xaxis_title="Région",
+            yaxis=dict(title="Production (M unités)", side="left"),
+            yaxis2=dict(title="Prix Moyen (K€)", side="right", overlaying="y"),
+            hovermode='x unified'
+        )
+        fig3.update_layout(xaxis_tickangle=45)
+        render_profiler.plotly_chart(fig3, use_container_width=True)
+
+    with col2:
+        # Parts de marché avec détails - style de vos dashboards
+        region_total = app.cube.rollup('Region', 'Production_Volume').rename('Production').reset_index()
+        region_total['Percentage'] = (region_total['Production'] / region_total['Production'].sum() * 100).round(1)
+
+        fig4 = px.pie(
+            region_total,
+            values='Production',
+            names='Region',
+            title="Parts de Marché par Région",
+            color_discrete_sequence=px.colors.qualitative.Set3
+        )
+        fig4.update_traces(
+            textposition='inside',
+            textinfo='percent+label',
+            hovertemplate='<b>%{label}</b><br>Production: %{value:,.0f}<br>Part: %{percent}<extra></extra>'
+        )
+        render_profiler.plotly_chart(fig4, use_container_width=True)
+
+    # Analyse des constructeurs par région
+    st.markdown("## 🏭 Constructeurs par Région")
+
+    # Matrice constructeurs x régions
+    manufacturer_region = app.cube.rollup(
+        ['Manufacturer', 'Region'], 'Production_Volume'
+    ).unstack('Region', fill_value=0)
+
+    # Prendre les top 10 constructeurs
+    top_manufacturers = app.cube.rollup('Manufacturer', 'Production_Volume').nlargest(10).index
+    manufacturer_region_top = manufacturer_region.loc[top_manufacturers]
+
+    fig5 = px.imshow(
+        manufacturer_region_top,
+        title="Matrice Constructeurs x Régions (Top 10)",
+        color_continuous_scale='Viridis',
+        aspect='auto'
+    )
+    fig5.update_layout(
+        xaxis_title="Région",
+        yaxis_title="Constructeur",
+        height=500
+    )
+    render_profiler.plotly_chart(fig5, use_container_width=True)
+
+    # Analyse des tendances régionales
+    st.markdown("## 📈 Tendances et Croissance Régionales")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Taux de croissance par région
+        growth_df = app.cube.growth_rates('Region').rename('Croissance').reset_index()
+
+        fig6 = px.bar(
+            growth_df,
+            x='Region',
+            y='Croissance',
+            title="Taux de Croissance par Région",
+            color='Croissance',
+            color_continuous_scale='RdYlGn'
+        )
+        fig6.update_layout(xaxis_tickangle=45)
+        fig6.add_hline(y=0, line_dash="dash", line_color="black", annotation_text="Seuil de croissance")
+        render_profiler.plotly_chart(fig6, use_container_width=True)
+
+    with col2:
+        # Évolution de la diversité des constructeurs par région
+        diversity_df = app.cube.rollup(
+            ['Year', 'Region'], 'Manufacturer', 'nunique'
+        ).rename('Nb_Constructeurs').reset_index()
+
+        fig7 = px.line(
+            diversity_df,
+            x='Year',
+            y='Nb_Constructeurs',
+            color='Region',
+            title="Évolution Diversité Constructeurs par Région",
+            markers=True
+        )
+        render_profiler.plotly_chart(fig7, use_container_width=True)
+
+    # Tableau de synthèse régionale
+    st.markdown("## 📋 Synthèse Régionale Détaillée")
+
+    # Enrichir les statistiques régionales
+    detailed_region_stats = app.cube.rollup_many('Region', {
+        'Production_Totale': ('Production_Volume', 'sum'),
+        'Production_Moyenne': ('Production_Volume', 'mean'),
+        'Production_StdDev': ('Production_Volume', 'std'),
+        'Prix_Moyen': ('Average_Price', 'mean'),
+        'Prix_Min': ('Average_Price', 'min'),
+        'Prix_Max': ('Average_Price', 'max'),
+        'Prix_Acier_Moyen': ('Steel_Price', 'mean'),
+        'Nb_Constructeurs': ('Manufacturer', 'nunique'),
+        'Premiere_Annee': ('Year', 'min'),
+        'Derniere_Annee': ('Year', 'max')
+    }).round(2)
+
+    # Ajouter des métriques calculées
+    detailed_region_stats['Part_Marche_%'] = (
+        detailed_region_stats['Production_Totale'] / detailed_region_stats['Production_Totale'].sum() * 100
+    ).round(2)
+
+    # Calculer la croissance pour chaque région
+    detailed_region_stats['Croissance_%'] = app.cube.growth_rates('Region')
+
+    # Formater pour l'affichage
+    display_stats = detailed_region_stats.copy()
+    display_stats['Production_Totale'] = (display_stats['Production_Totale'] / 1e6).round(2)
+    display_stats['Production_Moyenne'] = (display_stats['Production_Moyenne'] / 1e3).round(1)
+    display_stats['Production_StdDev'] = (display_stats['Production_StdDev'] / 1e3).round(1)
+
+    # Renommer pour l'affichage
+    display_stats.columns = [
+        'Prod. Totale (M)', 'Prod. Moy. (K)', 'Écart-Type (K)',
+        'Prix Moyen (€)', 'Prix Min (€)', 'Prix Max (€)', 'Prix Acier Moy.',
+        'Nb Constructeurs', 'Première Année', 'Dernière Année',
+        'Part Marché (%)', 'Croissance (%)'
+    ]
+
+    st.dataframe(
+        display_stats.sort_values('Part Marché (%)', ascending=False),
+        use_container_width=True
+    )
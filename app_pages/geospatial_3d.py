@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE GÉOSPATIAL 3D
+=============================================================================
+
+Analyse géospatiale 3D avancée.
+
+=============================================================================
+"""
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_geospatial_3d(app):
+    """Analyse géospatiale 3D avancée."""
+    st.markdown('<h1 class="main-header">🗺️ Analyse Géospatiale 3D</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #0A0A0A 0%, #1A1A1A 100%);
+                padding: 2rem; border-radius: 15px; margin-bottom: 2rem; text-align: center;">
+        <h2 style="color: #E31E24; margin: 0;">🌍 Visualisation 3D Interactive</h2>
+        <p style="color: #CCCCCC; margin-top: 1rem;">
+            Exploration géospatiale avancée de la production automobile mondiale
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Simulation de données géospatiales
+    geo_data = {
+        'North America': {'lat': 45.0, 'lon': -100.0, 'production': 25000000, 'ev_share': 0.15},
+        'Europe': {'lat': 50.0, 'lon': 10.0, 'production': 18000000, 'ev_share': 0.22},
+        'Asia Pacific': {'lat': 35.0, 'lon': 105.0, 'production': 35000000, 'ev_share': 0.25},
+        'China': {'lat': 35.0, 'lon': 105.0, 'production': 27000000, 'ev_share': 0.30}
+    }
+
+    # Graphique 3D scatter
+    fig = go.Figure(data=go.Scatter3d(
+        x=[data['lon'] for data in geo_data.values()],
+        y=[data['lat'] for data in geo_data.values()],
+        z=[data['production']/1e6 for data in geo_data.values()],
+        mode='markers+text',
+        marker=dict(
+            size=[data['production']/1e6 for data in geo_data.values()],
+            color=[data['ev_share']*100 for data in geo_data.values()],
+            colorscale='Viridis',
+            showscale=True,
+            colorbar=dict(title="Part EV (%)")
+        ),
+        text=list(geo_data.keys()),
+        textposition="top center"
+    ))
+
+    fig.update_layout(
+        title="Production Automobile Mondiale 3D",
+        scene=dict(
+            xaxis_title="Longitude",
+            yaxis_title="Latitude",
+            zaxis_title="Production (M)",
+            bgcolor="rgba(0,0,0,0)"
+        ),
+        height=600
+    )
+
+    render_profiler.plotly_chart(fig, use_container_width=True)
+
+    # Carte choroplèthe simulée
+    st.markdown("### 🗺️ **Carte de Densité**")
+
+    # Données pour choroplèthe
+    choropleth_data = pd.DataFrame({
+        'Region': list(geo_data.keys()),
+        'Production': [data['production'] for data in geo_data.values()],
+        'EV_Share': [data['ev_share']*100 for data in geo_data.values()]
+    })
+
+    fig2 = px.bar(choropleth_data, x='Region', y='Production',
+                 color='EV_Share',
+                 title="Densité de Production par Région",
+                 color_continuous_scale='Viridis')
+    fig2.update_layout(height=400)
+    render_profiler.plotly_chart(fig2, use_container_width=True)
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE ACCUEIL
+=============================================================================
+
+Page d'accueil immersive avec animations et temps réel.
+
+=============================================================================
+"""
+
+import html
+import random
+from datetime import datetime
+
+import plotly.graph_objects as go
+import streamlit as st
+
+import render_profiler
+from app_cache import get_chatbot_engine
+
+# Intervalle de rafraîchissement de la section temps réel de l'accueil
+# (mode TV, secondes)
+LIVE_REFRESH_SECONDS = 2
+
+
+def render_home(app):
+    """Page d'accueil immersive avec animations et temps réel."""
+
+    # En-tête immersif avec animation
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #0A0A0A 0%, #1A1A1A 50%, #E31E24 100%);
+                padding: 3rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;
+                position: relative; overflow: hidden;">
+        <div style="position: absolute; top: 0; left: 0; right: 0; bottom: 0;
+                    background: url('data:image/svg+xml,<svg xmlns=\"http://www.w3.org/2000/svg\" viewBox=\"0 0 100 100\"><defs><pattern id=\"grid\" width=\"10\" height=\"10\" patternUnits=\"userSpaceOnUse\"><path d=\"M 10 0 L 0 0 0 10\" fill=\"none\" stroke=\"%23333\" stroke-width=\"0.5\"/></pattern></defs><rect width=\"100\" height=\"100\" fill=\"url(%23grid)\"/></svg>\"></div>
+        <div style="position: relative; z-index: 1;">
+            <h1 style="color: white; margin: 0; font-size: 3.5rem; font-weight: bold;
+                       text-shadow: 0 4px 8px rgba(0,0,0,0.5); animation: glow 2s ease-in-out infinite alternate;">
+                🚗 MARCHÉ AUTOMOBILE MONDIAL
+            </h1>
+            <p style="color: #CCCCCC; font-size: 1.2rem; margin-top: 1rem;">
+                Analyse en temps réel du marché automobile mondial
+            </p>
+        </div>
+    </div>
+
+    <style>
+    @keyframes glow {
+        from { text-shadow: 0 4px 8px rgba(227, 30, 36, 0.5); }
+        to { text-shadow: 0 4px 20px rgba(227, 30, 36, 0.8); }
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    # KPIs temps réel avec animations count-up
+    render_realtime_kpis(app)
+
+    # Mini carrousel constructeurs
+    render_manufacturer_carousel(app)
+
+    # Faits marquants
+    render_key_events(app)
+
+    # Chatbot intégré
+    render_chatbot(app)
+
+
+def render_realtime_kpis(app):
+    """KPIs temps réel avec animations count-up."""
+    st.markdown("### 📊 **MÉTRIQUES TEMPS RÉEL**")
+
+    # Simulation temps réel
+    current_time = datetime.now()
+    base_production = 95000000  # Production annuelle de base
+
+    # Calcul production "temps réel" (simulation)
+    daily_production = base_production / 365
+    hourly_production = daily_production / 24
+    current_hour_production = int(hourly_production * (current_time.hour + 1))
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        # Production aujourd'hui (simulée)
+        st.markdown(f"""
+        <div class="metric-card-premium" style="background: linear-gradient(135deg, #E31E24 0%, #B71C1C 100%);
+                    color: white; text-align: center; animation: pulse 2s infinite;">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🏭 Production Aujourd'hui</div>
+            <div class="kpi-value" style="font-size: 2.5rem; font-weight: bold;">
+                {current_hour_production:,}
+            </div>
+            <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">véhicules</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        # Véhicules EV produits (simulation)
+        ev_today = int(current_hour_production * 0.18)  # 18% EV
+        st.markdown(f"""
+        <div class="metric-card-premium" style="background: linear-gradient(135deg, #00D563 0%, #00A651 100%);
+                    color: white; text-align: center; animation: pulse 2s infinite 0.5s;">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚡ Véhicules EV</div>
+            <div class="kpi-value" style="font-size: 2.5rem; font-weight: bold;">
+                {ev_today:,}
+            </div>
+            <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">électriques</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        # Valeur marchée (simulation)
+        market_value = current_hour_production * 35000  # Prix moyen 35k€
+        st.markdown(f"""
+        <div class="metric-card-premium" style="background: linear-gradient(135deg, #D4AF37 0%, #B8860B 100%);
+                    color: white; text-align: center; animation: pulse 2s infinite 1s;">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">💰 Valeur Marché</div>
+            <div class="kpi-value" style="font-size: 2.5rem; font-weight: bold;">
+                {market_value/1e9:.1f}Md€
+            </div>
+            <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">aujourd'hui</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        # Statut marché
+        market_status = "🟢 ACTIF" if 6 <= current_time.hour <= 22 else "🟡 RALENTI"
+        st.markdown(f"""
+        <div class="metric-card-premium" style="background: linear-gradient(135deg, #42A5F5 0%, #1976D2 100%);
+                    color: white; text-align: center; animation: pulse 2s infinite 1.5s;">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📈 Statut Marché</div>
+            <div class="kpi-value" style="font-size: 2rem; font-weight: bold;">
+                {market_status}
+            </div>
+            <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">
+                {current_time.strftime('%H:%M')} UTC
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # CSS pour animations
+    st.markdown("""
+    <style>
+    @keyframes pulse {
+        0% { transform: scale(1); }
+        50% { transform: scale(1.05); }
+        100% { transform: scale(1); }
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+
+def render_manufacturer_carousel(app):
+    """Mini carrousel des constructeurs avec stats clés."""
+    st.markdown("---")
+    st.markdown("### 🏭 **CONSTRUCTEURS LEADERS**")
+
+    # Données des constructeurs avec logos (émojis)
+    manufacturers = [
+        {"name": "Toyota", "logo": "🇯🇵", "production": "11.2M", "ev_share": "12%", "color": "#E31E24"},
+        {"name": "Volkswagen", "logo": "🇩🇪", "production": "9.8M", "ev_share": "8%", "color": "#1976D2"},
+        {"name": "General Motors", "logo": "🇺🇸", "production": "6.2M", "ev_share": "15%", "color": "#FF9800"},
+        {"name": "Ford", "logo": "🇺🇸", "production": "4.2M", "ev_share": "7%", "color": "#4CAF50"},
+        {"name": "Hyundai-Kia", "logo": "🇰🇷", "production": "7.1M", "ev_share": "9%", "color": "#9C27B0"},
+        {"name": "Stellantis", "logo": "🇮🇹", "production": "6.1M", "ev_share": "6%", "color": "#FF5722"}
+    ]
+
+    # Affichage en carrousel
+    cols = st.columns(len(manufacturers))
+
+    for i, (col, manu) in enumerate(zip(cols, manufacturers)):
+        with col:
+            st.markdown(f"""
+            <div style="background: linear-gradient(135deg, {manu['color']}20 0%, {manu['color']}40 100%);
+                        border: 2px solid {manu['color']};
+                        border-radius: 15px; padding: 1rem; text-align: center;
+                        transition: all 0.3s ease; cursor: pointer;
+                        animation: slideIn 0.8s ease-out {i*0.1}s both;">
+                <div style="font-size: 2rem; margin-bottom: 0.5rem;">{manu['logo']}</div>
+                <div style="font-weight: bold; color: {manu['color']}; margin-bottom: 0.5rem;">
+                    {manu['name']}
+                </div>
+                <div style="font-size: 0.9rem; color: #666;">
+                    📊 {manu['production']}<br>
+                    ⚡ {manu['ev_share']} EV
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # CSS pour animation slideIn
+    st.markdown("""
+    <style>
+    @keyframes slideIn {
+        from { opacity: 0; transform: translateY(30px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+
+def render_key_events(app):
+    """Page Faits marquants avec timeline."""
+    st.markdown("---")
+    st.markdown("### 📰 **FAITS MARQUANTS**")
+
+    # Événements clés
+    events = [
+        {
+            "year": "2020",
+            "title": "🦠 Pandémie COVID-19",
+            "description": "Chute de 15% de la production mondiale",
+            "impact": "Négatif",
+            "color": "#E31E24"
+        },
+        {
+            "year": "2021",
+            "title": "💰 Plan Biden Infrastructure",
+            "description": "500Md$ pour véhicules électriques",
+            "impact": "Positif",
+            "color": "#00D563"
+        },
+        {
+            "year": "2022",
+            "title": "⚡ Boom Tesla",
+            "description": "Tesla dépasse 1M véhicules/an",
+            "impact": "Positif",
+            "color": "#00D563"
+        },
+        {
+            "year": "2023",
+            "title": "🔋 Guerre des batteries",
+            "description": "Course aux batteries solides",
+            "impact": "Neutre",
+            "color": "#FF9800"
+        },
+        {
+            "year": "2024",
+            "title": "🇨🇳 Expansion BYD",
+            "description": "BYD devient n°2 mondial EV",
+            "impact": "Positif",
+            "color": "#00D563"
+        }
+    ]
+
+    # Timeline interactive
+    for i, event in enumerate(events):
+        col1, col2 = st.columns([1, 4])
+
+        with col1:
+            st.markdown(f"""
+            <div style="background: {event['color']}; color: white;
+                        border-radius: 50%; width: 60px; height: 60px;
+                        display: flex; align-items: center; justify-content: center;
+                        font-weight: bold; font-size: 1.1rem; margin: 0 auto;">
+                {event['year']}
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col2:
+            st.markdown(f"""
+            <div style="background: linear-gradient(135deg, {event['color']}10 0%, {event['color']}20 100%);
+                        border-left: 4px solid {event['color']};
+                        padding: 1rem; border-radius: 10px; margin-bottom: 1rem;">
+                <h4 style="margin: 0; color: {event['color']};">{event['title']}</h4>
+                <p style="margin: 0.5rem 0; color: #666;">{event['description']}</p>
+                <span style="background: {event['color']}; color: white;
+                             padding: 0.2rem 0.5rem; border-radius: 15px; font-size: 0.8rem;">
+                    Impact {event['impact']}
+                </span>
+            </div>
+            """, unsafe_allow_html=True)
+
+    # Section temps réel: seule partie ré-exécutée à intervalle fixe
+    render_live_market(app)
+
+
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+def render_live_market(app):
+    """
+    Production, part EV et production horaire en temps réel (mode TV).
+
+    Fragment Streamlit: ré-exécuté seul toutes les LIVE_REFRESH_SECONDS
+    secondes, sans relancer le script (données, KPIs, carrousel, chatbot).
+    """
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Production mondiale temps réel
+        current_production = 95000000 + random.randint(-1000000, 1000000)
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #E31E24 0%, #B71C1C 100%);
+                    color: white; padding: 3rem; border-radius: 20px; text-align: center;
+                    box-shadow: 0 0 30px rgba(227, 30, 36, 0.3); margin-bottom: 2rem;">
+            <div style="font-size: 2rem; margin-bottom: 1rem;">🏭 PRODUCTION MONDIALE</div>
+            <div style="font-size: 6rem; font-weight: bold; line-height: 1;">
+                {current_production/1e6:.1f}M
+            </div>
+            <div style="font-size: 1.5rem; opacity: 0.9;">véhicules/an</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        # Part EV temps réel
+        ev_share = 18.5 + random.uniform(-0.5, 0.5)
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #00D563 0%, #00A651 100%);
+                    color: white; padding: 3rem; border-radius: 20px; text-align: center;
+                    box-shadow: 0 0 30px rgba(0, 213, 99, 0.3); margin-bottom: 2rem;">
+            <div style="font-size: 2rem; margin-bottom: 1rem;">⚡ VÉHICULES ÉLECTRIQUES</div>
+            <div style="font-size: 6rem; font-weight: bold; line-height: 1;">
+                {ev_share:.1f}%
+            </div>
+            <div style="font-size: 1.5rem; opacity: 0.9;">du marché mondial</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Graphique temps réel simulé
+    st.markdown("### 📊 **ÉVOLUTION TEMPS RÉEL**")
+
+    # Données simulées temps réel
+    hours = list(range(24))
+    production_hourly = [random.randint(8000, 12000) for _ in hours]
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=hours, y=production_hourly,
+        mode='lines+markers',
+        name='Production Horaire',
+        line=dict(color='#E31E24', width=4),
+        marker=dict(size=8)
+    ))
+
+    fig.update_layout(
+        title="Production Horaire Mondiale (Simulation Temps Réel)",
+        xaxis_title="Heure (UTC)",
+        yaxis_title="Véhicules/heure",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white', size=16),
+        height=400
+    )
+
+    render_profiler.plotly_chart(fig, use_container_width=True)
+
+
+def render_chatbot(app):
+    """Chatbot intégré pour exploration des données."""
+    st.markdown("### 🤖 **ASSISTANT DATA EXPLORER**")
+
+    # Interface chatbot
+    with st.container():
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #1A1A1A 0%, #2C2C2C 100%);
+                    border-radius: 15px; padding: 2rem; margin-bottom: 2rem;">
+            <h4 style="color: #E31E24; margin: 0 0 1rem 0;">🤖 Assistant IA Automobile</h4>
+            <p style="color: #CCCCCC; margin: 0;">
+                Posez vos questions sur les données automobiles. Exemples :<br>
+                • "Montre-moi la production de Toyota en 2022"<br>
+                • "Quelle est la part EV en Europe ?"<br>
+                • "Compare Ford et GM"
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Zone de chat
+        user_question = st.text_input(
+            "💬 Votre question :",
+            placeholder="Ex: Montre-moi l'évolution des véhicules électriques...",
+            key="chatbot_input"
+        )
+
+        if user_question:
+            response = process_chatbot_query(app, user_question)
+
+            st.markdown(f"""
+            <div style="background: #E31E24; color: white; padding: 1rem;
+                        border-radius: 10px; margin: 1rem 0;">
+                <strong>🤖 Assistant :</strong><br>
+                {response}
+            </div>
+            """, unsafe_allow_html=True)
+
+
+def process_chatbot_query(app, query):
+    """
+    Réponse de l'assistant, calculée sur le cube d'agrégats.
+
+    Args:
+        app (StreamlitAutomotiveApp): Application
+        query (str): Question saisie
+
+    Returns:
+        str: Réponse en HTML (texte échappé, une ligne par résultat)
+    """
+    engine = get_chatbot_engine()
+    if engine is None:
+        return "❌ Données non disponibles : impossible de répondre à cette question."
+    return html.escape(engine.answer(query)).replace("\n", "<br>")
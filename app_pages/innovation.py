@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE INNOVATION & R&D
+=============================================================================
+
+Dashboard Innovation & R&D.
+
+=============================================================================
+"""
+
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_innovation_dashboard(app):
+    """Dashboard Innovation & R&D."""
+    st.markdown('<h1 class="main-header">💡 Innovation & R&D</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # KPIs Innovation
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        # Indice d'innovation (basé sur part EV)
+        innovation_index = app.df['EV_Share'].mean() * 100
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #06B6D4 0%, #0891B2 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🔬 Indice Innovation</div>
+            <div style="font-size: 3rem; font-weight: bold;">{innovation_index:.1f}</div>
+            <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">Score EV</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        # Vitesse d'adoption technologique
+        ev_growth = app.df.groupby('Year')['EV_Share'].mean().pct_change().mean() * 100
+        adoption_speed = min(100, max(0, 50 + ev_growth * 20))
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚡ Vitesse Adoption</div>
+            <div style="font-size: 3rem; font-weight: bold;">{adoption_speed:.0f}</div>
+            <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">/100</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        # Diversité technologique
+        tech_diversity = app.df['Category'].nunique() * 33.33  # 3 catégories max
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #8B5CF6 0%, #7C3AED 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🎯 Diversité Tech</div>
+            <div style="font-size: 3rem; font-weight: bold;">{tech_diversity:.0f}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        # Potentiel R&D (basé sur prix premium)
+        price_premium = (app.df['Average_Price'].std() / app.df['Average_Price'].mean()) * 100
+        rd_potential = min(100, price_premium * 2)
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🧪 Potentiel R&D</div>
+            <div style="font-size: 3rem; font-weight: bold;">{rd_potential:.0f}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Analyses Innovation
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Courbe d'adoption EV par constructeur
+        ev_by_manufacturer = app.df.groupby(['Manufacturer', 'Year'])['EV_Share'].mean().reset_index()
+        ev_by_manufacturer['EV_Share'] = ev_by_manufacturer['EV_Share'] * 100
+
+        fig1 = px.line(ev_by_manufacturer, x='Year', y='EV_Share', color='Manufacturer',
+                      title="Courbe d'Adoption Véhicules Électriques",
+                      labels={'EV_Share': 'Part EV (%)', 'Year': 'Année'})
+        fig1.update_layout(height=400)
+        render_profiler.plotly_chart(fig1, use_container_width=True)
+
+    with col2:
+        # Innovation vs Performance (Prix vs EV Share)
+        innovation_perf = app.df.groupby('Manufacturer').agg({
+            'Average_Price': 'mean',
+            'EV_Share': 'mean',
+            'Production_Volume': 'sum'
+        }).reset_index()
+
+        innovation_perf['EV_Share'] = innovation_perf['EV_Share'] * 100
+
+        fig2 = px.scatter(innovation_perf, x='EV_Share', y='Average_Price',
+                         size='Production_Volume', hover_name='Manufacturer',
+                         title="Innovation vs Performance (EV vs Prix)",
+                         labels={'EV_Share': 'Part EV (%)', 'Average_Price': 'Prix Moyen (€)'})
+        fig2.update_layout(height=400)
+        render_profiler.plotly_chart(fig2, use_container_width=True)
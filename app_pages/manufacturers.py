@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE FABRICANTS
+=============================================================================
+
+Page fabricants.
+
+=============================================================================
+"""
+
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_manufacturers(app):
+    """Page fabricants."""
+    st.markdown('<h1 class="main-header">🏭 Analyse des Fabricants</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Données non disponibles")
+        return
+
+    # Top fabricants
+    st.markdown("## 🏆 Top Fabricants")
+
+    manu_stats = app.df.groupby('Manufacturer').agg({
+        'Production': ['sum', 'mean'],
+        'SteelPrice': 'mean',
+        'Year': ['min', 'max']
+    }).round(2)
+
+    manu_stats.columns = ['Production Totale', 'Production Moyenne', 'Prix Acier Moyen', 'Première Année', 'Dernière Année']
+    manu_stats = manu_stats.sort_values('Production Totale', ascending=False)
+
+    st.dataframe(manu_stats.head(15), use_container_width=True)
+
+    # Graphiques fabricants
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Top 10 fabricants
+        top_manu = manu_stats.head(10).reset_index()
+        fig1 = px.bar(top_manu, x='Manufacturer', y='Production Totale',
+                     title="Top 10 Fabricants par Production")
+        fig1.update_xaxes(tickangle=45)
+        render_profiler.plotly_chart(fig1, use_container_width=True)
+
+    with col2:
+        # Évolution des top 5
+        top_5_names = manu_stats.head(5).index.tolist()
+        top_5_evolution = app.df[app.df['Manufacturer'].isin(top_5_names)]
+        top_5_yearly = top_5_evolution.groupby(['Year', 'Manufacturer'], observed=True)['Production'].sum().reset_index()
+
+        fig2 = px.line(top_5_yearly, x='Year', y='Production', color='Manufacturer',
+                      title="Évolution Top 5 Fabricants")
+        render_profiler.plotly_chart(fig2, use_container_width=True)
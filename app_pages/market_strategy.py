@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE STRATÉGIE MARCHÉ
+=============================================================================
+
+Dashboard Stratégie Marché.
+
+=============================================================================
+"""
+
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_market_strategy_dashboard(app):
+    """Dashboard Stratégie Marché."""
+    st.markdown('<h1 class="main-header">🎯 Stratégie Marché</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # KPIs Stratégiques
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        # Indice d'attractivité du marché
+        market_growth = app.df.groupby('Year')['Production_Volume'].sum().pct_change().mean() * 100
+        attractiveness = min(100, max(0, 50 + market_growth * 10))
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🎯 Attractivité Marché</div>
+            <div style="font-size: 3rem; font-weight: bold;">{attractiveness:.0f}</div>
+            <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">/100</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        # Potentiel de croissance
+        recent_growth = app.df[app.df['Year'] >= 2020].groupby('Year')['Production_Volume'].sum().pct_change().mean() * 100
+        growth_potential = min(100, max(0, 50 + recent_growth * 5))
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📈 Potentiel Croissance</div>
+            <div style="font-size: 3rem; font-weight: bold;">{growth_potential:.0f}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        # Niveau de saturation
+        avg_production = app.df['Production_Volume'].mean()
+        max_production = app.df['Production_Volume'].max()
+        saturation = (avg_production / max_production) * 100
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #8B5CF6 0%, #7C3AED 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📊 Niveau Saturation</div>
+            <div style="font-size: 3rem; font-weight: bold;">{saturation:.0f}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        # Score d'opportunité stratégique
+        opportunity_score = (attractiveness + growth_potential + (100 - saturation)) / 3
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #EF4444 0%, #DC2626 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🚀 Score Opportunité</div>
+            <div style="font-size: 3rem; font-weight: bold;">{opportunity_score:.0f}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Analyses stratégiques
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Matrice BCG simplifiée
+        bcg_data = app.df.groupby('Manufacturer').agg({
+            'Production_Volume': 'sum',
+            'Average_Price': 'mean'
+        }).reset_index()
+
+        bcg_data['Market_Share'] = (bcg_data['Production_Volume'] / bcg_data['Production_Volume'].sum()) * 100
+        bcg_data['Growth_Rate'] = bcg_data['Production_Volume'].pct_change().fillna(0) * 100
+
+        fig1 = px.scatter(bcg_data, x='Market_Share', y='Average_Price',
+                         size='Production_Volume', hover_name='Manufacturer',
+                         title="Matrice Stratégique : Part de Marché vs Prix",
+                         labels={'Market_Share': 'Part de Marché (%)', 'Average_Price': 'Prix Moyen (€)'})
+
+        # Ajouter des quadrants
+        fig1.add_hline(y=bcg_data['Average_Price'].median(), line_dash="dash", line_color="gray")
+        fig1.add_vline(x=bcg_data['Market_Share'].median(), line_dash="dash", line_color="gray")
+
+        fig1.update_layout(height=400)
+        render_profiler.plotly_chart(fig1, use_container_width=True)
+
+    with col2:
+        # Évolution des parts de marché
+        market_evolution = app.df.groupby(['Year', 'Manufacturer'])['Production_Volume'].sum().reset_index()
+        market_evolution['Total_Year'] = market_evolution.groupby('Year')['Production_Volume'].transform('sum')
+        market_evolution['Market_Share'] = (market_evolution['Production_Volume'] / market_evolution['Total_Year']) * 100
+
+        fig2 = px.line(market_evolution, x='Year', y='Market_Share', color='Manufacturer',
+                      title="Évolution des Parts de Marché",
+                      labels={'Market_Share': 'Part de Marché (%)', 'Year': 'Année'})
+        fig2.update_layout(height=400)
+        render_profiler.plotly_chart(fig2, use_container_width=True)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE MODE MATRIX
+=============================================================================
+
+Mode Matrix - Dashboard dans la Matrice.
+
+=============================================================================
+"""
+
+import streamlit as st
+
+
+def render_matrix_mode(app):
+    """Mode Matrix - Dashboard dans la Matrice."""
+    st.markdown('<h1 class="main-header">⚡ Mode Matrix - Réalité Automobile</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # Interface Matrix
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #000000 0%, #003300 100%);
+                padding: 3rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;
+                position: relative; overflow: hidden; border: 2px solid #00FF00;">
+        <div style="position: absolute; top: 0; left: 0; right: 0; bottom: 0;
+                    background: repeating-linear-gradient(90deg, transparent, transparent 2px, #00FF0010 2px, #00FF0010 4px);"></div>
+        <div style="position: relative; z-index: 1;">
+            <h1 style="color: #00FF00; margin: 0; font-size: 3rem; font-family: 'Courier New';
+                       text-shadow: 0 0 20px #00FF00; animation: matrixGlow 2s ease-in-out infinite alternate;">
+                ⚡ MATRIX AUTOMOBILE ⚡
+            </h1>
+            <p style="color: #00CC00; font-size: 1.2rem; margin-top: 1rem; font-family: 'Courier New';">
+                > BIENVENUE DANS LA RÉALITÉ DES DONNÉES <
+            </p>
+        </div>
+    </div>
+
+    <style>
+    @keyframes matrixGlow {
+        from { text-shadow: 0 0 20px #00FF00; }
+        to { text-shadow: 0 0 40px #00FF00, 0 0 60px #00FF00; }
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    # Code Matrix des données
+    st.markdown("### 💻 **CODE MATRIX DES DONNÉES**")
+
+    matrix_data = []
+    for _, row in app.df.head(10).iterrows():
+        matrix_line = f"MANU:{row['Manufacturer'][:4].upper()} PROD:{int(row['Production_Volume']/1000)}K EV:{row['EV_Share']:.2f} YEAR:{row['Year']}"
+        matrix_data.append(matrix_line)
+
+    for i, line in enumerate(matrix_data):
+        st.markdown(f"""
+        <div style="background: #000000; color: #00FF00; padding: 0.5rem;
+                    font-family: 'Courier New'; font-size: 0.9rem; margin: 0.2rem 0;
+                    border-left: 3px solid #00FF00; animation: matrixScroll 0.5s ease-in {i*0.1}s both;">
+            > {line}
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Pilules rouge/bleue
+    st.markdown("---")
+    st.markdown("### 💊 **CHOIX DE LA PILULE**")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        if st.button("🔴 PILULE ROUGE - Vérité des Données"):
+            st.markdown("""
+            <div style="background: #CC0000; color: white; padding: 2rem; border-radius: 15px;">
+                <h4>🔴 VÉRITÉ RÉVÉLÉE</h4>
+                <p>L'industrie automobile est à un tournant historique. Les véhicules électriques
+                ne sont pas qu'une mode, mais l'avenir inévitable. Tesla a ouvert la voie,
+                mais la Chine domine déjà la production. L'Europe et les USA doivent s'adapter ou disparaître.</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col2:
+        if st.button("🔵 PILULE BLEUE - Illusion Confortable"):
+            st.markdown("""
+            <div style="background: #0066CC; color: white; padding: 2rem; border-radius: 15px;">
+                <h4>🔵 ILLUSION MAINTENUE</h4>
+                <p>Tout va bien dans l'industrie automobile. Les constructeurs traditionnels
+                gardent le contrôle. L'essence restera dominante encore longtemps.
+                Pas besoin de changement radical... Retournez à vos tableaux Excel.</p>
+            </div>
+            """, unsafe_allow_html=True)
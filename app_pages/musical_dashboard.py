@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE DASHBOARD MUSICAL
+=============================================================================
+
+Dashboard Musical - Les données chantent !
+
+=============================================================================
+"""
+
+import random
+import time
+
+import plotly.graph_objects as go
+import streamlit as st
+
+import render_profiler
+
+
+def render_musical_dashboard(app):
+    """Dashboard Musical - Les données chantent !"""
+    st.markdown('<h1 class="main-header">🎵 Dashboard Musical - Symphony of Data</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # Interface musicale
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #2E1065 0%, #7C3AED 50%, #EC4899 100%);
+                padding: 3rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;
+                position: relative; overflow: hidden;">
+        <div style="position: absolute; top: 0; left: 0; right: 0; bottom: 0;
+                    background: url('data:image/svg+xml,<svg xmlns=\"http://www.w3.org/2000/svg\" viewBox=\"0 0 100 100\"><defs><pattern id=\"music\" width=\"20\" height=\"20\" patternUnits=\"userSpaceOnUse\"><circle cx=\"10\" cy=\"10\" r=\"2\" fill=\"%23ffffff\" opacity=\"0.1\"/></pattern></defs><rect width=\"100\" height=\"100\" fill=\"url(%23music)\"/></svg>');"></div>
+        <div style="position: relative; z-index: 1;">
+            <h1 style="color: white; margin: 0; font-size: 3.5rem; font-weight: bold;
+                       text-shadow: 0 4px 8px rgba(0,0,0,0.5); animation: musicPulse 2s ease-in-out infinite;">
+                🎼 AUTOMOTIVE SYMPHONY 🎼
+            </h1>
+            <p style="color: #E5E7EB; font-size: 1.2rem; margin-top: 1rem;">
+                Quand les données automobiles deviennent musique...
+            </p>
+        </div>
+    </div>
+
+    <style>
+    @keyframes musicPulse {
+        0%, 100% { transform: scale(1); }
+        50% { transform: scale(1.05); }
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    # Contrôles musicaux
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        tempo = st.slider("🎵 Tempo BPM", 60, 180, 120)
+
+    with col2:
+        key_signature = st.selectbox("🎼 Tonalité", ["C Major", "G Major", "D Major", "A Major"])
+
+    with col3:
+        instrument = st.selectbox("🎹 Instrument", ["Piano", "Violon", "Guitare", "Synthé"])
+
+    with col4:
+        play_mode = st.checkbox("▶️ Mode Lecture", value=False)
+
+    # Conversion des données en "notes musicales"
+    st.markdown("### 🎼 **PARTITION AUTOMOBILE**")
+
+    # Chaque constructeur = une note/accord
+    manufacturers = app.df['Manufacturer'].unique()
+    musical_notes = ['C', 'D', 'E', 'F', 'G', 'A', 'B']
+
+    # Assignation notes aux constructeurs
+    manu_notes = {}
+    for i, manu in enumerate(manufacturers):
+        manu_notes[manu] = musical_notes[i % len(musical_notes)]
+
+    # Visualisation partition
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("#### 🎹 **Composition Actuelle**")
+
+        for manu in manufacturers:
+            production = app.df[app.df['Manufacturer'] == manu]['Production_Volume'].sum()
+            note = manu_notes[manu]
+
+            # Volume détermine la "hauteur" de la note
+            volume = min(100, (production / 1e6) * 10)
+
+            # Couleur selon la note
+            note_colors = {
+                'C': '#FF6B6B', 'D': '#4ECDC4', 'E': '#45B7D1', 'F': '#96CEB4',
+                'G': '#FFEAA7', 'A': '#DDA0DD', 'B': '#98D8C8'
+            }
+
+            st.markdown(f"""
+            <div style="background: linear-gradient(135deg, {note_colors[note]} 0%, {note_colors[note]}80 100%);
+                        border-radius: 15px; padding: 1rem; margin: 0.5rem 0;
+                        display: flex; align-items: center; justify-content: space-between;">
+                <div>
+                    <strong style="color: white; font-size: 1.2rem;">🎵 {note} - {manu}</strong><br>
+                    <span style="color: white; opacity: 0.8;">Volume: {volume:.0f}/100</span>
+                </div>
+                <div style="background: white; border-radius: 50%; width: 50px; height: 50px;
+                            display: flex; align-items: center; justify-content: center;
+                            font-size: 1.5rem; font-weight: bold; color: {note_colors[note]};">
+                    {note}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+
+    with col2:
+        # Graphique "onde sonore" basé sur production
+        st.markdown("#### 🌊 **Onde Sonore des Données**")
+
+        # Simulation onde sonore
+        years = sorted(app.df['Year'].unique())
+        total_production = []
+
+        for year in years:
+            yearly_prod = app.df[app.df['Year'] == year]['Production_Volume'].sum()
+            total_production.append(yearly_prod)
+
+        # Création onde sinusoïdale basée sur données
+        import math
+        wave_x = []
+        wave_y = []
+
+        for i, (year, prod) in enumerate(zip(years, total_production)):
+            # Fréquence basée sur production
+            frequency = (prod / 1e8) * 2  # Normalisation
+            amplitude = (prod / max(total_production)) * 100
+
+            for t in range(10):  # 10 points par année
+                x_val = i * 10 + t
+                y_val = amplitude * math.sin(frequency * t * 0.5)
+                wave_x.append(x_val)
+                wave_y.append(y_val)
+
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=wave_x, y=wave_y,
+            mode='lines',
+            name='Onde Automobile',
+            line=dict(color='#7C3AED', width=3),
+            fill='tonexty',
+            fillcolor='rgba(124, 58, 237, 0.3)'
+        ))
+
+        fig.update_layout(
+            title="🎵 Onde Sonore de la Production",
+            xaxis_title="Temps (années × 10)",
+            yaxis_title="Amplitude",
+            plot_bgcolor='rgba(0,0,0,0.05)',
+            height=300
+        )
+
+        render_profiler.plotly_chart(fig, use_container_width=True)
+
+    # Playlist automobile
+    st.markdown("---")
+    st.markdown("### 🎧 **PLAYLIST AUTOMOBILE GÉNÉRÉE**")
+
+    # Génération playlist basée sur données
+    playlist_songs = [
+        {"title": "Electric Dreams", "artist": "Tesla Motors", "genre": "Electro", "bpm": tempo},
+        {"title": "German Engineering", "artist": "Volkswagen Symphony", "genre": "Classical", "bpm": tempo-10},
+        {"title": "American Muscle", "artist": "Ford Blues Band", "genre": "Rock", "bpm": tempo+20},
+        {"title": "Rising Sun", "artist": "Toyota Ensemble", "genre": "Ambient", "bpm": tempo-5},
+        {"title": "Korean Wave", "artist": "Hyundai-Kia Collective", "genre": "K-Pop", "bpm": tempo+15},
+        {"title": "Italian Passion", "artist": "Stellantis Orchestra", "genre": "Opera", "bpm": tempo+10}
+    ]
+
+    for i, song in enumerate(playlist_songs):
+        col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
+
+        with col1:
+            st.markdown(f"**🎵 {song['title']}**")
+
+        with col2:
+            st.markdown(f"*{song['artist']}*")
+
+        with col3:
+            st.markdown(f"🎼 {song['genre']} | {song['bpm']} BPM")
+
+        with col4:
+            if play_mode:
+                st.markdown("▶️")
+            else:
+                st.markdown("⏸️")
+
+    # Visualiseur musical
+    st.markdown("---")
+    st.markdown("### 🎨 **VISUALISEUR MUSICAL**")
+
+    if play_mode:
+        # Simulation barres de fréquence
+        frequencies = [random.randint(10, 100) for _ in range(20)]
+
+        fig = go.Figure(data=go.Bar(
+            x=list(range(20)),
+            y=frequencies,
+            marker=dict(
+                color=frequencies,
+                colorscale='Viridis',
+                showscale=False
+            )
+        ))
+
+        fig.update_layout(
+            title="🎵 Analyseur de Fréquences en Temps Réel",
+            xaxis_title="Fréquences",
+            yaxis_title="Amplitude",
+            showlegend=False,
+            height=300,
+            plot_bgcolor='rgba(0,0,0,0.8)',
+            paper_bgcolor='rgba(0,0,0,0)'
+        )
+
+        render_profiler.plotly_chart(fig, use_container_width=True)
+
+        # Auto-refresh pour effet temps réel
+        time.sleep(0.5)
+        st.rerun()
+    else:
+        st.info("🎵 Activez le Mode Lecture pour voir le visualiseur en action !")
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE ANALYSE POST-COVID
+=============================================================================
+
+Dashboard Analyse Post-COVID avec analyses complètes.
+
+=============================================================================
+"""
+
+import pandas as pd
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_post_covid_analysis(app):
+    """Dashboard Analyse Post-COVID avec analyses complètes."""
+    st.markdown('<h1 class="main-header">🦠 Analyse Post-COVID</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # En-tête contextuel COVID
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #FF6B6B 0%, #4ECDC4 100%);
+                padding: 2rem; border-radius: 15px; margin: 1rem 0; text-align: center;">
+        <h2 style="color: white; margin-bottom: 1rem;">🦠 Impact COVID-19 sur l'Industrie Automobile</h2>
+        <p style="color: #E0E0E0; font-size: 1.1rem;">
+            Analyse des transformations structurelles de l'industrie automobile suite à la pandémie (2020-2024)
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # KPIs Post-COVID
+    st.markdown("### 📊 KPIs Post-COVID")
+    col1, col2, col3, col4 = st.columns(4)
+
+    # Calculs pour les KPIs COVID
+    pre_covid_years = [2018, 2019]
+    covid_years = [2020, 2021]
+    post_covid_years = [2022, 2023, 2024]
+
+    pre_covid_production = app.df[app.df['Year'].isin(pre_covid_years)]['Production_Volume'].mean()
+    covid_production = app.df[app.df['Year'].isin(covid_years)]['Production_Volume'].mean()
+    post_covid_production = app.df[app.df['Year'].isin(post_covid_years)]['Production_Volume'].mean()
+
+    with col1:
+        # Impact production COVID
+        covid_impact = ((covid_production - pre_covid_production) / pre_covid_production) * 100
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #FF6B6B 0%, #FF8E8E 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📉 Impact COVID Production</div>
+            <div style="font-size: 3rem; font-weight: bold;">{covid_impact:.1f}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        # Récupération post-COVID
+        recovery_rate = ((post_covid_production - covid_production) / covid_production) * 100
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #4ECDC4 0%, #44A08D 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📈 Taux Récupération</div>
+            <div style="font-size: 3rem; font-weight: bold;">{recovery_rate:.1f}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        # Accélération EV post-COVID
+        pre_covid_ev = app.df[app.df['Year'].isin(pre_covid_years)]['EV_Share'].mean() * 100
+        post_covid_ev = app.df[app.df['Year'].isin(post_covid_years)]['EV_Share'].mean() * 100
+        ev_acceleration = post_covid_ev - pre_covid_ev
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #9B59B6 0%, #8E44AD 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚡ Accélération EV</div>
+            <div style="font-size: 3rem; font-weight: bold;">+{ev_acceleration:.1f}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        # Résilience globale
+        resilience_score = min(100, max(0, 50 + recovery_rate + ev_acceleration))
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #F39C12 0%, #E67E22 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🛡️ Score Résilience</div>
+            <div style="font-size: 3rem; font-weight: bold;">{resilience_score:.0f}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Graphique évolution production pré/pendant/post COVID
+    st.markdown("---")
+    st.markdown("### 📈 Évolution Production : Pré-COVID vs COVID vs Post-COVID")
+
+    # Préparation des données par période
+    covid_evolution = app.df.groupby('Year')['Production_Volume'].sum().reset_index()
+    covid_evolution['Période'] = covid_evolution['Year'].apply(
+        lambda x: 'Pré-COVID (2018-2019)' if x in pre_covid_years
+        else 'COVID (2020-2021)' if x in covid_years
+        else 'Post-COVID (2022-2024)' if x in post_covid_years
+        else 'Autre'
+    )
+
+    fig = px.line(covid_evolution, x='Year', y='Production_Volume',
+                 title="Impact COVID-19 sur la Production Automobile Mondiale",
+                 labels={'Production_Volume': 'Production (millions)', 'Year': 'Année'},
+                 color_discrete_sequence=['#FF6B6B'])
+
+    # Ajout de zones colorées pour les périodes
+    fig.add_vrect(x0=2017.5, x1=2019.5, fillcolor="green", opacity=0.1, annotation_text="Pré-COVID")
+    fig.add_vrect(x0=2019.5, x1=2021.5, fillcolor="red", opacity=0.1, annotation_text="COVID")
+    fig.add_vrect(x0=2021.5, x1=2024.5, fillcolor="blue", opacity=0.1, annotation_text="Post-COVID")
+
+    fig.update_layout(height=400)
+    render_profiler.plotly_chart(fig, use_container_width=True)
+
+    # Analyse par région de l'impact COVID
+    st.markdown("---")
+    st.markdown("### 🌍 Impact COVID par Région")
+
+    regional_covid_impact = []
+    for region in app.df['Region'].unique():
+        region_data = app.df[app.df['Region'] == region]
+        pre_covid_reg = region_data[region_data['Year'].isin(pre_covid_years)]['Production_Volume'].mean()
+        covid_reg = region_data[region_data['Year'].isin(covid_years)]['Production_Volume'].mean()
+        post_covid_reg = region_data[region_data['Year'].isin(post_covid_years)]['Production_Volume'].mean()
+
+        impact_reg = ((covid_reg - pre_covid_reg) / pre_covid_reg) * 100 if pre_covid_reg > 0 else 0
+        recovery_reg = ((post_covid_reg - covid_reg) / covid_reg) * 100 if covid_reg > 0 else 0
+
+        regional_covid_impact.append({
+            'Région': region,
+            'Impact COVID (%)': impact_reg,
+            'Récupération (%)': recovery_reg,
+            'Résilience': min(100, max(0, 50 + recovery_reg))
+        })
+
+    regional_df = pd.DataFrame(regional_covid_impact)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig_impact = px.bar(regional_df, x='Région', y='Impact COVID (%)',
+                           title="Impact COVID par Région",
+                           color='Impact COVID (%)',
+                           color_continuous_scale='Reds_r')
+        fig_impact.update_layout(height=400)
+        render_profiler.plotly_chart(fig_impact, use_container_width=True)
+
+    with col2:
+        fig_recovery = px.bar(regional_df, x='Région', y='Récupération (%)',
+                             title="Taux de Récupération par Région",
+                             color='Récupération (%)',
+                             color_continuous_scale='Greens')
+        fig_recovery.update_layout(height=400)
+        render_profiler.plotly_chart(fig_recovery, use_container_width=True)
+
+    # Analyse transformation EV post-COVID
+    st.markdown("---")
+    st.markdown("### ⚡ Accélération de la Transition Électrique Post-COVID")
+
+    ev_evolution = app.df.groupby('Year')['EV_Share'].mean().reset_index()
+    ev_evolution['EV_Share_Percent'] = ev_evolution['EV_Share'] * 100
+
+    fig_ev = px.line(ev_evolution, x='Year', y='EV_Share_Percent',
+                    title="Évolution de la Part des Véhicules Électriques",
+                    labels={'EV_Share_Percent': 'Part EV (%)', 'Year': 'Année'},
+                    color_discrete_sequence=['#9B59B6'])
+
+    # Ajout de zones colorées pour les périodes EV
+    fig_ev.add_vrect(x0=2017.5, x1=2019.5, fillcolor="orange", opacity=0.1, annotation_text="Pré-COVID")
+    fig_ev.add_vrect(x0=2019.5, x1=2021.5, fillcolor="red", opacity=0.1, annotation_text="COVID")
+    fig_ev.add_vrect(x0=2021.5, x1=2024.5, fillcolor="green", opacity=0.1, annotation_text="Accélération EV")
+
+    fig_ev.update_layout(height=400)
+    render_profiler.plotly_chart(fig_ev, use_container_width=True)
+
+    # Tableau de synthèse des transformations
+    st.markdown("---")
+    st.markdown("### 📋 Synthèse des Transformations Post-COVID")
+
+    transformations_data = {
+        'Transformation': [
+            '🏭 Digitalisation Production',
+            '🔄 Résilience Supply Chain',
+            '⚡ Accélération Électrification',
+            '🌱 Focus Durabilité',
+            '🤖 Automatisation Accrue',
+            '🏠 Télétravail Intégré',
+            '📱 Vente Digitale',
+            '🔧 Maintenance Prédictive'
+        ],
+        'Impact': [
+            'Très Élevé',
+            'Élevé',
+            'Très Élevé',
+            'Élevé',
+            'Élevé',
+            'Moyen',
+            'Très Élevé',
+            'Élevé'
+        ],
+        'Adoption (%)': [85, 78, 92, 73, 81, 65, 88, 76],
+        'Priorité 2024': [
+            '🔴 Critique',
+            '🟡 Importante',
+            '🔴 Critique',
+            '🟡 Importante',
+            '🟡 Importante',
+            '🟢 Modérée',
+            '🔴 Critique',
+            '🟡 Importante'
+        ]
+    }
+
+    transformations_df = pd.DataFrame(transformations_data)
+    st.dataframe(transformations_df, use_container_width=True, hide_index=True)
+
+    # Recommandations stratégiques post-COVID
+    st.markdown("---")
+    st.markdown("### 🎯 Recommandations Stratégiques Post-COVID")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        #### 🛡️ Renforcement de la Résilience
+        - **Diversification fournisseurs** : Réduire la dépendance géographique
+        - **Stocks stratégiques** : Maintenir des réserves critiques
+        - **Flexibilité production** : Capacité d'adaptation rapide
+        - **Partenariats locaux** : Développer l'écosystème régional
+        """)
+
+    with col2:
+        st.markdown("""
+        #### ⚡ Accélération de la Transformation
+        - **Investissement EV** : Doubler les capacités électriques
+        - **Digitalisation** : Automatiser les processus critiques
+        - **Formation équipes** : Développer les compétences futures
+        - **Innovation ouverte** : Collaborations technologiques
+        """)
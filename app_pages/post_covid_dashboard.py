@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE POST-COVID 2020-2023
+=============================================================================
+
+Dashboard Analyse Post-COVID (2020-2023).
+
+=============================================================================
+"""
+
+import pandas as pd
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_post_covid_dashboard(app):
+    """Dashboard Analyse Post-COVID (2020-2023)."""
+    st.markdown('<h1 class="main-header">🦠 Analyse Post-COVID (2020-2023)</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # Filtrer les données COVID (2020-2023)
+    covid_data = app.df[app.df['Year'] >= 2020].copy()
+    pre_covid_data = app.df[app.df['Year'] < 2020].copy()
+
+    # KPIs Impact COVID
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        # Impact sur la production (2020 vs 2019)
+        prod_2019 = app.df[app.df['Year'] == 2019]['Production_Volume'].sum()
+        prod_2020 = app.df[app.df['Year'] == 2020]['Production_Volume'].sum()
+        covid_impact = ((prod_2020 - prod_2019) / prod_2019) * 100
+
+        color = "#EF4444" if covid_impact < 0 else "#10B981"
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, {color} 0%, #DC2626 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📉 Impact Production 2020</div>
+            <div style="font-size: 3rem; font-weight: bold;">{covid_impact:.1f}%</div>
+            <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">vs 2019</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        # Vitesse de récupération (2021-2023)
+        recovery_rate = covid_data.groupby('Year')['Production_Volume'].sum().pct_change().mean() * 100
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🚀 Vitesse Récupération</div>
+            <div style="font-size: 3rem; font-weight: bold;">{recovery_rate:.1f}%</div>
+            <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">par an</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        # Accélération transition EV post-COVID
+        ev_pre_covid = pre_covid_data['EV_Share'].mean() * 100
+        ev_post_covid = covid_data['EV_Share'].mean() * 100
+        ev_acceleration = ev_post_covid - ev_pre_covid
+
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #8B5CF6 0%, #7C3AED 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚡ Accélération EV</div>
+            <div style="font-size: 3rem; font-weight: bold;">+{ev_acceleration:.1f}%</div>
+            <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">post-COVID</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        # Résilience par région (coefficient de variation)
+        regional_resilience = 100 - (covid_data.groupby('Region')['Production_Volume'].std() /
+                                    covid_data.groupby('Region')['Production_Volume'].mean()).mean() * 100
+
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🛡️ Résilience Régionale</div>
+            <div style="font-size: 3rem; font-weight: bold;">{regional_resilience:.0f}</div>
+            <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">/100</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Analyses détaillées COVID
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Comparaison Pré/Post COVID par région
+        comparison_data = []
+        for region in app.df['Region'].unique():
+            pre_covid_avg = pre_covid_data[pre_covid_data['Region'] == region]['Production_Volume'].mean()
+            post_covid_avg = covid_data[covid_data['Region'] == region]['Production_Volume'].mean()
+
+            comparison_data.append({
+                'Region': region,
+                'Pre_COVID': pre_covid_avg,
+                'Post_COVID': post_covid_avg,
+                'Impact': ((post_covid_avg - pre_covid_avg) / pre_covid_avg) * 100
+            })
+
+        comparison_df = pd.DataFrame(comparison_data)
+
+        fig1 = px.bar(comparison_df, x='Region', y=['Pre_COVID', 'Post_COVID'],
+                     title="Production Moyenne : Pré vs Post-COVID",
+                     labels={'value': 'Production Moyenne', 'variable': 'Période'},
+                     barmode='group')
+        fig1.update_layout(height=400)
+        render_profiler.plotly_chart(fig1, use_container_width=True)
+
+    with col2:
+        # Évolution annuelle 2019-2023 (focus crise)
+        yearly_evolution = app.df[app.df['Year'] >= 2019].groupby('Year')['Production_Volume'].sum().reset_index()
+
+        fig2 = px.line(yearly_evolution, x='Year', y='Production_Volume',
+                      title="Évolution Production 2019-2023 (Impact COVID)",
+                      labels={'Production_Volume': 'Production', 'Year': 'Année'})
+
+        # Ajouter ligne verticale pour début COVID (2020)
+        fig2.add_vline(x=2020, line_dash="dash", line_color="red",
+                      annotation_text="Début COVID-19")
+
+        fig2.update_layout(height=400)
+        render_profiler.plotly_chart(fig2, use_container_width=True)
+
+    # Section insights COVID
+    st.markdown("---")
+    st.markdown("### 🔍 **Insights Clés Post-COVID**")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+        **🦠 Impact Immédiat (2020)**
+        - Chute brutale de production
+        - Perturbation chaînes d'approvisionnement
+        - Fermetures d'usines mondiales
+        - Report d'achats consommateurs
+        """)
+
+    with col2:
+        st.markdown("""
+        **🚀 Récupération (2021-2022)**
+        - Rebond rapide de la demande
+        - Adaptation des processus
+        - Digitalisation accélérée
+        - Nouvelles habitudes mobilité
+        """)
+
+    with col3:
+        st.markdown("""
+        **⚡ Transformation (2023+)**
+        - Accélération transition EV
+        - Résilience renforcée
+        - Diversification géographique
+        - Innovation technologique
+        """)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE ANALYSE PRÉDICTIVE
+=============================================================================
+
+Dashboard Analyse Prédictive.
+
+=============================================================================
+"""
+
+import pandas as pd
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_predictive_dashboard(app):
+    """Dashboard Analyse Prédictive."""
+    st.markdown('<h1 class="main-header">🎯 Analyse Prédictive</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # Prédictions simples basées sur les tendances
+    yearly_data = app.df.groupby('Year').agg({
+        'Production_Volume': 'sum',
+        'Average_Price': 'mean',
+        'EV_Share': 'mean'
+    }).reset_index()
+
+    # Projection simple pour 2024-2026
+    last_year = yearly_data['Year'].max()
+    growth_rate = (yearly_data['Production_Volume'].iloc[-1] / yearly_data['Production_Volume'].iloc[0]) ** (1/len(yearly_data)) - 1
+
+    predictions = []
+    for year in range(last_year + 1, last_year + 4):
+        pred_production = yearly_data['Production_Volume'].iloc[-1] * ((1 + growth_rate) ** (year - last_year))
+        predictions.append({'Year': year, 'Production_Volume': pred_production, 'Type': 'Prédiction'})
+
+    # Graphique avec prédictions
+    historical = yearly_data.copy()
+    historical['Type'] = 'Historique'
+
+    combined_data = pd.concat([
+        historical[['Year', 'Production_Volume', 'Type']],
+        pd.DataFrame(predictions)
+    ])
+
+    fig = px.line(combined_data, x='Year', y='Production_Volume', color='Type',
+                 title="Production Historique et Prédictions",
+                 labels={'Production_Volume': 'Production', 'Year': 'Année'})
+    fig.update_layout(height=400)
+    render_profiler.plotly_chart(fig, use_container_width=True)
+
+    # KPIs prédictifs
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        pred_2024 = predictions[0]['Production_Volume']
+        st.metric("🔮 Production prédite 2024", f"{pred_2024/1e6:.0f}M unités")
+
+    with col2:
+        growth_2024 = ((pred_2024 / yearly_data['Production_Volume'].iloc[-1]) - 1) * 100
+        st.metric("📈 Croissance prédite 2024", f"{growth_2024:.1f}%")
+
+    with col3:
+        confidence = 75  # Score de confiance fixe
+        st.metric("🎯 Confiance prédiction", f"{confidence}%")
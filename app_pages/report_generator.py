@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE GÉNÉRATEUR DE RAPPORTS
+=============================================================================
+
+Générateur de rapports automatique.
+
+=============================================================================
+"""
+
+import time
+from datetime import datetime
+
+import streamlit as st
+
+
+def render_report_generator(app):
+    """Générateur de rapports automatique."""
+    st.markdown('<h1 class="main-header">📊 Générateur de Rapports</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #1976D2 0%, #1565C0 100%);
+                padding: 2rem; border-radius: 15px; margin-bottom: 2rem; text-align: center;">
+        <h2 style="color: white; margin: 0;">📋 Générateur Automatique</h2>
+        <p style="color: #E3F2FD; margin-top: 1rem;">
+            Créez des rapports personnalisés en quelques clics
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Configuration du rapport
+    col1, col2 = st.columns(2)
+
+    with col1:
+        report_type = st.selectbox(
+            "📊 Type de rapport",
+            ["Exécutif", "Technique", "Financier", "Stratégique"]
+        )
+
+        time_period = st.selectbox(
+            "📅 Période",
+            ["2023", "2022-2023", "2020-2023", "Toutes années"]
+        )
+
+    with col2:
+        focus_area = st.multiselect(
+            "🎯 Domaines d'analyse",
+            ["Production", "Véhicules EV", "Prix", "Régions", "Constructeurs"],
+            default=["Production", "Véhicules EV"]
+        )
+
+        export_format = st.selectbox(
+            "📄 Format d'export",
+            ["PDF", "Excel", "PowerPoint", "Word"]
+        )
+
+    # Génération du rapport
+    if st.button("🚀 Générer le Rapport", type="primary"):
+        with st.spinner("Génération en cours..."):
+            time.sleep(2)  # Simulation
+
+            # Contenu du rapport généré
+            st.success("✅ Rapport généré avec succès !")
+
+            # Aperçu du rapport
+            st.markdown("### 📋 **Aperçu du Rapport**")
+
+            report_content = f"""
+            <div style="background: white; color: black; padding: 2rem;
+                        border-radius: 10px; border: 1px solid #ddd;">
+                <h2 style="color: #1976D2; text-align: center;">
+                    RAPPORT {report_type.upper()} - INDUSTRIE AUTOMOBILE
+                </h2>
+                <hr>
+
+                <h3>📊 Résumé Exécutif</h3>
+                <p>Ce rapport analyse l'industrie automobile pour la période {time_period}.
+                Les domaines couverts incluent : {', '.join(focus_area)}.</p>
+
+                <h3>🔍 Faits Saillants</h3>
+                <ul>
+                    <li>Production mondiale : {app.df['Production_Volume'].sum()/1e6:.0f}M véhicules</li>
+                    <li>Part véhicules électriques : {app.df['EV_Share'].mean()*100:.1f}%</li>
+                    <li>Prix moyen : {app.df['Average_Price'].mean():,.0f}€</li>
+                    <li>Leader marché : Toyota (23.5% part de marché)</li>
+                </ul>
+
+                <h3>📈 Recommandations</h3>
+                <ol>
+                    <li>Accélérer la transition vers l'électrique</li>
+                    <li>Investir dans les technologies de batteries</li>
+                    <li>Diversifier géographiquement</li>
+                    <li>Optimiser les chaînes d'approvisionnement</li>
+                </ol>
+
+                <hr>
+                <p style="text-align: center; color: #666; font-size: 0.9rem;">
+                    Rapport généré automatiquement le {datetime.now().strftime('%d/%m/%Y à %H:%M')}
+                </p>
+            </div>
+            """
+
+            st.markdown(report_content, unsafe_allow_html=True)
+
+            # Boutons de téléchargement simulés
+            col1, col2, col3, col4 = st.columns(4)
+
+            with col1:
+                st.download_button(
+                    "📄 Télécharger PDF",
+                    data="Rapport PDF simulé",
+                    file_name=f"rapport_{report_type.lower()}_{datetime.now().strftime('%Y%m%d')}.pdf",
+                    mime="application/pdf"
+                )
+
+            with col2:
+                st.download_button(
+                    "📊 Télécharger Excel",
+                    data="Rapport Excel simulé",
+                    file_name=f"rapport_{report_type.lower()}_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                )
+
+            with col3:
+                st.download_button(
+                    "📽️ Télécharger PPT",
+                    data="Rapport PowerPoint simulé",
+                    file_name=f"rapport_{report_type.lower()}_{datetime.now().strftime('%Y%m%d')}.pptx",
+                    mime="application/vnd.openxmlformats-officedocument.presentationml.presentation"
+                )
+
+            with col4:
+                st.download_button(
+                    "📝 Télécharger Word",
+                    data="Rapport Word simulé",
+                    file_name=f"rapport_{report_type.lower()}_{datetime.now().strftime('%Y%m%d')}.docx",
+                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+                )
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE RISQUES & OPPORTUNITÉS
+=============================================================================
+
+Page analyse des risques.
+
+=============================================================================
+"""
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_risk_analysis(app):
+    """Page analyse des risques."""
+    st.markdown('<h1 class="main-header">⚠️ Analyse des Risques</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Données non disponibles pour l'analyse des risques")
+        return
+
+    # Indicateurs de risque principaux
+    st.markdown("## 🚨 Indicateurs de Risque Principaux")
+
+    # Calcul des métriques de risque
+    current_year = app.df['Year'].max()
+    recent_data = app.df[app.df['Year'] >= current_year - 2]
+
+    # Volatilité des prix
+    price_volatility = app.cube.rollup('Year', 'Average_Price', 'std').mean()
+    steel_volatility = app.cube.rollup('Year', 'Steel_Price', 'std').mean()
+
+    # Concentration du marché (indice Herfindahl)
+    herfindahl_index = app._calculate_market_concentration()
+
+    # Dépendance géographique
+    regional_concentration = app.cube.rollup('Region', 'Production_Volume')
+    max_regional_share = (regional_concentration.max() / regional_concentration.sum() * 100)
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        risk_level = "🔴 ÉLEVÉ" if price_volatility > 5000 else "🟡 MOYEN" if price_volatility > 2000 else "🟢 FAIBLE"
+        st.metric("💰 Volatilité Prix", f"{price_volatility:.0f}€", risk_level)
+
+    with col2:
+        steel_risk = "🔴 ÉLEVÉ" if steel_volatility > 100 else "🟡 MOYEN" if steel_volatility > 50 else "🟢 FAIBLE"
+        st.metric("⚙️ Volatilité Acier", f"{steel_volatility:.0f}€", steel_risk)
+
+    with col3:
+        concentration_risk = "🔴 ÉLEVÉ" if herfindahl_index > 2500 else "🟡 MOYEN" if herfindahl_index > 1500 else "🟢 FAIBLE"
+        st.metric("🏢 Concentration Marché", f"{herfindahl_index:.0f}", concentration_risk)
+
+    with col4:
+        geo_risk = "🔴 ÉLEVÉ" if max_regional_share > 60 else "🟡 MOYEN" if max_regional_share > 40 else "🟢 FAIBLE"
+        st.metric("🌍 Risque Géographique", f"{max_regional_share:.1f}%", geo_risk)
+
+    # Analyse des tendances de risque
+    st.markdown("## 📊 Analyse des Tendances de Risque")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Évolution de la volatilité des prix
+        yearly_volatility = app.cube.rollup_many('Year', {
+            'Price': ('Average_Price', 'std'),
+            'SteelPrice': ('Steel_Price', 'std')
+        }).fillna(0)
+
+        fig1 = go.Figure()
+        fig1.add_trace(go.Scatter(
+            x=yearly_volatility.index,
+            y=yearly_volatility['Price'],
+            mode='lines+markers',
+            name='Volatilité Prix Véhicules',
+            line=dict(color='red')
+        ))
+        fig1.add_trace(go.Scatter(
+            x=yearly_volatility.index,
+            y=yearly_volatility['SteelPrice'] * 50,  # Échelle pour visualisation
+            mode='lines+markers',
+            name='Volatilité Prix Acier (x50)',
+            line=dict(color='orange')
+        ))
+        fig1.update_layout(
+            title="Évolution de la Volatilité des Prix",
+            xaxis_title="Année",
+            yaxis_title="Écart-type des Prix"
+        )
+        render_profiler.plotly_chart(fig1, use_container_width=True)
+
+    with col2:
+        # Concentration du marché par année
+        year_shares = app.cube.rollup(['Year', 'Manufacturer'], 'Production_Volume').unstack('Manufacturer', fill_value=0)
+        year_totals = year_shares.sum(axis=1)
+        year_shares_pct = year_shares[year_totals > 0].div(year_totals[year_totals > 0], axis=0) * 100
+        concentration_df = (year_shares_pct ** 2).sum(axis=1).rename('HHI').reset_index()
+
+        if not concentration_df.empty:
+            fig2 = px.line(
+                concentration_df,
+                x='Year',
+                y='HHI',
+                title="Évolution de la Concentration du Marché",
+                markers=True
+            )
+            fig2.add_hline(y=1500, line_dash="dash", line_color="orange",
+                          annotation_text="Seuil Concentration Modérée")
+            fig2.add_hline(y=2500, line_dash="dash", line_color="red",
+                          annotation_text="Seuil Concentration Élevée")
+            render_profiler.plotly_chart(fig2, use_container_width=True)
+
+    # Matrice des risques
+    st.markdown("## 🎯 Matrice d'Évaluation des Risques")
+
+    # Définir les risques et leur évaluation
+    risks_data = [
+        {"Risque": "Volatilité des Prix", "Probabilité": 7, "Impact": 8, "Catégorie": "Économique"},
+        {"Risque": "Concentration Fournisseurs", "Probabilité": 6, "Impact": 7, "Catégorie": "Supply Chain"},
+        {"Risque": "Dépendance Géographique", "Probabilité": 5, "Impact": 9, "Catégorie": "Géopolitique"},
+        {"Risque": "Transition Électrique", "Probabilité": 9, "Impact": 8, "Catégorie": "Technologique"},
+        {"Risque": "Réglementation Environnementale", "Probabilité": 8, "Impact": 7, "Catégorie": "Réglementaire"},
+        {"Risque": "Crise Matières Premières", "Probabilité": 6, "Impact": 9, "Catégorie": "Supply Chain"},
+        {"Risque": "Récession Économique", "Probabilité": 4, "Impact": 9, "Catégorie": "Économique"},
+        {"Risque": "Guerre Commerciale", "Probabilité": 5, "Impact": 8, "Catégorie": "Géopolitique"}
+    ]
+
+    risks_df = pd.DataFrame(risks_data)
+    risks_df['Score_Risque'] = risks_df['Probabilité'] * risks_df['Impact']
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Matrice probabilité vs impact
+        fig3 = px.scatter(
+            risks_df,
+            x='Probabilité',
+            y='Impact',
+            size='Score_Risque',
+            color='Catégorie',
+            hover_name='Risque',
+            title="Matrice Probabilité vs Impact",
+            size_max=20
+        )
+
+        # Ajouter des zones de risque
+        fig3.add_shape(type="rect", x0=0, y0=7, x1=10, y1=10,
+                      fillcolor="red", opacity=0.2, line_width=0)
+        fig3.add_shape(type="rect", x0=7, y0=0, x1=10, y1=7,
+                      fillcolor="orange", opacity=0.2, line_width=0)
+        fig3.add_shape(type="rect", x0=0, y0=0, x1=7, y1=7,
+                      fillcolor="green", opacity=0.2, line_width=0)
+
+        fig3.update_layout(xaxis_range=[0, 10], yaxis_range=[0, 10])
+        render_profiler.plotly_chart(fig3, use_container_width=True)
+
+    with col2:
+        # Top risques par score
+        top_risks = risks_df.nlargest(5, 'Score_Risque')
+        fig4 = px.bar(
+            top_risks,
+            x='Score_Risque',
+            y='Risque',
+            color='Catégorie',
+            title="Top 5 Risques par Score",
+            orientation='h'
+        )
+        render_profiler.plotly_chart(fig4, use_container_width=True)
+
+    # Recommandations et plan d'action
+    st.markdown("## 💡 Recommandations et Plan d'Action")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        ### 🚨 Risques Critiques à Traiter
+
+        **1. Transition Électrique (Score: 72)**
+        - 📋 Action: Accélérer les investissements R&D
+        - 📅 Délai: 6 mois
+        - 👤 Responsable: Direction Innovation
+
+        **2. Dépendance Géographique (Score: 45)**
+        - 📋 Action: Diversifier les marchés
+        - 📅 Délai: 12 mois
+        - 👤 Responsable: Direction Commerciale
+
+        **3. Volatilité des Prix (Score: 56)**
+        - 📋 Action: Stratégies de couverture
+        - 📅 Délai: 3 mois
+        - 👤 Responsable: Direction Financière
+        """)
+
+    with col2:
+        st.markdown("""
+        ### 🎯 Opportunités Identifiées
+
+        **1. Marchés Émergents**
+        - 🌍 Expansion en Asie-Pacifique
+        - 📈 Potentiel de croissance: +25%
+
+        **2. Technologies Vertes**
+        - 🔋 Véhicules électriques et hybrides
+        - 💰 Subventions gouvernementales
+
+        **3. Digitalisation**
+        - 🤖 Industrie 4.0 et IoT
+        - ⚡ Optimisation des processus
+        """)
+
+    # Tableau de bord des indicateurs de risque
+    st.markdown("## 📊 Tableau de Bord des Indicateurs")
+
+    # Créer un DataFrame avec les indicateurs
+    avg_growth_rate = app.cube.growth_rates('Manufacturer').mean()
+    indicators_data = {
+        'Indicateur': ['Volatilité Prix', 'Volatilité Acier', 'Concentration Marché', 'Dépendance Géo.', 'Croissance Moyenne'],
+        'Valeur Actuelle': [f"{price_volatility:.0f}€", f"{steel_volatility:.0f}€", f"{herfindahl_index:.0f}",
+                           f"{max_regional_share:.1f}%", f"{avg_growth_rate:.1f}%"],
+        'Seuil Alerte': ['5000€', '100€', '2500', '60%', '0%'],
+        'Statut': [
+            '🔴 Critique' if price_volatility > 5000 else '🟡 Attention' if price_volatility > 2000 else '🟢 Normal',
+            '🔴 Critique' if steel_volatility > 100 else '🟡 Attention' if steel_volatility > 50 else '🟢 Normal',
+            '🔴 Critique' if herfindahl_index > 2500 else '🟡 Attention' if herfindahl_index > 1500 else '🟢 Normal',
+            '🔴 Critique' if max_regional_share > 60 else '🟡 Attention' if max_regional_share > 40 else '🟢 Normal',
+            '🟢 Positif' if avg_growth_rate > 0 else '🔴 Négatif'
+        ]
+    }
+
+    indicators_df = pd.DataFrame(indicators_data)
+    st.dataframe(indicators_df, use_container_width=True, hide_index=True)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE ANALYSE SECTORIELLE
+=============================================================================
+
+Dashboard Analyse Sectorielle.
+
+=============================================================================
+"""
+
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_sector_analysis_dashboard(app):
+    """Dashboard Analyse Sectorielle."""
+    st.markdown('<h1 class="main-header">📊 Analyse Sectorielle</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # Analyse par catégorie de véhicules
+    category_analysis = app.df.groupby('Category').agg({
+        'Production_Volume': 'sum',
+        'Average_Price': 'mean',
+        'EV_Share': 'mean'
+    }).reset_index()
+
+    # KPIs Sectoriels
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        dominant_category = category_analysis.loc[category_analysis['Production_Volume'].idxmax(), 'Category']
+        dominant_share = (category_analysis['Production_Volume'].max() / category_analysis['Production_Volume'].sum()) * 100
+
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🏆 Segment Dominant</div>
+            <div style="font-size: 2rem; font-weight: bold;">{dominant_category}</div>
+            <div style="font-size: 1rem; opacity: 0.9; margin-top: 0.5rem;">{dominant_share:.1f}% du marché</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        price_premium = category_analysis['Average_Price'].max() - category_analysis['Average_Price'].min()
+        st.metric("💰 Écart Prix Premium", f"{price_premium:,.0f}€")
+
+    with col3:
+        ev_penetration = category_analysis['EV_Share'].mean() * 100
+        st.metric("⚡ Pénétration EV Moyenne", f"{ev_penetration:.1f}%")
+
+    # Graphiques sectoriels
+    st.markdown("---")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        fig1 = px.pie(category_analysis, values='Production_Volume', names='Category',
+                     title="Répartition Production par Segment")
+        fig1.update_layout(height=400)
+        render_profiler.plotly_chart(fig1, use_container_width=True)
+
+    with col2:
+        fig2 = px.bar(category_analysis, x='Category', y='Average_Price',
+                     title="Prix Moyen par Segment",
+                     labels={'Average_Price': 'Prix Moyen (€)', 'Category': 'Segment'})
+        fig2.update_layout(height=400)
+        render_profiler.plotly_chart(fig2, use_container_width=True)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE RECOMMANDATIONS STRATÉGIQUES
+=============================================================================
+
+Dashboard Recommandations Stratégiques.
+
+=============================================================================
+"""
+
+import pandas as pd
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_strategic_recommendations_dashboard(app):
+    """Dashboard Recommandations Stratégiques."""
+    st.markdown('<h1 class="main-header">🎯 Recommandations Stratégiques</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # Analyse pour générer des recommandations intelligentes
+    latest_year = app.df['Year'].max()
+    latest_data = app.df[app.df['Year'] == latest_year]
+
+    # Calculs pour recommandations
+    growth_by_region = app.df.groupby(['Region', 'Year'])['Production_Volume'].sum().reset_index()
+    regional_growth = growth_by_region.groupby('Region')['Production_Volume'].apply(
+        lambda x: x.pct_change().mean()
+    ).sort_values(ascending=False)
+
+    ev_by_manufacturer = latest_data.groupby('Manufacturer')['EV_Share'].mean().sort_values(ascending=False)
+
+    # Section 1: Recommandations Prioritaires
+    st.markdown("## 🚀 **RECOMMANDATIONS PRIORITAIRES**")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #EF4444 0%, #DC2626 100%);
+                    padding: 2rem; border-radius: 15px; color: white; margin-bottom: 1rem;">
+            <h3 style="margin: 0; color: white;">🔥 ACTIONS IMMÉDIATES (0-6 mois)</h3>
+        </div>
+        """, unsafe_allow_html=True)
+
+        best_region = regional_growth.index[0]
+        best_ev_manufacturer = ev_by_manufacturer.index[0]
+
+        st.markdown(f"""
+        **1. 🌍 Expansion Géographique**
+        - **Priorité** : Région {best_region}
+        - **Croissance** : {regional_growth.iloc[0]*100:.1f}% annuelle
+        - **Action** : Augmenter capacités de production
+
+        **2. ⚡ Transition Électrique**
+        - **Benchmark** : {best_ev_manufacturer} ({ev_by_manufacturer.iloc[0]*100:.1f}% EV)
+        - **Action** : Accélérer développement EV
+
+        **3. 💰 Optimisation Coûts**
+        - **Focus** : Matières premières (acier)
+        - **Action** : Diversifier fournisseurs
+        """)
+
+    with col2:
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
+                    padding: 2rem; border-radius: 15px; color: white; margin-bottom: 1rem;">
+            <h3 style="margin: 0; color: white;">📈 STRATÉGIES MOYEN TERME (6-18 mois)</h3>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown(f"""
+        **1. 🔬 Innovation & R&D**
+        - **Budget** : +25% investissement R&D
+        - **Focus** : Technologies batteries
+        - **Partenariats** : Startups tech
+
+        **2. 🌐 Diversification**
+        - **Marchés** : Émergents (Asie-Pacifique)
+        - **Produits** : Véhicules hybrides
+        - **Canaux** : Vente directe
+
+        **3. 🤝 Alliances Stratégiques**
+        - **Constructeurs** : Partage technologies
+        - **Gouvernements** : Subventions EV
+        """)
+
+    # Section 2: Matrice de Priorisation
+    st.markdown("---")
+    st.markdown("## 📊 **MATRICE DE PRIORISATION STRATÉGIQUE**")
+
+    # Créer une matrice impact/effort
+    strategies = [
+        {"Strategy": "Expansion Chine", "Impact": 9, "Effort": 7, "ROI": 8.5},
+        {"Strategy": "Développement EV", "Impact": 10, "Effort": 8, "ROI": 9.0},
+        {"Strategy": "Optimisation Supply Chain", "Impact": 7, "Effort": 4, "ROI": 8.0},
+        {"Strategy": "Partenariats Tech", "Impact": 8, "Effort": 5, "ROI": 7.5},
+        {"Strategy": "Diversification Produits", "Impact": 6, "Effort": 6, "ROI": 6.5},
+        {"Strategy": "Digitalisation Processus", "Impact": 7, "Effort": 3, "ROI": 8.5}
+    ]
+
+    strategy_df = pd.DataFrame(strategies)
+
+    fig = px.scatter(strategy_df, x='Effort', y='Impact', size='ROI',
+                    hover_name='Strategy', color='ROI',
+                    title="Matrice Impact vs Effort (Taille = ROI)",
+                    labels={'Effort': 'Effort Requis (1-10)', 'Impact': 'Impact Potentiel (1-10)'})
+
+    # Ajouter quadrants
+    fig.add_hline(y=7, line_dash="dash", line_color="gray")
+    fig.add_vline(x=6, line_dash="dash", line_color="gray")
+
+    # Annotations quadrants
+    fig.add_annotation(x=3, y=9, text="Quick Wins", showarrow=False,
+                      bgcolor="lightgreen", bordercolor="green")
+    fig.add_annotation(x=8, y=9, text="Major Projects", showarrow=False,
+                      bgcolor="lightblue", bordercolor="blue")
+
+    fig.update_layout(height=500)
+    render_profiler.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PAGE DURABILITÉ & ESG
+=============================================================================
+
+Dashboard Durabilité & ESG.
+
+=============================================================================
+"""
+
+import streamlit as st
+
+import render_profiler
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+
+
+def render_sustainability_dashboard(app):
+    """Dashboard Durabilité & ESG."""
+    st.markdown('<h1 class="main-header">🌱 Durabilité & ESG</h1>',
+               unsafe_allow_html=True)
+
+    if not app.data_loaded:
+        st.error("❌ Aucune donnée chargée")
+        return
+
+    # KPIs ESG
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        ev_share_avg = app.df['EV_Share'].mean() * 100
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚡ Part véhicules électriques</div>
+            <div style="font-size: 3rem; font-weight: bold;">{ev_share_avg:.1f}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        carbon_intensity = app.df['Production_Volume'].sum() / 1e6  # Estimation
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🌍 Intensité carbone</div>
+            <div style="font-size: 3rem; font-weight: bold;">{carbon_intensity:.0f}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        sustainability_score = ev_share_avg * 2  # Score composite
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #8B5CF6 0%, #7C3AED 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🌱 Score durabilité</div>
+            <div style="font-size: 3rem; font-weight: bold;">{sustainability_score:.0f}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        regulatory_compliance = 85  # Score fixe pour l'exemple
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #EF4444 0%, #DC2626 100%);
+                    padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
+                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📋 Conformité réglementaire</div>
+            <div style="font-size: 3rem; font-weight: bold;">{regulatory_compliance}%</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Graphique évolution EV
+    st.markdown("---")
+    ev_evolution = app.df.groupby('Year')['EV_Share'].mean().reset_index()
+    ev_evolution['EV_Share'] = ev_evolution['EV_Share'] * 100
+
+    fig = px.line(ev_evolution, x='Year', y='EV_Share',
+                 title="Évolution de la Part des Véhicules Électriques",
+                 labels={'EV_Share': 'Part EV (%)', 'Year': 'Année'})
+    fig.update_layout(height=400)
+    render_profiler.plotly_chart(fig, use_container_width=True)
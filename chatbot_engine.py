@@ -0,0 +1,584 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+MOTEUR DE QUESTIONS-RÉPONSES DE L'ASSISTANT DATA EXPLORER
+=============================================================================
+
+Répond aux questions en langage naturel de l'assistant de la page
+d'accueil à partir du cube d'agrégats (`aggregate_cube`), au lieu de
+réponses préécrites:
+
+- normalisation de la question (minuscules, sans accents ni ponctuation)
+- entités reconnues: constructeurs, régions et catégories présents dans le
+  cube (noms et alias français: "général motors", "asie", "utilitaires"...),
+  années ("en 2022", "entre 2015 et 2020", "depuis 2018") et indicateur
+  ("production", "prix", "part EV", "chiffre d'affaires", "acier"...)
+- intentions: valeur, comparaison ("compare Ford et GM"), classement
+  ("leader", "top", "qui produit le plus"), évolution ("évolution", "croissance": TCAM) et part
+  de marché; la réponse est calculée sur les cellules du cube (quelques
+  milliers de lignes), en quelques millisecondes
+- noms propres inconnus du cube ("Tesla", "BYD"): signalés avec la liste
+  des valeurs disponibles, au lieu d'une réponse sur le marché total
+- réponses mémorisées (LRU) par question normalisée et version du dataset:
+  le moteur est reconstruit avec le cube quand le fichier de données
+  change (`app_cache.get_chatbot_engine`)
+
+Sans année, les valeurs et classements portent sur la dernière année
+disponible et les évolutions sur toute la période.
+
+Usage:
+    engine = ChatbotEngine(cube, version=fingerprint)
+    engine.answer("Compare Ford et GM en 2022")
+
+Auteur: Système d'Analyse Automobile Avancée
+=============================================================================
+"""
+
+import functools
+import math
+import re
+import unicodedata
+
+from aggregate_cube import DIMENSIONS
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+DEFAULT_MEMO_SIZE = 512
+
+# Indicateurs: statistique du cube, libellé, unité d'affichage et alias
+METRICS = {
+    'Production_Volume': {
+        'stat': 'sum', 'label': "production", 'unit': 'volume',
+        'aliases': ['production', 'produit', 'produits', 'produite', 'volume', 'volumes', 'unites'],
+    },
+    'Revenue': {
+        'stat': 'sum', 'label': "chiffre d'affaires", 'unit': 'revenue',
+        'aliases': ['chiffre d affaires', 'chiffres d affaires', 'revenu', 'revenus', 'ventes en valeur'],
+    },
+    'Average_Price': {
+        'stat': 'mean', 'label': "prix moyen", 'unit': 'price',
+        'aliases': ['prix moyen', 'prix', 'cout', 'couts'],
+    },
+    'EV_Share': {
+        'stat': 'mean', 'label': "part des véhicules électriques", 'unit': 'percent',
+        'aliases': ['part ev', 'part ve', 'part des ev', 'part des ve', 'part electrique',
+                    'part de l electrique', 'part des vehicules electriques', 'part de vehicules electriques',
+                    'taux d electrification', 'electrification', 'penetration ev', 'penetration electrique'],
+    },
+    'Steel_Price': {
+        'stat': 'mean', 'label': "prix de l'acier", 'unit': 'steel',
+        'aliases': ['prix de l acier', 'acier'],
+    },
+    'Oil_Price': {
+        'stat': 'mean', 'label': "prix du pétrole", 'unit': 'oil',
+        'aliases': ['prix du petrole', 'petrole', 'baril', 'brent'],
+    },
+    'GDP_Growth': {
+        'stat': 'mean', 'label': "croissance du PIB", 'unit': 'percent',
+        'aliases': ['croissance du pib', 'pib', 'croissance economique'],
+    },
+    'Interest_Rate': {
+        'stat': 'mean', 'label': "taux d'intérêt", 'unit': 'percent',
+        'aliases': ['taux d interet', 'taux d interets', 'taux directeur', 'taux directeurs'],
+    },
+    'US_Tariff_Rate': {
+        'stat': 'mean', 'label': "taux tarifaire US", 'unit': 'percent',
+        'aliases': ['taux tarifaire', 'droits de douane', 'droit de douane', 'douane', 'douanes',
+                    'tarif douanier', 'tarifs douaniers', 'tarifs'],
+    },
+}
+
+DEFAULT_METRIC = 'Production_Volume'
+
+# Alias français des valeurs des dimensions (les noms du cube sont
+# reconnus d'office, "_" et "-" lus comme des espaces)
+ENTITY_ALIASES = {
+    'Manufacturer': {
+        'GM': ['general motors', 'chevrolet'],
+        'Hyundai-Kia': ['hyundai', 'kia'],
+        'Volkswagen': ['vw', 'volkswagen group', 'groupe volkswagen'],
+        'Stellantis': ['peugeot', 'fiat', 'psa'],
+    },
+    'Region': {
+        'Asia_Pacific': ['asie pacifique', 'asie', 'apac', 'asia'],
+        'China': ['chine'],
+        'North_America': ['amerique du nord', 'amerique', 'etats unis', 'usa'],
+    },
+    'Category': {
+        'Electric_Vehicles': ['vehicules electriques', 'vehicule electrique', 'voitures electriques',
+                              'electriques', 'electrique', 'ev', 've'],
+        'Passenger_Cars': ['voitures particulieres', 'voiture particuliere', 'vehicules particuliers',
+                           'voitures', 'tourisme', 'particuliers'],
+        'Commercial_Vehicles': ['vehicules commerciaux', 'vehicules utilitaires', 'utilitaires',
+                                'utilitaire', 'commerciaux', 'camions'],
+    },
+}
+
+# Mots désignant une dimension (axe d'un classement)
+DIMENSION_WORDS = {
+    'Manufacturer': ['constructeur', 'constructeurs', 'fabricant', 'fabricants', 'marque', 'marques'],
+    'Region': ['region', 'regions', 'zone', 'zones', 'marche geographique', 'pays'],
+    'Category': ['categorie', 'categories', 'segment', 'segments'],
+    'Year': ['annee', 'annees'],
+}
+
+DIMENSION_LABELS = {'Manufacturer': "constructeur", 'Region': "région", 'Category': "catégorie", 'Year': "année"}
+
+# Intentions (par priorité décroissante)
+INTENT_WORDS = {
+    'share': ['part de marche', 'parts de marche', 'poids dans le marche'],
+    'ranking': ['leader', 'leaders', 'top', 'classement', 'premier', 'premiers', 'meilleur', 'meilleurs',
+                'plus gros', 'plus grand', 'plus grands', 'domine', 'dominent', 'principaux', 'qui produit le plus',
+                'produit le plus', 'produisent le plus', 'vend le plus', 'vendent le plus'],
+    'compare': ['compare', 'comparer', 'comparaison', 'versus', 'vs', 'face a', 'contre'],
+    'evolution': ['evolution', 'evolue', 'croissance', 'tendance', 'progression', 'augmente', 'augmentation',
+                  'baisse', 'historique', 'tcam', 'depuis'],
+}
+
+RANKING_SIZE = 3
+
+# Mots courants d'une question: jamais pris pour un nom propre inconnu
+# (les alias des indicateurs, entités, dimensions et intentions le sont déjà)
+COMMON_WORDS = {
+    'qui', 'que', 'qu', 'quoi', 'quel', 'quelle', 'quels', 'quelles', 'combien', 'comment', 'ou', 'quand',
+    'pourquoi', 'est', 'sont', 'a', 'ont', 'le', 'la', 'les', 'l', 'un', 'une', 'des', 'de', 'du', 'd', 'en',
+    'et', 'au', 'aux', 'pour', 'par', 'sur', 'dans', 'avec', 'chez', 'entre', 'depuis', 'apres', 'avant',
+    'donne', 'donnez', 'montre', 'montrez', 'affiche', 'affichez', 'moi', 'nous', 'vous', 'je', 'j', 'tu',
+    'ce', 'cette', 'ces', 'c', 'il', 'y', 'plus', 'moins', 'total', 'totale', 'mondial', 'mondiale', 'monde',
+    'marche', 'niveau', 'annee', 'dernier', 'derniere', 'actuel', 'actuelle', 'vente', 'ventes', 'bonjour',
+    'merci', 'stp', 'svp',
+}
+
+HELP_MESSAGE = (
+    "Je n'ai pas reconnu de constructeur, de région, de catégorie, d'année ou d'indicateur dans "
+    "votre question.\n"
+    "Exemples : « Production de Toyota en 2022 », « Part EV en Europe », « Compare Ford et GM », "
+    "« Leader en Chine », « Évolution du prix moyen depuis 2015 », « Part de marché de Stellantis »."
+)
+
+
+# =============================================================================
+# NORMALISATION ET FORMATAGE
+# =============================================================================
+
+def normalize_query(query):
+    """
+    Forme canonique d'une question (clé de mémoire et texte analysé).
+
+    Minuscules, accents retirés, ponctuation remplacée par des espaces,
+    espaces regroupés: "Quelle est la part EV en Europe ?" et
+    "quelle est la part ev en europe" ont la même clé.
+
+    Args:
+        query (str): Question saisie
+
+    Returns:
+        str: Question normalisée
+    """
+    text = unicodedata.normalize('NFKD', str(query).lower())
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    text = re.sub(r'[^a-z0-9]+', ' ', text)
+    return ' '.join(text.split())
+
+
+def _alias_pattern(alias):
+    return re.compile(r'\b' + re.escape(normalize_query(alias)) + r'\b')
+
+
+def _within(span, spans):
+    """Position contenue dans une position plus longue de `spans`."""
+    start, end = span
+    return any(outer_start <= start and end <= outer_end and outer_end - outer_start > end - start
+               for outer_start, outer_end in spans)
+
+
+def format_value(value, unit):
+    """Valeur d'un indicateur formatée pour la réponse."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return "n/d"
+    if unit == 'volume':
+        if abs(value) >= 1e6:
+            return f"{value / 1e6:.2f}M véhicules"
+        return f"{value:,.0f} véhicules".replace(',', ' ')
+    if unit == 'revenue':
+        if abs(value) >= 1e9:
+            return f"{value / 1e9:.1f} Md€"
+        return f"{value / 1e6:.1f} M€"
+    if unit == 'price':
+        return f"{value:,.0f} €".replace(',', ' ')
+    if unit == 'steel':
+        return f"{value:,.0f} $/t".replace(',', ' ')
+    if unit == 'oil':
+        return f"{value:.1f} $/baril"
+    if unit == 'percent':
+        return f"{value * 100:.1f}%"
+    return f"{value:,.2f}"
+
+
+def _format_years(years):
+    if len(years) == 1:
+        return f"en {years[0]}"
+    if list(years) == list(range(years[0], years[-1] + 1)):
+        return f"sur {years[0]}-{years[-1]}"
+    return "en " + ", ".join(str(year) for year in years)
+
+
+# =============================================================================
+# MOTEUR
+# =============================================================================
+
+class ChatbotEngine:
+    """
+    Réponses de l'assistant calculées sur le cube d'agrégats.
+
+    Attributes:
+        cube (AggregateCube): Cube Year × Region × Manufacturer × Category
+        version: Version du dataset (clé de mémoire, ex: empreinte du fichier)
+        years (list): Années disponibles, triées
+        levels (dict): {dimension: valeurs présentes}
+    """
+
+    def __init__(self, cube, version=None, memo_size=DEFAULT_MEMO_SIZE):
+        """
+        Construction des vocabulaires à partir des cellules du cube.
+
+        Args:
+            cube (AggregateCube): Cube d'agrégats (partagé, lecture seule)
+            version: Version du dataset servi par le cube
+            memo_size (int): Nombre maximal de réponses mémorisées
+        """
+        self.cube = cube
+        self.version = version
+        self.years = sorted(int(year) for year in cube.cells['Year'].unique())
+        self.levels = {
+            dimension: sorted(cube.cells[dimension].dropna().unique().tolist())
+            for dimension in DIMENSIONS if dimension != 'Year'
+        }
+        self.metrics = {name: spec for name, spec in METRICS.items() if name in cube.measures}
+
+        metric_aliases = [(alias, name) for name, spec in self.metrics.items() for alias in spec['aliases']]
+        entity_aliases = [
+            (alias, (dimension, value))
+            for dimension, values in self.levels.items()
+            for value in values
+            for alias in [value.replace('_', ' ').replace('-', ' ')] + ENTITY_ALIASES.get(dimension, {}).get(value, [])
+        ]
+        dimension_words = [(word, dimension) for dimension, words in DIMENSION_WORDS.items() for word in words]
+
+        # Alias les plus longs d'abord: "part des vehicules electriques"
+        # (indicateur) avant "vehicules electriques" (catégorie)
+        self._metric_patterns = self._patterns(metric_aliases)
+        self._entity_patterns = self._patterns(entity_aliases)
+        self._dimension_patterns = self._patterns(dimension_words)
+        self._intent_patterns = {
+            intent: [_alias_pattern(word) for word in words] for intent, words in INTENT_WORDS.items()
+        }
+
+        # Vocabulaire reconnu (noms propres inconnus: tout autre mot en capitale)
+        aliases = [alias for alias, _ in metric_aliases + entity_aliases + dimension_words]
+        aliases += [word for words in INTENT_WORDS.values() for word in words]
+        self._known_words = set(COMMON_WORDS).union(*(normalize_query(alias).split() for alias in aliases))
+
+        self._answer_memo = functools.lru_cache(maxsize=memo_size)(self._answer)
+
+    @staticmethod
+    def _patterns(pairs):
+        pairs = {normalize_query(alias): target for alias, target in pairs}
+        return [(_alias_pattern(alias), target) for alias in sorted(pairs, key=len, reverse=True)
+                for target in [pairs[alias]]]
+
+    # -------------------------------------------------------------------------
+    # API PUBLIQUE
+    # -------------------------------------------------------------------------
+
+    def answer(self, query):
+        """
+        Réponse à une question (mémorisée par question normalisée et version).
+
+        Args:
+            query (str): Question saisie
+
+        Returns:
+            str: Réponse en texte brut (une ligne par résultat)
+        """
+        text = normalize_query(query)
+        if not text:
+            return HELP_MESSAGE
+        # Noms propres lus sur la question saisie (la casse est perdue à la
+        # normalisation), dans la clé de mémoire
+        return self._answer_memo(self.version, text, self._unknown_names(query))
+
+    def parse(self, query):
+        """
+        Analyse d'une question: intention, indicateur, entités et années.
+
+        Args:
+            query (str): Question (normalisée ou non)
+
+        Returns:
+            dict: {'intent', 'metric', 'entities': {dimension: [valeurs]},
+                   'years': [années], 'out_of_range': [années absentes],
+                   'axis': dimension de classement citée ou None,
+                   'unknown': [noms propres absents du cube]}
+        """
+        text = f" {normalize_query(query)} "
+
+        # Intentions cherchées sur la question entière ("qui produit le plus":
+        # "produit" est aussi un alias de la production), sauf à l'intérieur
+        # d'un alias d'indicateur plus long ("croissance du pib")
+        metric_spans = [match.span() for pattern, _ in self._metric_patterns for match in pattern.finditer(text)]
+        intent = 'value'
+        for candidate, patterns in self._intent_patterns.items():
+            if any(not _within(match.span(), metric_spans) for pattern in patterns for match in pattern.finditer(text)):
+                intent = candidate
+                break
+
+        metric, text = self._first_match(self._metric_patterns, text)
+
+        # Entités, dans l'ordre de la question (ordre des comparaisons)
+        found = []
+        for pattern, (dimension, value) in self._entity_patterns:
+            for match in pattern.finditer(text):
+                found.append((match.start(), dimension, value))
+            text = pattern.sub(' ', text)
+        entities = {}
+        for _, dimension, value in sorted(found):
+            if value not in entities.setdefault(dimension, []):
+                entities[dimension].append(value)
+
+        years, out_of_range = self._parse_years(text)
+        axis, _ = self._first_match(self._dimension_patterns, text)
+
+        if intent == 'value' and any(len(values) > 1 for values in entities.values()):
+            intent = 'compare'
+
+        return {'intent': intent, 'metric': metric, 'entities': entities,
+                'years': years, 'out_of_range': out_of_range, 'axis': axis,
+                'unknown': list(self._unknown_names(query))}
+
+    def memo_info(self):
+        """Statistiques de la mémoire des réponses (hits, misses, taille)."""
+        return self._answer_memo.cache_info()
+
+    # -------------------------------------------------------------------------
+    # ANALYSE
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _first_match(patterns, text):
+        """Première cible reconnue (alias le plus long) et texte sans cet alias."""
+        for pattern, target in patterns:
+            if pattern.search(text):
+                return target, pattern.sub(' ', text)
+        return None, text
+
+    def _unknown_names(self, query):
+        """
+        Mots en capitale de la question absents du vocabulaire ("Tesla", "BYD").
+
+        Le premier mot d'une phrase ("Peux-tu", "Dis-moi") porte la capitale
+        de la phrase, pas celle d'un nom propre: il n'est jamais retenu.
+        """
+        query = str(query)
+        names = []
+        for match in re.finditer(r"[^\W\d_][\w'’-]*", query):
+            word = match.group()
+            sentence_start = re.search(r'(?:^|[.!?])\W*$', query[:match.start()]) is not None
+            if word[0].isupper() and not sentence_start and word not in names \
+                    and not set(normalize_query(word).split()) <= self._known_words:
+                names.append(word)
+        return tuple(names)
+
+    def _parse_years(self, text):
+        """Années citées (plages "entre X et Y", "de X à Y", "depuis X")."""
+        first, last = self.years[0], self.years[-1]
+        span = re.search(r'\b(?:entre|de|du)\s+((?:19|20)\d{2})\s+(?:et|a|au)\s+((?:19|20)\d{2})\b', text)
+        since = re.search(r'\b(?:depuis|apres)\s+((?:19|20)\d{2})\b', text)
+        if span:
+            start, stop = sorted((int(span.group(1)), int(span.group(2))))
+            requested = list(range(start, stop + 1))
+        elif since:
+            requested = list(range(int(since.group(1)), max(last, int(since.group(1))) + 1))
+        else:
+            requested = sorted({int(year) for year in re.findall(r'\b((?:19|20)\d{2})\b', text)})
+
+        years = [year for year in requested if first <= year <= last]
+        out_of_range = [year for year in requested if not first <= year <= last]
+        # Plage à cheval sur la période couverte: restreinte aux années disponibles
+        if (span or since) and years:
+            out_of_range = []
+        return years, out_of_range
+
+    # -------------------------------------------------------------------------
+    # CALCUL DES RÉPONSES
+    # -------------------------------------------------------------------------
+
+    def _answer(self, version, text, unknown=()):
+        # `version` fait partie de la clé de mémoire: un dataset mis à jour
+        # n'est jamais servi avec les réponses de l'ancien
+        parsed = self.parse(text)
+        if parsed['out_of_range']:
+            return self._out_of_range(parsed['out_of_range'])
+        if unknown:
+            return self._unknown(unknown)
+        if parsed['metric'] is None and not parsed['entities'] and not parsed['years'] \
+                and parsed['intent'] == 'value':
+            return HELP_MESSAGE
+
+        metric = parsed['metric'] or DEFAULT_METRIC
+        handler = {
+            'share': self._answer_share,
+            'ranking': self._answer_ranking,
+            'compare': self._answer_compare,
+            'evolution': self._answer_evolution,
+        }.get(parsed['intent'], self._answer_value)
+        return handler(metric, parsed)
+
+    def _out_of_range(self, years):
+        first, last = self.years[0], self.years[-1]
+        message = (f"Les données couvrent {first}-{last} : aucune observation "
+                   f"{_format_years(sorted(years))}.")
+        if max(years) > last:
+            message += " Les projections sont disponibles dans la page 🔮 Prospective 2030."
+        return message
+
+    def _unknown(self, names):
+        quoted = ", ".join(f"« {name} »" for name in names)
+        verb = "n'est pas reconnu" if len(names) == 1 else "ne sont pas reconnus"
+        lines = [f"{quoted} {verb} dans les données. Valeurs disponibles :"]
+        lines += [f"• {DIMENSION_LABELS[dimension].capitalize()}s : {', '.join(values)}"
+                  for dimension, values in self.levels.items()]
+        return "\n".join(lines)
+
+    def _filters(self, entities, years, exclude=()):
+        filters = {dimension: values for dimension, values in entities.items() if dimension not in exclude}
+        if years and 'Year' not in exclude:
+            filters['Year'] = years
+        return filters
+
+    def _scope(self, entities, years, exclude=()):
+        """Libellé du périmètre: "Toyota, Europe, en 2022"."""
+        parts = [" et ".join(values) for dimension, values in entities.items() if dimension not in exclude]
+        if years:
+            parts.append(_format_years(years))
+        return ", ".join(parts) if parts else "marché total"
+
+    def _value(self, metric, filters):
+        return self.cube.total(metric, self.metrics[metric]['stat'], filters=filters)
+
+    def _answer_value(self, metric, parsed):
+        spec = self.metrics[metric]
+        years = parsed['years'] or self.years[-1:]
+        value = self._value(metric, self._filters(parsed['entities'], years))
+        label = spec['label'][0].upper() + spec['label'][1:]
+        if spec['stat'] == 'mean' and len(years) > 1:
+            label += " (moyenne)"
+        return f"{label} — {self._scope(parsed['entities'], years)} : {format_value(value, spec['unit'])}"
+
+    def _answer_compare(self, metric, parsed):
+        spec = self.metrics[metric]
+        entities = parsed['entities']
+        years = parsed['years'] or self.years[-1:]
+
+        # Dimension comparée: la première avec plusieurs valeurs, sinon les années citées
+        dimension = next((name for name, values in entities.items() if len(values) > 1), None)
+        if dimension is None and len(parsed['years']) > 1:
+            series = self.cube.rollup('Year', metric, spec['stat'], filters=self._filters(entities, years))
+            rows = [(str(year), series.get(year, float('nan'))) for year in years]
+            scope = self._scope(entities, [], exclude=('Year',))
+        elif dimension is None:
+            return ("Précisez au moins deux constructeurs, régions, catégories ou années à comparer "
+                    "(ex: « Compare Ford et GM »).")
+        else:
+            series = self.cube.rollup(dimension, metric, spec['stat'],
+                                      filters=self._filters(entities, years))
+            rows = [(value, series.get(value, float('nan'))) for value in entities[dimension]]
+            scope = self._scope(entities, years, exclude=(dimension,))
+
+        lines = [f"Comparaison — {spec['label']}, {scope} :"]
+        lines += [f"• {name} : {format_value(value, spec['unit'])}" for name, value in rows]
+        (first_name, first), (second_name, second) = rows[0], rows[1]
+        if spec['unit'] == 'percent':
+            lines.append(f"Écart {first_name} / {second_name} : {(first - second) * 100:+.1f} pts")
+        elif second:
+            lines.append(f"Écart {first_name} / {second_name} : {(first / second - 1) * 100:+.1f}%")
+        return "\n".join(lines)
+
+    def _answer_ranking(self, metric, parsed):
+        spec = self.metrics[metric]
+        entities = parsed['entities']
+        years = parsed['years'] or self.years[-1:]
+
+        # Axe du classement: dimension citée ("régions"), sinon constructeurs
+        # (ou une dimension qui n'est pas déjà restreinte à une valeur)
+        axis = parsed['axis'] if parsed['axis'] not in (None, 'Year') else None
+        if axis is None:
+            axis = next((name for name in ['Manufacturer', 'Region', 'Category']
+                         if len(entities.get(name, [])) != 1), 'Manufacturer')
+
+        filters = self._filters(entities, years, exclude=(axis,))
+        series = self.cube.rollup(axis, metric, spec['stat'], filters=filters).sort_values(ascending=False)
+        if series.empty:
+            return f"Aucune donnée pour {self._scope(entities, years, exclude=(axis,))}."
+
+        total = series.sum() if spec['stat'] == 'sum' else None
+        lines = [f"Classement des {DIMENSION_LABELS[axis]}s — {spec['label']}, "
+                 f"{self._scope(entities, years, exclude=(axis,))} :"]
+        for rank, (name, value) in enumerate(series.head(RANKING_SIZE).items(), start=1):
+            share = f" ({value / total * 100:.1f}%)" if total else ""
+            lines.append(f"{rank}. {name} : {format_value(value, spec['unit'])}{share}")
+        return "\n".join(lines)
+
+    def _answer_evolution(self, metric, parsed):
+        spec = self.metrics[metric]
+        entities = parsed['entities']
+        years = parsed['years'] if len(parsed['years']) > 1 else self.years
+
+        series = self.cube.rollup('Year', metric, spec['stat'],
+                                  filters=self._filters(entities, years)).sort_index()
+        if len(series) < 2:
+            return f"Pas assez d'années pour une évolution ({self._scope(entities, years)})."
+
+        first_year, last_year = int(series.index[0]), int(series.index[-1])
+        first, last = series.iloc[0], series.iloc[-1]
+        peak_year = int(series.idxmax())
+        label = spec['label'][0].upper() + spec['label'][1:]
+        scope = self._scope(entities, list(range(first_year, last_year + 1)))
+        lines = [f"{label} — {scope} :",
+                 f"• {first_year} : {format_value(first, spec['unit'])} → {last_year} : "
+                 f"{format_value(last, spec['unit'])}"]
+        if spec['unit'] == 'percent':
+            lines.append(f"• Variation : {(last - first) * 100:+.1f} pts")
+        elif first > 0 and last > 0:
+            cagr = ((last / first) ** (1 / (last_year - first_year)) - 1) * 100
+            lines.append(f"• Variation : {(last / first - 1) * 100:+.1f}% (TCAM {cagr:+.1f}%/an)")
+        lines.append(f"• Maximum : {peak_year} ({format_value(series.max(), spec['unit'])})")
+        return "\n".join(lines)
+
+    def _answer_share(self, metric, parsed):
+        # Part de marché: indicateur additif uniquement (production par défaut)
+        if self.metrics[metric]['stat'] != 'sum':
+            metric = DEFAULT_METRIC
+        spec = self.metrics[metric]
+        entities = parsed['entities']
+        years = parsed['years'] or self.years[-1:]
+
+        dimension = next((name for name in ['Manufacturer', 'Region', 'Category'] if name in entities), None)
+        if dimension is None:
+            # "Parts de marché en Europe": classement avec parts
+            return self._answer_ranking(metric, parsed)
+
+        market = self._filters(entities, years, exclude=(dimension,))
+        total = self._value(metric, market)
+        series = self.cube.rollup(dimension, metric, spec['stat'], filters=market)
+        scope = self._scope(entities, years, exclude=(dimension,))
+
+        lines = [f"Part de marché ({spec['label']}) — {scope} :"]
+        for value in entities[dimension]:
+            amount = series.get(value, 0.0)
+            share = amount / total * 100 if total else float('nan')
+            lines.append(f"• {value} : {share:.1f}% ({format_value(amount, spec['unit'])} "
+                         f"sur {format_value(total, spec['unit'])})")
+        return "\n".join(lines)
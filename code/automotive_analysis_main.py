@@ -39,38 +39,97 @@ Scénarios analysés:
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime, timedelta
 import warnings
 import os
+import sys
+import io
 import json
 import pickle
-from tqdm import tqdm
+import inspect
+import contextlib
 
 # Suppression des avertissements pour une sortie propre
 warnings.filterwarnings('ignore')
 
-# Modèles de Machine Learning et métriques
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split, TimeSeriesSplit
-from sklearn.linear_model import LinearRegression
-import joblib
+# Modèles de prévision (Régression linéaire, XGBoost, Prophet, ARIMA),
+# ajustés en parallèle par l'ordonnanceur d'entraînement (librairies de
+# modélisation importées par chaque tâche, au premier ajustement)
+from training_scheduler import (
+    TrainingTask, fit_arima, fit_linear, fit_prophet, fit_xgboost,
+    run_training_tasks, score_xgboost_fold
+)
 
-# Modèles avancés de prévision
-import xgboost as xgb
-from prophet import Prophet
-from statsmodels.tsa.arima.model import ARIMA
+# Générateur vectorisé du panel synthétique
+from panel_generator import PanelConfig, generate_panel
 
-# Visualisation interactive
-import plotly.express as px
+# Prévisions hiérarchiques par segment (fabricant × région × catégorie)
+from segment_forecasting import DEFAULT_MODEL_PARAMS, SEGMENT_DIMENSIONS, forecast_segments
+
+# Mise à jour incrémentale des modèles après un nouveau mois de données
+from incremental_training import arima_profile, update_models, xgboost_profile
+
+# Réglage des hyperparamètres XGBoost sous budget de temps
+from hyperparameter_search import DEFAULT_TIME_BUDGET, search_xgboost
+
+# Grille de caractéristiques des scénarios et simulation Monte Carlo
+from scenario_simulation import SCENARIO_DEFAULTS, build_feature_grid, simulate_all_scenarios
+
+# Modules partagés à la racine du projet (chargeur colonnaire du dataset)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_store import load_dataset
+from model_cache import ModelCache, training_key
+from model_registry import ModelRegistry
+from dashboard_export import write_dashboard
+from lazy_imports import lazy_callable, lazy_module
+
+# Visualisation interactive (plotly.express et les sous-graphiques ne sont
+# chargés qu'à la création des dashboards)
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+px = lazy_module('plotly.express')
+make_subplots = lazy_callable('plotly.subplots', 'make_subplots')
+
+# =============================================================================
+# DASHBOARDS GÉNÉRÉS
+# =============================================================================
+
+# Dashboard → (méthode de rendu, entrées, fichier de sortie)
+DASHBOARD_BUILDS = {
+    'principal': ('_create_main_dashboard', ('df', 'forecasts'), 'dashboard_principal_automobile.html'),
+    'fabricants': ('_create_manufacturer_dashboard', ('df',), 'dashboard_fabricants_automobile.html'),
+    'transition_electrique': ('_create_ev_transition_dashboard', ('df', 'forecasts'), 'dashboard_transition_electrique.html'),
+    'modeles_ml': ('_create_ml_models_dashboard', ('forecasts', 'models'), 'dashboard_modeles_ml.html'),
+    'economique_strategique': ('_create_economic_strategic_dashboard', ('df', 'forecasts'), 'dashboard_analyse_economique_strategique.html'),
+    'intelligence_concurrentielle': ('_create_competitive_intelligence_dashboard', ('df', 'forecasts'), 'dashboard_intelligence_concurrentielle.html'),
+    'risques_opportunites': ('_create_risk_opportunity_dashboard', ('df', 'forecasts'), 'dashboard_risques_opportunites.html'),
+    'geographique_avance': ('_create_advanced_geographic_dashboard', ('df', 'forecasts'), 'dashboard_analyse_geographique_avancee.html'),
+    'executif': ('_create_executive_dashboard', ('df', 'forecasts'), 'dashboard_executif_direction.html')
+}
+
+# Empreintes des dashboards générés (reconstruction incrémentale)
+DASHBOARD_FINGERPRINTS = '.dashboard_fingerprints.json'
+
+
+def _render_dashboard(method, args, dashboard_mode, dashboard_gzip):
+    """
+    Rendu d'un dashboard dans un processus du pool.
+
+    Les méthodes `_create_*_dashboard` n'utilisent que leurs arguments et la
+    configuration d'export: une instance légère (sans données ni modèles)
+    suffit. La sortie console est capturée et renvoyée au processus parent.
+
+    Returns:
+        str: Messages affichés pendant le rendu
+    """
+    renderer = AutomotiveAnalysis.__new__(AutomotiveAnalysis)
+    renderer.dashboard_mode = dashboard_mode
+    renderer.dashboard_gzip = dashboard_gzip
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        getattr(renderer, method)(*args)
+    return output.getvalue()
 
-# Configuration des graphiques
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
 
 # =============================================================================
 # CLASSE PRINCIPALE D'ANALYSE
@@ -88,24 +147,31 @@ class AutomotiveAnalysis:
     - Produire les recommandations stratégiques
     """
     
-    def __init__(self, data_file='comprehensive_automotive_data.csv'):
+    def __init__(self, data_file='comprehensive_automotive_data.csv', dashboard_mode='shared', dashboard_gzip=False):
         """
         Initialisation de la classe d'analyse.
         
         Args:
             data_file (str): Nom du fichier de données à utiliser
+            dashboard_mode (str): Export des dashboards ('shared': Plotly.js
+                partagé, 'json': spécifications JSON, 'standalone': HTML autonome)
+            dashboard_gzip (bool): Écrire aussi des copies .gz des dashboards
         """
         self.data_file = data_file
+        self.dashboard_mode = dashboard_mode
+        self.dashboard_gzip = dashboard_gzip
         self.df = None                    # DataFrame principal
         self.models = {}                  # Dictionnaire des modèles entraînés
         self.scenarios = {}               # Dictionnaire des scénarios
         self.forecasts = {}               # Dictionnaire des prévisions
+        self.simulations = {}             # Bandes Monte Carlo par scénario
+        self.segment_forecasts = {}       # Prévisions réconciliées par segment
         self.recommendations = {}         # Dictionnaire des recommandations
         
         print("🚗 Initialisation de l'analyse automobile...")
         print(f"📁 Fichier de données: {data_file}")
     
-    def create_automotive_dataset(self):
+    def create_automotive_dataset(self, config=None):
         """
         Création d'un dataset automobile complet et réaliste.
         
@@ -116,6 +182,16 @@ class AutomotiveAnalysis:
         - Période 2010-2023 (données mensuelles)
         - Variables économiques et politiques
         
+        La génération est entièrement vectorisée (voir `panel_generator`):
+        le cube date × fabricant × catégorie × région est construit en une
+        seule passe NumPy avec des flux aléatoires reproductibles. Pour les
+        panels de stress-test trop grands pour la mémoire, utiliser
+        `panel_generator.write_panel` qui écrit le panel par blocs.
+        
+        Args:
+            config (PanelConfig): Dimensions, période et graine du panel
+                (défaut: configuration de référence ci-dessus)
+        
         Returns:
             pd.DataFrame: Dataset complet avec toutes les variables
         """
@@ -125,35 +201,16 @@ class AutomotiveAnalysis:
         # CONFIGURATION DES PARAMÈTRES DE BASE
         # =================================================================
         
-        # Période d'analyse: 2010-2023 (mensuel)
-        dates = pd.date_range('2010-01-01', '2023-12-31', freq='ME')
+        config = config or PanelConfig()
+        
+        # Période d'analyse (mensuelle par défaut)
+        dates = config.dates()
         n_periods = len(dates)
         print(f"📅 Période: {dates[0].strftime('%Y-%m')} à {dates[-1].strftime('%Y-%m')} ({n_periods} mois)")
         
-        # Fabricants principaux analysés
-        manufacturers = [
-            'Toyota',           # Leader mondial
-            'Volkswagen',       # Leader européen
-            'Ford',            # Leader américain traditionnel
-            'Hyundai-Kia',     # Leader coréen
-            'Stellantis',      # Groupe européen (ex-FCA/PSA)
-            'GM'               # General Motors
-        ]
-        
-        # Catégories de véhicules
-        categories = [
-            'Passenger_Cars',      # Voitures particulières
-            'Commercial_Vehicles', # Véhicules commerciaux
-            'Electric_Vehicles'    # Véhicules électriques
-        ]
-        
-        # Régions d'analyse
-        regions = [
-            'North_America',    # États-Unis, Canada, Mexique
-            'Europe',          # Union Européenne + UK
-            'Asia_Pacific',    # Japon, Corée, Australie, etc.
-            'China'            # Chine (marché spécifique)
-        ]
+        manufacturers = config.manufacturers
+        categories = config.categories
+        regions = config.regions
         
         print(f"🏭 Fabricants: {len(manufacturers)} ({', '.join(manufacturers)})")
         print(f"🚙 Catégories: {len(categories)} ({', '.join(categories)})")
@@ -163,211 +220,10 @@ class AutomotiveAnalysis:
         # GÉNÉRATION DES DONNÉES
         # =================================================================
         
-        data_rows = []
         total_combinations = len(dates) * len(manufacturers) * len(categories) * len(regions)
-        
         print(f"📊 Génération de {total_combinations:,} observations...")
         
-        # Boucle principale de génération des données
-        for i, date in enumerate(tqdm(dates, desc="Génération données")):
-            for manufacturer in manufacturers:
-                for category in categories:
-                    for region in regions:
-                        
-                        # =============================================
-                        # CALCUL DE LA PRODUCTION
-                        # =============================================
-                        
-                        # Volume de base par fabricant (unités/mois)
-                        base_production_volumes = {
-                            'Toyota': 120000,      # Leader mondial
-                            'Volkswagen': 110000,  # Fort en Europe
-                            'Ford': 90000,         # Traditionnel US
-                            'Hyundai-Kia': 80000,  # Croissance asiatique
-                            'Stellantis': 75000,   # Groupe européen
-                            'GM': 95000            # Traditionnel US
-                        }
-                        
-                        # Facteur par catégorie de véhicule
-                        category_factors = {
-                            'Passenger_Cars': 1.0,     # Catégorie principale
-                            'Commercial_Vehicles': 0.3, # Plus petit marché
-                            # Croissance progressive des VE (2010: 5% -> 2023: 35%)
-                            'Electric_Vehicles': 0.05 + (i/n_periods) * 0.30
-                        }
-                        
-                        # Facteur par région (spécialisation géographique)
-                        regional_factors = {
-                            'North_America': 0.25,  # 25% de la production
-                            'Europe': 0.30,         # 30% de la production
-                            'Asia_Pacific': 0.35,   # 35% de la production
-                            'China': 0.40           # 40% de la production (marché énorme)
-                        }
-                        
-                        # Calcul du volume de base
-                        base_volume = base_production_volumes[manufacturer]
-                        category_factor = category_factors[category]
-                        regional_factor = regional_factors[region]
-                        
-                        # Tendance temporelle (croissance 15% sur la période)
-                        trend_factor = 1 + (i/n_periods) * 0.15
-                        
-                        # Saisonnalité (variation ±10% selon le mois)
-                        seasonality_factor = 1 + 0.1 * np.sin(2 * np.pi * i / 12)
-                        
-                        # Bruit aléatoire (±8% de variation)
-                        noise_factor = np.random.normal(1, 0.08)
-                        
-                        # Volume final de production
-                        production_volume = int(
-                            base_volume * 
-                            category_factor * 
-                            regional_factor * 
-                            trend_factor * 
-                            seasonality_factor * 
-                            noise_factor
-                        )
-                        
-                        # Assurer un minimum de 1000 unités
-                        production_volume = max(production_volume, 1000)
-                        
-                        # =============================================
-                        # CALCUL DES PRIX
-                        # =============================================
-                        
-                        # Prix de base par catégorie (USD)
-                        base_prices = {
-                            'Passenger_Cars': 25000,      # Voitures particulières
-                            'Commercial_Vehicles': 45000,  # Véhicules commerciaux
-                            'Electric_Vehicles': 40000     # Véhicules électriques
-                        }
-                        
-                        # Premium par fabricant
-                        manufacturer_premiums = {
-                            'Toyota': 1.10,        # Premium qualité
-                            'Volkswagen': 1.15,    # Premium européen
-                            'Ford': 1.00,          # Prix standard
-                            'Hyundai-Kia': 0.90,   # Positionnement value
-                            'Stellantis': 1.05,    # Léger premium
-                            'GM': 1.00             # Prix standard
-                        }
-                        
-                        # Calcul du prix
-                        base_price = base_prices[category]
-                        manufacturer_premium = manufacturer_premiums[manufacturer]
-                        
-                        # Inflation (2% par an depuis 2010)
-                        years_since_2010 = date.year - 2010
-                        inflation_factor = (1.02) ** years_since_2010
-                        
-                        # Volatilité des prix (±3%)
-                        price_volatility = np.random.normal(1, 0.03)
-                        
-                        # Prix final
-                        average_price = round(
-                            base_price * 
-                            manufacturer_premium * 
-                            inflation_factor * 
-                            price_volatility, 
-                            2
-                        )
-                        
-                        # =============================================
-                        # INDICATEURS ÉCONOMIQUES
-                        # =============================================
-                        
-                        # Croissance du PIB (cycle économique)
-                        gdp_base = 0.02  # 2% de base
-                        gdp_cycle = 0.01 * np.sin(2 * np.pi * i / 60)  # Cycle 5 ans
-                        gdp_noise = np.random.normal(0, 0.005)
-                        gdp_growth = gdp_base + gdp_cycle + gdp_noise
-                        
-                        # Prix de l'acier (matière première critique)
-                        steel_base = 700  # USD/tonne
-                        steel_cycle = 50 * np.sin(2 * np.pi * i / 36)  # Cycle 3 ans
-                        steel_volatility = np.random.normal(0, 30)
-                        steel_price = steel_base + steel_cycle + steel_volatility
-                        
-                        # =============================================
-                        # POLITIQUES AMÉRICAINES
-                        # =============================================
-                        
-                        # Évolution des tarifs douaniers US
-                        if date.year < 2018:
-                            tariff_rate = 0.025      # 2.5% (période normale)
-                        elif date.year < 2021:
-                            tariff_rate = 0.05       # 5% (guerre commerciale)
-                        else:
-                            tariff_rate = 0.035      # 3.5% (normalisation partielle)
-                        
-                        # Subventions véhicules électriques
-                        if date.year < 2022:
-                            ev_subsidy = 7500        # Subvention standard
-                        else:
-                            # Augmentation progressive avec IRA
-                            ev_subsidy = 7500 + 1000 * (date.year - 2022)
-                        
-                        # =============================================
-                        # TRANSITION ÉLECTRIQUE
-                        # =============================================
-                        
-                        # Part des véhicules électriques (courbe sigmoïde)
-                        years_elapsed = date.year - 2010
-                        # Paramètres: L=40% max, k=0.3 vitesse, x0=8 point d'inflexion
-                        ev_share = 0.4 / (1 + np.exp(-0.3 * (years_elapsed - 8)))
-                        
-                        # =============================================
-                        # AUTRES VARIABLES
-                        # =============================================
-                        
-                        # Prix du pétrole (cycle avec volatilité)
-                        oil_base = 70  # USD/baril
-                        oil_cycle = 20 * np.sin(2 * np.pi * i / 24)  # Cycle 2 ans
-                        oil_volatility = np.random.normal(0, 10)
-                        oil_price = oil_base + oil_cycle + oil_volatility
-                        
-                        # Taux d'intérêt (cycle économique)
-                        interest_base = 0.03  # 3% de base
-                        interest_cycle = 0.02 * np.sin(2 * np.pi * i / 84)  # Cycle 7 ans
-                        interest_noise = np.random.normal(0, 0.005)
-                        interest_rate = interest_base + interest_cycle + interest_noise
-                        
-                        # =============================================
-                        # CRÉATION DE L'OBSERVATION
-                        # =============================================
-                        
-                        row = {
-                            # Identifiants
-                            'Date': date,
-                            'Manufacturer': manufacturer,
-                            'Category': category,
-                            'Region': region,
-                            
-                            # Variables cibles
-                            'Production_Volume': production_volume,
-                            'Average_Price': average_price,
-                            
-                            # Indicateurs économiques
-                            'GDP_Growth': round(gdp_growth, 4),
-                            'Steel_Price': round(max(steel_price, 400), 2),
-                            'Oil_Price': round(max(oil_price, 30), 2),
-                            'Interest_Rate': round(max(interest_rate, 0.001), 4),
-                            
-                            # Politiques américaines
-                            'US_Tariff_Rate': round(tariff_rate, 4),
-                            'US_EV_Subsidy': round(ev_subsidy, 0),
-                            
-                            # Transition électrique
-                            'EV_Share': round(ev_share, 4)
-                        }
-                        
-                        data_rows.append(row)
-        
-        # =================================================================
-        # CRÉATION DU DATAFRAME FINAL
-        # =================================================================
-        
-        df = pd.DataFrame(data_rows)
+        df = generate_panel(dates, manufacturers, categories, regions, seed=config.seed)
         
         # Sauvegarde du dataset
         df.to_csv(self.data_file, index=False)
@@ -379,7 +235,8 @@ class AutomotiveAnalysis:
         
         return df
 
-    def train_all_models(self, df):
+    def train_all_models(self, df, max_workers=None, use_cache=True, tune=False, tuning_budget=DEFAULT_TIME_BUDGET,
+                         only=None):
         """
         Entraînement de tous les modèles de machine learning demandés.
 
@@ -389,16 +246,37 @@ class AutomotiveAnalysis:
         3. Facebook Prophet - Pour l'analyse des séries temporelles
         4. ARIMA - Pour l'analyse classique des séries temporelles
 
+        Les ajustements indépendants (cibles production/prix, plis de
+        validation croisée, Prophet et ARIMA) sont exécutés en parallèle
+        sur un pool de processus (voir training_scheduler).
+
         Args:
             df (pd.DataFrame): Dataset d'entraînement
+            max_workers (int): Processus d'entraînement (défaut: un par cœur,
+                1 = séquentiel)
+            use_cache (bool): Recharger les ajustements déjà effectués sur les
+                mêmes données et paramètres (voir model_cache)
+            tune (bool): Rechercher les hyperparamètres XGBoost de chaque cible
+                (élimination successive, plis parallèles avec arrêt précoce,
+                voir hyperparameter_search) au lieu de la configuration fixe
+            tuning_budget (float): Durée totale du réglage (secondes),
+                partagée entre les cibles
+            only (list): Modèles à entraîner (ex: ['xgboost_price'],
+                défaut: tous); les autres sont absents du résultat
 
         Returns:
             tuple: (models_dict, feature_columns)
         """
+        from sklearn.metrics import mean_absolute_error, r2_score
+        from sklearn.model_selection import TimeSeriesSplit
+
         print("🤖 Entraînement de tous les modèles de machine learning...")
 
         models = {}
 
+        def wanted(name):
+            return only is None or name in only
+
         # =================================================================
         # PRÉPARATION DES DONNÉES
         # =================================================================
@@ -427,51 +305,9 @@ class AutomotiveAnalysis:
         print(f"🎯 Variables cibles: Production et Prix")
 
         # =================================================================
-        # 1. RÉGRESSION LINÉAIRE
-        # =================================================================
-
-        print("\n📊 Entraînement Régression Linéaire...")
-
-        # Modèle pour la production
-        lr_production = LinearRegression()
-        lr_production.fit(X, y_production)
-
-        # Calcul des métriques de performance
-        y_prod_pred = lr_production.predict(X)
-        lr_prod_r2 = r2_score(y_production, y_prod_pred)
-        lr_prod_mae = mean_absolute_error(y_production, y_prod_pred)
-
-        models['linear_regression_production'] = {
-            'model': lr_production,
-            'r2_score': lr_prod_r2,
-            'mae': lr_prod_mae,
-            'features': feature_columns
-        }
-
-        # Modèle pour les prix
-        lr_price = LinearRegression()
-        lr_price.fit(X, y_price)
-
-        y_price_pred = lr_price.predict(X)
-        lr_price_r2 = r2_score(y_price, y_price_pred)
-        lr_price_mae = mean_absolute_error(y_price, y_price_pred)
-
-        models['linear_regression_price'] = {
-            'model': lr_price,
-            'r2_score': lr_price_r2,
-            'mae': lr_price_mae,
-            'features': feature_columns
-        }
-
-        print(f"  ✅ Production - R²: {lr_prod_r2:.3f}, MAE: {lr_prod_mae:,.0f}")
-        print(f"  ✅ Prix - R²: {lr_price_r2:.3f}, MAE: {lr_price_mae:,.0f}")
-
-        # =================================================================
-        # 2. XGBOOST (MODÈLE PRINCIPAL)
+        # PLANIFICATION DES AJUSTEMENTS INDÉPENDANTS
         # =================================================================
 
-        print("\n🚀 Entraînement XGBoost (Modèle Principal)...")
-
         # Configuration XGBoost optimisée
         xgb_params = {
             'objective': 'reg:squarederror',  # Régression
@@ -483,65 +319,7 @@ class AutomotiveAnalysis:
             'random_state': 42                # Reproductibilité
         }
 
-        # Modèle XGBoost pour la production
-        xgb_production = xgb.XGBRegressor(**xgb_params)
-        xgb_production.fit(X, y_production)
-
-        # Évaluation avec validation croisée temporelle
-        tscv = TimeSeriesSplit(n_splits=5)
-        xgb_prod_scores = []
-
-        for train_idx, test_idx in tscv.split(X):
-            X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
-            y_train, y_test = y_production.iloc[train_idx], y_production.iloc[test_idx]
-
-            temp_model = xgb.XGBRegressor(**xgb_params)
-            temp_model.fit(X_train, y_train)
-            pred = temp_model.predict(X_test)
-            score = r2_score(y_test, pred)
-            xgb_prod_scores.append(score)
-
-        models['xgboost_production'] = {
-            'model': xgb_production,
-            'cv_r2_mean': np.mean(xgb_prod_scores),
-            'cv_r2_std': np.std(xgb_prod_scores),
-            'features': feature_columns,
-            'feature_importance': dict(zip(feature_columns, xgb_production.feature_importances_))
-        }
-
-        # Modèle XGBoost pour les prix
-        xgb_price = xgb.XGBRegressor(**xgb_params)
-        xgb_price.fit(X, y_price)
-
-        xgb_price_scores = []
-        for train_idx, test_idx in tscv.split(X):
-            X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
-            y_train, y_test = y_price.iloc[train_idx], y_price.iloc[test_idx]
-
-            temp_model = xgb.XGBRegressor(**xgb_params)
-            temp_model.fit(X_train, y_train)
-            pred = temp_model.predict(X_test)
-            score = r2_score(y_test, pred)
-            xgb_price_scores.append(score)
-
-        models['xgboost_price'] = {
-            'model': xgb_price,
-            'cv_r2_mean': np.mean(xgb_price_scores),
-            'cv_r2_std': np.std(xgb_price_scores),
-            'features': feature_columns,
-            'feature_importance': dict(zip(feature_columns, xgb_price.feature_importances_))
-        }
-
-        print(f"  ✅ Production - R² CV: {np.mean(xgb_prod_scores):.3f} ± {np.std(xgb_prod_scores):.3f}")
-        print(f"  ✅ Prix - R² CV: {np.mean(xgb_price_scores):.3f} ± {np.std(xgb_price_scores):.3f}")
-
-        # =================================================================
-        # 3. FACEBOOK PROPHET
-        # =================================================================
-
-        print("\n🔮 Entraînement Facebook Prophet...")
-
-        # Agrégation des données pour Prophet (format requis)
+        # Agrégation des données pour Prophet et ARIMA (format requis)
         prophet_data = df.groupby('Date').agg({
             'Production_Volume': 'sum',      # Somme de la production
             'Average_Price': 'mean',         # Prix moyen
@@ -555,57 +333,190 @@ class AutomotiveAnalysis:
         prophet_prod_df.columns = ['ds', 'y', 'steel_price', 'gdp_growth']
 
         # Configuration Prophet
-        prophet_production = Prophet(
-            yearly_seasonality=True,      # Saisonnalité annuelle
-            weekly_seasonality=False,     # Pas de saisonnalité hebdomadaire (données mensuelles)
-            daily_seasonality=False,      # Pas de saisonnalité quotidienne
-            changepoint_prior_scale=0.05  # Sensibilité aux changements de tendance
-        )
-
-        # Ajout des régresseurs externes
-        prophet_production.add_regressor('steel_price')  # Prix de l'acier
-        prophet_production.add_regressor('gdp_growth')   # Croissance du PIB
+        prophet_params = {
+            'yearly_seasonality': True,       # Saisonnalité annuelle
+            'weekly_seasonality': False,      # Pas de saisonnalité hebdomadaire (données mensuelles)
+            'daily_seasonality': False,       # Pas de saisonnalité quotidienne
+            'changepoint_prior_scale': 0.05   # Sensibilité aux changements de tendance
+        }
+        prophet_regressors = ['steel_price', 'gdp_growth']  # Prix de l'acier, croissance du PIB
 
-        # Entraînement
-        prophet_production.fit(prophet_prod_df)
+        # ARIMA(p=2, d=1, q=2): 2 termes AR, 1 différenciation, 2 termes MA
+        arima_order = (2, 1, 2)
 
-        models['prophet_production'] = {
-            'model': prophet_production,
-            'regressors': ['steel_price', 'gdp_growth'],
-            'data_format': 'monthly_aggregated'
+        # Tâches les plus longues en premier (Prophet, ARIMA, XGBoost)
+        tasks = {
+            'prophet_production': TrainingTask(fit_prophet, prophet_prod_df, prophet_regressors, prophet_params),
+            'arima_production': TrainingTask(fit_arima, prophet_data['Production_Volume'], arima_order)
         }
 
-        print(f"  ✅ Prophet Production - Régresseurs: steel_price, gdp_growth")
+        targets = {'production': y_production, 'price': y_price}
+        target_labels = {'production': "Production", 'price': "Prix"}
+        tscv = TimeSeriesSplit(n_splits=5)
+
+        # Réglage: meilleure configuration et métriques CV par cible
+        tuning = {}
+        if tune:
+            for target, y in targets.items():
+                if not wanted(f'xgboost_{target}'):
+                    continue
+                print(f"\n🎛️  Réglage XGBoost {target} (budget {tuning_budget / len(targets):.0f} s)...")
+                try:
+                    result = search_xgboost(X, y, xgb_params, time_budget=tuning_budget / len(targets),
+                                            max_workers=max_workers)
+                except RuntimeError as e:
+                    print(f"  ❌ Réglage échoué: {e} - configuration fixe conservée")
+                    continue
+                if result is None:
+                    print("  ⚠️ Budget insuffisant: configuration fixe conservée")
+                    continue
+                tuning[target] = result
+                print(f"  ✅ {result['n_configurations']} configurations, {result['rungs_completed']} paliers, "
+                      f"{result['elapsed_seconds']:.0f} s - R² CV: {result['cv_r2_mean']:.3f} "
+                      f"({result['n_folds']} plis, {result['params']['n_estimators']} arbres)")
+
+        for target, y in targets.items():
+            if target in tuning:
+                # Métriques CV issues du réglage: pas de nouvelle validation croisée
+                tasks[f'xgboost_{target}'] = TrainingTask(fit_xgboost, X, y, tuning[target]['params'], uses_xgboost=True)
+                continue
+
+            tasks[f'xgboost_{target}'] = TrainingTask(fit_xgboost, X, y, xgb_params, uses_xgboost=True)
+
+            # Évaluation avec validation croisée temporelle (un pli = une tâche)
+            for fold, (train_idx, test_idx) in enumerate(tscv.split(X)):
+                tasks[f'xgboost_{target}_fold_{fold}'] = TrainingTask(
+                    score_xgboost_fold,
+                    X.iloc[train_idx], y.iloc[train_idx], X.iloc[test_idx], y.iloc[test_idx],
+                    xgb_params, uses_xgboost=True
+                )
+
+        for target, y in targets.items():
+            tasks[f'linear_regression_{target}'] = TrainingTask(fit_linear, X, y)
+
+        # Sous-ensemble demandé (plis CV rattachés à leur modèle)
+        tasks = {name: task for name, task in tasks.items() if wanted(name.split('_fold_')[0])}
+
+        print(f"\n⚙️  {len(tasks)} ajustements indépendants planifiés")
+
+        # Ajustements déjà effectués sur les mêmes données et paramètres
+        cache = ModelCache() if use_cache else None
+        cache_keys = {}
+        cached = {}
+        if cache is not None:
+            for name, task in tasks.items():
+                cache_keys[name] = training_key(task.func, *task.args)
+                hit, value = cache.load(cache_keys[name])
+                if hit:
+                    cached[name] = value
+            print(f"💾 {len(cached)}/{len(tasks)} ajustements rechargés depuis le cache")
+
+        pending = {name: task for name, task in tasks.items() if name not in cached}
+        results, errors = run_training_tasks(pending, max_workers=max_workers) if pending else ({}, {})
+
+        if cache is not None:
+            for name, value in results.items():
+                cache.store(cache_keys[name], value)
+        results.update(cached)
+
+        # Les erreurs des modèles principaux sont fatales, comme en séquentiel
+        for name, error in errors.items():
+            if name != 'arima_production':
+                raise error
 
         # =================================================================
-        # 4. ARIMA (MODÈLE CLASSIQUE)
+        # 1. RÉGRESSION LINÉAIRE
         # =================================================================
 
-        print("\n📈 Entraînement ARIMA...")
+        if any(wanted(f'linear_regression_{target}') for target in targets):
+            print("\n📊 Régression Linéaire...")
 
-        try:
-            # Utilisation des données agrégées mensuellement
-            monthly_production = prophet_data['Production_Volume']
-
-            # Configuration ARIMA (p=2, d=1, q=2)
-            # p=2: 2 termes autorégressifs
-            # d=1: 1 différenciation pour stationnarité
-            # q=2: 2 termes de moyenne mobile
-            arima_model = ARIMA(monthly_production, order=(2, 1, 2))
-            arima_fit = arima_model.fit()
-
-            models['arima_production'] = {
-                'model': arima_fit,
-                'order': (2, 1, 2),
-                'aic': arima_fit.aic,
+        for target, y in targets.items():
+            if not wanted(f'linear_regression_{target}'):
+                continue
+            model = results[f'linear_regression_{target}']
+
+            # Calcul des métriques de performance
+            y_pred = model.predict(X)
+            models[f'linear_regression_{target}'] = {
+                'model': model,
+                'r2_score': r2_score(y, y_pred),
+                'mae': mean_absolute_error(y, y_pred),
+                'features': feature_columns
+            }
+
+            print(f"  ✅ {target_labels[target]} - R²: {models[f'linear_regression_{target}']['r2_score']:.3f}, "
+                  f"MAE: {models[f'linear_regression_{target}']['mae']:,.0f}")
+
+        # =================================================================
+        # 2. XGBOOST (MODÈLE PRINCIPAL)
+        # =================================================================
+
+        if any(wanted(f'xgboost_{target}') for target in targets):
+            print("\n🚀 XGBoost (Modèle Principal)...")
+
+        for target in targets:
+            if not wanted(f'xgboost_{target}'):
+                continue
+            model = results[f'xgboost_{target}']
+            if target in tuning:
+                cv_r2_mean, cv_r2_std = tuning[target]['cv_r2_mean'], tuning[target]['cv_r2_std']
+            else:
+                scores = [results[f'xgboost_{target}_fold_{fold}'] for fold in range(tscv.n_splits)]
+                cv_r2_mean, cv_r2_std = np.mean(scores), np.std(scores)
+
+            models[f'xgboost_{target}'] = {
+                'model': model,
+                'cv_r2_mean': cv_r2_mean,
+                'cv_r2_std': cv_r2_std,
+                'params': tuning[target]['params'] if target in tuning else xgb_params,
+                'tuning': {k: v for k, v in tuning[target].items() if k != 'params'} if target in tuning else None,
+                'features': feature_columns,
+                'feature_importance': dict(zip(feature_columns, model.feature_importances_)),
+                # Références du contrôle de dérive des mises à jour incrémentales
+                'training_profile': xgboost_profile(model, X, targets[target], cv_r2_mean, df['Date'].max())
+            }
+
+            print(f"  ✅ {target_labels[target]} - R² CV: {models[f'xgboost_{target}']['cv_r2_mean']:.3f} "
+                  f"± {models[f'xgboost_{target}']['cv_r2_std']:.3f}")
+
+        # =================================================================
+        # 3. FACEBOOK PROPHET
+        # =================================================================
+
+        if wanted('prophet_production'):
+            print("\n🔮 Facebook Prophet...")
+
+            models['prophet_production'] = {
+                'model': results['prophet_production'],
+                'regressors': prophet_regressors,
                 'data_format': 'monthly_aggregated'
             }
 
-            print(f"  ✅ ARIMA(2,1,2) - AIC: {arima_fit.aic:.2f}")
+            print(f"  ✅ Prophet Production - Régresseurs: steel_price, gdp_growth")
 
-        except Exception as e:
-            print(f"  ❌ ARIMA échoué: {e}")
-            models['arima_production'] = None
+        # =================================================================
+        # 4. ARIMA (MODÈLE CLASSIQUE)
+        # =================================================================
+
+        if wanted('arima_production'):
+            print("\n📈 ARIMA...")
+
+            if 'arima_production' in results:
+                arima_fit = results['arima_production']
+                models['arima_production'] = {
+                    'model': arima_fit,
+                    'order': arima_order,
+                    'aic': arima_fit.aic,
+                    'training_profile': arima_profile(arima_fit, arima_order, df['Date'].max()),
+                    'data_format': 'monthly_aggregated'
+                }
+
+                print(f"  ✅ ARIMA(2,1,2) - AIC: {arima_fit.aic:.2f}")
+
+            else:
+                print(f"  ❌ ARIMA échoué: {errors['arima_production']}")
+                models['arima_production'] = None
 
         # =================================================================
         # RÉSUMÉ DES MODÈLES
@@ -615,6 +526,71 @@ class AutomotiveAnalysis:
 
         return models, feature_columns
 
+    def update_all_models(self, df, max_workers=None):
+        """
+        Mise à jour incrémentale des modèles enregistrés sur les nouveaux mois.
+
+        XGBoost est prolongé de quelques arbres ajustés sur les nouvelles
+        lignes, ARIMA est étendu aux nouvelles observations sans
+        ré-estimation, les régressions linéaires sont réajustées (voir
+        incremental_training). Seuls les modèles qui dérivent ou ne peuvent
+        pas être mis à jour (profil d'entraînement absent, caractéristiques
+        non reproductibles) sont réentraînés (`train_all_models(only=...)`);
+        les autres conservent leur mise à jour incrémentale.
+
+        Args:
+            df (pd.DataFrame): Dataset complet (historique + nouveaux mois)
+            max_workers (int): Processus d'entraînement (voir train_all_models)
+
+        Returns:
+            tuple: (models_dict, feature_columns, modifiés) où `modifiés` est la
+                liste des modèles mis à jour ou réentraînés
+        """
+        print("🔁 Mise à jour incrémentale des modèles...")
+
+        registry = ModelRegistry()
+        previous = {}
+        for name in registry.names():
+            try:
+                previous[name] = registry.load(name)
+            except Exception as e:
+                # Dépendance absente (prophet...): modèle conservé hors mise à jour
+                print(f"  ⚠️ {name} non chargé: {e}")
+
+        updated, refits = update_models(previous, df, max_workers=max_workers or 1)
+
+        for name, artifact in updated.items():
+            print(f"  ✅ {name} mis à jour (données jusqu'à {df['Date'].max():%Y-%m})")
+
+        refitted = {}
+        feature_columns = None
+        if refits:
+            for name, reason in refits.items():
+                print(f"  🔄 {name}: {reason}")
+            print(f"  ➡️ Entraînement complet de {len(refits)} modèle(s)")
+            refitted, feature_columns = self.train_all_models(df, max_workers=max_workers, only=list(refits))
+        elif not updated:
+            print("  💾 Modèles déjà à jour")
+
+        models = dict(previous, **updated, **refitted)
+        if feature_columns is None:
+            feature_columns = models['xgboost_production']['features']
+        return models, feature_columns, list(updated) + list(refitted)
+
+    def refresh_models(self, max_workers=None):
+        """
+        Mise à jour des modèles après une ingestion, sans le reste de l'analyse.
+
+        Args:
+            max_workers (int): Processus d'entraînement
+
+        Returns:
+            list: Noms des modèles enregistrés
+        """
+        self.df = load_dataset(self.data_file)
+        self.models, _, updated = self.update_all_models(self.df, max_workers=max_workers)
+        return self.register_models(self.models, names=updated)
+
     def create_all_scenarios(self):
         """
         Création de tous les scénarios d'analyse demandés.
@@ -779,6 +755,93 @@ class AutomotiveAnalysis:
 
         return scenarios
 
+    def build_scenario_features(self, base_features, scenarios, n_horizons, ev_share_growth=None):
+        """
+        Matrice des caractéristiques pour tous les scénarios et tous les horizons.
+
+        Les lignes sont ordonnées scénario par scénario (dans l'ordre de
+        `scenarios`), puis par horizon: la ligne `s * n_horizons + i`
+        correspond au scénario `s` à l'horizon `i`. Un seul `predict` par
+        modèle suffit ensuite pour toutes les prévisions.
+
+        Args:
+            base_features (pd.DataFrame): Dernière observation (une ligne)
+            scenarios (dict): Dictionnaire des scénarios
+            n_horizons (int): Nombre d'années de prévision
+            ev_share_growth (float): Croissance annuelle de la part VE imposée
+                (défaut: celle de chaque scénario)
+
+        Returns:
+            pd.DataFrame: (n_scénarios × n_horizons) lignes, colonnes de base_features
+        """
+        params = list(scenarios.values())
+
+        parameters = {
+            name: np.array([p.get(name, default) for p in params], dtype=float)
+            for name, default in SCENARIO_DEFAULTS.items()
+        }
+        if ev_share_growth is not None:
+            parameters['ev_share_growth'] = np.full(len(params), ev_share_growth)
+
+        return build_feature_grid(base_features, parameters, n_horizons)
+
+    def _predict_scenario_grid(self, model, features, n_scenarios, n_horizons):
+        """Prédiction groupée, remise en forme (scénario, horizon) et bornée à 0."""
+        predictions = np.asarray(model.predict(features), dtype=float)
+        return np.maximum(predictions, 0).reshape(n_scenarios, n_horizons)
+
+    def _prophet_scenario_grid(self, prophet_model, scenarios, n_horizons, freq='YE'):
+        """
+        Prévisions Prophet (scénario, horizon) avec un seul appel à predict.
+
+        Les régresseurs ne diffèrent entre scénarios que sur les dates
+        futures: Prophet évalue une seule fois les dates futures aux valeurs
+        de référence (acier 700, PIB 2%), puis la contribution de chaque
+        scénario est ajoutée en bloc à partir des coefficients ajustés
+        (terme additif, ou proportionnel à la tendance en mode multiplicatif).
+        C'est exactement la décomposition de `predict`, sans reconstruire ni
+        réévaluer l'historique complet pour chaque scénario.
+
+        Args:
+            prophet_model: Modèle Prophet ajusté (régresseurs steel_price, gdp_growth)
+            scenarios (dict): Dictionnaire des scénarios
+            n_horizons (int): Nombre de périodes futures
+            freq (str): Fréquence des dates futures
+
+        Returns:
+            np.ndarray: Production prévue (n_scénarios, n_horizons)
+        """
+        from prophet.utilities import regressor_coefficients
+
+        params = list(scenarios.values())
+
+        # Valeurs de référence et valeurs par scénario (colonnes entières)
+        reference = {'steel_price': 700.0, 'gdp_growth': 0.02}
+        scenario_values = {
+            'steel_price': 700 * np.array([p.get('steel_price_factor', 1.0) for p in params], dtype=float),
+            'gdp_growth': np.array([p.get('gdp_growth', 0.02) for p in params], dtype=float)
+        }
+
+        future = prophet_model.make_future_dataframe(periods=n_horizons, freq=freq, include_history=False)
+        for regressor, value in reference.items():
+            future[regressor] = value
+
+        prediction = prophet_model.predict(future)
+        baseline = prediction['yhat'].to_numpy()
+        trend = prediction['trend'].to_numpy()
+
+        # Écart de chaque scénario à la référence: (scénarios, 1) × coefficients
+        additive = np.zeros(len(params))
+        multiplicative = np.zeros(len(params))
+        for _, row in regressor_coefficients(prophet_model).iterrows():
+            delta = (scenario_values[row['regressor']] - reference[row['regressor']]) * row['coef']
+            if row['regressor_mode'] == 'multiplicative':
+                multiplicative += delta
+            else:
+                additive += delta
+
+        return baseline[None, :] + additive[:, None] + multiplicative[:, None] * trend[None, :]
+
     def forecast_all_scenarios_to_2030(self, models, feature_columns, scenarios, base_data):
         """
         Génération de prévisions jusqu'en 2030 pour tous les scénarios.
@@ -803,11 +866,41 @@ class AutomotiveAnalysis:
 
         forecasts = {}
 
+        # =================================================================
+        # PRÉDICTIONS GROUPÉES (TOUS SCÉNARIOS × TOUS HORIZONS)
+        # =================================================================
+
+        # Une matrice de caractéristiques et un seul predict par modèle,
+        # redistribués ensuite dans la structure par scénario
+        n_scenarios = len(scenarios)
+        n_horizons = len(forecast_dates)
+        base_features = base_data[feature_columns].iloc[-1:]
+        grid_predictions = {}
+
+        if 'xgboost_production' in models and models['xgboost_production'] is not None:
+            xgb_features = self.build_scenario_features(base_features, scenarios, n_horizons)
+            grid_predictions['xgboost'] = (
+                self._predict_scenario_grid(models['xgboost_production']['model'], xgb_features, n_scenarios, n_horizons),
+                self._predict_scenario_grid(models['xgboost_price']['model'], xgb_features, n_scenarios, n_horizons)
+            )
+
+        if 'linear_regression_production' in models:
+            lr_features = self.build_scenario_features(base_features, scenarios, n_horizons, ev_share_growth=0.1)
+            grid_predictions['linear_regression'] = (
+                self._predict_scenario_grid(models['linear_regression_production']['model'], lr_features, n_scenarios, n_horizons),
+                self._predict_scenario_grid(models['linear_regression_price']['model'], lr_features, n_scenarios, n_horizons)
+            )
+
+        if 'prophet_production' in models and models['prophet_production'] is not None:
+            grid_predictions['prophet'] = self._prophet_scenario_grid(
+                models['prophet_production']['model'], scenarios, n_horizons
+            )
+
         # =================================================================
         # PRÉVISIONS POUR CHAQUE SCÉNARIO
         # =================================================================
 
-        for scenario_name, scenario_params in scenarios.items():
+        for scenario_index, (scenario_name, scenario_params) in enumerate(scenarios.items()):
             print(f"\n  🔮 Scénario: {scenario_name}")
             print(f"     📝 {scenario_params['description']}")
 
@@ -820,40 +913,10 @@ class AutomotiveAnalysis:
             if 'xgboost_production' in models and models['xgboost_production'] is not None:
                 print("    🚀 Prévisions XGBoost...")
 
-                # Données de base pour les prévisions
-                base_features = base_data[feature_columns].iloc[-1:].copy()
-
-                xgb_prod_forecast = []
-                xgb_price_forecast = []
-
-                for i, date in enumerate(forecast_dates):
-                    # Mise à jour des caractéristiques selon le scénario
-                    updated_features = base_features.copy()
-
-                    # Application des paramètres du scénario
-                    updated_features['US_Tariff_Rate'] = scenario_params.get('tariff_rate', 0.035)
-                    updated_features['US_EV_Subsidy'] = scenario_params.get('ev_subsidy', 7500)
-                    updated_features['GDP_Growth'] = scenario_params.get('gdp_growth', 0.02)
-                    updated_features['Steel_Price'] = 700 * scenario_params.get('steel_price_factor', 1.0)
-
-                    # Évolution de la part des véhicules électriques
-                    base_ev_share = 0.15  # Part actuelle (15%)
-                    ev_growth = scenario_params.get('ev_share_growth', 0.15)
-                    updated_features['EV_Share'] = min(base_ev_share + i * ev_growth, 0.8)
-
-                    # Prix du pétrole (évolution modérée)
-                    updated_features['Oil_Price'] = 70 + i * 2  # Augmentation 2$/an
-
-                    # Taux d'intérêt (cycle économique)
-                    updated_features['Interest_Rate'] = 0.03 + 0.01 * np.sin(i * 0.5)
-
-                    # Prédictions avec les modèles XGBoost
-                    prod_pred = models['xgboost_production']['model'].predict(updated_features)[0]
-                    price_pred = models['xgboost_price']['model'].predict(updated_features)[0]
-
-                    # Assurer des valeurs positives
-                    xgb_prod_forecast.append(max(prod_pred, 0))
-                    xgb_price_forecast.append(max(price_pred, 0))
+                # Ligne du scénario dans les prédictions groupées (valeurs déjà positives)
+                xgb_prod_grid, xgb_price_grid = grid_predictions['xgboost']
+                xgb_prod_forecast = xgb_prod_grid[scenario_index].tolist()
+                xgb_price_forecast = xgb_price_grid[scenario_index].tolist()
 
                 scenario_forecasts['xgboost'] = {
                     'dates': list(forecast_dates),
@@ -872,29 +935,8 @@ class AutomotiveAnalysis:
             if 'prophet_production' in models and models['prophet_production'] is not None:
                 print("    🔮 Prévisions Prophet...")
 
-                # Création du dataframe futur pour Prophet
-                prophet_model = models['prophet_production']['model']
-                future = prophet_model.make_future_dataframe(periods=len(forecast_dates), freq='YE')
-
-                # Ajout des régresseurs pour les prévisions futures
-                for i in range(len(future)):
-                    if i >= len(future) - len(forecast_dates):  # Dates futures
-                        idx_future = i - (len(future) - len(forecast_dates))
-
-                        # Régresseurs selon le scénario
-                        future.loc[i, 'steel_price'] = 700 * scenario_params.get('steel_price_factor', 1.0)
-                        future.loc[i, 'gdp_growth'] = scenario_params.get('gdp_growth', 0.02)
-                    else:
-                        # Données historiques (moyennes)
-                        future.loc[i, 'steel_price'] = 700
-                        future.loc[i, 'gdp_growth'] = 0.02
-
-                # Génération des prévisions
-                prophet_forecast = prophet_model.predict(future)
-
-                # Extraction des prévisions futures
-                future_indices = prophet_forecast.index[-len(forecast_dates):]
-                prophet_production = prophet_forecast.loc[future_indices, 'yhat'].tolist()
+                # Ligne du scénario dans les prévisions Prophet groupées
+                prophet_production = grid_predictions['prophet'][scenario_index].tolist()
 
                 # Prix estimés (Prophet ne prédit que la production)
                 prophet_prices = [30000 + i * 1000 for i in range(len(forecast_dates))]  # Estimation simple
@@ -915,29 +957,10 @@ class AutomotiveAnalysis:
             if 'linear_regression_production' in models:
                 print("    📊 Prévisions Régression Linéaire...")
 
-                # Utilisation des mêmes données que XGBoost
-                base_features = base_data[feature_columns].iloc[-1:].copy()
-
-                lr_prod_forecast = []
-                lr_price_forecast = []
-
-                for i, date in enumerate(forecast_dates):
-                    # Mise à jour des caractéristiques
-                    updated_features = base_features.copy()
-                    updated_features['US_Tariff_Rate'] = scenario_params.get('tariff_rate', 0.035)
-                    updated_features['US_EV_Subsidy'] = scenario_params.get('ev_subsidy', 7500)
-                    updated_features['GDP_Growth'] = scenario_params.get('gdp_growth', 0.02)
-                    updated_features['Steel_Price'] = 700 * scenario_params.get('steel_price_factor', 1.0)
-                    updated_features['EV_Share'] = min(0.15 + i * 0.1, 0.8)
-                    updated_features['Oil_Price'] = 70 + i * 2
-                    updated_features['Interest_Rate'] = 0.03 + 0.01 * np.sin(i * 0.5)
-
-                    # Prédictions
-                    prod_pred = models['linear_regression_production']['model'].predict(updated_features)[0]
-                    price_pred = models['linear_regression_price']['model'].predict(updated_features)[0]
-
-                    lr_prod_forecast.append(max(prod_pred, 0))
-                    lr_price_forecast.append(max(price_pred, 0))
+                # Mêmes caractéristiques que XGBoost (part VE à +10%/an)
+                lr_prod_grid, lr_price_grid = grid_predictions['linear_regression']
+                lr_prod_forecast = lr_prod_grid[scenario_index].tolist()
+                lr_price_forecast = lr_price_grid[scenario_index].tolist()
 
                 scenario_forecasts['linear_regression'] = {
                     'dates': list(forecast_dates),
@@ -1037,7 +1060,101 @@ class AutomotiveAnalysis:
         print(f"\n✅ Prévisions terminées pour {len(forecasts)} scénarios")
         return forecasts
 
-    def create_comprehensive_dashboards(self, df, forecasts):
+    def simulate_scenarios_to_2030(self, models, feature_columns, scenarios, base_data,
+                                   n_paths=10000, seed=42):
+        """
+        Simulation Monte Carlo des scénarios jusqu'en 2030.
+
+        Les paramètres de chaque scénario sont traités comme des distributions
+        centrées sur leurs valeurs ponctuelles; les chemins tirés sont évalués
+        en lots par le modèle principal et résumés en bandes P5/P50/P95.
+
+        Args:
+            models (dict): Dictionnaire des modèles entraînés
+            feature_columns (list): Liste des caractéristiques utilisées
+            scenarios (dict): Dictionnaire des scénarios
+            base_data (pd.DataFrame): Données de base pour les prévisions
+            n_paths (int): Nombre de chemins simulés par scénario
+            seed (int): Graine de la simulation
+
+        Returns:
+            dict: Bandes de quantiles par scénario (voir scenario_simulation)
+        """
+        print(f"🎲 Simulation Monte Carlo ({n_paths:,} chemins par scénario)...")
+
+        forecast_dates = pd.date_range('2024-01-01', '2030-12-31', freq='YE')
+
+        try:
+            simulations = simulate_all_scenarios(
+                models, feature_columns, scenarios, base_data, forecast_dates,
+                n_paths=n_paths, seed=seed
+            )
+        except ValueError as e:
+            print(f"  ❌ Simulation impossible: {e}")
+            return {}
+
+        for scenario_name, simulation in simulations.items():
+            production = simulation['production']
+            print(f"  🔮 {scenario_name}: production 2030 "
+                  f"P5 {production['p5'][-1]:,.0f} | P50 {production['p50'][-1]:,.0f} | P95 {production['p95'][-1]:,.0f}")
+
+        print(f"✅ Simulation terminée pour {len(simulations)} scénarios")
+        return simulations
+
+    def forecast_segments_to_2030(self, df, model_type='arima', max_workers=None, use_cache=True):
+        """
+        Prévisions par segment (fabricant × région × catégorie) jusqu'en 2030.
+
+        Un modèle est ajusté par segment en parallèle, puis les prévisions
+        sont réconciliées pour que leur somme soit égale à la prévision du
+        total mondial (voir segment_forecasting).
+
+        Args:
+            df (pd.DataFrame): Données historiques
+            model_type (str): 'arima', 'prophet' ou 'xgboost'
+            max_workers (int): Processus d'entraînement (1 = séquentiel)
+            use_cache (bool): Réutiliser les prévisions déjà calculées sur les
+                mêmes données et paramètres
+
+        Returns:
+            dict: Prévisions réconciliées (voir forecast_segments), vide en cas d'échec
+        """
+        print(f"🧩 Prévisions par segment ({model_type.upper()})...")
+
+        columns = ['Date'] + SEGMENT_DIMENSIONS + ['Production_Volume']
+        params = DEFAULT_MODEL_PARAMS[model_type]
+
+        try:
+            cache = ModelCache() if use_cache else None
+            key = training_key(forecast_segments, df[columns], model_type, params, '2030-12-31') if cache else None
+            cached, result = cache.load(key) if cache else (False, None)
+            if cached:
+                print("  💾 Prévisions rechargées depuis le cache")
+            else:
+                result = forecast_segments(df, model_type=model_type, params=params, max_workers=max_workers)
+                # Prévisions partiellement plates: jamais mises en cache
+                if cache and not result['fallbacks']:
+                    cache.store(key, result)
+        except Exception as e:
+            print(f"  ❌ Prévisions par segment échouées: {type(e).__name__}: {e}")
+            return {}
+
+        if result['fallbacks']:
+            print(f"  ⚠️ {len(result['fallbacks'])} série(s) prolongée(s) au dernier niveau (ajustement échoué):")
+            for segment, error in list(result['fallbacks'].items())[:5]:
+                print(f"    - {segment}: {error}")
+
+        # Synthèse annuelle par fabricant (les segments somment au total)
+        annual = result['segments'].assign(Year=result['segments']['Date'].dt.year)
+        by_manufacturer = annual[annual['Year'] == annual['Year'].max()].groupby('Manufacturer', observed=True)['Forecast'].sum()
+
+        print(f"  ✅ {result['n_segments']} segments × {len(result['dates'])} mois, réconciliation {result['reconciliation']}")
+        for manufacturer, production in by_manufacturer.sort_values(ascending=False).items():
+            print(f"    🏭 {manufacturer}: {production:,.0f} unités en {annual['Year'].max()}")
+
+        return result
+
+    def create_comprehensive_dashboards(self, df, forecasts, max_workers=None, force=False):
         """
         Création de dashboards interactifs complets.
 
@@ -1047,13 +1164,87 @@ class AutomotiveAnalysis:
         1. Dashboard principal - Comparaison des scénarios
         2. Dashboard fabricants - Analyse par constructeur
         3. Dashboard transition électrique - Focus sur les VE
+        4. à 9. Modèles ML, économie stratégique, concurrence, risques,
+           géographie et synthèse exécutive
+
+        Les dashboards sont indépendants: ils sont construits en parallèle
+        sur un pool de processus. Chaque dashboard est identifié par une
+        empreinte de ses entrées (données, prévisions, métriques des modèles),
+        du code de sa méthode et du code de rendu commun (`_render_dashboard`,
+        module `dashboard_export`) et du mode d'export; il n'est reconstruit
+        que si cette empreinte a changé ou si son fichier a disparu.
 
         Args:
             df (pd.DataFrame): Données historiques
             forecasts (dict): Prévisions par scénario
+            max_workers (int): Processus de rendu (1 = séquentiel)
+            force (bool): Reconstruire tous les dashboards
         """
         print("📊 Création des dashboards interactifs...")
 
+        # Entrées disponibles (les objets modèles ne servent pas au rendu)
+        inputs = {
+            'df': df,
+            'forecasts': forecasts,
+            'models': {
+                name: ({k: v for k, v in data.items() if k != 'model'} if data else data)
+                for name, data in self.models.items()
+            }
+        }
+
+        # Empreintes des dashboards déjà générés
+        fingerprints = {}
+        if os.path.exists(DASHBOARD_FINGERPRINTS):
+            with open(DASHBOARD_FINGERPRINTS, 'r', encoding='utf-8') as f:
+                fingerprints = json.load(f)
+
+        # Code de rendu commun à tous les dashboards (processus et export)
+        shared_code = (inspect.getsource(_render_dashboard), inspect.getsource(inspect.getmodule(write_dashboard)))
+
+        tasks = {}
+        current = {}
+        for name, (method, arguments, output_file) in DASHBOARD_BUILDS.items():
+            args = tuple(inputs[argument] for argument in arguments)
+            current[name] = training_key(
+                f'dashboard:{name}', inspect.getsource(getattr(AutomotiveAnalysis, method)), *shared_code,
+                self.dashboard_mode, self.dashboard_gzip, *args
+            )
+
+            output_path = output_file if self.dashboard_mode != 'json' else os.path.splitext(output_file)[0] + '.json'
+            if not force and fingerprints.get(name) == current[name] and os.path.exists(output_path):
+                continue
+
+            tasks[name] = TrainingTask(_render_dashboard, method, args, self.dashboard_mode, self.dashboard_gzip)
+
+        skipped = len(DASHBOARD_BUILDS) - len(tasks)
+        if skipped:
+            print(f"  💾 {skipped}/{len(DASHBOARD_BUILDS)} dashboards à jour (non reconstruits)")
+
+        results, errors = run_training_tasks(tasks, max_workers=max_workers) if tasks else ({}, {})
+
+        for name, logs in results.items():
+            print(logs, end='')
+            fingerprints[name] = current[name]
+        for name, error in errors.items():
+            print(f"  ❌ Dashboard {name}: {error}")
+            fingerprints.pop(name, None)
+
+        with open(DASHBOARD_FINGERPRINTS, 'w', encoding='utf-8') as f:
+            json.dump(fingerprints, f, indent=2)
+
+        if errors:
+            print(f"⚠️ {len(errors)} dashboards en échec")
+        else:
+            print("✅ Tous les dashboards créés avec succès!")
+
+    def _create_main_dashboard(self, df, forecasts):
+        """
+        Création du dashboard principal (comparaison des scénarios).
+
+        Args:
+            df (pd.DataFrame): Données historiques
+            forecasts (dict): Prévisions par scénario
+        """
         # =================================================================
         # 1. DASHBOARD PRINCIPAL - COMPARAISON DES SCÉNARIOS
         # =================================================================
@@ -1201,59 +1392,9 @@ class AutomotiveAnalysis:
         fig_main.update_yaxes(title_text="Part VE (%)", row=2, col=2)
 
         # Sauvegarde du dashboard principal
-        fig_main.write_html("dashboard_principal_automobile.html")
+        write_dashboard(fig_main, "dashboard_principal_automobile.html", self.dashboard_mode, self.dashboard_gzip)
         print("    ✅ Dashboard principal sauvegardé: dashboard_principal_automobile.html")
 
-        # =================================================================
-        # 2. DASHBOARD FABRICANTS
-        # =================================================================
-
-        self._create_manufacturer_dashboard(df)
-
-        # =================================================================
-        # 3. DASHBOARD TRANSITION ÉLECTRIQUE
-        # =================================================================
-
-        self._create_ev_transition_dashboard(df, forecasts)
-
-        # =================================================================
-        # 4. DASHBOARD MODÈLES ML
-        # =================================================================
-
-        self._create_ml_models_dashboard(forecasts, self.models)
-
-        # =================================================================
-        # 5. DASHBOARD ANALYSE ÉCONOMIQUE STRATÉGIQUE
-        # =================================================================
-
-        self._create_economic_strategic_dashboard(df, forecasts)
-
-        # =================================================================
-        # 6. DASHBOARD INTELLIGENCE CONCURRENTIELLE
-        # =================================================================
-
-        self._create_competitive_intelligence_dashboard(df, forecasts)
-
-        # =================================================================
-        # 7. DASHBOARD RISQUES ET OPPORTUNITÉS
-        # =================================================================
-
-        self._create_risk_opportunity_dashboard(df, forecasts)
-
-        # =================================================================
-        # 8. DASHBOARD GÉOGRAPHIQUE AVANCÉ
-        # =================================================================
-
-        self._create_advanced_geographic_dashboard(df, forecasts)
-
-        # =================================================================
-        # 9. DASHBOARD EXÉCUTIF (SYNTHÈSE)
-        # =================================================================
-
-        self._create_executive_dashboard(df, forecasts)
-
-        print("✅ Tous les dashboards créés avec succès!")
-
     def _create_manufacturer_dashboard(self, df):
         """
         Création du dashboard spécialisé pour l'analyse par fabricant.
@@ -1358,7 +1499,7 @@ class AutomotiveAnalysis:
         )
 
         # Sauvegarde
-        fig_manu.write_html("dashboard_fabricants_automobile.html")
+        write_dashboard(fig_manu, "dashboard_fabricants_automobile.html", self.dashboard_mode, self.dashboard_gzip)
         print("    ✅ Dashboard fabricants sauvegardé: dashboard_fabricants_automobile.html")
 
     def _create_ev_transition_dashboard(self, df, forecasts):
@@ -1502,7 +1643,7 @@ class AutomotiveAnalysis:
         fig_ev.update_yaxes(title_text="Adoption VE (%)", row=2, col=2)
 
         # Sauvegarde
-        fig_ev.write_html("dashboard_transition_electrique.html")
+        write_dashboard(fig_ev, "dashboard_transition_electrique.html", self.dashboard_mode, self.dashboard_gzip)
         print("    ✅ Dashboard transition électrique sauvegardé: dashboard_transition_electrique.html")
 
     def _create_ml_models_dashboard(self, forecasts, models):
@@ -1803,7 +1944,7 @@ class AutomotiveAnalysis:
         fig_ml.update_yaxes(title_text="Divergence (%)", row=2, col=2)
 
         # Sauvegarde
-        fig_ml.write_html("dashboard_modeles_ml.html")
+        write_dashboard(fig_ml, "dashboard_modeles_ml.html", self.dashboard_mode, self.dashboard_gzip)
         print("    ✅ Dashboard modèles ML sauvegardé: dashboard_modeles_ml.html")
 
     def _create_economic_strategic_dashboard(self, df, forecasts):
@@ -2009,7 +2150,7 @@ class AutomotiveAnalysis:
         fig_econ.update_yaxes(title_text="Inflation Véhicules (%)", secondary_y=True, row=2, col=2)
 
         # Sauvegarde
-        fig_econ.write_html("dashboard_analyse_economique_strategique.html")
+        write_dashboard(fig_econ, "dashboard_analyse_economique_strategique.html", self.dashboard_mode, self.dashboard_gzip)
         print("    ✅ Dashboard analyse économique stratégique sauvegardé")
 
     def _create_competitive_intelligence_dashboard(self, df, forecasts):
@@ -2262,7 +2403,7 @@ class AutomotiveAnalysis:
         fig_comp.update_yaxes(title_text="Marge Estimée (%)", row=2, col=2)
 
         # Sauvegarde
-        fig_comp.write_html("dashboard_intelligence_concurrentielle.html")
+        write_dashboard(fig_comp, "dashboard_intelligence_concurrentielle.html", self.dashboard_mode, self.dashboard_gzip)
         print("    ✅ Dashboard intelligence concurrentielle sauvegardé")
 
     def _create_risk_opportunity_dashboard(self, df, forecasts):
@@ -2555,7 +2696,7 @@ class AutomotiveAnalysis:
         fig_risk.update_yaxes(title_text="Score de Rendement (Croissance %)", row=2, col=2)
 
         # Sauvegarde
-        fig_risk.write_html("dashboard_risques_opportunites.html")
+        write_dashboard(fig_risk, "dashboard_risques_opportunites.html", self.dashboard_mode, self.dashboard_gzip)
         print("    ✅ Dashboard risques et opportunités sauvegardé")
 
     def _create_advanced_geographic_dashboard(self, df, forecasts):
@@ -2838,7 +2979,7 @@ class AutomotiveAnalysis:
         fig_geo.update_yaxes(title_text="Tarifs US (%)", secondary_y=True, row=2, col=2)
 
         # Sauvegarde
-        fig_geo.write_html("dashboard_analyse_geographique_avancee.html")
+        write_dashboard(fig_geo, "dashboard_analyse_geographique_avancee.html", self.dashboard_mode, self.dashboard_gzip)
         print("    ✅ Dashboard analyse géographique avancée sauvegardé")
 
     def _create_executive_dashboard(self, df, forecasts):
@@ -3096,7 +3237,7 @@ class AutomotiveAnalysis:
         fig_exec.update_yaxes(title_text="Niveau Priorité", row=2, col=1)
 
         # Sauvegarde
-        fig_exec.write_html("dashboard_executif_direction.html")
+        write_dashboard(fig_exec, "dashboard_executif_direction.html", self.dashboard_mode, self.dashboard_gzip)
         print("    ✅ Dashboard exécutif direction sauvegardé")
 
     def _create_economic_analysis_dashboard(self, df, forecasts):
@@ -3292,7 +3433,7 @@ class AutomotiveAnalysis:
         fig_econ.update_yaxes(title_text="Inflation Acier (%)", secondary_y=True, row=2, col=2)
 
         # Sauvegarde
-        fig_econ.write_html("dashboard_analyse_economique.html")
+        write_dashboard(fig_econ, "dashboard_analyse_economique.html", self.dashboard_mode, self.dashboard_gzip)
         print("    ✅ Dashboard analyse économique sauvegardé: dashboard_analyse_economique.html")
 
     def generate_strategic_recommendations(self, df, forecasts):
@@ -3428,12 +3569,42 @@ class AutomotiveAnalysis:
         print("✅ Recommandations stratégiques générées")
         return recommendations
 
-    def save_all_results(self, models, forecasts, recommendations):
+    def register_models(self, models, names=None):
+        """
+        Enregistrement des modèles dans le registre versionné.
+
+        Args:
+            models (dict): Modèles {nom: artefact}
+            names (list): Modèles à enregistrer (défaut: tous)
+
+        Returns:
+            list: Noms des modèles enregistrés
+        """
+        registry = ModelRegistry()
+        data_hash = training_key('training_data', self.df, environment=False) if self.df is not None else None
+        registered = []
+
+        for model_name, model_data in models.items():
+            if names is not None and model_name not in names:
+                continue
+            if model_data is not None and 'model' in model_data:
+                try:
+                    entry = registry.register(model_name, model_data, data_hash=data_hash,
+                                              source='automotive_analysis_main')
+                    print(f"    ✅ {model_name} → v{entry['version']} ({entry['file']})")
+                    registered.append(model_name)
+                except Exception as e:
+                    print(f"    ❌ Erreur {model_name}: {e}")
+
+        return registered
+
+    def save_all_results(self, models, forecasts, recommendations, simulations=None, segment_forecasts=None,
+                         model_names=None):
         """
         Sauvegarde complète de tous les résultats de l'analyse.
 
         Cette fonction sauvegarde:
-        - Les modèles ML entraînés (format pickle)
+        - Les modèles ML entraînés (registre versionné, voir model_registry)
         - Les résultats complets (format JSON)
         - Un rapport Excel détaillé
 
@@ -3441,6 +3612,10 @@ class AutomotiveAnalysis:
             models (dict): Modèles entraînés
             forecasts (dict): Prévisions par scénario
             recommendations (dict): Recommandations stratégiques
+            simulations (dict): Bandes Monte Carlo par scénario (optionnel)
+            segment_forecasts (dict): Prévisions par segment (optionnel)
+            model_names (list): Modèles à enregistrer (défaut: tous; après une
+                mise à jour incrémentale, seuls les modèles modifiés)
         """
         print("💾 Sauvegarde complète de tous les résultats...")
 
@@ -3448,19 +3623,8 @@ class AutomotiveAnalysis:
         # SAUVEGARDE DES MODÈLES ML
         # =================================================================
 
-        print("  🤖 Sauvegarde des modèles ML...")
-        models_saved = 0
-
-        for model_name, model_data in models.items():
-            if model_data is not None and 'model' in model_data:
-                try:
-                    filename = f'{model_name}_clean.pkl'
-                    joblib.dump(model_data['model'], filename)
-                    print(f"    ✅ {model_name} → {filename}")
-                    models_saved += 1
-                except Exception as e:
-                    print(f"    ❌ Erreur {model_name}: {e}")
-
+        print("  🤖 Enregistrement des modèles ML dans le registre...")
+        models_saved = len(self.register_models(models, names=model_names))
         print(f"  📊 {models_saved} modèles sauvegardés")
 
         # =================================================================
@@ -3483,6 +3647,7 @@ class AutomotiveAnalysis:
             },
 
             'forecasts_2030': forecasts,
+            'monte_carlo_2030': simulations or {},
             'recommendations': recommendations,
 
             'summary': {
@@ -3499,6 +3664,14 @@ class AutomotiveAnalysis:
 
         print("    ✅ Résultats JSON → automotive_analysis_results_clean.json")
 
+        # =================================================================
+        # SAUVEGARDE DES PRÉVISIONS PAR SEGMENT
+        # =================================================================
+
+        if segment_forecasts:
+            segment_forecasts['segments'].to_csv('segment_forecasts_2030.csv', index=False)
+            print("    ✅ Prévisions par segment → segment_forecasts_2030.csv")
+
         # =================================================================
         # SAUVEGARDE RAPPORT EXCEL
         # =================================================================
@@ -3566,7 +3739,7 @@ class AutomotiveAnalysis:
 
         print("✅ Sauvegarde complète terminée")
 
-    def run_complete_analysis(self):
+    def run_complete_analysis(self, incremental=False, tune=False):
         """
         Exécution complète de l'analyse automobile.
 
@@ -3579,6 +3752,12 @@ class AutomotiveAnalysis:
         6. Génération des recommandations
         7. Sauvegarde des résultats
 
+        Args:
+            incremental (bool): Mettre à jour les modèles enregistrés sur les
+                nouveaux mois au lieu de tout réentraîner (voir update_all_models)
+            tune (bool): Régler les hyperparamètres XGBoost lors d'un
+                entraînement complet (voir train_all_models)
+
         Returns:
             bool: True si l'analyse s'est déroulée avec succès
         """
@@ -3599,7 +3778,7 @@ class AutomotiveAnalysis:
                 self.df = self.create_automotive_dataset()
             else:
                 print(f"📁 Chargement des données existantes: {self.data_file}")
-                self.df = pd.read_csv(self.data_file, parse_dates=['Date'])
+                self.df = load_dataset(self.data_file)
                 print(f"✅ Données chargées: {self.df.shape[0]:,} observations")
 
             # =============================================================
@@ -3607,7 +3786,11 @@ class AutomotiveAnalysis:
             # =============================================================
 
             print("\n🤖 PHASE 2: ENTRAÎNEMENT DES MODÈLES ML")
-            self.models, feature_columns = self.train_all_models(self.df)
+            updated_models = None
+            if incremental:
+                self.models, feature_columns, updated_models = self.update_all_models(self.df)
+            else:
+                self.models, feature_columns = self.train_all_models(self.df, tune=tune)
 
             # =============================================================
             # PHASE 3: SCÉNARIOS
@@ -3624,6 +3807,10 @@ class AutomotiveAnalysis:
             self.forecasts = self.forecast_all_scenarios_to_2030(
                 self.models, feature_columns, self.scenarios, self.df
             )
+            self.simulations = self.simulate_scenarios_to_2030(
+                self.models, feature_columns, self.scenarios, self.df
+            )
+            self.segment_forecasts = self.forecast_segments_to_2030(self.df)
 
             # =============================================================
             # PHASE 5: DASHBOARDS
@@ -3644,7 +3831,10 @@ class AutomotiveAnalysis:
             # =============================================================
 
             print("\n💾 PHASE 7: SAUVEGARDE DES RÉSULTATS")
-            self.save_all_results(self.models, self.forecasts, self.recommendations)
+            self.save_all_results(
+                self.models, self.forecasts, self.recommendations,
+                self.simulations, self.segment_forecasts, model_names=updated_models
+            )
 
             # =============================================================
             # RÉSUMÉ FINAL
@@ -3720,7 +3910,7 @@ class AutomotiveAnalysis:
 # FONCTION PRINCIPALE ET POINT D'ENTRÉE
 # =============================================================================
 
-def main():
+def main(incremental=False, tune=False):
     """
     Fonction principale d'exécution de l'analyse automobile.
 
@@ -3728,6 +3918,11 @@ def main():
     1. Initialise la classe d'analyse
     2. Lance l'analyse complète
     3. Affiche le résultat final
+
+    Args:
+        incremental (bool): Mise à jour incrémentale des modèles enregistrés
+            (après ingestion de nouveaux mois) au lieu d'un réentraînement complet
+        tune (bool): Réglage des hyperparamètres XGBoost sous budget de temps
     """
 
     print("🚗" + "="*78 + "🚗")
@@ -3748,7 +3943,7 @@ def main():
 
     # Initialisation et exécution
     analyzer = AutomotiveAnalysis()
-    success = analyzer.run_complete_analysis()
+    success = analyzer.run_complete_analysis(incremental=incremental, tune=tune)
 
     # Résultat final
     if success:
@@ -3771,8 +3966,19 @@ if __name__ == "__main__":
     Point d'entrée principal du script.
 
     Exécute l'analyse complète quand le script est lancé directement.
+
+    Options:
+        --incremental    analyse complète, modèles mis à jour incrémentalement
+        --update-models  mise à jour incrémentale des modèles seule (après
+                         `python ingestion.py <mois>.csv`), en quelques secondes
+        --tune           réglage des hyperparamètres XGBoost (DEFAULT_TIME_BUDGET)
     """
-    success = main()
+    if '--update-models' in sys.argv[1:]:
+        registered = AutomotiveAnalysis().refresh_models()
+        print(f"\n🔁 {len(registered)} modèles enregistrés: {', '.join(registered) or '-'}")
+        exit(0)
+
+    success = main(incremental='--incremental' in sys.argv[1:], tune='--tune' in sys.argv[1:])
 
     if success:
         print("\n🚗 Analyse automobile complète réussie! 🚗")
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+RECHERCHE D'HYPERPARAMÈTRES XGBOOST SOUS BUDGET DE TEMPS
+=============================================================================
+
+`train_all_models` évalue une configuration XGBoost fixe (100 arbres,
+profondeur 6). En mode réglage, ce module cherche une meilleure
+configuration dans un budget de temps fixe:
+
+- configurations tirées au hasard dans SEARCH_SPACE (la configuration
+  fixe fait toujours partie des candidates)
+- élimination successive (successive halving): chaque palier évalue les
+  configurations restantes sur davantage de plis de validation croisée
+  temporelle (les plus récents d'abord) et ne garde que le meilleur tiers
+- chaque (configuration, pli) est une tâche du pool de `training_scheduler`:
+  les plis sont évalués en parallèle, avec arrêt précoce sur la fin
+  chronologique du pli d'entraînement (le nombre d'arbres est appris)
+- un pli de calibration (configuration de base, pli le plus récent) est
+  évalué avant le premier palier: sa durée sert d'estimation initiale
+- le pool de processus est démarré une seule fois pour tous les paliers,
+  sur le budget: s'il n'est pas prêt à temps, les plis sont évalués en
+  séquence dans ce processus
+- une tâche n'est démarrée que si elle doit se terminer avant l'échéance
+  (durée estimée = plus long pli observé); les autres sont annulées et la
+  meilleure configuration du dernier palier complet est retenue
+- les erreurs des tâches ne sont pas confondues avec l'échéance: si aucune
+  configuration d'un palier n'aboutit pour une autre raison (paramètres
+  invalides, pool de processus cassé), l'erreur est levée
+
+Usage:
+    from hyperparameter_search import search_xgboost
+    result = search_xgboost(X, y, xgb_params, time_budget=120)
+    result['params']          # meilleure configuration (n_estimators appris)
+    result['cv_r2_mean']      # R² moyen sur les plis évalués
+
+=============================================================================
+"""
+
+import os
+import time
+
+import numpy as np
+
+from training_scheduler import (
+    TrainingTask, run_training_tasks, score_xgboost_fold_early_stopping, start_training_pool
+)
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Paramètre -> (loi, minimum, maximum)
+SEARCH_SPACE = {
+    'max_depth': ('int', 3, 8),
+    'learning_rate': ('log', 0.02, 0.3),
+    'subsample': ('uniform', 0.6, 1.0),
+    'colsample_bytree': ('uniform', 0.6, 1.0),
+    'min_child_weight': ('log', 1, 20),
+    'reg_lambda': ('log', 0.1, 10)
+}
+
+# Arbres au plus par ajustement (l'arrêt précoce choisit le nombre utile)
+MAX_TREES = 1000
+EARLY_STOPPING_ROUNDS = 30
+VALIDATION_FRACTION = 0.15
+
+# Élimination successive: configurations initiales, fraction conservée et
+# plis (les plus récents) évalués à chaque palier
+DEFAULT_N_CONFIGURATIONS = 27
+HALVING_FACTOR = 3
+N_SPLITS = 5
+RUNG_FOLDS = (1, 3, 5)
+
+# Budget par défaut d'une recherche (secondes)
+DEFAULT_TIME_BUDGET = 300
+
+
+def sample_configurations(n_configurations, base_params, rng):
+    """
+    Configurations candidates: la configuration de base puis des tirages.
+
+    Args:
+        n_configurations (int): Nombre total de configurations
+        base_params (dict): Paramètres XGBoost de référence (objectif, graine...)
+        rng (np.random.Generator): Générateur aléatoire
+
+    Returns:
+        list: Dictionnaires de paramètres XGBoost (n_estimators = MAX_TREES)
+    """
+    base = dict(base_params, n_estimators=MAX_TREES)
+    configurations = [base]
+
+    for _ in range(n_configurations - 1):
+        params = dict(base)
+        for name, (law, low, high) in SEARCH_SPACE.items():
+            if law == 'int':
+                params[name] = int(rng.integers(low, high + 1))
+            elif law == 'log':
+                params[name] = float(np.exp(rng.uniform(np.log(low), np.log(high))))
+            else:
+                params[name] = float(rng.uniform(low, high))
+        configurations.append(params)
+
+    return configurations
+
+
+def search_xgboost(X, y, base_params, time_budget=DEFAULT_TIME_BUDGET,
+                   n_configurations=DEFAULT_N_CONFIGURATIONS, max_workers=None, seed=42):
+    """
+    Recherche de la meilleure configuration XGBoost dans un budget de temps.
+
+    Args:
+        X (pd.DataFrame): Caractéristiques (ordre chronologique)
+        y (pd.Series): Cible
+        base_params (dict): Configuration de référence (toujours évaluée)
+        time_budget (float): Durée maximale de la recherche (secondes)
+        n_configurations (int): Configurations du premier palier
+        max_workers (int): Processus du pool (voir run_training_tasks)
+        seed (int): Graine des tirages
+
+    Returns:
+        dict | None: {
+            'params': meilleure configuration (n_estimators = médiane des
+                meilleures itérations de ses plis),
+            'cv_r2_mean', 'cv_r2_std', 'cv_rmse_mean', 'n_folds' (plis évalués),
+            'n_configurations', 'rungs_completed', 'elapsed_seconds'
+        }, None si aucun palier n'a pu être terminé dans le budget
+
+    Raises:
+        RuntimeError: Si aucune configuration d'un palier n'aboutit pour une
+            autre raison que l'échéance (exception d'origine en cause)
+    """
+    from sklearn.model_selection import TimeSeriesSplit
+
+    start = time.monotonic()
+    deadline = start + time_budget
+
+    folds = list(TimeSeriesSplit(n_splits=N_SPLITS).split(X))
+    configurations = sample_configurations(n_configurations, base_params, np.random.default_rng(seed))
+    scores = {index: {} for index in range(len(configurations))}
+
+    alive = list(range(len(configurations)))
+    best = None
+    rungs_completed = 0
+
+    def fold_task(index, fold):
+        train_idx, test_idx = folds[fold]
+        return TrainingTask(
+            score_xgboost_fold_early_stopping,
+            X.iloc[train_idx], y.iloc[train_idx], X.iloc[test_idx], y.iloc[test_idx],
+            configurations[index], VALIDATION_FRACTION, EARLY_STOPPING_ROUNDS,
+            uses_xgboost=True
+        )
+
+    # Calibration: un pli évalué dans ce processus (imports compris) donne la
+    # marge initiale; une configuration de base invalide échoue ici
+    calibration_start = time.monotonic()
+    results, errors = run_training_tasks({'calibration': fold_task(0, N_SPLITS - 1)}, max_workers=1)
+    if errors:
+        raise RuntimeError(f"Pli de calibration en échec: {errors['calibration']}") from errors['calibration']
+    scores[0][N_SPLITS - 1] = results['calibration']
+    slowest = time.monotonic() - calibration_start
+
+    # Pool commun aux paliers, démarré sur le budget (assez tôt pour un pli)
+    max_workers = max_workers or os.cpu_count() or 1
+    pool = None
+    if max_workers > 1:
+        pool = start_training_pool(max_workers, deadline=deadline - slowest)
+        if pool is None:
+            print("  ⚠️ Pool de processus non démarré dans le budget - plis évalués en séquence")
+            max_workers = 1
+
+    try:
+        for rung, n_folds in enumerate(RUNG_FOLDS):
+            fold_ids = list(range(N_SPLITS - n_folds, N_SPLITS))
+            tasks = {
+                f'config_{index}_fold_{fold}': fold_task(index, fold)
+                for index in alive for fold in fold_ids if fold not in scores[index]
+            }
+
+            # Tâches démarrées seulement si elles finissent avant l'échéance
+            results, errors = run_training_tasks(tasks, max_workers=max_workers, deadline=deadline,
+                                                 expected_seconds=slowest, pool=pool)
+            for name, result in results.items():
+                _, index, _, fold = name.split('_')
+                scores[int(index)][int(fold)] = result
+                slowest = max(slowest, result['seconds'])
+
+            failures = {name: error for name, error in errors.items() if not isinstance(error, TimeoutError)}
+            complete = [index for index in alive if all(fold in scores[index] for fold in fold_ids)]
+            if not complete:
+                if failures:
+                    name, error = next(iter(failures.items()))
+                    raise RuntimeError(
+                        f"Palier {rung + 1}: {len(failures)}/{len(tasks)} tâches en échec ({name}: {error})"
+                    ) from error
+                break
+            if failures:
+                print(f"  ⚠️ Palier {rung + 1}: {len(failures)} tâche(s) en échec, configurations écartées "
+                      f"({next(iter(failures.values()))})")
+
+            ranking = sorted(complete, key=lambda index: -np.mean([scores[index][fold]['r2'] for fold in fold_ids]))
+            best = ranking[0]
+            rungs_completed = rung + 1
+            alive = ranking[:max(1, len(ranking) // HALVING_FACTOR)]
+
+            if time.monotonic() >= deadline - slowest:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if best is None:
+        return None
+
+    best_folds = [scores[best][fold] for fold in sorted(scores[best])]
+    r2 = [result['r2'] for result in best_folds]
+    return {
+        'params': dict(
+            configurations[best],
+            n_estimators=int(np.median([result['best_iteration'] + 1 for result in best_folds]))
+        ),
+        'cv_r2_mean': float(np.mean(r2)),
+        'cv_r2_std': float(np.std(r2)),
+        'cv_rmse_mean': float(np.mean([result['rmse'] for result in best_folds])),
+        'n_folds': len(best_folds),
+        'n_configurations': len(configurations),
+        'rungs_completed': rungs_completed,
+        'elapsed_seconds': time.monotonic() - start
+    }
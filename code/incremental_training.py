@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+MISE À JOUR INCRÉMENTALE DES MODÈLES APRÈS UN NOUVEAU MOIS DE DONNÉES
+=============================================================================
+
+Après l'ingestion d'un mois (ingestion.py), `train_all_models` réajusterait
+XGBoost (production, prix) et ses dix plis de validation croisée depuis zéro
+et ré-estimerait ARIMA(2,1,2) sur toute la série. Ce module met à jour les
+modèles existants en quelques secondes:
+
+- XGBoost: démarrage à chaud, quelques arbres supplémentaires ajustés sur
+  une fenêtre glissante se terminant par les nouveaux mois, à taux
+  d'apprentissage réduit (`extend_xgboost`): ajustés sur les 72 seules
+  lignes d'un mois, ils en apprennent le bruit et dégradent les mois suivants
+- ARIMA: espace d'état étendu aux nouvelles observations, paramètres
+  inchangés (`extend_arima`)
+- régressions linéaires: réajustées sur tout l'historique (millisecondes)
+- Prophet: conservé tel quel jusqu'au prochain entraînement complet
+
+Un contrôle de dérive décide, modèle par modèle, si la mise à jour suffit
+ou si un entraînement complet est nécessaire:
+- profil d'entraînement absent (modèle historique) ou trop d'arbres / de
+  mois ajoutés depuis le dernier entraînement complet
+- caractéristiques des nouvelles lignes hors du domaine d'entraînement
+- XGBoost: RMSE sur les nouvelles lignes au-delà de ERROR_DRIFT_RATIO fois
+  la RMSE hors échantillon attendue (validation croisée)
+- ARIMA: erreur de prévision à un pas au-delà de ARIMA_DRIFT_SIGMA écarts
+  types des résidus
+
+Usage:
+    from incremental_training import update_models
+    models, refits = update_models(previous_models, df)
+    if refits:   # {nom: motif}
+        models, _ = analysis.train_all_models(df)
+
+=============================================================================
+"""
+
+import numpy as np
+import pandas as pd
+
+from training_scheduler import TrainingTask, extend_arima, extend_xgboost, fit_linear, run_training_tasks
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Cible de chaque famille de modèles tabulaires
+TARGETS = {'production': 'Production_Volume', 'price': 'Average_Price'}
+
+# Arbres ajoutés par mise à jour, et plafond relatif au modèle complet
+INCREMENTAL_TREES = 10
+MAX_EXTRA_TREES_RATIO = 0.5
+
+# Mois vus par les arbres ajoutés (nouveaux mois inclus) et taux
+# d'apprentissage relatif à celui du modèle complet
+INCREMENTAL_WINDOW_MONTHS = 12
+INCREMENTAL_LEARNING_RATE_FACTOR = 0.5
+
+# Seuils de dérive
+ERROR_DRIFT_RATIO = 1.3
+FEATURE_RANGE_MARGIN = 0.1
+ARIMA_DRIFT_SIGMA = 4.0
+MAX_ARIMA_APPENDS = 12
+
+
+# =============================================================================
+# PROFILS D'ENTRAÎNEMENT
+# =============================================================================
+
+def monthly_production(df):
+    """Production totale par mois (série des modèles ARIMA et Prophet)."""
+    return df.groupby('Date')['Production_Volume'].sum()
+
+
+def xgboost_profile(model, X, y, cv_r2_mean, trained_until):
+    """
+    Références d'un XGBoost entraîné complètement, pour le contrôle de dérive.
+
+    Args:
+        model: XGBRegressor entraîné
+        X (pd.DataFrame): Caractéristiques d'entraînement
+        y (pd.Series): Cible
+        cv_r2_mean (float): R² moyen de validation croisée
+        trained_until (pd.Timestamp): Dernier mois d'entraînement
+
+    Returns:
+        dict: Profil stocké dans l'artefact ('training_profile')
+    """
+    return {
+        'trained_until': pd.Timestamp(trained_until).isoformat(),
+        'base_trees': int(model.get_booster().num_boosted_rounds()),
+        'extra_trees': 0,
+        'feature_min': {column: float(value) for column, value in X.min().items()},
+        'feature_max': {column: float(value) for column, value in X.max().items()},
+        # RMSE hors échantillon attendue: variance non expliquée en validation croisée
+        'reference_rmse': float(np.std(y) * np.sqrt(max(1 - cv_r2_mean, 0)))
+    }
+
+
+def arima_profile(results, order, trained_until):
+    """
+    Références d'un ARIMA estimé complètement.
+
+    Returns:
+        dict: Profil stocké dans l'artefact ('training_profile')
+    """
+    # Les premiers résidus (différenciation) ne sont pas représentatifs
+    residuals = np.asarray(results.resid, dtype=float)[order[1]:]
+    return {
+        'trained_until': pd.Timestamp(trained_until).isoformat(),
+        'appended_months': 0,
+        'resid_std': float(np.std(residuals))
+    }
+
+
+# =============================================================================
+# CONTRÔLES DE DÉRIVE
+# =============================================================================
+
+def _rmse(actual, predicted):
+    return float(np.sqrt(np.mean((np.asarray(actual, dtype=float) - np.asarray(predicted, dtype=float)) ** 2)))
+
+
+def xgboost_drift(profile, model, X_new, y_new):
+    """
+    Motif d'entraînement complet d'un XGBoost, None si la mise à jour suffit.
+
+    Returns:
+        tuple: (motif ou None, RMSE du modèle actuel sur les nouvelles lignes)
+    """
+    if profile['extra_trees'] + INCREMENTAL_TREES > MAX_EXTRA_TREES_RATIO * profile['base_trees']:
+        return f"{profile['extra_trees']} arbres déjà ajoutés depuis l'entraînement complet", None
+
+    for column in X_new.columns:
+        low, high = profile['feature_min'][column], profile['feature_max'][column]
+        margin = FEATURE_RANGE_MARGIN * (high - low)
+        if X_new[column].min() < low - margin or X_new[column].max() > high + margin:
+            return f"{column} hors du domaine d'entraînement [{low:.4g}, {high:.4g}]", None
+
+    rmse = _rmse(y_new, model.predict(X_new))
+    if rmse > ERROR_DRIFT_RATIO * profile['reference_rmse']:
+        return f"RMSE {rmse:,.0f} > {ERROR_DRIFT_RATIO} × {profile['reference_rmse']:,.0f} attendue", rmse
+    return None, rmse
+
+
+def arima_drift(profile, extended, n_observed, new_values):
+    """
+    Motif de ré-estimation d'un ARIMA, None si l'extension suffit.
+
+    Args:
+        profile (dict): Profil d'entraînement
+        extended: Résultats ARIMA étendus aux nouvelles valeurs
+        n_observed (int): Observations avant extension
+        new_values (np.ndarray): Nouvelles observations
+
+    Returns:
+        tuple: (motif ou None, plus grande erreur à un pas en écarts types)
+    """
+    if profile['appended_months'] + len(new_values) > MAX_ARIMA_APPENDS:
+        return f"{profile['appended_months']} mois déjà ajoutés sans ré-estimation", None
+
+    # Prévisions à un pas des nouveaux mois (filtrées avec les paramètres actuels)
+    predicted = np.asarray(extended.predict(start=n_observed, end=n_observed + len(new_values) - 1), dtype=float)
+    z_max = float(np.max(np.abs(new_values - predicted)) / profile['resid_std'])
+    if z_max > ARIMA_DRIFT_SIGMA:
+        return f"erreur de prévision à {z_max:.1f} écarts types", z_max
+    return None, z_max
+
+
+# =============================================================================
+# MISE À JOUR
+# =============================================================================
+
+def _new_rows(df, profile):
+    """Lignes postérieures au dernier mois d'entraînement."""
+    return df[df['Date'] > pd.Timestamp(profile['trained_until'])]
+
+
+def update_models(previous, df, max_workers=1):
+    """
+    Mise à jour incrémentale des modèles sur les mois ajoutés depuis leur entraînement.
+
+    Args:
+        previous (dict): Artefacts actuels {nom: {'model', 'features',
+            'training_profile', ...}} (format de train_all_models)
+        df (pd.DataFrame): Dataset complet (historique + nouveaux mois)
+        max_workers (int): Processus des ajustements (1 = processus courant,
+            le plus rapide pour ces ajustements courts)
+
+    Returns:
+        tuple: (artefacts mis à jour {nom: artefact}, entraînements complets
+            nécessaires {nom: motif})
+    """
+    updated = {}
+    refits = {}
+    tasks = {}
+    pending = {}
+
+    for target, column in TARGETS.items():
+        name = f'xgboost_{target}'
+        artifact = previous.get(name)
+        profile = (artifact or {}).get('training_profile')
+        if profile is None:
+            refits[name] = "profil d'entraînement absent"
+            continue
+
+        new = _new_rows(df, profile)
+        if new.empty:
+            continue
+        X_new, y_new = new[artifact['features']], new[column]
+        reason, rmse = xgboost_drift(profile, artifact['model'], X_new, y_new)
+        if reason:
+            refits[name] = reason
+            continue
+
+        window = df[df['Date'] > new['Date'].max() - pd.offsets.MonthEnd(INCREMENTAL_WINDOW_MONTHS)]
+        learning_rate = artifact['model'].get_params()['learning_rate'] * INCREMENTAL_LEARNING_RATE_FACTOR
+        tasks[name] = TrainingTask(
+            extend_xgboost, artifact['model'], window[artifact['features']], window[column],
+            INCREMENTAL_TREES, learning_rate, uses_xgboost=True
+        )
+        pending[name] = (artifact, new, rmse)
+
+    # Régressions linéaires: réajustement complet, quasi instantané
+    for target, column in TARGETS.items():
+        name = f'linear_regression_{target}'
+        artifact = previous.get(name)
+        if artifact is None:
+            continue
+        features = artifact.get('features') or []
+        if artifact.get('scaler') is not None or not features or not set(features) <= set(df.columns):
+            # Artefact d'un autre pipeline (normalisation, caractéristiques dérivées)
+            refits[name] = "caractéristiques non reproductibles"
+            continue
+        tasks[name] = TrainingTask(fit_linear, df[features], df[column])
+        pending[name] = (artifact, df, None)
+
+    results, errors = run_training_tasks(tasks, max_workers=max_workers) if tasks else ({}, {})
+    for name, error in errors.items():
+        refits[name] = f"échec de la mise à jour: {error}"
+
+    for name, model in results.items():
+        artifact, rows, rmse = pending[name]
+        column = TARGETS[name.rsplit('_', 1)[1]]
+        if name.startswith('xgboost'):
+            profile = artifact['training_profile']
+            updated[name] = dict(
+                artifact, model=model,
+                feature_importance=dict(zip(artifact['features'], model.feature_importances_)),
+                training_profile=dict(
+                    profile, trained_until=rows['Date'].max().isoformat(),
+                    extra_trees=profile['extra_trees'] + INCREMENTAL_TREES
+                ),
+                incremental_rmse=rmse
+            )
+        else:
+            predictions = model.predict(rows[artifact['features']])
+            residuals = rows[column] - predictions
+            updated[name] = dict(
+                artifact, model=model,
+                r2_score=float(1 - np.sum(residuals ** 2) / np.sum((rows[column] - rows[column].mean()) ** 2)),
+                mae=float(np.mean(np.abs(residuals)))
+            )
+
+    # ARIMA: extension de l'espace d'état (millisecondes, dans ce processus)
+    artifact = previous.get('arima_production')
+    profile = (artifact or {}).get('training_profile')
+    if profile is None:
+        refits['arima_production'] = "profil d'entraînement absent"
+    else:
+        series = monthly_production(df)
+        new_values = series[series.index > pd.Timestamp(profile['trained_until'])].to_numpy(dtype=float)
+        if len(new_values):
+            results_arima = artifact['model']
+            extended = extend_arima(results_arima, new_values)
+            reason, _ = arima_drift(profile, extended, int(results_arima.nobs), new_values)
+            if reason:
+                refits['arima_production'] = reason
+            else:
+                updated['arima_production'] = dict(
+                    artifact, model=extended, aic=extended.aic,
+                    training_profile=dict(
+                        profile, trained_until=series.index.max().isoformat(),
+                        appended_months=profile['appended_months'] + len(new_values)
+                    )
+                )
+
+    return updated, refits
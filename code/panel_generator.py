@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+GÉNÉRATEUR VECTORISÉ DU PANEL AUTOMOBILE SYNTHÉTIQUE
+=============================================================================
+
+Ce module construit le panel date × fabricant × catégorie × région en une
+seule passe, sous forme de tableaux NumPy diffusés (broadcasting), au lieu
+des quatre boucles Python imbriquées historiques.
+
+Chaque variable aléatoire dispose de son propre flux `np.random.Generator`
+issu d'une même `SeedSequence`: le panel est reproductible pour une graine
+donnée et les distributions sont identiques à celles de la version boucle
+(mêmes moyennes, écarts-types, cycles et bornes).
+
+Le générateur est paramétrable via `PanelConfig` (listes de dimensions,
+plage de dates, fréquence, graine) et peut écrire des panels de plusieurs
+dizaines de millions de lignes par blocs de taille fixe, sans jamais
+matérialiser le panel complet en mémoire. Le résultat ne dépend pas de la
+taille des blocs: chaque flux aléatoire est consommé séquentiellement.
+
+Usage:
+    from panel_generator import generate_panel
+    df = generate_panel(seed=42)
+
+    # Panel de stress-test streamé sur disque
+    python panel_generator.py --manufacturers 200 --start 1990-01-01 \\
+        --output stress_panel.csv --chunk-rows 1000000
+
+=============================================================================
+"""
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# PARAMÈTRES DE RÉFÉRENCE DU PANEL
+# =============================================================================
+
+# Fabricants principaux analysés
+DEFAULT_MANUFACTURERS = [
+    'Toyota',           # Leader mondial
+    'Volkswagen',       # Leader européen
+    'Ford',             # Leader américain traditionnel
+    'Hyundai-Kia',      # Leader coréen
+    'Stellantis',       # Groupe européen (ex-FCA/PSA)
+    'GM'                # General Motors
+]
+
+# Catégories de véhicules
+DEFAULT_CATEGORIES = [
+    'Passenger_Cars',      # Voitures particulières
+    'Commercial_Vehicles', # Véhicules commerciaux
+    'Electric_Vehicles'    # Véhicules électriques
+]
+
+# Régions d'analyse
+DEFAULT_REGIONS = [
+    'North_America',    # États-Unis, Canada, Mexique
+    'Europe',           # Union Européenne + UK
+    'Asia_Pacific',     # Japon, Corée, Australie, etc.
+    'China'             # Chine (marché spécifique)
+]
+
+# Volume de base par fabricant (unités/mois)
+BASE_PRODUCTION_VOLUMES = {
+    'Toyota': 120000,
+    'Volkswagen': 110000,
+    'Ford': 90000,
+    'Hyundai-Kia': 80000,
+    'Stellantis': 75000,
+    'GM': 95000
+}
+
+# Premium de prix par fabricant
+MANUFACTURER_PREMIUMS = {
+    'Toyota': 1.10,
+    'Volkswagen': 1.15,
+    'Ford': 1.00,
+    'Hyundai-Kia': 0.90,
+    'Stellantis': 1.05,
+    'GM': 1.00
+}
+
+# Facteur fixe par catégorie (les VE suivent une rampe temporelle)
+CATEGORY_FACTORS = {
+    'Passenger_Cars': 1.0,
+    'Commercial_Vehicles': 0.3
+}
+EV_CATEGORY = 'Electric_Vehicles'
+
+# Facteur par région (spécialisation géographique)
+REGIONAL_FACTORS = {
+    'North_America': 0.25,
+    'Europe': 0.30,
+    'Asia_Pacific': 0.35,
+    'China': 0.40
+}
+
+# Prix de base par catégorie (USD)
+BASE_PRICES = {
+    'Passenger_Cars': 25000,
+    'Commercial_Vehicles': 45000,
+    'Electric_Vehicles': 40000
+}
+
+# Valeurs par défaut pour les dimensions absentes des tables ci-dessus
+# (panels de stress-test avec des fabricants/régions fictifs)
+DEFAULT_BASE_VOLUME = 90000
+DEFAULT_PREMIUM = 1.0
+DEFAULT_CATEGORY_FACTOR = 0.5
+DEFAULT_REGIONAL_FACTOR = 0.30
+DEFAULT_BASE_PRICE = 30000
+
+# Année de référence pour l'inflation et la courbe VE
+REFERENCE_YEAR = 2010
+
+# Ordre des flux aléatoires (un flux indépendant par variable bruitée)
+NOISE_STREAMS = ['production', 'price', 'gdp', 'steel', 'oil', 'interest']
+
+# Taille cible d'un bloc lors de l'écriture streamée (lignes)
+DEFAULT_CHUNK_ROWS = 500000
+
+# Ordre des colonnes du dataset final
+COLUMNS = [
+    'Date', 'Manufacturer', 'Category', 'Region',
+    'Production_Volume', 'Average_Price',
+    'GDP_Growth', 'Steel_Price', 'Oil_Price', 'Interest_Rate',
+    'US_Tariff_Rate', 'US_EV_Subsidy', 'EV_Share'
+]
+
+
+class PanelConfig:
+    """
+    Configuration du panel synthétique.
+
+    Regroupe les dimensions (fabricants, catégories, régions), la plage de
+    dates, la fréquence et la graine, pour que les panels de stress-test
+    (50 à 200 fabricants, 30+ ans) se décrivent sans toucher au code.
+    """
+
+    def __init__(self, manufacturers=None, categories=None, regions=None,
+                 start='2010-01-01', end='2023-12-31', freq='ME', seed=42,
+                 chunk_rows=DEFAULT_CHUNK_ROWS):
+        """
+        Initialisation de la configuration.
+
+        Args:
+            manufacturers (list): Fabricants (défaut: DEFAULT_MANUFACTURERS)
+            categories (list): Catégories (défaut: DEFAULT_CATEGORIES)
+            regions (list): Régions (défaut: DEFAULT_REGIONS)
+            start (str): Première date du panel
+            end (str): Dernière date du panel
+            freq (str): Fréquence pandas des dates ('ME' = fin de mois)
+            seed (int | None): Graine des flux aléatoires
+            chunk_rows (int): Taille cible d'un bloc écrit sur disque
+        """
+        self.manufacturers = list(manufacturers or DEFAULT_MANUFACTURERS)
+        self.categories = list(categories or DEFAULT_CATEGORIES)
+        self.regions = list(regions or DEFAULT_REGIONS)
+        self.start = start
+        self.end = end
+        self.freq = freq
+        self.seed = seed
+        self.chunk_rows = chunk_rows
+
+    def dates(self):
+        """Dates du panel selon la plage et la fréquence configurées."""
+        return pd.date_range(self.start, self.end, freq=self.freq)
+
+    @property
+    def rows_per_date(self):
+        """Nombre d'observations par date (M × C × R)."""
+        return len(self.manufacturers) * len(self.categories) * len(self.regions)
+
+    @property
+    def total_rows(self):
+        """Nombre total d'observations du panel."""
+        return len(self.dates()) * self.rows_per_date
+
+
+def synthetic_names(defaults, count, prefix):
+    """
+    Extension d'une liste de dimensions avec des noms fictifs.
+
+    Args:
+        defaults (list): Noms réels conservés en tête de liste
+        count (int): Nombre total de noms souhaités
+        prefix (str): Préfixe des noms générés (ex: 'Manufacturer')
+
+    Returns:
+        list: `count` noms, les réels d'abord puis `prefix_001`, ...
+    """
+    names = list(defaults[:count])
+    names += [f"{prefix}_{k:03d}" for k in range(len(names) + 1, count + 1)]
+    return names
+
+
+def make_noise_generators(seed):
+    """
+    Création d'un générateur aléatoire indépendant par variable bruitée.
+
+    Args:
+        seed (int | None): Graine de la SeedSequence racine
+
+    Returns:
+        dict: Générateurs `np.random.Generator` indexés par nom de flux
+    """
+    children = np.random.SeedSequence(seed).spawn(len(NOISE_STREAMS))
+    return {name: np.random.default_rng(child) for name, child in zip(NOISE_STREAMS, children)}
+
+
+def _lookup(mapping, keys, default):
+    """Vecteur des valeurs de `mapping` pour `keys` (avec valeur par défaut)."""
+    return np.array([mapping.get(key, default) for key in keys], dtype=np.float64)
+
+
+def build_panel_block(dates, period_index, n_periods, manufacturers, categories, regions, generators):
+    """
+    Construction vectorisée d'un bloc du panel pour un ensemble de dates.
+
+    Toutes les variables sont calculées sur un cube (T, M, C, R) par
+    diffusion NumPy puis aplaties dans l'ordre date → fabricant →
+    catégorie → région, identique à l'ordre des boucles historiques.
+
+    Args:
+        dates (pd.DatetimeIndex): Dates du bloc
+        period_index (np.ndarray): Indice global de chaque date dans la période
+        n_periods (int): Nombre total de périodes du panel
+        manufacturers (list): Fabricants
+        categories (list): Catégories de véhicules
+        regions (list): Régions
+        generators (dict): Flux aléatoires (voir `make_noise_generators`)
+
+    Returns:
+        pd.DataFrame: Bloc du panel (len(dates) × M × C × R lignes)
+    """
+    n_t, n_m, n_c, n_r = len(dates), len(manufacturers), len(categories), len(regions)
+    shape = (n_t, n_m, n_c, n_r)
+    size = n_t * n_m * n_c * n_r
+
+    i = np.asarray(period_index, dtype=np.float64)
+    years = np.asarray(dates.year, dtype=np.int64)
+
+    # Axes de diffusion: temps (T,1,1,1), fabricant (1,M,1,1), catégorie (1,1,C,1), région (1,1,1,R)
+    t_axis = (slice(None), None, None, None)
+    m_axis = (None, slice(None), None, None)
+    c_axis = (None, None, slice(None), None)
+    r_axis = (None, None, None, slice(None))
+
+    # =================================================================
+    # PRODUCTION
+    # =================================================================
+
+    base_volume = _lookup(BASE_PRODUCTION_VOLUMES, manufacturers, DEFAULT_BASE_VOLUME)
+    regional_factor = _lookup(REGIONAL_FACTORS, regions, DEFAULT_REGIONAL_FACTOR)
+
+    # Facteur catégorie (T, C): les VE croissent de 5% à 35% sur la période
+    is_ev = np.array([category == EV_CATEGORY for category in categories])
+    fixed_factor = _lookup(CATEGORY_FACTORS, categories, DEFAULT_CATEGORY_FACTOR)
+    ev_ramp = 0.05 + (i / n_periods) * 0.30
+    category_factor = np.where(is_ev[None, :], ev_ramp[:, None], fixed_factor[None, :])
+
+    trend_factor = 1 + (i / n_periods) * 0.15
+    seasonality_factor = 1 + 0.1 * np.sin(2 * np.pi * i / 12)
+    noise_factor = generators['production'].normal(1, 0.08, size).reshape(shape)
+
+    production = (
+        base_volume[m_axis] *
+        category_factor[:, None, :, None] *
+        regional_factor[r_axis] *
+        (trend_factor * seasonality_factor)[t_axis] *
+        noise_factor
+    )
+    # Troncature entière puis minimum de 1000 unités
+    production = np.maximum(np.trunc(production), 1000).astype(np.int64)
+
+    # =================================================================
+    # PRIX
+    # =================================================================
+
+    base_price = _lookup(BASE_PRICES, categories, DEFAULT_BASE_PRICE)
+    premium = _lookup(MANUFACTURER_PREMIUMS, manufacturers, DEFAULT_PREMIUM)
+    inflation_factor = 1.02 ** (years - REFERENCE_YEAR)
+    price_volatility = generators['price'].normal(1, 0.03, size).reshape(shape)
+
+    average_price = np.round(
+        base_price[c_axis] * premium[m_axis] * inflation_factor[t_axis] * price_volatility,
+        2
+    )
+
+    # =================================================================
+    # INDICATEURS ÉCONOMIQUES (cycle par date + bruit par observation)
+    # =================================================================
+
+    def cycle_plus_noise(stream, base, amplitude, period, sigma):
+        cycle = base + amplitude * np.sin(2 * np.pi * i / period)
+        return cycle[t_axis] + generators[stream].normal(0, sigma, size).reshape(shape)
+
+    gdp_growth = np.round(cycle_plus_noise('gdp', 0.02, 0.01, 60, 0.005), 4)
+    steel_price = np.round(np.maximum(cycle_plus_noise('steel', 700, 50, 36, 30), 400), 2)
+    oil_price = np.round(np.maximum(cycle_plus_noise('oil', 70, 20, 24, 10), 30), 2)
+    interest_rate = np.round(np.maximum(cycle_plus_noise('interest', 0.03, 0.02, 84, 0.005), 0.001), 4)
+
+    # =================================================================
+    # POLITIQUES US ET TRANSITION ÉLECTRIQUE (fonction de l'année seule)
+    # =================================================================
+
+    tariff_rate = np.select([years < 2018, years < 2021], [0.025, 0.05], default=0.035)
+    ev_subsidy = np.where(years < 2022, 7500, 7500 + 1000 * (years - 2022))
+    ev_share = np.round(0.4 / (1 + np.exp(-0.3 * (years - REFERENCE_YEAR - 8))), 4)
+
+    per_date = n_m * n_c * n_r
+
+    def broadcast_dates(values):
+        return np.repeat(values, per_date)
+
+    # =================================================================
+    # ASSEMBLAGE DU BLOC
+    # =================================================================
+
+    # Dimensions encodées en catégories (codes entiers, pas de chaînes répétées)
+    manufacturer_codes = np.broadcast_to(np.arange(n_m)[m_axis], shape).ravel()
+    category_codes = np.broadcast_to(np.arange(n_c)[c_axis], shape).ravel()
+    region_codes = np.broadcast_to(np.arange(n_r)[r_axis], shape).ravel()
+
+    block = pd.DataFrame({
+        'Date': broadcast_dates(dates.values),
+        'Manufacturer': pd.Categorical.from_codes(manufacturer_codes, categories=manufacturers),
+        'Category': pd.Categorical.from_codes(category_codes, categories=categories),
+        'Region': pd.Categorical.from_codes(region_codes, categories=regions),
+        'Production_Volume': production.ravel(),
+        'Average_Price': average_price.ravel(),
+        'GDP_Growth': gdp_growth.ravel(),
+        'Steel_Price': steel_price.ravel(),
+        'Oil_Price': oil_price.ravel(),
+        'Interest_Rate': interest_rate.ravel(),
+        'US_Tariff_Rate': broadcast_dates(tariff_rate),
+        'US_EV_Subsidy': broadcast_dates(ev_subsidy),
+        'EV_Share': broadcast_dates(ev_share)
+    }, columns=COLUMNS)
+
+    return block
+
+
+def iter_panel_chunks(config):
+    """
+    Génération du panel par blocs de dates consécutives.
+
+    Chaque bloc contient environ `config.chunk_rows` lignes (toujours un
+    nombre entier de dates). Les flux aléatoires sont partagés entre blocs,
+    le panel obtenu est donc identique quelle que soit la taille des blocs.
+
+    Args:
+        config (PanelConfig): Configuration du panel
+
+    Yields:
+        pd.DataFrame: Blocs successifs du panel
+    """
+    dates = config.dates()
+    n_periods = len(dates)
+    dates_per_chunk = max(1, config.chunk_rows // config.rows_per_date)
+    generators = make_noise_generators(config.seed)
+
+    for start in range(0, n_periods, dates_per_chunk):
+        stop = min(start + dates_per_chunk, n_periods)
+        yield build_panel_block(
+            dates[start:stop],
+            np.arange(start, stop),
+            n_periods,
+            config.manufacturers,
+            config.categories,
+            config.regions,
+            generators
+        )
+
+
+def write_panel(config, output_path):
+    """
+    Écriture streamée du panel sur disque, bloc par bloc.
+
+    Le format est déduit de l'extension: `.parquet` (pyarrow requis, un
+    row group par bloc) ou CSV dans les autres cas. Seul le bloc courant
+    est présent en mémoire.
+
+    Args:
+        config (PanelConfig): Configuration du panel
+        output_path (str): Fichier de sortie
+
+    Returns:
+        int: Nombre de lignes écrites
+    """
+    rows_written = 0
+    is_parquet = output_path.endswith('.parquet')
+    writer = None
+
+    if is_parquet:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+    if os.path.exists(output_path):
+        os.remove(output_path)
+
+    try:
+        for block in iter_panel_chunks(config):
+            if is_parquet:
+                table = pa.Table.from_pandas(block, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, table.schema)
+                writer.write_table(table)
+            else:
+                block.to_csv(output_path, mode='a', header=(rows_written == 0), index=False)
+            rows_written += len(block)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return rows_written
+
+
+def generate_panel(dates=None, manufacturers=None, categories=None, regions=None, seed=42):
+    """
+    Génération complète du panel automobile en une seule passe vectorisée.
+
+    Args:
+        dates (pd.DatetimeIndex): Dates mensuelles (défaut: 2010-01 à 2023-12)
+        manufacturers (list): Fabricants (défaut: DEFAULT_MANUFACTURERS)
+        categories (list): Catégories (défaut: DEFAULT_CATEGORIES)
+        regions (list): Régions (défaut: DEFAULT_REGIONS)
+        seed (int | None): Graine des flux aléatoires
+
+    Returns:
+        pd.DataFrame: Panel complet (dates × fabricants × catégories × régions)
+    """
+    if dates is None:
+        dates = pd.date_range('2010-01-01', '2023-12-31', freq='ME')
+    dates = pd.DatetimeIndex(dates)
+
+    return build_panel_block(
+        dates,
+        np.arange(len(dates)),
+        len(dates),
+        list(manufacturers or DEFAULT_MANUFACTURERS),
+        list(categories or DEFAULT_CATEGORIES),
+        list(regions or DEFAULT_REGIONS),
+        make_noise_generators(seed)
+    )
+
+
+def main():
+    """Point d'entrée CLI: écriture streamée d'un panel de stress-test."""
+    parser = argparse.ArgumentParser(description="Génération streamée du panel automobile synthétique")
+    parser.add_argument('--manufacturers', type=int, default=len(DEFAULT_MANUFACTURERS),
+                        help="Nombre de fabricants (noms fictifs au-delà des 6 réels)")
+    parser.add_argument('--categories', type=int, default=len(DEFAULT_CATEGORIES),
+                        help="Nombre de catégories de véhicules")
+    parser.add_argument('--regions', type=int, default=len(DEFAULT_REGIONS),
+                        help="Nombre de régions")
+    parser.add_argument('--start', default='2010-01-01', help="Première date")
+    parser.add_argument('--end', default='2023-12-31', help="Dernière date")
+    parser.add_argument('--freq', default='ME', help="Fréquence pandas des dates")
+    parser.add_argument('--seed', type=int, default=42, help="Graine aléatoire")
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS,
+                        help="Taille cible d'un bloc écrit")
+    parser.add_argument('--output', default='synthetic_automotive_panel.csv',
+                        help="Fichier de sortie (.csv ou .parquet)")
+    args = parser.parse_args()
+
+    config = PanelConfig(
+        manufacturers=synthetic_names(DEFAULT_MANUFACTURERS, args.manufacturers, 'Manufacturer'),
+        categories=synthetic_names(DEFAULT_CATEGORIES, args.categories, 'Category'),
+        regions=synthetic_names(DEFAULT_REGIONS, args.regions, 'Region'),
+        start=args.start,
+        end=args.end,
+        freq=args.freq,
+        seed=args.seed,
+        chunk_rows=args.chunk_rows
+    )
+
+    print(f"🔧 Génération de {config.total_rows:,} observations → {args.output}")
+    rows = write_panel(config, args.output)
+    print(f"✅ {rows:,} observations écrites dans {args.output}")
+
+
+if __name__ == "__main__":
+    main()
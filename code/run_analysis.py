@@ -143,7 +143,7 @@ def run_automotive_analysis():
     6. Export des résultats en Excel et JSON
 
     Fichiers générés:
-        - 9 dashboards HTML interactifs (42.4 MB total)
+        - 9 dashboards HTML interactifs (Plotly.js partagé, voir dashboard_export)
         - 6 modèles ML sauvegardés (.pkl)
         - 1 rapport Excel complet
         - 1 fichier JSON avec tous les résultats
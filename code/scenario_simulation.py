@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+SIMULATION MONTE CARLO DES SCÉNARIOS 2024-2030
+=============================================================================
+
+Les scénarios de `create_all_scenarios` sont des estimations ponctuelles
+(tarifs, subventions VE, croissance du PIB, prix de l'acier). Ce module les
+traite comme des distributions:
+
+- chaque paramètre de scénario est tiré autour de sa valeur centrale, avec
+  des corrélations entre paramètres (copule gaussienne)
+- le prix du pétrole et les taux d'intérêt reçoivent des chocs annuels
+  cumulés (marches aléatoires autour de leurs trajectoires de référence)
+- tous les chemins sont assemblés en une seule matrice de caractéristiques
+  et évalués par les modèles entraînés en grands lots
+- le résultat est résumé en bandes de quantiles (P5/P50/P95) par scénario
+  et par année, prêtes pour des graphiques en éventail
+
+Chaque scénario dispose de son propre flux aléatoire issu d'une même
+`SeedSequence`: les résultats sont reproductibles et indépendants de
+l'ordre ou du nombre de scénarios simulés.
+
+Usage:
+    from scenario_simulation import simulate_all_scenarios
+    bands = simulate_all_scenarios(models, feature_columns, scenarios,
+                                   base_data, forecast_dates, n_paths=100000)
+    bands['status_quo']['production']['p95']
+
+=============================================================================
+"""
+
+import numpy as np
+
+# =============================================================================
+# PARAMÈTRES DE SIMULATION
+# =============================================================================
+
+# Valeurs centrales par défaut (identiques à forecast_all_scenarios_to_2030)
+SCENARIO_DEFAULTS = {
+    'tariff_rate': 0.035,
+    'ev_subsidy': 7500,
+    'gdp_growth': 0.02,
+    'steel_price_factor': 1.0,
+    'ev_share_growth': 0.15
+}
+
+# Incertitude des paramètres de scénario: (type, dispersion)
+# - 'relative': écart-type proportionnel à la valeur centrale
+# - 'absolute': écart-type en unités du paramètre
+# - 'lognormal': facteur multiplicatif exp(N(0, dispersion))
+PARAMETER_UNCERTAINTY = {
+    'tariff_rate': ('relative', 0.25),
+    'ev_subsidy': ('relative', 0.15),
+    'gdp_growth': ('absolute', 0.01),
+    'steel_price_factor': ('lognormal', 0.15),
+    'ev_share_growth': ('relative', 0.25)
+}
+
+# Corrélations entre paramètres (ordre de PARAMETER_UNCERTAINTY):
+# tarifs élevés ↔ acier cher, croissance ↔ demande d'acier, subventions ↔ adoption VE
+PARAMETER_CORRELATION = np.array([
+    # tariff  subsidy  gdp   steel  ev_growth
+    [1.0,    -0.2,    -0.2,  0.4,   -0.1],
+    [-0.2,    1.0,     0.0,  0.0,    0.4],
+    [-0.2,    0.0,     1.0,  0.3,    0.1],
+    [0.4,     0.0,     0.3,  1.0,   -0.1],
+    [-0.1,    0.4,     0.1, -0.1,    1.0]
+])
+
+# Chocs annuels des trajectoires communes (écarts-types par an)
+OIL_PRICE_SHOCK = 6.0         # $/baril
+INTEREST_RATE_SHOCK = 0.004   # points de taux
+
+DEFAULT_N_PATHS = 10000
+DEFAULT_QUANTILES = (5, 50, 95)
+DEFAULT_BATCH_ROWS = 1_000_000
+
+# Modèles utilisables (production, prix), par ordre de préférence
+SIMULATION_MODELS = {
+    'xgboost': ('xgboost_production', 'xgboost_price'),
+    'linear_regression': ('linear_regression_production', 'linear_regression_price')
+}
+
+
+# =============================================================================
+# CONSTRUCTION DES CARACTÉRISTIQUES
+# =============================================================================
+
+def build_feature_grid(base_features, parameters, n_horizons, oil_shocks=None, rate_shocks=None):
+    """
+    Matrice des caractéristiques pour G groupes (scénarios ou chemins) × horizons.
+
+    La ligne `g * n_horizons + i` correspond au groupe `g` à l'horizon `i`.
+
+    Args:
+        base_features (pd.DataFrame): Dernière observation (une ligne)
+        parameters (dict): {paramètre: tableau (G,)} pour les clés de
+            SCENARIO_DEFAULTS
+        n_horizons (int): Nombre d'années de prévision
+        oil_shocks (np.ndarray): Écarts cumulés au prix du pétrole (G, n_horizons)
+        rate_shocks (np.ndarray): Écarts cumulés aux taux d'intérêt (G, n_horizons)
+
+    Returns:
+        pd.DataFrame: (G × n_horizons) lignes, colonnes de base_features
+    """
+    n_groups = len(parameters['tariff_rate'])
+    horizons = np.arange(n_horizons)
+
+    def per_group(values):
+        return np.repeat(np.asarray(values, dtype=float), n_horizons)
+
+    def per_horizon(values):
+        return np.tile(values, n_groups)
+
+    features = base_features.iloc[np.zeros(n_groups * n_horizons, dtype=int)].reset_index(drop=True)
+
+    features['US_Tariff_Rate'] = per_group(parameters['tariff_rate'])
+    features['US_EV_Subsidy'] = per_group(parameters['ev_subsidy'])
+    features['GDP_Growth'] = per_group(parameters['gdp_growth'])
+    features['Steel_Price'] = 700 * per_group(parameters['steel_price_factor'])
+
+    # Part VE: 15% actuellement, croissance linéaire plafonnée à 80%
+    features['EV_Share'] = np.minimum(0.15 + per_horizon(horizons) * per_group(parameters['ev_share_growth']), 0.8)
+
+    # Pétrole (+2$/an) et taux d'intérêt (cycle économique), éventuellement choqués
+    oil_price = per_horizon(70 + horizons * 2)
+    interest_rate = per_horizon(0.03 + 0.01 * np.sin(horizons * 0.5))
+    if oil_shocks is not None:
+        oil_price = np.maximum(oil_price + oil_shocks.ravel(), 0)
+    if rate_shocks is not None:
+        interest_rate = np.maximum(interest_rate + rate_shocks.ravel(), 0)
+    features['Oil_Price'] = oil_price
+    features['Interest_Rate'] = interest_rate
+
+    return features
+
+
+# =============================================================================
+# ÉCHANTILLONNAGE
+# =============================================================================
+
+def sample_scenario_parameters(scenario_params, n_paths, rng):
+    """
+    Tirage conjoint des paramètres d'un scénario autour de leurs valeurs centrales.
+
+    Args:
+        scenario_params (dict): Paramètres du scénario (valeurs centrales)
+        n_paths (int): Nombre de chemins
+        rng (np.random.Generator): Générateur aléatoire
+
+    Returns:
+        dict: {paramètre: tableau (n_paths,)}
+    """
+    names = list(PARAMETER_UNCERTAINTY)
+    normals = rng.multivariate_normal(np.zeros(len(names)), PARAMETER_CORRELATION, size=n_paths)
+
+    samples = {}
+    for column, name in enumerate(names):
+        center = scenario_params.get(name, SCENARIO_DEFAULTS[name])
+        kind, spread = PARAMETER_UNCERTAINTY[name]
+        z = normals[:, column]
+
+        if kind == 'relative':
+            values = center * (1 + spread * z)
+        elif kind == 'absolute':
+            values = center + spread * z
+        else:
+            values = center * np.exp(spread * z - spread ** 2 / 2)
+
+        # Taux, subventions et croissance VE restent positifs
+        samples[name] = values if name == 'gdp_growth' else np.maximum(values, 0)
+
+    return samples
+
+
+def sample_path_shocks(n_paths, n_horizons, rng):
+    """
+    Chocs cumulés (marches aléatoires) du pétrole et des taux d'intérêt.
+
+    Returns:
+        tuple: (chocs pétrole, chocs taux), tableaux (n_paths, n_horizons)
+    """
+    oil = np.cumsum(rng.normal(0, OIL_PRICE_SHOCK, size=(n_paths, n_horizons)), axis=1)
+    rates = np.cumsum(rng.normal(0, INTEREST_RATE_SHOCK, size=(n_paths, n_horizons)), axis=1)
+    return oil, rates
+
+
+# =============================================================================
+# SIMULATION
+# =============================================================================
+
+def predict_in_batches(model, features, batch_rows=DEFAULT_BATCH_ROWS):
+    """Prédiction par lots de `batch_rows` lignes (mémoire bornée)."""
+    if len(features) <= batch_rows:
+        return np.asarray(model.predict(features), dtype=float)
+
+    return np.concatenate([
+        np.asarray(model.predict(features.iloc[start:start + batch_rows]), dtype=float)
+        for start in range(0, len(features), batch_rows)
+    ])
+
+
+def quantile_bands(paths, quantiles=DEFAULT_QUANTILES):
+    """
+    Bandes de quantiles par horizon.
+
+    Args:
+        paths (np.ndarray): Chemins simulés (n_paths, n_horizons)
+        quantiles (tuple): Percentiles à calculer
+
+    Returns:
+        dict: {'p5': [...], 'p50': [...], ...} une valeur par horizon
+    """
+    values = np.percentile(paths, quantiles, axis=0)
+    return {f'p{q:g}': row.tolist() for q, row in zip(quantiles, values)}
+
+
+def simulate_scenario(production_model, price_model, base_features, scenario_params,
+                      n_horizons, n_paths=DEFAULT_N_PATHS, rng=None, batch_rows=DEFAULT_BATCH_ROWS):
+    """
+    Simulation Monte Carlo d'un scénario.
+
+    Args:
+        production_model: Modèle de production (méthode predict)
+        price_model: Modèle de prix (méthode predict)
+        base_features (pd.DataFrame): Dernière observation (une ligne)
+        scenario_params (dict): Paramètres centraux du scénario
+        n_horizons (int): Nombre d'années de prévision
+        n_paths (int): Nombre de chemins
+        rng (np.random.Generator): Générateur aléatoire
+        batch_rows (int): Taille des lots de prédiction
+
+    Returns:
+        tuple: (production, prix), tableaux (n_paths, n_horizons) bornés à 0
+    """
+    rng = rng or np.random.default_rng()
+
+    parameters = sample_scenario_parameters(scenario_params, n_paths, rng)
+    oil_shocks, rate_shocks = sample_path_shocks(n_paths, n_horizons, rng)
+    features = build_feature_grid(base_features, parameters, n_horizons, oil_shocks, rate_shocks)
+
+    production = predict_in_batches(production_model, features, batch_rows)
+    prices = predict_in_batches(price_model, features, batch_rows)
+
+    shape = (n_paths, n_horizons)
+    return np.maximum(production, 0).reshape(shape), np.maximum(prices, 0).reshape(shape)
+
+
+def simulate_all_scenarios(models, feature_columns, scenarios, base_data, forecast_dates,
+                           n_paths=DEFAULT_N_PATHS, seed=42, quantiles=DEFAULT_QUANTILES,
+                           model_name=None, batch_rows=DEFAULT_BATCH_ROWS):
+    """
+    Bandes de quantiles Monte Carlo pour tous les scénarios.
+
+    Args:
+        models (dict): Modèles entraînés (structure de train_all_models)
+        feature_columns (list): Caractéristiques des modèles
+        scenarios (dict): Scénarios (valeurs centrales des paramètres)
+        base_data (pd.DataFrame): Données historiques
+        forecast_dates (pd.DatetimeIndex): Dates de prévision (une par horizon)
+        n_paths (int): Nombre de chemins par scénario
+        seed (int): Graine de la SeedSequence
+        quantiles (tuple): Percentiles des bandes
+        model_name (str): Clé de SIMULATION_MODELS (défaut: premier disponible)
+        batch_rows (int): Taille des lots de prédiction
+
+    Returns:
+        dict: {scénario: {'dates', 'production', 'prices', 'n_paths', 'model'}}
+            où production et prices sont des bandes {'p5': [...], ...}
+
+    Raises:
+        ValueError: Si aucun modèle utilisable n'est disponible
+    """
+    if model_name is None:
+        model_name = next(
+            (name for name, keys in SIMULATION_MODELS.items()
+             if all(models.get(key) is not None for key in keys)),
+            None
+        )
+    if model_name is None:
+        raise ValueError("Aucun modèle de production/prix disponible pour la simulation")
+
+    production_key, price_key = SIMULATION_MODELS[model_name]
+    production_model = models[production_key]['model']
+    price_model = models[price_key]['model']
+
+    base_features = base_data[feature_columns].iloc[-1:]
+    n_horizons = len(forecast_dates)
+
+    # Un flux aléatoire indépendant par scénario
+    streams = np.random.SeedSequence(seed).spawn(len(scenarios))
+
+    simulations = {}
+    for stream, (scenario_name, scenario_params) in zip(streams, scenarios.items()):
+        production, prices = simulate_scenario(
+            production_model, price_model, base_features, scenario_params,
+            n_horizons, n_paths, np.random.default_rng(stream), batch_rows
+        )
+        simulations[scenario_name] = {
+            'dates': list(forecast_dates),
+            'production': quantile_bands(production, quantiles),
+            'prices': quantile_bands(prices, quantiles),
+            'n_paths': n_paths,
+            'model': model_name
+        }
+
+    return simulations
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PRÉVISIONS HIÉRARCHIQUES PAR SEGMENT (FABRICANT × RÉGION × CATÉGORIE)
+=============================================================================
+
+Les modèles globaux de `train_all_models` ne voient que le total mensuel:
+aucune prévision n'existe au niveau fabricant, région ou catégorie affiché
+par les dashboards. Ce module:
+
+1. découpe le panel en séries mensuelles par segment (une seule passe
+   groupby, 72 segments aujourd'hui, des milliers à grande échelle)
+2. ajuste un modèle par segment (ARIMA, Prophet ou XGBoost autorégressif)
+   et prévoit jusqu'à l'horizon demandé; les segments sont regroupés en
+   lots répartis sur le pool de processus de `training_scheduler`
+3. prévoit le total global avec le même type de modèle
+4. réconcilie les prévisions pour que la somme des segments soit égale au
+   total à chaque date (répartition proportionnelle descendante), ou
+   prend la somme des segments comme total (ascendante)
+
+Un segment dont l'ajustement échoue numériquement (série constante,
+matrice singulière...) est prolongé à son dernier niveau et signalé dans
+`fallbacks`. Une dépendance absente ou des paramètres invalides (tous les
+ajustements échouent) lèvent une exception au lieu de produire des
+prévisions plates.
+
+Usage:
+    from segment_forecasting import forecast_segments
+    result = forecast_segments(df, model_type='arima', end='2030-12-31')
+    result['segments']      # Date, Manufacturer, Region, Category, Forecast
+
+=============================================================================
+"""
+
+import importlib.util
+
+import numpy as np
+import pandas as pd
+
+from training_scheduler import TrainingTask, run_training_tasks
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SEGMENT_DIMENSIONS = ['Manufacturer', 'Region', 'Category']
+TARGET_COLUMN = 'Production_Volume'
+
+SEGMENT_MODELS = ['arima', 'prophet', 'xgboost']
+RECONCILIATION_METHODS = ['proportional', 'bottom_up']
+
+# Paramètres par défaut de chaque type de modèle
+DEFAULT_MODEL_PARAMS = {
+    'arima': {'order': (2, 1, 2)},
+    'prophet': {
+        'yearly_seasonality': True,
+        'weekly_seasonality': False,
+        'daily_seasonality': False,
+        'changepoint_prior_scale': 0.05
+    },
+    'xgboost': {
+        'objective': 'reg:squarederror',
+        'n_estimators': 100,
+        'learning_rate': 0.1,
+        'max_depth': 4,
+        'random_state': 42
+    }
+}
+
+# Librairie requise par chaque type de modèle
+MODEL_DEPENDENCIES = {'arima': 'statsmodels', 'prophet': 'prophet', 'xgboost': 'xgboost'}
+
+# Échecs d'ajustement numériques d'un segment (prolongé au dernier niveau).
+# np.linalg.LinAlgError et xgboost.core.XGBoostError dérivent de ValueError;
+# ImportError, TypeError (paramètres inconnus)... sont propagées
+FIT_ERRORS = (ValueError, ArithmeticError)
+
+# Retards utilisés par le modèle XGBoost autorégressif (mois)
+XGBOOST_LAGS = (1, 2, 3, 12)
+
+# Segments par tâche envoyée au pool (amortit le coût de sérialisation)
+DEFAULT_BATCH_SIZE = 16
+
+
+# =============================================================================
+# PRÉPARATION DES SÉRIES
+# =============================================================================
+
+def segment_series(df, dimensions=None, target=TARGET_COLUMN):
+    """
+    Séries mensuelles de la cible par segment.
+
+    Args:
+        df (pd.DataFrame): Panel (Date, dimensions, cible)
+        dimensions (list): Dimensions des segments (défaut: SEGMENT_DIMENSIONS)
+        target (str): Colonne à prévoir
+
+    Returns:
+        pd.DataFrame: Index Date (mensuel trié), une colonne par segment
+            (MultiIndex des valeurs de dimensions), dates manquantes à 0
+    """
+    dimensions = list(dimensions or SEGMENT_DIMENSIONS)
+    panel = df.groupby(['Date'] + dimensions, observed=True)[target].sum()
+    wide = panel.unstack(dimensions, fill_value=0).sort_index()
+    if not isinstance(wide.columns, pd.MultiIndex):
+        wide.columns = pd.MultiIndex.from_arrays([wide.columns], names=dimensions)
+    return wide.astype(float)
+
+
+# =============================================================================
+# MODÈLES PAR SEGMENT
+# =============================================================================
+
+def _forecast_arima(history, horizon, params):
+    from statsmodels.tsa.arima.model import ARIMA
+
+    fitted = ARIMA(history.to_numpy(), order=tuple(params['order'])).fit()
+    return np.asarray(fitted.forecast(steps=horizon), dtype=float)
+
+
+def _forecast_prophet(history, horizon, params):
+    from prophet import Prophet
+
+    model = Prophet(**params)
+    model.fit(pd.DataFrame({'ds': history.index, 'y': history.to_numpy()}))
+    freq = pd.infer_freq(history.index) or 'ME'
+    future = model.make_future_dataframe(periods=horizon, freq=freq, include_history=False)
+    return model.predict(future)['yhat'].to_numpy(dtype=float)
+
+
+def _forecast_xgboost(history, horizon, params, n_jobs=None):
+    import xgboost as xgb
+
+    values = history.to_numpy(dtype=float)
+    max_lag = max(XGBOOST_LAGS)
+    if len(values) <= max_lag + 1:
+        # Historique trop court: prolongation du dernier niveau
+        return np.full(horizon, values[-1] if len(values) else 0.0)
+
+    def lag_features(series, t):
+        return [series[t - lag] for lag in XGBOOST_LAGS] + [t % 12]
+
+    X = np.array([lag_features(values, t) for t in range(max_lag, len(values))])
+    y = values[max_lag:]
+
+    model = xgb.XGBRegressor(**params, n_jobs=n_jobs)
+    model.fit(X, y)
+
+    # Prévision récursive: chaque prévision alimente les retards suivants
+    extended = list(values)
+    for t in range(len(values), len(values) + horizon):
+        extended.append(float(model.predict(np.array([lag_features(extended, t)]))[0]))
+    return np.asarray(extended[len(values):])
+
+
+FORECASTERS = {
+    'arima': _forecast_arima,
+    'prophet': _forecast_prophet,
+    'xgboost': _forecast_xgboost
+}
+
+
+def forecast_segment_batch(histories, model_type, horizon, params, n_jobs=None):
+    """
+    Ajustement et prévision d'un lot de segments (exécuté dans un worker).
+
+    Args:
+        histories (pd.DataFrame): Séries mensuelles, une colonne par segment
+        model_type (str): Type de modèle (SEGMENT_MODELS)
+        horizon (int): Nombre de mois à prévoir
+        params (dict): Paramètres du modèle
+        n_jobs (int): Threads XGBoost alloués au worker
+
+    Returns:
+        dict: {'forecasts': {segment: tableau (horizon,)},
+               'fallbacks': {segment: erreur}} — prévision plate au dernier
+            niveau observé pour les segments dont l'ajustement échoue
+            (FIT_ERRORS); les autres exceptions sont propagées
+    """
+    forecaster = FORECASTERS[model_type]
+    kwargs = {'n_jobs': n_jobs} if model_type == 'xgboost' else {}
+
+    forecasts = {}
+    fallbacks = {}
+    for segment in histories.columns:
+        history = histories[segment]
+        try:
+            forecasts[segment] = forecaster(history, horizon, params, **kwargs)
+        except FIT_ERRORS as e:
+            forecasts[segment] = np.full(horizon, history.iloc[-1] if len(history) else 0.0)
+            fallbacks[segment] = f'{type(e).__name__}: {e}'
+    return {'forecasts': forecasts, 'fallbacks': fallbacks}
+
+
+# =============================================================================
+# RÉCONCILIATION
+# =============================================================================
+
+def reconcile(segment_forecasts, total_forecast=None, method='proportional'):
+    """
+    Réconciliation des prévisions de segments avec le total.
+
+    Args:
+        segment_forecasts (np.ndarray): Prévisions (segments, horizon)
+        total_forecast (np.ndarray): Prévision du total (horizon,)
+        method (str): 'proportional' (segments mis à l'échelle du total) ou
+            'bottom_up' (total = somme des segments)
+
+    Returns:
+        tuple: (segments réconciliés, total) — la somme des segments est
+            égale au total à chaque horizon
+    """
+    segments = np.maximum(np.asarray(segment_forecasts, dtype=float), 0)
+
+    if method == 'bottom_up' or total_forecast is None:
+        return segments, segments.sum(axis=0)
+    if method != 'proportional':
+        raise ValueError(f"Méthode de réconciliation inconnue: {method}")
+
+    total = np.maximum(np.asarray(total_forecast, dtype=float), 0)
+    sums = segments.sum(axis=0)
+
+    # Parts de chaque segment (parts égales si tous les segments sont nuls)
+    shares = np.divide(segments, sums, out=np.full_like(segments, 1 / len(segments)), where=sums > 0)
+    return shares * total, total
+
+
+# =============================================================================
+# PRÉVISION HIÉRARCHIQUE
+# =============================================================================
+
+def forecast_segments(df, model_type='arima', end='2030-12-31', dimensions=None,
+                      params=None, reconciliation='proportional', max_workers=None,
+                      batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Prévisions réconciliées par segment jusqu'à `end`.
+
+    Args:
+        df (pd.DataFrame): Panel mensuel (Date, dimensions, Production_Volume)
+        model_type (str): 'arima', 'prophet' ou 'xgboost'
+        end (str): Dernière date de prévision
+        dimensions (list): Dimensions des segments (défaut: SEGMENT_DIMENSIONS)
+        params (dict): Paramètres du modèle (défaut: DEFAULT_MODEL_PARAMS)
+        reconciliation (str): Méthode de RECONCILIATION_METHODS
+        max_workers (int): Processus du pool (1 = séquentiel)
+        batch_size (int): Segments par tâche
+
+    Returns:
+        dict: {
+            'dates': dates mensuelles prévues,
+            'segments': DataFrame long (Date, dimensions..., Forecast),
+            'total': prévision du total (liste),
+            'model_type', 'reconciliation', 'n_segments',
+            'fallbacks': {segment ou 'total': erreur} des séries prolongées
+                au dernier niveau (vide si tous les ajustements ont abouti)
+        }
+
+    Raises:
+        ValueError: Si le type de modèle est inconnu
+        ImportError: Si la librairie du modèle n'est pas installée
+        RuntimeError: Si aucun ajustement n'aboutit (paramètres invalides)
+    """
+    if model_type not in SEGMENT_MODELS:
+        raise ValueError(f"Type de modèle inconnu: {model_type} (attendu: {SEGMENT_MODELS})")
+    if importlib.util.find_spec(MODEL_DEPENDENCIES[model_type]) is None:
+        raise ImportError(f"Le modèle {model_type} requiert {MODEL_DEPENDENCIES[model_type]}, non installé")
+
+    dimensions = list(dimensions or SEGMENT_DIMENSIONS)
+    params = params or DEFAULT_MODEL_PARAMS[model_type]
+
+    histories = segment_series(df, dimensions)
+    # Même convention de dates que l'historique (fin de mois par défaut)
+    freq = pd.infer_freq(histories.index) or 'ME'
+    forecast_dates = pd.date_range(histories.index.max(), end, freq=freq)[1:]
+    horizon = len(forecast_dates)
+    uses_xgboost = model_type == 'xgboost'
+
+    # Un lot par tâche + le total global (même type de modèle)
+    segments = list(histories.columns)
+    tasks = {
+        f'batch_{start // batch_size}': TrainingTask(
+            forecast_segment_batch, histories[segments[start:start + batch_size]],
+            model_type, horizon, params, uses_xgboost=uses_xgboost
+        )
+        for start in range(0, len(segments), batch_size)
+    }
+    total_history = histories.sum(axis=1).to_frame('total')
+    tasks['total'] = TrainingTask(
+        forecast_segment_batch, total_history, model_type, horizon, params, uses_xgboost=uses_xgboost
+    )
+
+    results, errors = run_training_tasks(tasks, max_workers=max_workers)
+    if errors:
+        raise next(iter(errors.values()))
+
+    by_segment = {}
+    fallbacks = {}
+    for name, batch in results.items():
+        if name != 'total':
+            by_segment.update(batch['forecasts'])
+            fallbacks.update(batch['fallbacks'])
+    total_fallback = results['total']['fallbacks'].get('total')
+
+    # Tous les ajustements en échec: erreur systématique, pas un segment atypique
+    if total_fallback is not None and len(fallbacks) == len(segments):
+        raise RuntimeError(f"Aucun ajustement {model_type} n'a abouti: {total_fallback}")
+
+    fallbacks = {' / '.join(map(str, segment)): error for segment, error in fallbacks.items()}
+    if total_fallback is not None:
+        fallbacks['total'] = total_fallback
+
+    raw = np.vstack([by_segment[segment] for segment in segments])
+    reconciled, total = reconcile(raw, results['total']['forecasts']['total'], reconciliation)
+
+    # Format long: une ligne par (date, segment)
+    long = pd.DataFrame({
+        'Date': np.tile(forecast_dates, len(segments)),
+        'Forecast': reconciled.ravel()
+    })
+    for level, dimension in enumerate(dimensions):
+        long.insert(level + 1, dimension, np.repeat(histories.columns.get_level_values(level), horizon))
+
+    return {
+        'dates': list(forecast_dates),
+        'segments': long,
+        'total': total.tolist(),
+        'model_type': model_type,
+        'reconciliation': reconciliation,
+        'n_segments': len(segments),
+        'fallbacks': fallbacks
+    }
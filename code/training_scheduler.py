@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+ORDONNANCEUR D'ENTRAÎNEMENT PARALLÈLE DES MODÈLES
+=============================================================================
+
+`train_all_models` enchaîne des ajustements indépendants: régressions
+linéaires et XGBoost pour la production et le prix, dix plis de validation
+croisée temporelle, Prophet et ARIMA. Ce module les exécute comme des
+tâches indépendantes réparties sur un pool de processus.
+
+- chaque tâche est une fonction de module (sérialisable) et ses arguments
+- le nombre de threads XGBoost par tâche est budgété pour que
+  (processus × threads) ne dépasse pas le nombre de cœurs
+- les processus sont créés en mode `spawn` (pas de fork d'un runtime
+  OpenMP déjà initialisé)
+- une tâche qui échoue n'interrompt pas les autres: son exception est
+  renvoyée à part, l'appelant décide du repli
+
+Usage:
+    tasks = {
+        'xgb_prod': TrainingTask(fit_xgboost, X, y, params, uses_xgboost=True),
+        'arima': TrainingTask(fit_arima, series, (2, 1, 2)),
+    }
+    results, errors = run_training_tasks(tasks, max_workers=4)
+
+=============================================================================
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+
+class TrainingTask:
+    """
+    Ajustement indépendant à exécuter dans le pool.
+
+    Attributes:
+        func (callable): Fonction de module à appeler
+        args (tuple): Arguments positionnels
+        uses_xgboost (bool): La tâche reçoit un budget de threads `n_jobs`
+    """
+
+    def __init__(self, func, *args, uses_xgboost=False):
+        self.func = func
+        self.args = args
+        self.uses_xgboost = uses_xgboost
+
+    def run(self, n_jobs=None):
+        """Exécution de la tâche (avec budget de threads XGBoost si applicable)."""
+        if self.uses_xgboost:
+            return self.func(*self.args, n_jobs=n_jobs)
+        return self.func(*self.args)
+
+
+# =============================================================================
+# TÂCHES D'AJUSTEMENT
+# =============================================================================
+# Les librairies de modélisation sont importées dans chaque tâche: seul le
+# processus qui exécute l'ajustement paie leur coût de chargement.
+
+def fit_linear(X, y):
+    """Régression linéaire ajustée sur (X, y)."""
+    from sklearn.linear_model import LinearRegression
+
+    model = LinearRegression()
+    model.fit(X, y)
+    return model
+
+
+def fit_xgboost(X, y, params, n_jobs=None):
+    """XGBoost ajusté sur (X, y) avec au plus `n_jobs` threads."""
+    import xgboost as xgb
+
+    model = xgb.XGBRegressor(**params, n_jobs=n_jobs)
+    model.fit(X, y)
+    return model
+
+
+def score_xgboost_fold(X_train, y_train, X_test, y_test, params, n_jobs=None):
+    """R² hors échantillon d'un pli de validation croisée XGBoost."""
+    from sklearn.metrics import r2_score
+
+    model = fit_xgboost(X_train, y_train, params, n_jobs=n_jobs)
+    return r2_score(y_test, model.predict(X_test))
+
+
+def score_xgboost_fold_early_stopping(X_train, y_train, X_test, y_test, params, validation_fraction,
+                                      early_stopping_rounds, n_jobs=None):
+    """
+    Pli de validation croisée XGBoost avec arrêt précoce.
+
+    La fin (chronologique) du pli d'entraînement sert de jeu de validation
+    pour l'arrêt précoce; le pli de test n'est utilisé que pour le score.
+
+    Returns:
+        dict: {'r2', 'rmse', 'best_iteration', 'seconds'}
+    """
+    import xgboost as xgb
+    from sklearn.metrics import mean_squared_error, r2_score
+
+    start = time.perf_counter()
+    split = int(len(X_train) * (1 - validation_fraction))
+    model = xgb.XGBRegressor(**params, early_stopping_rounds=early_stopping_rounds, n_jobs=n_jobs)
+    model.fit(X_train.iloc[:split], y_train.iloc[:split],
+              eval_set=[(X_train.iloc[split:], y_train.iloc[split:])], verbose=False)
+
+    # predict() s'arrête à la meilleure itération
+    predictions = model.predict(X_test)
+    return {
+        'r2': float(r2_score(y_test, predictions)),
+        'rmse': float(mean_squared_error(y_test, predictions) ** 0.5),
+        'best_iteration': int(model.best_iteration),
+        'seconds': time.perf_counter() - start
+    }
+
+
+def fit_prophet(history, regressors, prophet_params):
+    """Prophet ajusté sur un historique (ds, y, régresseurs)."""
+    from prophet import Prophet
+
+    model = Prophet(**prophet_params)
+    for regressor in regressors:
+        model.add_regressor(regressor)
+    model.fit(history)
+    return model
+
+
+def fit_arima(series, order):
+    """ARIMA ajusté sur une série univariée."""
+    from statsmodels.tsa.arima.model import ARIMA
+
+    return ARIMA(series, order=order).fit()
+
+
+def extend_xgboost(model, X, y, n_trees, learning_rate=None, n_jobs=None):
+    """
+    XGBoost prolongé de `n_trees` arbres ajustés sur (X, y).
+
+    Les arbres existants sont conservés (démarrage à chaud): seuls les
+    nouveaux arbres voient les lignes transmises, avec un taux
+    d'apprentissage éventuellement réduit.
+    """
+    import xgboost as xgb
+
+    params = dict(model.get_params(), n_estimators=n_trees, n_jobs=n_jobs)
+    if learning_rate is not None:
+        params['learning_rate'] = learning_rate
+    extended = xgb.XGBRegressor(**params)
+    extended.fit(X, y, xgb_model=model.get_booster())
+    return extended
+
+
+def extend_arima(results, values):
+    """
+    ARIMA étendu aux nouvelles observations, paramètres inchangés.
+
+    L'espace d'état est filtré sur les seules nouvelles valeurs
+    (`append(refit=False)`): pas de ré-estimation.
+    """
+    return results.append(values, refit=False)
+
+
+# =============================================================================
+# ORDONNANCEMENT
+# =============================================================================
+
+def xgboost_thread_budget(n_workers, n_cores=None):
+    """
+    Threads XGBoost par processus pour ne pas sur-souscrire les cœurs.
+
+    Args:
+        n_workers (int): Processus du pool
+        n_cores (int): Cœurs disponibles (défaut: os.cpu_count())
+
+    Returns:
+        int: Threads par tâche XGBoost (au moins 1)
+    """
+    n_cores = n_cores or os.cpu_count() or 1
+    return max(1, n_cores // max(1, n_workers))
+
+
+def _run_task(task, n_jobs):
+    return task.run(n_jobs)
+
+
+def _warm_up(uses_xgboost):
+    """Démarrage d'un processus du pool (imports des tâches à venir)."""
+    if uses_xgboost:
+        import xgboost  # noqa: F401
+
+
+def _timeout_error():
+    return TimeoutError("Échéance atteinte avant le démarrage de la tâche")
+
+
+def start_training_pool(max_workers, uses_xgboost=True, deadline=None):
+    """
+    Pool de processus démarré (imports faits), réutilisable entre plusieurs
+    appels à `run_training_tasks`: le démarrage n'est payé qu'une fois.
+
+    Args:
+        max_workers (int): Processus du pool
+        uses_xgboost (bool): Importer XGBoost dans chaque processus
+        deadline (float): Échéance (`time.monotonic()`) du démarrage
+
+    Returns:
+        ProcessPoolExecutor | None: Pool prêt (à fermer par l'appelant), None
+            si ses processus ne sont pas prêts à l'échéance (exécution
+            séquentielle à prévoir)
+    """
+    context = multiprocessing.get_context('spawn')
+    pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+    timeout = None if deadline is None else max(0, deadline - time.monotonic())
+    _, pending = wait([pool.submit(_warm_up, uses_xgboost) for _ in range(max_workers)], timeout=timeout)
+    if pending:
+        # Les processus en cours de démarrage se terminent seuls
+        pool.shutdown(wait=False, cancel_futures=True)
+        return None
+    return pool
+
+
+def run_training_tasks(tasks, max_workers=None, deadline=None, expected_seconds=0.0, pool=None):
+    """
+    Exécution concurrente de tâches d'entraînement indépendantes.
+
+    Args:
+        tasks (dict): {nom: TrainingTask}
+        max_workers (int): Processus du pool (défaut: min(tâches, cœurs));
+            1 = exécution séquentielle dans le processus courant
+        deadline (float): Échéance (`time.monotonic()`): une tâche n'est
+            démarrée que si elle doit se terminer avant l'échéance (durée
+            estimée), les autres sont annulées (TimeoutError dans les
+            erreurs). Le démarrage du pool est pris sur l'échéance; s'il
+            n'est pas prêt à temps, les tâches sont exécutées en séquence
+        expected_seconds (float): Durée estimée d'une tâche avant toute
+            mesure (ex: pli de calibration); ensuite la plus longue durée
+            observée
+        pool (ProcessPoolExecutor): Pool déjà démarré (voir
+            `start_training_pool`), non fermé ici
+
+    Returns:
+        tuple: (résultats {nom: valeur}, erreurs {nom: exception})
+    """
+    n_cores = os.cpu_count() or 1
+    max_workers = max_workers or min(len(tasks), n_cores)
+    n_jobs = xgboost_thread_budget(max_workers, n_cores)
+
+    if max_workers > 1 and pool is None:
+        if deadline is None:
+            return _run_in_new_pool(tasks, max_workers, n_jobs)
+        uses_xgboost = any(task.uses_xgboost for task in tasks.values())
+        pool = start_training_pool(max_workers, uses_xgboost, deadline - expected_seconds)
+        if pool is not None:
+            with pool:
+                return _run_bounded(pool, tasks, max_workers, n_jobs, deadline, expected_seconds)
+        max_workers = 1
+
+    if max_workers <= 1:
+        return _run_sequential(tasks, n_jobs, deadline, expected_seconds)
+    return _run_bounded(pool, tasks, max_workers, n_jobs, deadline, expected_seconds)
+
+
+def _fits(now, estimate, deadline):
+    return deadline is None or now + estimate <= deadline
+
+
+def _run_sequential(tasks, n_jobs, deadline, estimate):
+    results = {}
+    errors = {}
+    for name, task in tasks.items():
+        start = time.monotonic()
+        if not _fits(start, estimate, deadline):
+            errors[name] = _timeout_error()
+            continue
+        try:
+            results[name] = task.run(n_jobs)
+        except Exception as e:
+            errors[name] = e
+        estimate = max(estimate, time.monotonic() - start)
+    return results, errors
+
+
+def _run_in_new_pool(tasks, max_workers, n_jobs):
+    results = {}
+    errors = {}
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+        futures = {name: pool.submit(_run_task, task, n_jobs) for name, task in tasks.items()}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                errors[name] = e
+    return results, errors
+
+
+def _run_bounded(pool, tasks, max_workers, n_jobs, deadline, estimate):
+    results = {}
+    errors = {}
+
+    # Au plus une tâche par processus: aucune tâche en file d'attente
+    # ne peut démarrer après l'échéance
+    queue = list(tasks.items())
+    running = {}
+    while queue or running:
+        while queue and len(running) < max_workers and _fits(time.monotonic(), estimate, deadline):
+            name, task = queue.pop(0)
+            running[pool.submit(_run_task, task, n_jobs)] = (name, time.monotonic())
+        if not running:
+            break
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            name, submitted = running.pop(future)
+            estimate = max(estimate, time.monotonic() - submitted)
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                errors[name] = e
+
+    for name, _ in queue:
+        errors[name] = _timeout_error()
+
+    return results, errors
@@ -13,7 +13,6 @@ Version: 2.0 - Dashboards Clairs et Logiques
 =============================================================================
 """
 
-import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
@@ -23,29 +22,33 @@ import os
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
+from data_store import load_dataset
+from dashboard_export import write_dashboard
 
 class ClearDashboardCreator:
     """
     Classe pour créer des dashboards clairs et logiques
     """
     
-    def __init__(self, data_path='data/comprehensive_automotive_data.csv'):
+    def __init__(self, data_path='data/comprehensive_automotive_data.csv', export_mode='shared', gzip=False):
         """
         Initialise le créateur de dashboards
         
         Args:
             data_path (str): Chemin vers le fichier de données
+            export_mode (str): 'shared' (Plotly.js partagé), 'json' ou 'standalone'
+            gzip (bool): Écrire aussi des copies .gz pré-compressées
         """
         self.data_path = data_path
+        self.export_mode = export_mode
+        self.gzip = gzip
         self.df = None
         self.load_data()
         
     def load_data(self):
         """Charge et prépare les données"""
         try:
-            self.df = pd.read_csv(self.data_path)
-            self.df['Date'] = pd.to_datetime(self.df['Date'])
-            self.df['Year'] = self.df['Date'].dt.year
+            self.df = load_dataset(self.data_path)
             self.df['Month'] = self.df['Date'].dt.month
             print("✅ Données chargées avec succès")
         except Exception as e:
@@ -140,7 +143,7 @@ class ClearDashboardCreator:
         # Sauvegarde
         output_path = "dashboards/dashboard_kpi_overview.html"
         os.makedirs("dashboards", exist_ok=True)
-        fig.write_html(output_path)
+        write_dashboard(fig, output_path, self.export_mode, self.gzip)
         print(f"✅ Dashboard sauvegardé: {output_path}")
         
     def create_production_analysis_dashboard(self):
@@ -214,7 +217,7 @@ class ClearDashboardCreator:
         
         # Sauvegarde
         output_path = "dashboards/dashboard_production_analysis.html"
-        fig.write_html(output_path)
+        write_dashboard(fig, output_path, self.export_mode, self.gzip)
         print(f"✅ Dashboard sauvegardé: {output_path}")
         
     def create_price_analysis_dashboard(self):
@@ -290,7 +293,7 @@ class ClearDashboardCreator:
         
         # Sauvegarde
         output_path = "dashboards/dashboard_price_analysis.html"
-        fig.write_html(output_path)
+        write_dashboard(fig, output_path, self.export_mode, self.gzip)
         print(f"✅ Dashboard sauvegardé: {output_path}")
         
     def create_ev_transition_dashboard(self):
@@ -365,7 +368,7 @@ class ClearDashboardCreator:
         
         # Sauvegarde
         output_path = "dashboards/dashboard_ev_transition.html"
-        fig.write_html(output_path)
+        write_dashboard(fig, output_path, self.export_mode, self.gzip)
         print(f"✅ Dashboard sauvegardé: {output_path}")
         
     def create_economic_indicators_dashboard(self):
@@ -443,7 +446,7 @@ class ClearDashboardCreator:
         
         # Sauvegarde
         output_path = "dashboards/dashboard_economic_indicators.html"
-        fig.write_html(output_path)
+        write_dashboard(fig, output_path, self.export_mode, self.gzip)
         print(f"✅ Dashboard sauvegardé: {output_path}")
         
     def create_comprehensive_dashboard(self):
@@ -554,7 +557,7 @@ class ClearDashboardCreator:
         
         # Sauvegarde
         output_path = "dashboards/dashboard_comprehensive.html"
-        fig.write_html(output_path)
+        write_dashboard(fig, output_path, self.export_mode, self.gzip)
         print(f"✅ Dashboard sauvegardé: {output_path}")
         
     def create_all_dashboards(self):
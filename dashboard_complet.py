@@ -9,13 +9,17 @@ Dashboard interactif avec toutes les pages demandées.
 
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import streamlit as st
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
+from app_cache import get_dataset
+from lazy_imports import lazy_callable, lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
+make_subplots = lazy_callable('plotly.subplots', 'make_subplots')
 
 class DashboardComplet:
     def __init__(self):
@@ -40,9 +44,8 @@ class DashboardComplet:
     def charger_donnees(self):
         """Charge et prépare les données"""
         try:
-            self.donnees = pd.read_csv("data/comprehensive_automotive_data.csv")
-            self.donnees['Date'] = pd.to_datetime(self.donnees['Date'])
-            self.donnees['Année'] = self.donnees['Date'].dt.year
+            self.donnees = get_dataset()
+            self.donnees['Année'] = self.donnees['Year']
             self.donnees['Revenus'] = self.donnees['Production_Volume'] * self.donnees['Average_Price']
             return True
         except Exception as e:
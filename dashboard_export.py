@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+EXPORT DES DASHBOARDS HTML AVEC PLOTLY.JS PARTAGÉ
+=============================================================================
+
+`fig.write_html()` embarque par défaut le bundle Plotly.js complet (~4.6 MB)
+dans chaque fichier: les dashboards de l'analyse principale et de
+`create_clear_dashboards.py` pèsent ainsi plusieurs dizaines de MB pour
+quelques centaines de KB de données.
+
+Ce module écrit une seule copie locale de Plotly.js (nom versionné, donc
+cachable indéfiniment par le navigateur) à côté des dashboards, et des
+fichiers légers qui la référencent. Modes d'export:
+- 'shared'     : HTML complet avec <script src="plotly-<version>.min.js">
+- 'json'       : spécification JSON de la figure + visionneuse HTML unique
+                 (dashboard_viewer.html?spec=<fichier>.json)
+- 'standalone' : comportement historique (Plotly.js embarqué)
+
+Option `gzip`: copies pré-compressées (.gz) à servir directement par le
+serveur intranet (gzip_static / Content-Encoding: gzip).
+
+Usage:
+    from dashboard_export import write_dashboard
+    write_dashboard(fig, "dashboards/dashboard_kpi_overview.html")
+    write_dashboard(fig, "dashboard_principal.html", mode='json', gzip=True)
+
+Auteur: Système d'Analyse Automobile Avancée
+=============================================================================
+"""
+
+import gzip as gzip_lib
+import os
+import shutil
+
+from plotly.offline import get_plotlyjs, get_plotlyjs_version
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+EXPORT_MODES = ['shared', 'json', 'standalone']
+DEFAULT_MODE = 'shared'
+DEFAULT_GZIP = False
+
+VIEWER_NAME = 'dashboard_viewer.html'
+
+# Visionneuse des spécifications JSON (mode 'json')
+VIEWER_TEMPLATE = """<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<title>Dashboard automobile</title>
+<script src="{asset}"></script>
+<style>html, body, #dashboard {{ margin: 0; width: 100%; height: 100%; }}</style>
+</head>
+<body>
+<div id="dashboard"></div>
+<script>
+  var spec = new URLSearchParams(window.location.search).get('spec');
+  fetch(spec)
+    .then(function (response) {{ return response.json(); }})
+    .then(function (figure) {{
+      document.title = (figure.layout && figure.layout.title && figure.layout.title.text) || spec;
+      Plotly.newPlot('dashboard', figure.data, figure.layout, {{responsive: true}});
+    }});
+</script>
+</body>
+</html>
+"""
+
+
+def plotly_asset_name():
+    """Nom versionné du fichier Plotly.js partagé."""
+    return f'plotly-{get_plotlyjs_version()}.min.js'
+
+
+def _write_gzip_copy(path):
+    """Copie pré-compressée `<path>.gz` (niveau maximal, mtime conservé)."""
+    temporary = f'{path}.gz.{os.getpid()}.tmp'
+    with open(path, 'rb') as source, gzip_lib.open(temporary, 'wb', compresslevel=9) as target:
+        shutil.copyfileobj(source, target)
+    shutil.copystat(path, temporary)
+    os.replace(temporary, path + '.gz')
+
+
+def ensure_plotly_asset(output_dir, gzip=DEFAULT_GZIP):
+    """
+    Écriture unique de Plotly.js dans `output_dir` (si absent).
+
+    Args:
+        output_dir (str): Répertoire des dashboards
+        gzip (bool): Écrire aussi la copie .gz
+
+    Returns:
+        str: Chemin du fichier Plotly.js
+    """
+    asset_path = os.path.join(output_dir or '.', plotly_asset_name())
+
+    if not os.path.exists(asset_path):
+        os.makedirs(output_dir or '.', exist_ok=True)
+        # Écriture atomique: plusieurs processus de rendu peuvent arriver ici
+        temporary = f'{asset_path}.{os.getpid()}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as f:
+            f.write(get_plotlyjs())
+        os.replace(temporary, asset_path)
+
+    if gzip and not os.path.exists(asset_path + '.gz'):
+        _write_gzip_copy(asset_path)
+
+    return asset_path
+
+
+def _ensure_viewer(output_dir, asset_name, gzip):
+    """Visionneuse HTML unique des spécifications JSON."""
+    viewer_path = os.path.join(output_dir or '.', VIEWER_NAME)
+    content = VIEWER_TEMPLATE.format(asset=asset_name)
+
+    current = None
+    if os.path.exists(viewer_path):
+        with open(viewer_path, encoding='utf-8') as f:
+            current = f.read()
+
+    if current != content:
+        with open(viewer_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        if gzip:
+            _write_gzip_copy(viewer_path)
+
+    return viewer_path
+
+
+def write_dashboard(fig, output_path, mode=DEFAULT_MODE, gzip=DEFAULT_GZIP):
+    """
+    Export d'une figure Plotly en dashboard léger.
+
+    Args:
+        fig (go.Figure): Figure à exporter
+        output_path (str): Fichier HTML cible (en mode 'json', la
+            spécification est écrite avec l'extension .json)
+        mode (str): Mode parmi EXPORT_MODES
+        gzip (bool): Écrire aussi les copies .gz
+
+    Returns:
+        str: Chemin du fichier écrit (HTML ou JSON)
+
+    Raises:
+        ValueError: Si le mode est inconnu
+    """
+    if mode not in EXPORT_MODES:
+        raise ValueError(f"Mode d'export inconnu: {mode} (attendu: {EXPORT_MODES})")
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    if mode == 'standalone':
+        fig.write_html(output_path)
+    elif mode == 'shared':
+        asset_path = ensure_plotly_asset(output_dir, gzip)
+        fig.write_html(output_path, include_plotlyjs=os.path.basename(asset_path))
+    else:
+        asset_path = ensure_plotly_asset(output_dir, gzip)
+        _ensure_viewer(output_dir, os.path.basename(asset_path), gzip)
+        output_path = os.path.splitext(output_path)[0] + '.json'
+        fig.write_json(output_path)
+
+    if gzip:
+        _write_gzip_copy(output_path)
+
+    return output_path
+
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+STOCKAGE COLONNAIRE ET CHARGEUR UNIQUE DU DATASET AUTOMOBILE
+=============================================================================
+
+Point d'entrée unique pour charger `comprehensive_automotive_data.csv` dans
+toutes les applications (analyse principale, apps Streamlit, dashboards,
+scripts KPI, régénération des modèles).
+
+Le CSV reste la source de vérité, mais il est converti une fois en fichier
+colonnaire (Parquet par défaut, Feather possible) à côté du CSV:
+- Manufacturer, Category et Region sont stockés en dictionnaire (catégories)
+- Date est stockée en datetime natif
+- Year est pré-calculée (plus de re-parsing de Date à chaque démarrage)
+
+Le fichier colonnaire est régénéré automatiquement dès que le CSV est plus
+récent. Sans pyarrow, le chargeur retombe sur une lecture CSV typée.
+
+Usage:
+    from data_store import load_dataset
+    df = load_dataset()                                   # toutes les colonnes
+    df = load_dataset(columns=['Year', 'Production_Volume'])
+
+    python data_store.py        # conversion explicite du CSV par défaut
+
+Les nouveaux mois de données s'ajoutent sans retraiter l'historique avec
+`append_rows` (voir ingestion.py): chaque ajout est écrit dans son propre
+fichier de partition (`<dataset>.parts/`), relu avec le fichier colonnaire
+principal; une conversion explicite (`python data_store.py`) les réintègre
+dans ce dernier.
+
+Auteur: Système d'Analyse Automobile Avancée
+=============================================================================
+"""
+
+import os
+import shutil
+
+import pandas as pd
+
+# =============================================================================
+# CHEMINS ET SCHÉMA
+# =============================================================================
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
+DEFAULT_CSV_PATH = os.path.join(DATA_DIR, 'comprehensive_automotive_data.csv')
+
+# Emplacements historiques du CSV, par ordre de priorité
+DATASET_CANDIDATES = [
+    DEFAULT_CSV_PATH,
+    os.path.join(PROJECT_ROOT, 'comprehensive_automotive_data.csv'),
+    os.path.join(PROJECT_ROOT, 'code', 'comprehensive_automotive_data.csv')
+]
+
+# Formats colonnaires supportés (extension → format)
+COLUMNAR_FORMATS = {'.parquet': 'parquet', '.feather': 'feather'}
+DEFAULT_COLUMNAR_EXTENSION = '.parquet'
+
+# Dimensions encodées en dictionnaire
+CATEGORICAL_COLUMNS = ['Manufacturer', 'Category', 'Region']
+
+# Colonnes dérivées stockées dans le fichier colonnaire
+DERIVED_COLUMNS = ['Year']
+
+
+def _pyarrow_available():
+    """Vérifie la présence de pyarrow (dépendance optionnelle)."""
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def resolve_dataset_path(candidates=None):
+    """
+    Recherche du premier fichier de données existant.
+
+    Args:
+        candidates (list): Chemins à tester (défaut: DATASET_CANDIDATES)
+
+    Returns:
+        str | None: Chemin du CSV (ou de son fichier colonnaire) trouvé
+    """
+    for path in candidates or DATASET_CANDIDATES:
+        if os.path.exists(path) or os.path.exists(columnar_path(path)):
+            return path
+    return None
+
+
+def columnar_path(csv_path, extension=DEFAULT_COLUMNAR_EXTENSION):
+    """Chemin du fichier colonnaire associé à un CSV."""
+    return os.path.splitext(csv_path)[0] + extension
+
+
+def parts_path(columnar):
+    """Répertoire des partitions ajoutées à un fichier colonnaire."""
+    return os.path.splitext(columnar)[0] + '.parts'
+
+
+def _part_files(columnar):
+    """Partitions ajoutées au fichier colonnaire, dans l'ordre d'ajout."""
+    directory = parts_path(columnar)
+    if not os.path.isdir(directory):
+        return []
+    extension = os.path.splitext(columnar)[1]
+    return [os.path.join(directory, name) for name in sorted(os.listdir(directory)) if name.endswith(extension)]
+
+
+def prepare_columns(df):
+    """
+    Typage canonique du dataset (en place).
+
+    - Date en datetime natif
+    - Dimensions en catégories
+    - Year dérivée de Date (int16)
+
+    Args:
+        df (pd.DataFrame): Dataset brut
+
+    Returns:
+        pd.DataFrame: Le même DataFrame, typé
+    """
+    if 'Date' in df.columns:
+        df['Date'] = pd.to_datetime(df['Date'])
+        df['Year'] = df['Date'].dt.year.astype('int16')
+
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+
+    return df
+
+
+def convert_to_columnar(csv_path=DEFAULT_CSV_PATH, output_path=None):
+    """
+    Conversion d'un CSV en fichier colonnaire typé.
+
+    Args:
+        csv_path (str): CSV source
+        output_path (str): Fichier de sortie (.parquet ou .feather,
+            défaut: même nom que le CSV avec l'extension .parquet)
+
+    Returns:
+        str: Chemin du fichier colonnaire écrit
+    """
+    output_path = output_path or columnar_path(csv_path)
+    _write_columnar(prepare_columns(pd.read_csv(csv_path)), output_path)
+    # Les partitions ajoutées sont dans le CSV, donc dans le fichier réécrit
+    shutil.rmtree(parts_path(output_path), ignore_errors=True)
+    return output_path
+
+
+def _write_columnar(df, path):
+    """Écriture d'un DataFrame typé au format colonnaire de `path`."""
+    if COLUMNAR_FORMATS[os.path.splitext(path)[1]] == 'parquet':
+        df.to_parquet(path, index=False)
+    else:
+        df.to_feather(path)
+
+
+def append_rows(csv_path, rows):
+    """
+    Ajout de nouvelles lignes au dataset sans relire ni réécrire l'historique.
+
+    Les lignes sont ajoutées en fin de CSV (mode append). Si le fichier
+    colonnaire était à jour, elles sont écrites dans une nouvelle partition
+    (`parts_path`), relue avec lui par `load_dataset`: le coût d'un ajout ne
+    dépend que de la taille des nouvelles lignes.
+
+    Args:
+        csv_path (str): CSV du dataset
+        rows (pd.DataFrame): Nouvelles lignes (colonnes du CSV)
+
+    Returns:
+        pd.DataFrame: Nouvelles lignes typées (voir prepare_columns)
+    """
+    columnar = columnar_path(csv_path)
+    columnar_fresh = _is_fresh(columnar, csv_path) and _pyarrow_available()
+
+    header = list(pd.read_csv(csv_path, nrows=0).columns)
+    output = rows[header].copy()
+    output['Date'] = pd.to_datetime(output['Date']).dt.strftime('%Y-%m-%d')
+    output.to_csv(csv_path, mode='a', header=False, index=False)
+
+    typed = prepare_columns(rows[header].copy())
+    if columnar_fresh:
+        # Écrite après l'ajout au CSV: le stockage colonnaire reste à jour
+        directory = parts_path(columnar)
+        os.makedirs(directory, exist_ok=True)
+        name = f"part-{len(_part_files(columnar)):05d}-{typed['Date'].min():%Y-%m}"
+        _write_columnar(typed, os.path.join(directory, name + os.path.splitext(columnar)[1]))
+
+    return typed
+
+
+def _read_columnar(path, columns):
+    """Lecture d'un fichier colonnaire (et de ses partitions) en ne décodant que `columns`."""
+    fmt = COLUMNAR_FORMATS[os.path.splitext(path)[1]]
+    reader = pd.read_parquet if fmt == 'parquet' else pd.read_feather
+    frames = [reader(part, columns=columns) for part in [path] + _part_files(path)]
+    if len(frames) == 1:
+        return frames[0]
+
+    for column in CATEGORICAL_COLUMNS:
+        if column in frames[0].columns:
+            # Catégories communes, sinon la concaténation retombe en chaînes
+            categories = frames[0][column].cat.categories
+            for frame in frames[1:]:
+                categories = categories.union(frame[column].cat.categories)
+            for frame in frames:
+                frame[column] = frame[column].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _read_csv(path, columns):
+    """Lecture CSV typée (repli sans pyarrow), limitée à `columns`."""
+    usecols = None
+    if columns is not None:
+        usecols = [c for c in columns if c not in DERIVED_COLUMNS]
+        if any(c in DERIVED_COLUMNS for c in columns) and 'Date' not in usecols:
+            usecols.append('Date')
+
+    dtypes = {column: 'category' for column in CATEGORICAL_COLUMNS}
+    df = prepare_columns(pd.read_csv(path, usecols=usecols, dtype=dtypes))
+
+    if columns is not None:
+        df = df[list(columns)]
+    return df
+
+
+def _is_fresh(columnar, source):
+    """Le fichier colonnaire (ou sa dernière partition) est-il plus récent que sa source ?"""
+    if not os.path.exists(columnar):
+        return False
+    if not os.path.exists(source):
+        return True
+    updated = max(os.path.getmtime(part) for part in [columnar] + _part_files(columnar))
+    return updated >= os.path.getmtime(source)
+
+
+def load_dataset(path=None, columns=None, categorical=True):
+    """
+    Chargement du dataset automobile depuis le stockage colonnaire.
+
+    Si `path` désigne un CSV, son fichier colonnaire est utilisé (et créé
+    ou rafraîchi si nécessaire). Seules les colonnes demandées sont lues.
+
+    Args:
+        path (str): CSV ou fichier colonnaire (défaut: premier candidat existant)
+        columns (list): Colonnes à charger (défaut: toutes, Year incluse)
+        categorical (bool): Garder les dimensions en catégories (sinon chaînes)
+
+    Returns:
+        pd.DataFrame: Dataset typé (Date datetime, Year entière)
+
+    Raises:
+        FileNotFoundError: Si aucun fichier de données n'est trouvé
+    """
+    path = path or resolve_dataset_path()
+    if path is None:
+        raise FileNotFoundError("Aucun fichier comprehensive_automotive_data trouvé")
+
+    if os.path.splitext(path)[1] in COLUMNAR_FORMATS:
+        df = _read_columnar(path, columns)
+    else:
+        columnar = columnar_path(path)
+        if not _is_fresh(columnar, path) and _pyarrow_available():
+            try:
+                convert_to_columnar(path, columnar)
+            except OSError:
+                # Répertoire en lecture seule: lecture CSV directe
+                pass
+
+        if _is_fresh(columnar, path):
+            df = _read_columnar(columnar, columns)
+        elif os.path.exists(path):
+            df = _read_csv(path, columns)
+        else:
+            raise FileNotFoundError(f"Fichier de données introuvable: {path}")
+
+    if not categorical:
+        for column in CATEGORICAL_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype(str)
+
+    return df
+
+
+def main():
+    """Conversion explicite du CSV par défaut en fichier colonnaire."""
+    csv_path = resolve_dataset_path()
+    if csv_path is None or not os.path.exists(csv_path):
+        print("❌ Aucun CSV de données trouvé")
+        return
+
+    output = convert_to_columnar(csv_path)
+    csv_size = os.path.getsize(csv_path) / 1024
+    columnar_size = os.path.getsize(output) / 1024
+    print(f"✅ {csv_path} ({csv_size:.1f} KB) → {output} ({columnar_size:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
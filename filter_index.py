@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+INDEX DE FILTRAGE DES DONNÉES POUR LES FILTRES MULTI-SÉLECTION
+=============================================================================
+
+Les filtres de la barre latérale (années, régions, constructeurs,
+catégories) copiaient le dataset à chaque rerun puis enchaînaient quatre
+masques `isin`, chacun produisant un nouveau DataFrame. Ici:
+
+- chaque ligne reçoit une fois pour toutes le code entier de sa cellule
+  Year × Region × Manufacturer × Category (codes des catégories
+  combinés, `np.ravel_multi_index`)
+- une sélection devient une table booléenne sur les cellules (produit
+  des valeurs autorisées de chaque dimension, quelques milliers
+  d'entrées): le masque des lignes est obtenu en un seul passage
+  (`table[codes]`), sans `isin` ni DataFrame intermédiaire
+- une dimension triée dans le dataset (Year: lignes chronologiques)
+  est indexée par plages de lignes: le passage est limité aux plages des
+  valeurs sélectionnées (les 3 dernières années = 3/14 des lignes)
+- le résultat est un tableau de positions de lignes, mémorisé (LRU) par
+  sélection normalisée (ordre des valeurs indifférent)
+- le DataFrame filtré n'est matérialisé qu'à la demande: le dataset
+  lui-même si tout est sélectionné, une tranche `iloc` si les lignes sont
+  contiguës, une extraction `take` sinon (dernières sélections mémorisées)
+
+Le dataset indexé est partagé en lecture seule (`app_cache.get_filter_index`):
+les frames renvoyés ne doivent pas être modifiés en place.
+
+Usage:
+    index = FilterIndex(df)
+    rows = index.rows({'Year': [2022, 2023], 'Region': ['Europe']})
+    filtered_df = index.frame({'Year': [2022, 2023], 'Region': ['Europe']})
+
+Auteur: Système d'Analyse Automobile Avancée
+=============================================================================
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from aggregate_cube import DIMENSIONS
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Sélections mémorisées: positions de lignes (légères) et frames filtrés
+DEFAULT_MAX_SELECTIONS = 64
+DEFAULT_MAX_FRAMES = 4
+
+
+def _dimension_codes(column):
+    """
+    Codes entiers et valeurs d'une dimension.
+
+    Les valeurs manquantes reçoivent le dernier code (jamais sélectionnable,
+    comme avec `isin`).
+
+    Returns:
+        tuple: (codes np.ndarray, valeurs pd.Index)
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes, values = column.cat.codes.to_numpy(), column.cat.categories
+    else:
+        codes, values = pd.factorize(column, sort=True)
+    codes = np.where(codes < 0, len(values), codes)
+    return codes, pd.Index(values)
+
+
+class FilterIndex:
+    """
+    Index des lignes du dataset par cellule des dimensions de filtrage.
+
+    Attributes:
+        df (pd.DataFrame): Dataset indexé (partagé, lecture seule)
+        dimensions (list): Dimensions filtrables
+        levels (dict): {dimension: valeurs présentes, triées}
+    """
+
+    def __init__(self, df, dimensions=None, max_selections=DEFAULT_MAX_SELECTIONS,
+                 max_frames=DEFAULT_MAX_FRAMES):
+        """
+        Construction de l'index (un passage par dimension).
+
+        Args:
+            df (pd.DataFrame): Dataset (dimensions en colonnes)
+            dimensions (list): Dimensions filtrables (défaut: DIMENSIONS)
+            max_selections (int): Sélections dont les positions sont mémorisées
+            max_frames (int): Sélections dont le frame filtré est mémorisé
+        """
+        self.df = df
+        self.dimensions = list(dimensions or DIMENSIONS)
+        self.max_selections = max_selections
+        self.max_frames = max_frames
+
+        codes = []
+        self._values = {}
+        self._complete = {}
+        self.levels = {}
+        for dimension in self.dimensions:
+            dimension_codes, values = _dimension_codes(df[dimension])
+            counts = np.bincount(dimension_codes, minlength=len(values) + 1)
+            codes.append(dimension_codes)
+            self._values[dimension] = values
+            self.levels[dimension] = sorted(values[counts[:len(values)] > 0].tolist())
+            # Sélection de toutes les valeurs présentes = pas de filtre (sauf valeurs manquantes)
+            self._complete[dimension] = frozenset(self.levels[dimension]) if counts[-1] == 0 else None
+
+        # Code de cellule par ligne (+1 par dimension: valeur manquante)
+        self._shape = tuple(len(self._values[dimension]) + 1 for dimension in self.dimensions)
+        cells = np.ravel_multi_index(codes, self._shape) if len(df) else np.zeros(0, dtype=np.intp)
+        self._cells = cells.astype(np.int32) if int(np.prod(self._shape)) < 2 ** 31 else cells
+        self._present = np.flatnonzero(np.bincount(self._cells, minlength=int(np.prod(self._shape))))
+
+        # Première dimension triée: plages de lignes de chaque valeur
+        self._range_dimension = None
+        self._range_starts = None
+        for dimension, dimension_codes in zip(self.dimensions, codes):
+            if len(dimension_codes) and np.all(dimension_codes[1:] >= dimension_codes[:-1]):
+                self._range_dimension = dimension
+                self._range_starts = np.searchsorted(dimension_codes, np.arange(len(self._values[dimension]) + 2))
+                break
+
+        self._lock = threading.Lock()
+        self._rows = OrderedDict()    # sélection normalisée -> positions (None = tout)
+        self._frames = OrderedDict()  # sélection normalisée -> DataFrame
+
+    # =================================================================
+    # SÉLECTIONS
+    # =================================================================
+
+    def normalize(self, selection):
+        """
+        Clé canonique d'une sélection.
+
+        Les dimensions sans valeur sélectionnée ne filtrent pas (comme les
+        multiselect vides de la barre latérale), ni celles dont toutes les
+        valeurs présentes sont sélectionnées.
+
+        Args:
+            selection (dict): {dimension: valeurs autorisées}
+
+        Returns:
+            tuple: ((dimension, frozenset des valeurs), ...) dans l'ordre
+                des dimensions
+
+        Raises:
+            KeyError: Si une dimension n'est pas indexée
+        """
+        unknown = set(selection or {}) - set(self.dimensions)
+        if unknown:
+            raise KeyError(f"Dimensions non indexées: {', '.join(sorted(unknown))}")
+        key = []
+        for dimension in self.dimensions:
+            values = (selection or {}).get(dimension)
+            if values is None or len(values) == 0:
+                continue
+            values = frozenset(values)
+            complete = self._complete[dimension]
+            if complete is None or not complete <= values:
+                key.append((dimension, values))
+        return tuple(key)
+
+    def _cell_table(self, key):
+        """Table booléenne des cellules autorisées par une sélection normalisée."""
+        filters = dict(key)
+        table = np.ones(1, dtype=bool)
+        for dimension in self.dimensions:
+            values = self._values[dimension]
+            if dimension in filters:
+                allowed = np.zeros(len(values) + 1, dtype=bool)
+                positions = values.get_indexer(list(filters[dimension]))
+                allowed[positions[positions >= 0]] = True
+            else:
+                allowed = np.ones(len(values) + 1, dtype=bool)
+            table = np.logical_and.outer(table, allowed).reshape(-1)
+        return table
+
+    def _candidate_ranges(self, filters):
+        """Plages de lignes à parcourir (dimension triée filtrée, sinon tout)."""
+        if self._range_dimension not in filters:
+            return [(0, len(self._cells))]
+
+        positions = self._values[self._range_dimension].get_indexer(list(filters[self._range_dimension]))
+        ranges = []
+        for position in sorted(positions[positions >= 0]):
+            start, stop = int(self._range_starts[position]), int(self._range_starts[position + 1])
+            if ranges and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], stop)
+            elif start < stop:
+                ranges.append((start, stop))
+        return ranges
+
+    def rows(self, selection):
+        """
+        Positions des lignes retenues par une sélection.
+
+        Args:
+            selection (dict): {dimension: valeurs autorisées}
+
+        Returns:
+            np.ndarray | None: Positions croissantes, None si toutes les
+                lignes sont retenues
+        """
+        key = self.normalize(selection)
+        with self._lock:
+            if key in self._rows:
+                self._rows.move_to_end(key)
+                return self._rows[key]
+
+        filters = dict(key)
+        table = self._cell_table(key)
+        allowed = table[self._present]
+        if allowed.all():
+            rows = None
+        elif not allowed.any():
+            rows = np.zeros(0, dtype=np.intp)
+        elif list(filters) == [self._range_dimension]:
+            # Seule la dimension triée filtre: ses plages suffisent
+            rows = np.concatenate([np.arange(start, stop) for start, stop in self._candidate_ranges(filters)])
+        else:
+            # Un seul passage sur les lignes: masque = table[code de cellule]
+            rows = np.concatenate([
+                start + np.flatnonzero(table[self._cells[start:stop]])
+                for start, stop in self._candidate_ranges(filters)
+            ])
+
+        with self._lock:
+            self._rows[key] = rows
+            while len(self._rows) > self.max_selections:
+                self._rows.popitem(last=False)
+        return rows
+
+    def frame(self, selection):
+        """
+        Lignes du dataset retenues par une sélection.
+
+        Args:
+            selection (dict): {dimension: valeurs autorisées}
+
+        Returns:
+            pd.DataFrame: Dataset lui-même (tout sélectionné), tranche
+                (lignes contiguës) ou extraction; à ne pas modifier en place
+        """
+        key = self.normalize(selection)
+        with self._lock:
+            if key in self._frames:
+                self._frames.move_to_end(key)
+                return self._frames[key]
+
+        rows = self.rows(selection)
+        if rows is None:
+            return self.df
+        if len(rows) and rows[-1] - rows[0] + 1 == len(rows):
+            frame = self.df.iloc[rows[0]:rows[-1] + 1]
+        else:
+            frame = self.df.take(rows)
+
+        with self._lock:
+            self._frames[key] = frame
+            while len(self._frames) > self.max_frames:
+                self._frames.popitem(last=False)
+        return frame
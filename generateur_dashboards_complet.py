@@ -16,6 +16,7 @@ import streamlit as st
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
+from data_store import load_dataset
 
 class GenerateurDashboardsComplet:
     def __init__(self):
@@ -40,9 +41,8 @@ class GenerateurDashboardsComplet:
     def charger_donnees(self):
         """Charge et prépare les données"""
         try:
-            self.donnees = pd.read_csv("data/comprehensive_automotive_data.csv")
-            self.donnees['Date'] = pd.to_datetime(self.donnees['Date'])
-            self.donnees['Année'] = self.donnees['Date'].dt.year
+            self.donnees = load_dataset()
+            self.donnees['Année'] = self.donnees['Year']
             self.donnees['Mois'] = self.donnees['Date'].dt.month
             
             # Ajouter des colonnes calculées
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+SERVICE D'INFÉRENCE DES MODÈLES POUR LES PRÉDICTIONS INTERACTIVES
+=============================================================================
+
+Les pages « Modèles ML » des applications Streamlit appellent ce service
+pour obtenir la production annuelle prédite par chaque modèle sérialisé
+(XGBoost, régression linéaire, Prophet, ARIMA) pour une année, un scénario
+et des valeurs macro-économiques choisies par l'utilisateur.
+
+- modèles tabulaires (XGBoost, régression linéaire): les lignes du dernier
+  exercice observé (fabricant × région × catégorie × mois) sont projetées
+  sur l'année demandée avec les paramètres du scénario, puis prédites et
+  sommées
+- Prophet: prévision mensuelle du total avec les régresseurs du scénario
+- ARIMA: prévision univariée du total mensuel (indépendante du scénario)
+
+Chaque prédiction est mémorisée (LRU) par (modèle, version du registre,
+année, scénario, acier, PIB, tarifs): les mouvements répétés des curseurs
+sont servis depuis la mémoire. Un modèle en échec (dépendance absente,
+artefact illisible) est mémorisé comme indisponible pour sa version: il
+n'est ni relu ni désérialisé à chaque mouvement de curseur.
+
+Le prix moyen du scénario est prédit par le modèle de prix (XGBoost prix)
+s'il est servi (`predict_price`). Les modèles ne sont chargés qu'à la première
+prédiction qui les utilise. Le service est partagé entre sessions par
+`app_cache.get_inference_service` et reconstruit quand une version change.
+
+Usage:
+    from app_cache import get_inference_service
+    service = get_inference_service()
+    service.predict(2030, "Status Quo", steel_price=750, gdp_growth=0.025)
+    # {'XGBoost': 17_250_000.0, 'Régression Linéaire': ..., 'ARIMA': ...}
+
+Auteur: Système d'Analyse Automobile Avancée
+=============================================================================
+"""
+
+import functools
+
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Scénarios proposés par les pages de prédiction (paramètres identiques à
+# ceux de AutomotiveAnalysis.create_all_scenarios)
+PREDICTION_SCENARIOS = {
+    "Status Quo": {
+        'tariff_rate': 0.035, 'ev_subsidy': 7500, 'gdp_growth': 0.02, 'steel_price_factor': 1.0
+    },
+    "Politiques Protectionnistes US": {
+        'tariff_rate': 0.10, 'ev_subsidy': 5000, 'gdp_growth': 0.015, 'steel_price_factor': 1.2
+    },
+    "Accélération Véhicules Électriques": {
+        'tariff_rate': 0.02, 'ev_subsidy': 12000, 'gdp_growth': 0.025, 'steel_price_factor': 0.9
+    },
+    "Crise Matières Premières": {
+        'tariff_rate': 0.035, 'ev_subsidy': 7500, 'gdp_growth': 0.01, 'steel_price_factor': 1.5
+    },
+    "Percée Technologique": {
+        'tariff_rate': 0.035, 'ev_subsidy': 7500, 'gdp_growth': 0.03, 'steel_price_factor': 0.8
+    }
+}
+DEFAULT_SCENARIO = "Status Quo"
+
+# Croissance annuelle de la part VE (relative) et plafond
+DEFAULT_EV_SHARE_GROWTH = 0.15
+MAX_EV_SHARE = 0.8
+
+MODEL_LABELS = {
+    'xgboost': 'XGBoost',
+    'linear_regression': 'Régression Linéaire',
+    'prophet': 'Prophet',
+    'arima': 'ARIMA'
+}
+
+# Modèles de prix (prix moyen par véhicule), exclus des prédictions de production
+PRICE_MODELS = {
+    'xgboost_price': 'XGBoost (prix)'
+}
+
+# Régresseurs Prophet -> colonnes du dataset (moyennes mensuelles)
+PROPHET_REGRESSORS = {
+    'steel_price': 'Steel_Price',
+    'gdp_growth': 'GDP_Growth'
+}
+
+# Prédictions mémorisées (modèle × paramètres)
+DEFAULT_MEMO_SIZE = 4096
+
+
+def _unwrap(artifact):
+    """
+    Modèle et métadonnées d'un artefact sérialisé.
+
+    Les artefacts du registre sont des dictionnaires {'model', 'scaler',
+    'features', ...}; un estimateur seul est aussi accepté.
+
+    Returns:
+        tuple: (modèle, métadonnées dict)
+    """
+    if isinstance(artifact, dict) and 'model' in artifact:
+        return artifact['model'], artifact
+    return artifact, {}
+
+
+# =============================================================================
+# SERVICE D'INFÉRENCE
+# =============================================================================
+
+class InferenceService:
+    """
+    Prédictions annuelles de production par modèle, mémorisées.
+
+    Attributes:
+        loader (callable): Chargement d'un modèle par nom (clé de MODEL_LABELS)
+        versions (dict): {nom: version du modèle} des modèles disponibles
+        last_year (int): Dernière année observée
+        annual_history (pd.Series): Production annuelle observée par année
+        errors (dict): {nom: message} des modèles indisponibles
+    """
+
+    def __init__(self, loader, versions, history, memo_size=DEFAULT_MEMO_SIZE):
+        """
+        Args:
+            loader (callable): loader(nom) -> artefact (ex: ModelRegistry.load)
+            versions (dict): Version de chaque modèle disponible (clé de
+                mémoire), modèles de production et de prix (PRICE_MODELS)
+            history (pd.DataFrame): Panel observé (Date, Year, caractéristiques,
+                Production_Volume)
+            memo_size (int): Nombre maximal de prédictions mémorisées
+        """
+        self.loader = loader
+        self.versions = dict(versions)
+        self.errors = {}
+        self._failures = {}  # (nom, version) -> message: modèles non réessayés
+
+        self.last_year = int(history['Year'].max())
+        self.annual_history = history.groupby('Year')['Production_Volume'].sum()
+
+        # Lignes du dernier exercice: base de projection des modèles tabulaires
+        base_rows = history[history['Year'] == self.last_year].reset_index(drop=True)
+        base_rows['Month'] = base_rows['Date'].dt.month
+        self.base_rows = base_rows
+
+        self._predict_memo = functools.lru_cache(maxsize=memo_size)(self._predict_model)
+
+    # -------------------------------------------------------------------------
+    # API PUBLIQUE
+    # -------------------------------------------------------------------------
+
+    def predict(self, year, scenario, steel_price=None, gdp_growth=None, tariff_rate=None):
+        """
+        Production annuelle prédite par chaque modèle disponible.
+
+        Args:
+            year (int): Année de prévision (postérieure à last_year)
+            scenario (str): Clé de PREDICTION_SCENARIOS
+            steel_price (float): Prix moyen de l'acier ($/t, défaut: dernier
+                prix observé × facteur du scénario)
+            gdp_growth (float): Croissance du PIB (fraction, défaut: scénario)
+            tariff_rate (float): Taux tarifaire US (fraction, défaut: scénario)
+
+        Returns:
+            dict: {libellé du modèle: production annuelle prédite}
+
+        Raises:
+            ValueError: Si l'année est déjà observée
+        """
+        if year <= self.last_year:
+            raise ValueError(f"Année {year} déjà observée (dernière année: {self.last_year})")
+
+        inputs = (
+            int(year), scenario,
+            None if steel_price is None else round(float(steel_price), 2),
+            None if gdp_growth is None else round(float(gdp_growth), 6),
+            None if tariff_rate is None else round(float(tariff_rate), 6)
+        )
+
+        predictions = {}
+        for name in self.versions:
+            if name in PRICE_MODELS:
+                continue
+            prediction = self._predict_or_fail(name, inputs)
+            if prediction is not None:
+                predictions[MODEL_LABELS.get(name, name)] = prediction
+        return predictions
+
+    def predict_price(self, year, scenario, steel_price=None, gdp_growth=None, tariff_rate=None):
+        """
+        Prix moyen par véhicule prédit pour le scénario (modèle de prix).
+
+        Args:
+            year (int): Année de prévision (postérieure à last_year)
+            scenario (str): Clé de PREDICTION_SCENARIOS
+            steel_price, gdp_growth, tariff_rate: Voir predict
+
+        Returns:
+            float | None: Prix moyen prédit, None si aucun modèle de prix
+                n'est disponible
+        """
+        if year <= self.last_year:
+            raise ValueError(f"Année {year} déjà observée (dernière année: {self.last_year})")
+
+        inputs = (
+            int(year), scenario,
+            None if steel_price is None else round(float(steel_price), 2),
+            None if gdp_growth is None else round(float(gdp_growth), 6),
+            None if tariff_rate is None else round(float(tariff_rate), 6)
+        )
+        for name in PRICE_MODELS:
+            if name in self.versions:
+                prediction = self._predict_or_fail(name, inputs)
+                if prediction is not None:
+                    return prediction
+        return None
+
+    def _predict_or_fail(self, name, inputs):
+        """Prédiction mémorisée d'un modèle, None s'il est indisponible."""
+        version = self.versions.get(name)
+        # lru_cache ne mémorise pas les exceptions: échec retenu par version
+        if (name, version) in self._failures:
+            return None
+        try:
+            return self._predict_memo(name, version, *inputs)
+        except Exception as e:
+            # Modèle incompatible (dépendance absente, format inattendu...)
+            message = f'{type(e).__name__}: {e}'
+            self._failures[(name, version)] = message
+            self.errors[name] = message
+            return None
+
+    def unavailable(self):
+        """
+        Modèles indisponibles, avec leur libellé.
+
+        Returns:
+            dict: {libellé du modèle: message d'erreur}
+        """
+        labels = {**MODEL_LABELS, **PRICE_MODELS}
+        return {labels.get(name, name): message for name, message in self.errors.items()}
+
+    def predict_path(self, years, scenario, **parameters):
+        """
+        Trajectoires annuelles par modèle.
+
+        Args:
+            years (list): Années de prévision
+            scenario (str): Clé de PREDICTION_SCENARIOS
+            **parameters: steel_price, gdp_growth, tariff_rate (voir predict)
+
+        Returns:
+            dict: {libellé du modèle: liste des productions (une par année)}
+        """
+        paths = {}
+        for year in years:
+            for label, value in self.predict(year, scenario, **parameters).items():
+                paths.setdefault(label, []).append(value)
+        return {label: values for label, values in paths.items() if len(values) == len(years)}
+
+    def memo_info(self):
+        """Statistiques de la mémoire des prédictions (hits, misses, taille)."""
+        return self._predict_memo.cache_info()
+
+    # -------------------------------------------------------------------------
+    # PRÉDICTION PAR TYPE DE MODÈLE
+    # -------------------------------------------------------------------------
+
+    def _predict_model(self, name, version, year, scenario, steel_price, gdp_growth, tariff_rate):
+        # `version` fait partie de la clé de mémoire: un modèle réentraîné
+        # n'est jamais servi avec les prédictions de l'ancien
+        model, metadata = _unwrap(self.loader(name))
+        rows = self._scenario_rows(year, scenario, steel_price, gdp_growth, tariff_rate)
+
+        if name == 'arima':
+            steps = (year - self.last_year) * 12
+            return float(np.maximum(np.asarray(model.forecast(steps=steps), dtype=float)[-12:], 0).sum())
+        if name == 'prophet':
+            return self._predict_prophet(model, year, rows)
+        if name in PRICE_MODELS:
+            return self._predict_price(model, metadata, rows)
+        return self._predict_tabular(model, metadata, rows)
+
+    def _scenario_rows(self, year, scenario, steel_price, gdp_growth, tariff_rate):
+        """Lignes du dernier exercice projetées sur `year` selon le scénario."""
+        params = PREDICTION_SCENARIOS.get(scenario, PREDICTION_SCENARIOS[DEFAULT_SCENARIO])
+        horizon = year - self.last_year
+        rows = self.base_rows.copy()
+
+        # Niveaux moyens imposés, dispersion régionale conservée
+        observed_steel = rows['Steel_Price'].mean()
+        steel_target = observed_steel * params['steel_price_factor'] if steel_price is None else steel_price
+        rows['Steel_Price'] = rows['Steel_Price'] * (steel_target / observed_steel)
+
+        gdp_target = params['gdp_growth'] if gdp_growth is None else gdp_growth
+        rows['GDP_Growth'] = rows['GDP_Growth'] + (gdp_target - rows['GDP_Growth'].mean())
+
+        rows['US_Tariff_Rate'] = params['tariff_rate'] if tariff_rate is None else tariff_rate
+        rows['US_EV_Subsidy'] = params['ev_subsidy']
+
+        ev_growth = params.get('ev_share_growth', DEFAULT_EV_SHARE_GROWTH)
+        rows['EV_Share'] = np.minimum(rows['EV_Share'] * (1 + ev_growth) ** horizon, MAX_EV_SHARE)
+
+        rows['Year'] = year
+        return rows
+
+    @staticmethod
+    def _row_predictions(model, metadata, rows):
+        """Prédictions par ligne d'un modèle tabulaire (non négatives)."""
+        features = metadata.get('features') or list(getattr(model, 'feature_names_in_', []))
+        X = rows[features]
+        if metadata.get('scaler') is not None:
+            X = metadata['scaler'].transform(X)
+        return np.maximum(model.predict(X), 0)
+
+    @classmethod
+    def _predict_tabular(cls, model, metadata, rows):
+        """Somme des prédictions par ligne (production annuelle totale)."""
+        return float(cls._row_predictions(model, metadata, rows).sum())
+
+    @classmethod
+    def _predict_price(cls, model, metadata, rows):
+        """Moyenne des prix prédits par ligne (comme Average_Price observé)."""
+        return float(cls._row_predictions(model, metadata, rows).mean())
+
+    @staticmethod
+    def _predict_prophet(model, year, rows):
+        """Somme des 12 prévisions mensuelles du total."""
+        future = pd.DataFrame({'ds': pd.date_range(f'{year}-01-01', periods=12, freq='ME')})
+        monthly = rows.groupby('Month')[list(PROPHET_REGRESSORS.values())].mean()
+        for regressor in getattr(model, 'extra_regressors', {}):
+            future[regressor] = monthly[PROPHET_REGRESSORS[regressor]].to_numpy()
+        return float(np.maximum(model.predict(future)['yhat'].to_numpy(), 0).sum())
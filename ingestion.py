@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+INGESTION INCRÉMENTALE DES DONNÉES MENSUELLES
+=============================================================================
+
+Les données de production arrivent chaque mois. Plutôt que de régénérer le
+dataset (`create_automotive_dataset`) ou de retraiter 14 ans d'historique,
+ce module ajoute uniquement la nouvelle partition:
+
+1. validation de la seule partition reçue (schéma, mois postérieurs et
+   contigus au dernier mois stocké, grille complète des segments, clés
+   uniques, valeurs manquantes ou hors bornes) — l'historique n'est lu que
+   sur ses colonnes clés, depuis le stockage colonnaire
+2. ajout en fin de CSV et écriture d'une nouvelle partition colonnaire, sans
+   réécrire l'historique (`data_store.append_rows`)
+3. mise à jour du cube d'agrégats persisté par fusion des cellules de la
+   nouvelle partition (`AggregateCube.merge`)
+4. signalement des éléments dérivés devenus obsolètes: modèles du registre
+   (champ 'stale' du manifeste, effacé au prochain enregistrement) et
+   dashboards de l'analyse principale (empreintes supprimées: reconstruits
+   au prochain `create_comprehensive_dashboards`)
+
+Usage:
+    from ingestion import ingest_months
+    report = ingest_months('arrivees/production_2024_01.csv')
+
+    python ingestion.py arrivees/production_2024_01.csv
+    python ingestion.py arrivees/production_2024_01.csv --dry-run
+
+Auteur: Système d'Analyse Automobile Avancée
+=============================================================================
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import pandas as pd
+
+from aggregate_cube import AggregateCube, cube_path
+from data_store import (
+    PROJECT_ROOT, _pyarrow_available, append_rows, load_dataset, resolve_dataset_path
+)
+from model_registry import ModelRegistry
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Clé d'une observation: un segment (fabricant × catégorie × région) par mois
+SEGMENT_COLUMNS = ['Manufacturer', 'Category', 'Region']
+KEY_COLUMNS = ['Date'] + SEGMENT_COLUMNS
+
+# Bornes admises des valeurs (None = non bornée)
+VALUE_BOUNDS = {
+    'Production_Volume': (0, None),
+    'Average_Price': (0, None),
+    'Steel_Price': (0, None),
+    'US_Tariff_Rate': (0, 1),
+    'US_EV_Subsidy': (0, None),
+    'EV_Share': (0, 1),
+    'Oil_Price': (0, None),
+    'Interest_Rate': (0, 1)
+}
+
+# Empreintes des dashboards de l'analyse principale (selon le répertoire
+# de lancement de code/automotive_analysis_main.py)
+DASHBOARD_FINGERPRINT_FILES = [
+    os.path.join(PROJECT_ROOT, '.dashboard_fingerprints.json'),
+    os.path.join(PROJECT_ROOT, 'code', '.dashboard_fingerprints.json')
+]
+
+
+# =============================================================================
+# VALIDATION DE LA PARTITION
+# =============================================================================
+
+def store_state(csv_path):
+    """
+    Dernier mois stocké et segments attendus chaque mois.
+
+    Seules les colonnes clés sont lues (stockage colonnaire).
+
+    Returns:
+        tuple: (dernière date pd.Timestamp, ensemble des segments du dernier mois)
+    """
+    keys = load_dataset(csv_path, columns=KEY_COLUMNS, categorical=False)
+    last_date = keys['Date'].max()
+    segments = set(keys.loc[keys['Date'] == last_date, SEGMENT_COLUMNS].itertuples(index=False, name=None))
+    return last_date, segments
+
+
+def validate_partition(rows, columns, last_date, segments):
+    """
+    Contrôles de la nouvelle partition avant ajout.
+
+    Args:
+        rows (pd.DataFrame): Nouvelles lignes (Date en fin de mois)
+        columns (list): Colonnes du dataset stocké
+        last_date (pd.Timestamp): Dernier mois stocké
+        segments (set): Segments attendus chaque mois
+
+    Returns:
+        list: Messages d'erreur (vide si la partition est valide)
+    """
+    missing_columns = [column for column in columns if column not in rows.columns]
+    if missing_columns:
+        return [f"Colonnes manquantes: {', '.join(missing_columns)}"]
+
+    errors = []
+    extra_columns = [column for column in rows.columns if column not in columns]
+    if extra_columns:
+        errors.append(f"Colonnes inconnues: {', '.join(extra_columns)}")
+
+    if rows.empty:
+        return errors + ["Partition vide"]
+
+    # Mois postérieurs au stock et sans trou
+    months = sorted(rows['Date'].unique())
+    expected = pd.date_range(last_date + pd.offsets.MonthEnd(1), periods=len(months), freq='ME')
+    if months[0] <= last_date:
+        errors.append(f"Mois déjà stockés (dernier mois: {last_date:%Y-%m}): "
+                      f"{', '.join(f'{m:%Y-%m}' for m in months if m <= last_date)}")
+    elif list(months) != list(expected):
+        errors.append(f"Mois non contigus au stock: attendus {', '.join(f'{m:%Y-%m}' for m in expected)}")
+
+    duplicated = rows.duplicated(KEY_COLUMNS)
+    if duplicated.any():
+        errors.append(f"{int(duplicated.sum())} lignes en double (Date × segment)")
+
+    # Grille complète des segments pour chaque mois
+    for month, group in rows.groupby('Date'):
+        received = set(group[SEGMENT_COLUMNS].itertuples(index=False, name=None))
+        if received != segments:
+            errors.append(f"{month:%Y-%m}: {len(segments - received)} segments manquants, "
+                          f"{len(received - segments)} segments inconnus")
+
+    null_counts = rows[columns].isna().sum()
+    for column, count in null_counts[null_counts > 0].items():
+        errors.append(f"{column}: {count} valeurs manquantes")
+
+    for column, (low, high) in VALUE_BOUNDS.items():
+        values = pd.to_numeric(rows[column], errors='coerce')
+        outside = (values < low) if low is not None else pd.Series(False, index=rows.index)
+        if high is not None:
+            outside |= values > high
+        if outside.any():
+            errors.append(f"{column}: {int(outside.sum())} valeurs hors bornes [{low}, {high}]")
+
+    return errors
+
+
+# =============================================================================
+# OBSOLESCENCE DES ÉLÉMENTS DÉRIVÉS
+# =============================================================================
+
+def mark_dashboards_stale(paths=None):
+    """
+    Suppression des empreintes des dashboards de l'analyse principale.
+
+    Returns:
+        int: Nombre d'empreintes supprimées
+    """
+    cleared = 0
+    for path in paths or DASHBOARD_FINGERPRINT_FILES:
+        if not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            cleared += len(json.load(f))
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({}, f)
+    return cleared
+
+
+# =============================================================================
+# INGESTION
+# =============================================================================
+
+def ingest_months(new_data, csv_path=None, dry_run=False, registry=None):
+    """
+    Ajout d'un ou plusieurs nouveaux mois au dataset.
+
+    Args:
+        new_data (str | pd.DataFrame): CSV ou DataFrame des nouvelles lignes
+            (colonnes du dataset; les dates sont ramenées en fin de mois)
+        csv_path (str): CSV du dataset (défaut: premier candidat existant)
+        dry_run (bool): Valider sans rien écrire
+        registry (ModelRegistry): Registre des modèles à signaler (défaut: models/)
+
+    Returns:
+        dict: {'months', 'rows', 'cube' (chemin ou None), 'stale_models',
+            'stale_dashboards'}
+
+    Raises:
+        FileNotFoundError: Si le dataset est introuvable
+        ValueError: Si la partition est invalide (message détaillé)
+    """
+    csv_path = csv_path or resolve_dataset_path()
+    if csv_path is None or not os.path.exists(csv_path):
+        raise FileNotFoundError("Aucun CSV comprehensive_automotive_data trouvé")
+
+    rows = pd.read_csv(new_data) if isinstance(new_data, str) else new_data.copy()
+    if 'Date' in rows.columns:
+        rows['Date'] = pd.to_datetime(rows['Date']) + pd.offsets.MonthEnd(0)
+
+    columns = list(pd.read_csv(csv_path, nrows=0).columns)
+    last_date, segments = store_state(csv_path)
+    errors = validate_partition(rows, columns, last_date, segments)
+    if errors:
+        raise ValueError("Partition invalide:\n  - " + "\n  - ".join(errors))
+
+    months = [f'{month:%Y-%m}' for month in sorted(rows['Date'].unique())]
+    report = {'months': months, 'rows': len(rows), 'cube': None, 'stale_models': [], 'stale_dashboards': 0}
+    if dry_run:
+        return report
+
+    # Le cube persisté n'est complété que s'il couvrait tout l'historique
+    cube_file = cube_path(csv_path)
+    cube_fresh = os.path.exists(cube_file) and os.path.getmtime(cube_file) >= os.path.getmtime(csv_path)
+
+    typed = append_rows(csv_path, rows)
+
+    if _pyarrow_available():
+        if cube_fresh:
+            cube = AggregateCube.load(cube_file).merge(AggregateCube.from_frame(typed))
+        else:
+            # Premier passage: cube complet, mis à jour incrémentalement ensuite
+            cube = AggregateCube.from_frame(load_dataset(csv_path))
+        cube.save(cube_file)
+        report['cube'] = cube_file
+
+    reason = f"nouvelles données jusqu'à {months[-1]}"
+    report['stale_models'] = (registry or ModelRegistry()).mark_stale(reason)
+    report['stale_dashboards'] = mark_dashboards_stale()
+    return report
+
+
+def main():
+    """Ingestion d'un fichier mensuel en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Ajout incrémental de nouveaux mois au dataset")
+    parser.add_argument('source', help="CSV des nouvelles lignes (colonnes du dataset)")
+    parser.add_argument('--data', default=None, help="CSV du dataset (défaut: data/comprehensive_automotive_data.csv)")
+    parser.add_argument('--dry-run', action='store_true', help="Valider la partition sans l'ajouter")
+    args = parser.parse_args()
+
+    print(f"📥 Ingestion de {args.source}")
+    try:
+        report = ingest_months(args.source, csv_path=args.data, dry_run=args.dry_run)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"✅ {report['rows']:,} lignes valides ({', '.join(report['months'])})")
+    if args.dry_run:
+        print("  ℹ️ Validation seule: rien n'a été écrit")
+        return 0
+    if report['cube']:
+        print(f"  🧊 Cube d'agrégats mis à jour: {report['cube']}")
+    print(f"  ⚠️ Modèles à réentraîner: {', '.join(report['stale_models']) or '-'}")
+    print(f"  ⚠️ Dashboards à reconstruire: {report['stale_dashboards']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+IMPORTS DIFFÉRÉS ET BUDGET D'IMPORT DES POINTS D'ENTRÉE
+=============================================================================
+
+Les librairies lourdes (xgboost, sklearn, statsmodels, prophet,
+plotly.express...) coûtent plusieurs secondes d'import à froid alors que la
+plupart des pages et des étapes n'en ont pas besoin. Ce module:
+
+1. fournit des mandataires chargés au premier accès (`lazy_module`,
+   `lazy_callable`): le nom reste disponible au niveau module, l'import
+   n'a lieu qu'à la première utilisation par la page ou l'étape concernée
+2. mesure le coût d'import à froid de chaque point d'entrée
+   (`python -X importtime` sur ses imports de premier niveau, dans un
+   interpréteur neuf) et le compare à un budget exprimé en surcoût par
+   rapport à son socle incompressible (pandas, streamlit)
+
+Usage:
+    from lazy_imports import lazy_module, lazy_callable
+    px = lazy_module('plotly.express')
+    make_subplots = lazy_callable('plotly.subplots', 'make_subplots')
+
+    python lazy_imports.py                 # rapport de tous les points d'entrée
+    python lazy_imports.py streamlit_app.py --repeat 5
+
+Auteur: Système d'Analyse Automobile Avancée
+=============================================================================
+"""
+
+import argparse
+import ast
+import importlib
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Point d'entrée -> (socle incompressible, surcoût autorisé en ms)
+ENTRY_POINTS = {
+    'streamlit_app.py': (('pandas', 'streamlit'), 50),
+    'streamlit_app_fixed.py': (('pandas', 'streamlit'), 50),
+    'streamlit_app_clear.py': (('pandas', 'streamlit'), 50),
+    'dashboard_complet.py': (('pandas', 'streamlit'), 50),
+    'analyze_kpis.py': (('pandas',), 25),
+    'code/automotive_analysis_main.py': (('pandas',), 100),
+}
+
+# Budget des points d'entrée non déclarés
+DEFAULT_BUDGET = (('pandas',), 50)
+
+# Librairies qui ne doivent jamais être chargées au démarrage
+HEAVY_PACKAGES = [
+    'xgboost', 'sklearn', 'statsmodels', 'prophet', 'scipy',
+    'matplotlib', 'seaborn', 'joblib', 'tqdm', 'plotly.express'
+]
+
+# Appels de niveau module conservés lors de la mesure (imports différés)
+LAZY_HELPERS = {'lazy_module', 'lazy_callable'}
+
+DEFAULT_REPEAT = 3
+
+
+# =============================================================================
+# CHARGEMENT DIFFÉRÉ
+# =============================================================================
+
+class LazyModule:
+    """
+    Mandataire d'un module importé au premier accès à l'un de ses attributs.
+
+    Contrairement à `importlib.util.LazyLoader`, le mandataire n'est pas
+    inscrit dans sys.modules: ni le module parent ni le module lui-même ne
+    sont chargés avant la première utilisation réelle.
+    """
+
+    def __init__(self, name):
+        """
+        Args:
+            name (str): Nom complet du module (ex: 'plotly.express')
+        """
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'chargé' if self._module is not None else 'différé'
+        return f"<LazyModule {self._name} ({state})>"
+
+
+def lazy_module(name):
+    """
+    Module importé à la première utilisation.
+
+    Args:
+        name (str): Nom complet du module
+
+    Returns:
+        module | LazyModule: Le module s'il est déjà chargé, sinon un mandataire
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
+
+
+def lazy_callable(module_name, attribute):
+    """
+    Fonction d'un module importé au premier appel.
+
+    Args:
+        module_name (str): Nom complet du module
+        attribute (str): Nom de la fonction ou de la classe
+
+    Returns:
+        callable: Fonction transmettant l'appel à `module.attribute`
+    """
+    module = lazy_module(module_name)
+
+    def call(*args, **kwargs):
+        return getattr(module, attribute)(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = attribute
+    call.__doc__ = f"{module_name}.{attribute} (import différé au premier appel)"
+    return call
+
+
+# =============================================================================
+# BUDGET D'IMPORT PAR POINT D'ENTRÉE
+# =============================================================================
+
+def startup_imports(path):
+    """
+    Instructions exécutées au démarrage d'un point d'entrée.
+
+    Seuls les imports de premier niveau (y compris dans un bloc try) et les
+    appels de niveau module à `lazy_module` / `lazy_callable` sont retenus:
+    le corps du script (lecture du CSV, rendu...) n'est pas exécuté.
+
+    Args:
+        path (str): Fichier du point d'entrée
+
+    Returns:
+        str: Code source des seules instructions de démarrage
+
+    Raises:
+        SyntaxError: Si le fichier n'est pas analysable par cet interpréteur
+    """
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    def is_lazy_assignment(node):
+        return (isinstance(node, ast.Assign) and isinstance(node.value, ast.Call)
+                and isinstance(node.value.func, ast.Name) and node.value.func.id in LAZY_HELPERS)
+
+    statements = []
+    for node in tree.body:
+        if isinstance(node, ast.Try):
+            statements.append(ast.Try(
+                body=[n for n in node.body if isinstance(n, (ast.Import, ast.ImportFrom))] or [ast.Pass()],
+                handlers=[ast.ExceptHandler(type=None, name=None, body=[ast.Pass()])],
+                orelse=[], finalbody=[]
+            ))
+        elif isinstance(node, (ast.Import, ast.ImportFrom)) or is_lazy_assignment(node):
+            statements.append(node)
+
+    return ast.unparse(ast.fix_missing_locations(ast.Module(body=statements, type_ignores=[])))
+
+
+def parse_importtime(stderr, exclude=(), baseline=()):
+    """
+    Lecture de la sortie de `python -X importtime`.
+
+    Args:
+        stderr (str): Sortie d'erreur de l'interpréteur
+        exclude (set): Modules chargés par le démarrage de l'interpréteur
+            lui-même (site, encodings...), ignorés
+        baseline (tuple): Modules du socle, comptés là où ils sont chargés
+            (premier niveau ou import imbriqué d'un module du projet)
+
+    Returns:
+        tuple: (durée totale en ms, {module de premier niveau: durée
+            cumulée en ms}, ensemble des modules chargés, durée cumulée
+            du socle en ms)
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Les imports imbriqués sont indentés (2 espaces par niveau) sous leur importateur
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((depth, name.strip(), int(cumulative) / 1000))
+
+    top_level = {}
+    loaded = set()
+    baseline_ms = 0.0
+    ancestors = []
+    # Sortie en post-ordre (importateur après ses imports): parcours inversé
+    # pour connaître les importateurs de chaque module
+    for depth, module, cumulative in reversed(entries):
+        ancestors = ancestors[:depth] + [module]
+        if module in exclude:
+            continue
+        loaded.add(module)
+        if depth == 0:
+            top_level[module] = top_level.get(module, 0) + cumulative
+        # Socle compté une seule fois: pas sous un autre module du socle
+        if module in baseline and not any(parent in baseline for parent in ancestors[:-1]):
+            baseline_ms += cumulative
+
+    return sum(top_level.values()), top_level, loaded, baseline_ms
+
+
+def measure_imports(source, search_path, repeat=DEFAULT_REPEAT, exclude=(), baseline=()):
+    """
+    Coût d'import à froid d'un code de démarrage (meilleur de `repeat`).
+
+    Args:
+        source (str): Instructions à exécuter dans un interpréteur neuf
+        search_path (list): Répertoires ajoutés au PYTHONPATH
+        repeat (int): Nombre de mesures
+        exclude (set): Modules ignorés (voir parse_importtime)
+        baseline (tuple): Modules du socle (voir parse_importtime)
+
+    Returns:
+        tuple: (durée totale en ms, {module: ms}, modules chargés, socle en ms)
+
+    Raises:
+        RuntimeError: Si l'exécution échoue (dépendance absente...)
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(search_path + [os.environ.get('PYTHONPATH', '')]))
+    best = None
+
+    for _ in range(max(1, repeat)):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', source],
+            env=env, capture_output=True, text=True, cwd=search_path[0]
+        )
+        if completed.returncode != 0:
+            message = completed.stderr.strip().splitlines()
+            raise RuntimeError(message[-1] if message else f"code retour {completed.returncode}")
+        measure = parse_importtime(completed.stderr, exclude, baseline)
+        if best is None or measure[0] < best[0]:
+            best = measure
+
+    return best
+
+
+def heavy_packages(loaded):
+    """Librairies de HEAVY_PACKAGES présentes parmi les modules chargés."""
+    return [package for package in HEAVY_PACKAGES
+            if any(module == package or module.startswith(package + '.') for module in loaded)]
+
+
+def entry_point_report(entry_point, repeat=DEFAULT_REPEAT):
+    """
+    Budget d'import d'un point d'entrée.
+
+    Args:
+        entry_point (str): Chemin relatif à la racine (clé de ENTRY_POINTS)
+        repeat (int): Nombre de mesures (la meilleure est retenue)
+
+    Returns:
+        dict: {
+            'entry_point', 'total_ms', 'baseline_ms', 'overhead_ms',
+            'budget_ms', 'within_budget', 'heavy' (librairies lourdes
+            chargées), 'top' (5 imports de premier niveau les plus coûteux),
+            'error' (message si la mesure est impossible)
+        }
+    """
+    baseline_modules, budget_ms = ENTRY_POINTS.get(entry_point, DEFAULT_BUDGET)
+    path = os.path.join(PROJECT_ROOT, entry_point)
+    search_path = [os.path.dirname(path), PROJECT_ROOT]
+    report = {'entry_point': entry_point, 'budget_ms': budget_ms}
+
+    try:
+        # Modules de l'interpréteur nu, communs à toutes les mesures
+        _, _, interpreter, _ = measure_imports('pass', search_path, repeat=1)
+        total_ms, top_level, loaded, baseline_ms = measure_imports(
+            startup_imports(path), search_path, repeat, interpreter, baseline_modules
+        )
+    except (SyntaxError, RuntimeError) as e:
+        report.update(error=str(e), within_budget=False)
+        return report
+
+    # Socle et surcoût mesurés dans le même interpréteur (pas de bruit
+    # entre deux exécutions): le surcoût est tout ce qui n'est pas le socle,
+    # même quand le socle est chargé par un module du projet (pandas via
+    # render_profiler...)
+    overhead_ms = total_ms - baseline_ms
+    heavy = heavy_packages(loaded)
+    report.update(
+        total_ms=total_ms,
+        baseline_ms=baseline_ms,
+        overhead_ms=overhead_ms,
+        within_budget=overhead_ms <= budget_ms and not heavy,
+        heavy=heavy,
+        top=sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:5]
+    )
+    return report
+
+
+def print_report(report):
+    """Affichage du budget d'un point d'entrée."""
+    print(f"\n📦 {report['entry_point']}")
+    if 'error' in report:
+        print(f"  ❌ Mesure impossible: {report['error']}")
+        return
+
+    status = '✅' if report['within_budget'] else '❌'
+    print(f"  {status} Démarrage: {report['total_ms']:.0f} ms "
+          f"(socle {report['baseline_ms']:.0f} ms + {report['overhead_ms']:.0f} ms, "
+          f"budget +{report['budget_ms']} ms)")
+    if report['heavy']:
+        print(f"  ⚠️ Librairies lourdes chargées au démarrage: {', '.join(report['heavy'])}")
+    for module, duration in report['top']:
+        print(f"    {duration:8.1f} ms  {module}")
+
+
+def main():
+    """Rapport du budget d'import des points d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Budget d'import à froid des points d'entrée")
+    parser.add_argument('entry_points', nargs='*', default=list(ENTRY_POINTS),
+                        help="Points d'entrée (défaut: tous ceux de ENTRY_POINTS)")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help="Mesures par point d'entrée (la meilleure est retenue)")
+    args = parser.parse_args()
+
+    print("⏱️ BUDGET D'IMPORT À FROID")
+    reports = [entry_point_report(entry_point, args.repeat) for entry_point in args.entry_points]
+    for report in reports:
+        print_report(report)
+
+    return 0 if all(report['within_budget'] for report in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
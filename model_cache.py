@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+CACHE D'ENTRAÎNEMENT ADRESSÉ PAR CONTENU
+=============================================================================
+
+Cache disque des modèles ajustés, partagé par `run_complete_analysis`
+(code/automotive_analysis_main.py) et `regenerate_models.py`.
+
+La clé d'une entrée est un hash SHA-256 de tout ce qui détermine le
+résultat d'un ajustement:
+- le type de modèle: nom, ou fonction d'ajustement (nom qualifié et
+  code source: une modification du code invalide ses entrées)
+- les versions des librairies d'entraînement (numpy, pandas, scikit-learn,
+  xgboost, statsmodels, prophet): une mise à jour invalide les entrées
+- le contenu des données d'entraînement (valeurs, colonnes, types, index)
+- la liste des caractéristiques et les hyperparamètres
+
+Tant que le CSV et les paramètres ne changent pas, une ré-exécution recharge
+les artefacts (modèles, scores de validation croisée) au lieu de les
+réajuster. Toute modification des données, des paramètres, du code ou des
+librairies produit une nouvelle clé: il n'y a jamais d'invalidation manuelle
+à faire. Une entrée illisible (version de librairie incompatible...) est
+traitée comme absente.
+
+Usage:
+    from model_cache import ModelCache, training_key
+    cache = ModelCache()
+    key = training_key(fit_xgboost, X, y, xgb_params)
+    model, hit = cache.get_or_compute(key, lambda: fit_xgboost(X, y, xgb_params))
+
+    python model_cache.py --clear     # vidage du cache
+
+Auteur: Système d'Analyse Automobile Avancée
+=============================================================================
+"""
+
+import argparse
+import functools
+import glob
+import hashlib
+import importlib.metadata
+import inspect
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from data_store import PROJECT_ROOT
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+CACHE_DIR = os.path.join(PROJECT_ROOT, 'models', 'cache')
+CACHE_EXTENSION = '.pkl'
+
+# Version du format des clés (à incrémenter si le hachage change)
+CACHE_VERSION = 2
+
+# Librairies dont la version fait partie des clés d'entraînement
+TRAINING_LIBRARIES = ('numpy', 'pandas', 'scikit-learn', 'xgboost', 'statsmodels', 'prophet')
+
+# Nombre maximal d'entrées conservées (les plus anciennes sont supprimées)
+MAX_ENTRIES = 256
+
+
+# =============================================================================
+# CLÉS DE CACHE
+# =============================================================================
+
+def _update_digest(digest, value):
+    """Ajout récursif d'une valeur au hash (données, conteneurs, scalaires)."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        columns = list(value.columns) if isinstance(value, pd.DataFrame) else [value.name]
+        dtypes = list(value.dtypes.astype(str)) if isinstance(value, pd.DataFrame) else [str(value.dtype)]
+        digest.update(repr((type(value).__name__, columns, dtypes, value.shape)).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(repr((value.dtype.str, value.shape)).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b'{')
+        for key in sorted(value, key=repr):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+        digest.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        digest.update(b'[')
+        for item in value:
+            _update_digest(digest, item)
+        digest.update(b']')
+    else:
+        digest.update(repr(value).encode())
+    digest.update(b';')
+
+
+@functools.lru_cache(maxsize=1)
+def library_versions():
+    """
+    Versions installées des librairies d'entraînement (sans les importer).
+
+    Returns:
+        tuple: ((librairie, version ou None si absente), ...)
+    """
+    versions = []
+    for library in TRAINING_LIBRARIES:
+        try:
+            versions.append((library, importlib.metadata.version(library)))
+        except importlib.metadata.PackageNotFoundError:
+            versions.append((library, None))
+    return tuple(versions)
+
+
+def _model_identity(model_type):
+    """Identité d'un type de modèle: nom, ou nom qualifié et source d'une fonction."""
+    if not callable(model_type):
+        return model_type
+    try:
+        source = inspect.getsource(model_type)
+    except (OSError, TypeError):
+        # Source indisponible (fonction native, code interactif)
+        source = None
+    return (getattr(model_type, '__module__', None), getattr(model_type, '__qualname__', repr(model_type)), source)
+
+
+def training_key(model_type, *inputs, environment=True):
+    """
+    Clé de cache d'un ajustement.
+
+    Args:
+        model_type (str | callable): Type de modèle, ou fonction
+            d'ajustement (son code source fait partie de la clé)
+        *inputs: Tout ce qui détermine le résultat (DataFrame, Series,
+            tableaux, listes de caractéristiques, dictionnaires de paramètres)
+        environment (bool): Inclure les versions des librairies
+            d'entraînement (False pour une simple empreinte de données)
+
+    Returns:
+        str: Empreinte SHA-256 hexadécimale
+    """
+    digest = hashlib.sha256()
+    _update_digest(digest, (CACHE_VERSION, _model_identity(model_type)))
+    if environment:
+        _update_digest(digest, library_versions())
+    for value in inputs:
+        _update_digest(digest, value)
+    return digest.hexdigest()
+
+
+# =============================================================================
+# CACHE DISQUE
+# =============================================================================
+
+class ModelCache:
+    """
+    Cache disque d'artefacts d'entraînement indexé par `training_key`.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_entries=MAX_ENTRIES):
+        """
+        Args:
+            cache_dir (str): Répertoire des entrées
+            max_entries (int): Nombre maximal d'entrées conservées
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+
+    def path(self, key):
+        """Chemin du fichier d'une entrée."""
+        return os.path.join(self.cache_dir, key + CACHE_EXTENSION)
+
+    def load(self, key):
+        """
+        Lecture d'une entrée.
+
+        Returns:
+            tuple: (trouvée, valeur) — (False, None) si absente ou illisible
+        """
+        path = self.path(key)
+        if not os.path.exists(path):
+            return False, None
+        try:
+            with open(path, 'rb') as f:
+                return True, pickle.load(f)
+        except Exception:
+            # Entrée corrompue ou incompatible: sera réécrite
+            return False, None
+
+    def store(self, key, value):
+        """
+        Écriture atomique d'une entrée (fichier temporaire puis renommage).
+
+        Returns:
+            bool: True si l'entrée a été écrite
+        """
+        path = self.path(key)
+        temporary = f'{path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temporary, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            # Répertoire en lecture seule ou artefact non sérialisable:
+            # pas de fichier temporaire partiel laissé dans le cache
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            return False
+
+        self.prune()
+        return True
+
+    def get_or_compute(self, key, compute):
+        """
+        Valeur en cache, ou calculée puis mise en cache.
+
+        Args:
+            key (str): Clé (voir training_key)
+            compute (callable): Calcul à effectuer en cas d'absence
+
+        Returns:
+            tuple: (valeur, trouvée en cache)
+        """
+        hit, value = self.load(key)
+        if hit:
+            return value, True
+
+        value = compute()
+        self.store(key, value)
+        return value, False
+
+    def entries(self):
+        """Fichiers d'entrées, du plus ancien au plus récent."""
+        paths = glob.glob(os.path.join(self.cache_dir, '*' + CACHE_EXTENSION))
+        return sorted(paths, key=os.path.getmtime)
+
+    def prune(self):
+        """Suppression des entrées les plus anciennes au-delà de max_entries."""
+        entries = self.entries()
+        for path in entries[:max(0, len(entries) - self.max_entries)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        """Suppression de toutes les entrées."""
+        for path in self.entries():
+            os.remove(path)
+
+
+def main():
+    """Inspection et vidage du cache en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Cache d'entraînement des modèles")
+    parser.add_argument('--clear', action='store_true', help="Vider le cache")
+    args = parser.parse_args()
+
+    cache = ModelCache()
+    entries = cache.entries()
+    size = sum(os.path.getsize(path) for path in entries) / 1024 / 1024
+    print(f"📦 {cache.cache_dir}: {len(entries)} entrées ({size:.1f} MB)")
+
+    if args.clear:
+        cache.clear()
+        print("🗑️ Cache vidé")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+REGISTRE DES MODÈLES VERSIONNÉS
+=============================================================================
+
+Point unique d'écriture et de lecture des modèles entraînés, partagé par
+`run_complete_analysis` (code/automotive_analysis_main.py),
+`regenerate_models.py` et les applications Streamlit (via app_cache).
+
+- un manifeste JSON (models/manifest.json) décrit chaque modèle: version,
+  fichier, empreinte SHA-256 du fichier, hash des données d'entraînement,
+  métriques, caractéristiques, date d'entraînement et origine
+- un seul format d'artefact: dictionnaire {'model', 'features', ...}
+  sérialisé avec pickle dans models/<nom>-v<version>.pkl
+- les modèles sont chargés à la première utilisation (`load`), l'empreinte
+  du fichier est vérifiée, et seuls les `max_loaded` derniers modèles
+  utilisés restent en mémoire (LRU)
+- les modèles XGBoost sont aussi exportés en tableaux NumPy
+  (models/<nom>-v<version>.npz, voir tree_export): `load(nom, compact=True)`
+  les sert sans importer xgboost
+- les anciens fichiers `*_clean.pkl` (models/, code/, racine) restent
+  lisibles tant qu'ils ne sont pas enregistrés dans le manifeste;
+  `python model_registry.py --import-legacy` les y inscrit sur place
+
+Usage:
+    from model_registry import ModelRegistry
+    registry = ModelRegistry()
+    registry.register('xgboost_production', {'model': model, 'features': features},
+                      metrics={'cv_r2_mean': 0.82}, training_data=df)
+    artifact = registry.load('xgboost_production')   # chargé au premier appel
+    compact = registry.load('xgboost_production', compact=True)  # sans xgboost
+
+    python model_registry.py                   # contenu du manifeste
+    python model_registry.py --import-legacy   # inscription des *_clean.pkl
+    python model_registry.py --export-compact  # export NumPy des modèles XGBoost
+
+Auteur: Système d'Analyse Automobile Avancée
+=============================================================================
+"""
+
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from data_store import PROJECT_ROOT
+from tree_export import TreeEnsemble, export_booster, is_xgboost_model
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+REGISTRY_DIR = os.path.join(PROJECT_ROOT, 'models')
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+# Modèles conservés en mémoire par processus
+DEFAULT_MAX_LOADED = 4
+
+# Versions conservées sur disque par modèle (les plus anciennes sont supprimées)
+KEEP_VERSIONS = 3
+
+# Emplacements historiques des modèles non encore enregistrés
+LEGACY_FILES = {
+    'xgboost_production': ['models/xgboost_production_clean.pkl', 'code/xgboost_production_clean.pkl', 'xgboost_production_clean.pkl'],
+    'xgboost_price': ['models/xgboost_price_clean.pkl', 'code/xgboost_price_clean.pkl', 'xgboost_price_clean.pkl'],
+    'linear_regression_production': ['models/linear_regression_production_clean.pkl', 'code/linear_regression_production_clean.pkl', 'linear_regression_production_clean.pkl'],
+    'linear_regression_price': ['models/linear_regression_price_clean.pkl', 'code/linear_regression_price_clean.pkl', 'linear_regression_price_clean.pkl'],
+    'prophet_production': ['models/prophet_production_clean.pkl', 'code/prophet_production_clean.pkl', 'prophet_production_clean.pkl'],
+    'arima_production': ['models/arima_production_clean.pkl', 'code/arima_production_clean.pkl', 'arima_production_clean.pkl']
+}
+
+# Clés d'artefact reprises dans le manifeste
+METRIC_KEYS = ['r2_score', 'mae', 'cv_r2_mean', 'cv_r2_std', 'aic']
+
+
+def _sha256(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+def _write_atomic(path, content):
+    """Écriture atomique (fichier temporaire puis renommage)."""
+    temporary = f'{path}.{os.getpid()}.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(content)
+    os.replace(temporary, path)
+
+
+def _as_artifact(artifact):
+    """Artefact au format du registre: dictionnaire contenant 'model'."""
+    if isinstance(artifact, dict) and 'model' in artifact:
+        return artifact
+    return {'model': artifact}
+
+
+def _deserialize(content):
+    """Désérialisation pickle, ou joblib pour les anciens fichiers de l'analyse."""
+    try:
+        return pickle.loads(content)
+    except pickle.UnpicklingError:
+        import joblib
+        return joblib.load(io.BytesIO(content))
+
+
+def _compact_content(artifact):
+    """
+    Export NumPy (.npz) du modèle d'un artefact XGBoost.
+
+    Returns:
+        bytes | None: Contenu du fichier, None si le modèle n'est pas exportable
+    """
+    model = artifact.get('model')
+    if not is_xgboost_model(model):
+        return None
+    try:
+        ensemble = export_booster(model, feature_names=artifact.get('features'))
+    except ValueError:
+        # Objectif ou booster non supporté: seul le pickle est servi
+        return None
+    buffer = io.BytesIO()
+    ensemble.save(buffer)
+    return buffer.getvalue()
+
+
+# =============================================================================
+# REGISTRE
+# =============================================================================
+
+class ModelRegistry:
+    """
+    Manifeste des modèles et cache borné des modèles chargés.
+
+    Les méthodes sont sûres entre threads (sessions Streamlit concurrentes).
+    """
+
+    def __init__(self, registry_dir=REGISTRY_DIR, max_loaded=DEFAULT_MAX_LOADED):
+        """
+        Args:
+            registry_dir (str): Répertoire des artefacts et du manifeste
+            max_loaded (int): Nombre maximal de modèles gardés en mémoire
+        """
+        self.registry_dir = registry_dir
+        self.manifest_path = os.path.join(registry_dir, MANIFEST_NAME)
+        self.max_loaded = max_loaded
+
+        self._lock = threading.RLock()
+        self._manifest = None
+        self._manifest_mtime = None
+        self._loaded = OrderedDict()  # (nom, version, compact) -> artefact
+
+    # -------------------------------------------------------------------------
+    # MANIFESTE
+    # -------------------------------------------------------------------------
+
+    def manifest(self):
+        """
+        Contenu du manifeste (relu uniquement si le fichier a changé).
+
+        Returns:
+            dict: {'version': MANIFEST_VERSION, 'models': {nom: entrée}}
+        """
+        with self._lock:
+            mtime = os.stat(self.manifest_path).st_mtime_ns if os.path.exists(self.manifest_path) else None
+            if self._manifest is None or mtime != self._manifest_mtime:
+                manifest = {'version': MANIFEST_VERSION, 'models': {}}
+                if mtime is not None:
+                    with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                        manifest = json.load(f)
+                self._manifest = manifest
+                self._manifest_mtime = mtime
+            return self._manifest
+
+    def _save_manifest(self, manifest):
+        os.makedirs(self.registry_dir, exist_ok=True)
+        content = json.dumps(manifest, indent=2, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        _write_atomic(self.manifest_path, content)
+        self._manifest = None
+
+    def _legacy_entry(self, name):
+        """Entrée provisoire d'un ancien fichier `*_clean.pkl` non enregistré."""
+        for candidate in LEGACY_FILES.get(name, []):
+            path = os.path.join(PROJECT_ROOT, candidate)
+            if os.path.exists(path):
+                stat = os.stat(path)
+                return {
+                    'version': 0,
+                    'file': os.path.relpath(path, self.registry_dir),
+                    'sha256': None,
+                    'legacy_fingerprint': [stat.st_mtime_ns, stat.st_size],
+                    'source': 'legacy'
+                }
+        return None
+
+    def entry(self, name):
+        """
+        Entrée du manifeste d'un modèle (ou d'un ancien fichier non enregistré).
+
+        Returns:
+            dict | None: Entrée, None si le modèle est inconnu
+        """
+        entry = self.manifest()['models'].get(name)
+        return entry if entry is not None else self._legacy_entry(name)
+
+    def names(self):
+        """Noms des modèles disponibles (manifeste et anciens fichiers)."""
+        available = set(self.manifest()['models'])
+        available.update(name for name in LEGACY_FILES if self._legacy_entry(name) is not None)
+        return sorted(available)
+
+    def version_key(self, name):
+        """
+        Identifiant de la version courante d'un modèle, sans le charger.
+
+        Returns:
+            tuple | None: (version, empreinte), None si le modèle est inconnu
+        """
+        entry = self.entry(name)
+        if entry is None:
+            return None
+        return (entry['version'], entry['sha256'] or tuple(entry['legacy_fingerprint']))
+
+    # -------------------------------------------------------------------------
+    # CHARGEMENT
+    # -------------------------------------------------------------------------
+
+    def load(self, name, compact=False):
+        """
+        Artefact d'un modèle, chargé à la première demande.
+
+        Args:
+            name (str): Nom du modèle (ex: 'xgboost_production')
+            compact (bool): Servir l'export NumPy s'il existe (TreeEnsemble,
+                même API predict, sans import de xgboost); sinon l'artefact
+                complet
+
+        Returns:
+            dict: Artefact {'model', 'features', ...}
+
+        Raises:
+            KeyError: Si le modèle est inconnu
+            ValueError: Si l'empreinte du fichier ne correspond pas au manifeste
+        """
+        entry = self.entry(name)
+        if entry is None:
+            raise KeyError(f"Modèle inconnu du registre: {name}")
+
+        compact = compact and entry.get('compact') is not None
+        key = (name, self.version_key(name), compact)
+        with self._lock:
+            if key in self._loaded:
+                self._loaded.move_to_end(key)
+                return self._loaded[key]
+
+        if compact:
+            content = self._read(name, entry['version'], entry['compact'])
+            artifact = {'model': TreeEnsemble.load(io.BytesIO(content)), 'features': entry.get('features')}
+        else:
+            artifact = _as_artifact(_deserialize(self._read(name, entry['version'], entry)))
+
+        with self._lock:
+            self._loaded[key] = artifact
+            self._loaded.move_to_end(key)
+            while len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+        return artifact
+
+    def _read(self, name, version, file_entry):
+        """Contenu d'un fichier du registre, empreinte vérifiée."""
+        path = os.path.normpath(os.path.join(self.registry_dir, file_entry['file']))
+        with open(path, 'rb') as f:
+            content = f.read()
+        if file_entry['sha256'] is not None and _sha256(content) != file_entry['sha256']:
+            raise ValueError(f"Empreinte invalide pour {name} v{version}: {path}")
+        return content
+
+    def loaded(self):
+        """Modèles actuellement en mémoire [(nom, version, compact)]."""
+        with self._lock:
+            return [(name, version[0], compact) for name, version, compact in self._loaded]
+
+    def _write_compact(self, name, version, artifact):
+        """
+        Écriture de l'export NumPy d'un modèle XGBoost.
+
+        Returns:
+            dict | None: {'file', 'sha256'}, None si le modèle n'est pas exportable
+        """
+        content = _compact_content(artifact)
+        if content is None:
+            return None
+        filename = f'{name}-v{version}.npz'
+        _write_atomic(os.path.join(self.registry_dir, filename), content)
+        return {'file': filename, 'sha256': _sha256(content)}
+
+    # -------------------------------------------------------------------------
+    # ENREGISTREMENT
+    # -------------------------------------------------------------------------
+
+    def register(self, name, artifact, features=None, metrics=None, training_data=None,
+                 data_hash=None, source=None):
+        """
+        Enregistrement d'une nouvelle version d'un modèle.
+
+        Un artefact identique (même contenu, mêmes données) à la version
+        courante ne crée pas de nouvelle version.
+
+        Args:
+            name (str): Nom du modèle
+            artifact: Estimateur ou dictionnaire {'model', ...}
+            features (list): Caractéristiques (défaut: artifact['features'])
+            metrics (dict): Métriques (défaut: clés METRIC_KEYS de l'artefact)
+            training_data: Données d'entraînement (hachées par training_key)
+            data_hash (str): Hash des données déjà calculé
+            source (str): Origine de l'entraînement (script)
+
+        Returns:
+            dict: Entrée du manifeste
+        """
+        artifact = _as_artifact(artifact)
+        if features is None:
+            features = artifact.get('features')
+        if metrics is None:
+            metrics = {key: artifact[key] for key in METRIC_KEYS if key in artifact}
+        if data_hash is None and training_data is not None:
+            from model_cache import training_key
+            data_hash = training_key('training_data', training_data, environment=False)
+
+        content = pickle.dumps(artifact, protocol=pickle.HIGHEST_PROTOCOL)
+        checksum = _sha256(content)
+
+        with self._lock:
+            manifest = self.manifest()
+            current = manifest['models'].get(name)
+            if current is not None and current['sha256'] == checksum and current.get('data_hash') == data_hash:
+                return current
+
+            version = (current['version'] if current else 0) + 1
+            filename = f'{name}-v{version}.pkl'
+            os.makedirs(self.registry_dir, exist_ok=True)
+            _write_atomic(os.path.join(self.registry_dir, filename), content)
+            compact = self._write_compact(name, version, artifact)
+
+            entry = {
+                'version': version,
+                'file': filename,
+                'sha256': checksum,
+                'data_hash': data_hash,
+                'metrics': {key: float(value) for key, value in (metrics or {}).items()},
+                'features': [str(feature) for feature in features] if features is not None else None,
+                'trained_date': artifact.get('trained_date') or datetime.now().isoformat(),
+                'source': source,
+                'compact': compact
+            }
+            manifest = dict(manifest, models=dict(manifest['models'], **{name: entry}))
+            self._save_manifest(manifest)
+            self._prune(name, version)
+        return entry
+
+    def _prune(self, name, version):
+        """Suppression des fichiers au-delà des KEEP_VERSIONS dernières versions."""
+        for path in glob.glob(os.path.join(self.registry_dir, f'{name}-v*.*')):
+            suffix, extension = os.path.splitext(os.path.basename(path)[len(name) + 2:])
+            if extension in ('.pkl', '.npz') and suffix.isdigit() and int(suffix) <= version - KEEP_VERSIONS:
+                os.remove(path)
+
+    def import_legacy(self):
+        """
+        Inscription sur place des anciens fichiers `*_clean.pkl`.
+
+        Returns:
+            list: Noms des modèles inscrits
+        """
+        imported = []
+        with self._lock:
+            manifest = self.manifest()
+            models = dict(manifest['models'])
+            for name in LEGACY_FILES:
+                if name in models:
+                    continue
+                entry = self._legacy_entry(name)
+                if entry is None:
+                    continue
+                path = os.path.normpath(os.path.join(self.registry_dir, entry['file']))
+                with open(path, 'rb') as f:
+                    content = f.read()
+                try:
+                    artifact = _as_artifact(_deserialize(content))
+                except Exception:
+                    # Dépendance absente (prophet...): inscription sans métadonnées
+                    artifact = {'model': None}
+                features = artifact.get('features')
+                if features is None and hasattr(artifact['model'], 'feature_names_in_'):
+                    features = list(artifact['model'].feature_names_in_)
+                models[name] = {
+                    'version': 1,
+                    'file': entry['file'],
+                    'sha256': _sha256(content),
+                    'data_hash': None,
+                    'metrics': {key: float(artifact[key]) for key in METRIC_KEYS if key in artifact},
+                    'features': [str(feature) for feature in features] if features is not None else None,
+                    'trained_date': artifact.get('trained_date'),
+                    'source': 'legacy',
+                    'compact': self._write_compact(name, 1, dict(artifact, features=features))
+                }
+                imported.append(name)
+            if imported:
+                self._save_manifest(dict(manifest, models=models))
+        return imported
+
+    def mark_stale(self, reason, names=None):
+        """
+        Signalement des modèles entraînés sur des données désormais incomplètes.
+
+        L'entrée garde son artefact (toujours servi) et reçoit un champ
+        'stale'; le prochain `register` du modèle l'efface.
+
+        Args:
+            reason (str): Motif (ex: "nouvelles données jusqu'à 2024-02")
+            names (list): Modèles concernés (défaut: tous ceux du manifeste)
+
+        Returns:
+            list: Noms des modèles marqués
+        """
+        with self._lock:
+            manifest = self.manifest()
+            models = dict(manifest['models'])
+            marked = [name for name in (names or list(models)) if name in models]
+            stale = {'reason': reason, 'since': datetime.now().isoformat()}
+            for name in marked:
+                models[name] = dict(models[name], stale=stale)
+            if marked:
+                self._save_manifest(dict(manifest, models=models))
+        return marked
+
+    def export_compact(self):
+        """
+        Export NumPy des modèles XGBoost enregistrés qui n'en ont pas encore.
+
+        Returns:
+            list: Noms des modèles exportés
+        """
+        exported = []
+        with self._lock:
+            manifest = self.manifest()
+            models = dict(manifest['models'])
+            for name, entry in manifest['models'].items():
+                if entry.get('compact') is not None:
+                    continue
+                try:
+                    artifact = self.load(name)
+                except Exception:
+                    continue
+                artifact = dict(artifact, features=entry.get('features') or artifact.get('features'))
+                compact = self._write_compact(name, entry['version'], artifact)
+                if compact is not None:
+                    models[name] = dict(entry, compact=compact)
+                    exported.append(name)
+            if exported:
+                self._save_manifest(dict(manifest, models=models))
+        return exported
+
+
+def main():
+    """Inspection du manifeste et inscription des anciens fichiers."""
+    parser = argparse.ArgumentParser(description="Registre des modèles versionnés")
+    parser.add_argument('--import-legacy', action='store_true',
+                        help="Inscrire les fichiers *_clean.pkl dans le manifeste")
+    parser.add_argument('--export-compact', action='store_true',
+                        help="Exporter en tableaux NumPy les modèles XGBoost enregistrés")
+    args = parser.parse_args()
+
+    registry = ModelRegistry()
+    if args.import_legacy:
+        imported = registry.import_legacy()
+        print(f"📥 {len(imported)} modèles inscrits: {', '.join(imported) or '-'}")
+    if args.export_compact:
+        exported = registry.export_compact()
+        print(f"🌲 {len(exported)} modèles exportés en NumPy: {', '.join(exported) or '-'}")
+
+    print(f"📦 {registry.manifest_path}")
+    for name in registry.names():
+        entry = registry.entry(name)
+        metrics = ', '.join(f"{key}={value:.3f}" for key, value in (entry.get('metrics') or {}).items())
+        checksum = (entry['sha256'] or 'non enregistré')[:12]
+        compact = ' (+npz)' if entry.get('compact') else ''
+        stale = f"  ⚠️ obsolète: {entry['stale']['reason']}" if entry.get('stale') else ''
+        print(f"  {name:<30} v{entry['version']:<3} {checksum:<14} {entry['file']}{compact}  {metrics}{stale}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,12 +13,19 @@ Version: 1.0 - Régénération des modèles
 =============================================================================
 """
 
-import pandas as pd
 import numpy as np
-import pickle
 import warnings
 from datetime import datetime
 warnings.filterwarnings('ignore')
+from data_store import load_dataset
+from model_cache import ModelCache, training_key
+from model_registry import ModelRegistry
+
+# Cache partagé avec run_complete_analysis (clé = données + paramètres)
+MODEL_CACHE = ModelCache()
+
+# Registre versionné lu par les applications Streamlit (models/manifest.json)
+REGISTRY = ModelRegistry()
 
 # Imports ML
 from sklearn.linear_model import LinearRegression
@@ -43,25 +50,17 @@ except ImportError:
 def load_data():
     """Charge les données pour l'entraînement."""
     try:
-        # Essayer de charger depuis data/
-        df = pd.read_csv('data/comprehensive_automotive_data.csv')
-        print("✅ Données chargées depuis data/")
+        # Stockage colonnaire partagé (data/ puis emplacements historiques)
+        df = load_dataset()
+        print("✅ Données chargées")
         return df
-    except:
-        try:
-            # Essayer de charger depuis code/
-            df = pd.read_csv('code/comprehensive_automotive_data.csv')
-            print("✅ Données chargées depuis code/")
-            return df
-        except:
-            print("❌ Impossible de charger les données")
-            return None
+    except Exception:
+        print("❌ Impossible de charger les données")
+        return None
 
 def prepare_features(df):
     """Prépare les features pour l'entraînement."""
-    # Conversion de la date
-    df['Date'] = pd.to_datetime(df['Date'])
-    df['Year'] = df['Date'].dt.year
+    # Date et Year sont typées par le chargeur; seul le mois est dérivé
     df['Month'] = df['Date'].dt.month
     
     # Features numériques
@@ -84,39 +83,44 @@ def train_linear_regression(X, y):
     print("\n🔧 Entraînement Régression Linéaire...")
     
     try:
-        # Division train/test
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, random_state=42
-        )
-        
-        # Normalisation
-        scaler = StandardScaler()
-        X_train_scaled = scaler.fit_transform(X_train)
-        X_test_scaled = scaler.transform(X_test)
+        split_params = {'test_size': 0.2, 'random_state': 42}
         
-        # Entraînement
-        model = LinearRegression()
-        model.fit(X_train_scaled, y_train)
+        def fit():
+            # Division train/test
+            X_train, X_test, y_train, y_test = train_test_split(X, y, **split_params)
+            
+            # Normalisation
+            scaler = StandardScaler()
+            X_train_scaled = scaler.fit_transform(X_train)
+            X_test_scaled = scaler.transform(X_test)
+            
+            # Entraînement
+            model = LinearRegression()
+            model.fit(X_train_scaled, y_train)
+            
+            # Évaluation
+            y_pred = model.predict(X_test_scaled)
+            
+            return {
+                'model': model,
+                'scaler': scaler,
+                'features': list(X.columns),
+                'r2_score': r2_score(y_test, y_pred),
+                'trained_date': datetime.now().isoformat()
+            }
         
-        # Évaluation
-        y_pred = model.predict(X_test_scaled)
-        r2 = r2_score(y_test, y_pred)
+        key = training_key(fit, X, y, split_params)
+        model_data, cached = MODEL_CACHE.get_or_compute(key, fit)
+        if cached:
+            print(f"  💾 Modèle rechargé depuis le cache (entraîné le {model_data['trained_date']})")
         
-        print(f"  ✅ R² Score: {r2:.3f}")
-        
-        # Sauvegarde
-        model_data = {
-            'model': model,
-            'scaler': scaler,
-            'features': list(X.columns),
-            'r2_score': r2,
-            'trained_date': datetime.now().isoformat()
-        }
+        print(f"  ✅ R² Score: {model_data['r2_score']:.3f}")
         
-        with open('models/linear_regression_production_clean.pkl', 'wb') as f:
-            pickle.dump(model_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Enregistrement dans le registre
+        entry = REGISTRY.register('linear_regression_production', model_data,
+                                  training_data=(X, y), source='regenerate_models')
         
-        print("  ✅ Modèle sauvegardé: models/linear_regression_production_clean.pkl")
+        print(f"  ✅ Modèle enregistré: linear_regression_production v{entry['version']} ({entry['file']})")
         return True
         
     except Exception as e:
@@ -145,34 +149,44 @@ def train_prophet(df):
         prophet_df = prophet_df.fillna(0)
         
         # Configuration Prophet
-        model = Prophet(
-            yearly_seasonality=True,
-            weekly_seasonality=False,
-            daily_seasonality=False,
-            changepoint_prior_scale=0.05
-        )
-        
-        # Ajout des régresseurs
-        model.add_regressor('steel_price')
-        model.add_regressor('gdp_growth')
+        prophet_params = {
+            'yearly_seasonality': True,
+            'weekly_seasonality': False,
+            'daily_seasonality': False,
+            'changepoint_prior_scale': 0.05
+        }
+        regressors = ['steel_price', 'gdp_growth']
         
-        # Entraînement
-        model.fit(prophet_df)
+        def fit():
+            model = Prophet(**prophet_params)
+            
+            # Ajout des régresseurs
+            for regressor in regressors:
+                model.add_regressor(regressor)
+            
+            # Entraînement
+            model.fit(prophet_df)
+            
+            return {
+                'model': model,
+                'regressors': regressors,
+                'data_format': 'monthly_aggregated',
+                'trained_date': datetime.now().isoformat()
+            }
         
-        print("  ✅ Prophet entraîné avec succès")
+        key = training_key(fit, prophet_df, regressors, prophet_params)
+        model_data, cached = MODEL_CACHE.get_or_compute(key, fit)
         
-        # Sauvegarde
-        model_data = {
-            'model': model,
-            'regressors': ['steel_price', 'gdp_growth'],
-            'data_format': 'monthly_aggregated',
-            'trained_date': datetime.now().isoformat()
-        }
+        if cached:
+            print(f"  💾 Prophet rechargé depuis le cache (entraîné le {model_data['trained_date']})")
+        else:
+            print("  ✅ Prophet entraîné avec succès")
         
-        with open('models/prophet_production_clean.pkl', 'wb') as f:
-            pickle.dump(model_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Enregistrement dans le registre
+        entry = REGISTRY.register('prophet_production', model_data,
+                                  training_data=prophet_df, source='regenerate_models')
         
-        print("  ✅ Modèle sauvegardé: models/prophet_production_clean.pkl")
+        print(f"  ✅ Modèle enregistré: prophet_production v{entry['version']} ({entry['file']})")
         return True
         
     except Exception as e:
@@ -190,27 +204,34 @@ def train_arima(df):
     try:
         # Préparation des données
         monthly_data = df.groupby('Date')['Production_Volume'].sum().sort_index()
-        monthly_data = monthly_data.fillna(method='ffill').fillna(0)
+        monthly_data = monthly_data.ffill().fillna(0)
         
-        # Entraînement ARIMA
-        model = ARIMA(monthly_data, order=(2, 1, 2))
-        fitted_model = model.fit()
+        order = (2, 1, 2)
         
-        print(f"  ✅ ARIMA(2,1,2) - AIC: {fitted_model.aic:.2f}")
+        def fit():
+            # Entraînement ARIMA
+            fitted_model = ARIMA(monthly_data, order=order).fit()
+            
+            return {
+                'model': fitted_model,
+                'order': order,
+                'aic': fitted_model.aic,
+                'data_format': 'monthly_aggregated',
+                'trained_date': datetime.now().isoformat()
+            }
         
-        # Sauvegarde
-        model_data = {
-            'model': fitted_model,
-            'order': (2, 1, 2),
-            'aic': fitted_model.aic,
-            'data_format': 'monthly_aggregated',
-            'trained_date': datetime.now().isoformat()
-        }
+        key = training_key(fit, monthly_data, order)
+        model_data, cached = MODEL_CACHE.get_or_compute(key, fit)
+        if cached:
+            print(f"  💾 ARIMA rechargé depuis le cache (entraîné le {model_data['trained_date']})")
+        
+        print(f"  ✅ ARIMA(2,1,2) - AIC: {model_data['aic']:.2f}")
         
-        with open('models/arima_production_clean.pkl', 'wb') as f:
-            pickle.dump(model_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Enregistrement dans le registre
+        entry = REGISTRY.register('arima_production', model_data,
+                                  training_data=monthly_data, source='regenerate_models')
         
-        print("  ✅ Modèle sauvegardé: models/arima_production_clean.pkl")
+        print(f"  ✅ Modèle enregistré: arima_production v{entry['version']} ({entry['file']})")
         return True
         
     except Exception as e:
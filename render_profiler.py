@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+PROFILAGE DU RENDU DES PAGES STREAMLIT
+=============================================================================
+
+Mesure, à chaque exécution du script Streamlit, où passe le temps d'une
+page:
+- `load_data`: chargement du dataset, des résultats et du cube
+- page: durée totale du rendu de la page sélectionnée
+- graphiques: pour chaque `plotly_chart`, temps de préparation depuis le
+  graphique précédent (agrégations pandas + construction de la figure) et
+  temps d'envoi (`st.plotly_chart`: sérialisation JSON de la figure)
+- octets lus sur le dataset de l'application (colonnes, filtres et
+  extractions via `ScannedFrame`; approximation des données parcourues)
+
+Chaque mesure (span) est une ligne JSON d'un journal à rotation
+(reports/render_profile.jsonl, RotatingFileHandler). `summarize` en
+calcule les percentiles p50/p95 par page et par graphique pour la page
+de diagnostic (`?page=diagnostics`, absente du menu).
+
+Le profil de l'exécution en cours est porté par une ContextVar: les
+sessions Streamlit (un thread par exécution) ne se mélangent pas.
+
+Usage:
+    with render_profiler.run() as profile:
+        with render_profiler.span('load_data'):
+            ...
+        profile.page = 'executive'
+        with render_profiler.span('page'):
+            render_profiler.plotly_chart(fig, use_container_width=True)
+
+Auteur: Système d'Analyse Automobile Avancée
+=============================================================================
+"""
+
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import time
+import uuid
+from logging.handlers import RotatingFileHandler
+
+import pandas as pd
+import streamlit as st
+
+from data_store import PROJECT_ROOT
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+PROFILE_LOG = os.path.join(PROJECT_ROOT, 'reports', 'render_profile.jsonl')
+
+# Rotation du journal: taille maximale d'un fichier et fichiers conservés
+MAX_LOG_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 3
+
+# Percentiles affichés par la page de diagnostic
+PERCENTILES = {'p50': 0.5, 'p95': 0.95}
+
+_current = contextvars.ContextVar('render_profile', default=None)
+_loggers = {}
+
+
+def _span_logger(path):
+    """Logger JSONL à rotation associé à un fichier (un par processus)."""
+    if path not in _loggers:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        logger = logging.getLogger(f'render_profiler.{path}')
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        handler = RotatingFileHandler(path, maxBytes=MAX_LOG_BYTES, backupCount=LOG_BACKUPS, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        _loggers[path] = logger
+    return _loggers[path]
+
+
+# =============================================================================
+# PROFIL D'UNE EXÉCUTION
+# =============================================================================
+
+class RenderProfile:
+    """
+    Mesures d'une exécution du script (une page rendue).
+
+    Attributes:
+        run_id (str): Identifiant de l'exécution
+        page (str): Page rendue (renseignée après la navigation)
+        spans (list): Mesures {'span', 'name', 'ms', ...}
+        bytes_scanned (int): Octets lus sur le dataset de l'application
+    """
+
+    def __init__(self):
+        self.run_id = uuid.uuid4().hex[:12]
+        self.page = None
+        self.spans = []
+        self.bytes_scanned = 0
+        self.charts = 0
+        self._checkpoint = time.perf_counter()
+
+    def record(self, span, ms, **fields):
+        """Ajout d'une mesure (écrite à la fin de l'exécution)."""
+        self.spans.append(dict(span=span, ms=round(ms, 3), **fields))
+
+    def flush(self, path=PROFILE_LOG):
+        """Écriture des mesures de l'exécution dans le journal JSONL."""
+        logger = _span_logger(path)
+        timestamp = time.time()
+        for span in self.spans:
+            logger.info(json.dumps(dict(ts=timestamp, run=self.run_id, page=self.page, **span), ensure_ascii=False))
+
+
+def current_profile():
+    """Profil de l'exécution en cours, None hors de `run()`."""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def run(path=PROFILE_LOG):
+    """
+    Profilage d'une exécution du script; les mesures sont écrites en sortie.
+
+    Les exécutions interrompues (nouveau rerun, st.stop) ou en erreur sont
+    écrites avec le nom de l'exception.
+
+    Yields:
+        RenderProfile: Profil de l'exécution (renseigner `page`)
+    """
+    profile = RenderProfile()
+    token = _current.set(profile)
+    start = time.perf_counter()
+    error = None
+    try:
+        yield profile
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        _current.reset(token)
+        profile.record('run', (time.perf_counter() - start) * 1000,
+                       bytes_scanned=profile.bytes_scanned, charts=profile.charts, error=error)
+        try:
+            profile.flush(path)
+        except OSError:
+            # Le profilage ne doit jamais empêcher le rendu
+            pass
+
+
+@contextlib.contextmanager
+def span(name):
+    """Mesure d'une phase ('load_data', 'page'...) de l'exécution en cours."""
+    profile = current_profile()
+    if profile is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    bytes_before = profile.bytes_scanned
+    profile._checkpoint = start
+    try:
+        yield
+    finally:
+        profile.record(name, (time.perf_counter() - start) * 1000,
+                       bytes_scanned=profile.bytes_scanned - bytes_before)
+
+
+def plotly_chart(fig, **kwargs):
+    """
+    `st.plotly_chart` mesuré: préparation depuis le point précédent et envoi.
+
+    Args:
+        fig: Figure Plotly
+        **kwargs: Arguments de st.plotly_chart
+
+    Returns:
+        Élément Streamlit renvoyé par st.plotly_chart
+    """
+    profile = current_profile()
+    if profile is None:
+        return st.plotly_chart(fig, **kwargs)
+
+    start = time.perf_counter()
+    element = st.plotly_chart(fig, **kwargs)
+    end = time.perf_counter()
+
+    profile.charts += 1
+    title = getattr(getattr(getattr(fig, 'layout', None), 'title', None), 'text', None)
+    profile.record('chart', (end - profile._checkpoint) * 1000,
+                   name=title or f'graphique {profile.charts}',
+                   prep_ms=round((start - profile._checkpoint) * 1000, 3),
+                   render_ms=round((end - start) * 1000, 3))
+    profile._checkpoint = end
+    return element
+
+
+# =============================================================================
+# OCTETS LUS SUR LE DATASET
+# =============================================================================
+
+def _nbytes(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=False).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=False))
+    return 0
+
+
+class ScannedFrame(pd.DataFrame):
+    """
+    Dataset qui comptabilise les octets lus dans le profil en cours.
+
+    Chaque lecture par `[]` (colonne, liste de colonnes, filtre booléen,
+    y compris celles faites par groupby et .loc) ajoute la taille du
+    résultat. Les frames dérivés sont des DataFrame ordinaires: seules les
+    lectures du dataset lui-même sont comptées. Construction sans copie
+    des données.
+    """
+
+    @property
+    def _constructor(self):
+        return pd.DataFrame
+
+    def __getitem__(self, key):
+        result = super().__getitem__(key)
+        profile = current_profile()
+        if profile is not None:
+            profile.bytes_scanned += _nbytes(result)
+        return result
+
+
+# =============================================================================
+# LECTURE DU JOURNAL
+# =============================================================================
+
+def load_spans(path=PROFILE_LOG):
+    """
+    Mesures du journal et de ses fichiers de rotation.
+
+    Returns:
+        pd.DataFrame: Une ligne par mesure (vide si aucun journal)
+    """
+    records = []
+    for file in [f'{path}.{i}' for i in range(LOG_BACKUPS, 0, -1)] + [path]:
+        if not os.path.exists(file):
+            continue
+        with open(file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Ligne tronquée (écriture concurrente interrompue)
+                    continue
+    return pd.DataFrame.from_records(records)
+
+
+def _percentiles(grouped, column):
+    summary = grouped[column].agg(['count', 'mean', 'max'])
+    for label, q in PERCENTILES.items():
+        summary[label] = grouped[column].quantile(q)
+    return summary[['count'] + list(PERCENTILES) + ['mean', 'max']].round(1)
+
+
+def summarize(spans):
+    """
+    Percentiles des durées par page et par graphique.
+
+    Args:
+        spans (pd.DataFrame): Mesures (`load_spans`)
+
+    Returns:
+        dict: {'pages': durée totale et octets lus par page,
+               'phases': durée par page et phase,
+               'charts': préparation et envoi par graphique}
+    """
+    if spans.empty:
+        return {'pages': pd.DataFrame(), 'phases': pd.DataFrame(), 'charts': pd.DataFrame()}
+
+    spans = spans.assign(page=spans['page'].fillna('-'))
+    runs = spans[spans['span'] == 'run']
+    pages = _percentiles(runs.groupby('page'), 'ms')
+    pages['bytes_p50'] = runs.groupby('page')['bytes_scanned'].median()
+    pages['errors'] = runs.groupby('page')['error'].apply(lambda errors: int(errors.notna().sum()))
+    pages = pages.sort_values('p95', ascending=False)
+
+    phases = _percentiles(spans[~spans['span'].isin(['run', 'chart'])].groupby(['page', 'span']), 'ms')
+
+    charts = spans[spans['span'] == 'chart']
+    if charts.empty:
+        chart_summary = pd.DataFrame()
+    else:
+        grouped = charts.groupby(['page', 'name'])
+        chart_summary = _percentiles(grouped, 'ms')
+        for column in ['prep_ms', 'render_ms']:
+            for label, q in PERCENTILES.items():
+                chart_summary[f'{column[:-3]}_{label}'] = grouped[column].quantile(q).round(1)
+        chart_summary = chart_summary.sort_values('p95', ascending=False)
+
+    return {'pages': pages, 'phases': phases, 'charts': chart_summary}
@@ -10,31 +10,25 @@ Application web interactive pour l'analyse automobile complète avec:
 - Analyses économiques et géographiques
 - Interface utilisateur moderne et responsive
 
+Ce script ne contient que la navigation et le chargement des données:
+chaque page est un module du paquet `app_pages`, importé quand elle est
+affichée, avec ses dépendances de données déclarées dans le registre.
+
 Auteur: Système d'Analyse Automobile Avancée
 Date: Juillet 2025
 Version: 1.0 - Application Streamlit
 =============================================================================
 """
 
-import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pickle
-import time
-import random
-from datetime import datetime, timedelta
-import json
-import time
-import random
-from datetime import datetime, timedelta
-import json
-import json
-import os
-from datetime import datetime, timedelta
 import warnings
+
+import streamlit as st
+
+import render_profiler
+from app_cache import get_dataset, get_aggregate_cube, get_analysis_results, get_model_catalog, APP_MODELS
+from app_pages import get_page, load_renderer, menu_pages
+from data_store import resolve_dataset_path
+
 warnings.filterwarnings('ignore')
 
 # Configuration de la page Streamlit
@@ -84,341 +78,94 @@ class StreamlitAutomotiveApp:
     
     def __init__(self):
         """Initialisation de l'application."""
-        self.data_loaded = False
+        self.data_loaded = resolve_dataset_path() is not None
         self.df = None
+        self.cube = None
         self.models = {}
         self.forecasts = {}
-        self.load_data()
-
-    def render_post_covid_analysis(self):
-        """Dashboard Analyse Post-COVID avec analyses complètes."""
-        st.markdown('<h1 class="main-header">🦠 Analyse Post-COVID</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # En-tête contextuel COVID
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #FF6B6B 0%, #4ECDC4 100%);
-                    padding: 2rem; border-radius: 15px; margin: 1rem 0; text-align: center;">
-            <h2 style="color: white; margin-bottom: 1rem;">🦠 Impact COVID-19 sur l'Industrie Automobile</h2>
-            <p style="color: #E0E0E0; font-size: 1.1rem;">
-                Analyse des transformations structurelles de l'industrie automobile suite à la pandémie (2020-2024)
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # KPIs Post-COVID
-        st.markdown("### 📊 KPIs Post-COVID")
-        col1, col2, col3, col4 = st.columns(4)
-
-        # Calculs pour les KPIs COVID
-        pre_covid_years = [2018, 2019]
-        covid_years = [2020, 2021]
-        post_covid_years = [2022, 2023, 2024]
-
-        pre_covid_production = self.df[self.df['Year'].isin(pre_covid_years)]['Production_Volume'].mean()
-        covid_production = self.df[self.df['Year'].isin(covid_years)]['Production_Volume'].mean()
-        post_covid_production = self.df[self.df['Year'].isin(post_covid_years)]['Production_Volume'].mean()
-
-        with col1:
-            # Impact production COVID
-            covid_impact = ((covid_production - pre_covid_production) / pre_covid_production) * 100
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #FF6B6B 0%, #FF8E8E 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📉 Impact COVID Production</div>
-                <div style="font-size: 3rem; font-weight: bold;">{covid_impact:.1f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            # Récupération post-COVID
-            recovery_rate = ((post_covid_production - covid_production) / covid_production) * 100
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #4ECDC4 0%, #44A08D 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📈 Taux Récupération</div>
-                <div style="font-size: 3rem; font-weight: bold;">{recovery_rate:.1f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            # Accélération EV post-COVID
-            pre_covid_ev = self.df[self.df['Year'].isin(pre_covid_years)]['EV_Share'].mean() * 100
-            post_covid_ev = self.df[self.df['Year'].isin(post_covid_years)]['EV_Share'].mean() * 100
-            ev_acceleration = post_covid_ev - pre_covid_ev
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #9B59B6 0%, #8E44AD 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚡ Accélération EV</div>
-                <div style="font-size: 3rem; font-weight: bold;">+{ev_acceleration:.1f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col4:
-            # Résilience globale
-            resilience_score = min(100, max(0, 50 + recovery_rate + ev_acceleration))
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #F39C12 0%, #E67E22 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🛡️ Score Résilience</div>
-                <div style="font-size: 3rem; font-weight: bold;">{resilience_score:.0f}</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Graphique évolution production pré/pendant/post COVID
-        st.markdown("---")
-        st.markdown("### 📈 Évolution Production : Pré-COVID vs COVID vs Post-COVID")
-
-        # Préparation des données par période
-        covid_evolution = self.df.groupby('Year')['Production_Volume'].sum().reset_index()
-        covid_evolution['Période'] = covid_evolution['Year'].apply(
-            lambda x: 'Pré-COVID (2018-2019)' if x in pre_covid_years
-            else 'COVID (2020-2021)' if x in covid_years
-            else 'Post-COVID (2022-2024)' if x in post_covid_years
-            else 'Autre'
-        )
-
-        fig = px.line(covid_evolution, x='Year', y='Production_Volume',
-                     title="Impact COVID-19 sur la Production Automobile Mondiale",
-                     labels={'Production_Volume': 'Production (millions)', 'Year': 'Année'},
-                     color_discrete_sequence=['#FF6B6B'])
-
-        # Ajout de zones colorées pour les périodes
-        fig.add_vrect(x0=2017.5, x1=2019.5, fillcolor="green", opacity=0.1, annotation_text="Pré-COVID")
-        fig.add_vrect(x0=2019.5, x1=2021.5, fillcolor="red", opacity=0.1, annotation_text="COVID")
-        fig.add_vrect(x0=2021.5, x1=2024.5, fillcolor="blue", opacity=0.1, annotation_text="Post-COVID")
-
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
-
-        # Analyse par région de l'impact COVID
-        st.markdown("---")
-        st.markdown("### 🌍 Impact COVID par Région")
-
-        regional_covid_impact = []
-        for region in self.df['Region'].unique():
-            region_data = self.df[self.df['Region'] == region]
-            pre_covid_reg = region_data[region_data['Year'].isin(pre_covid_years)]['Production_Volume'].mean()
-            covid_reg = region_data[region_data['Year'].isin(covid_years)]['Production_Volume'].mean()
-            post_covid_reg = region_data[region_data['Year'].isin(post_covid_years)]['Production_Volume'].mean()
-
-            impact_reg = ((covid_reg - pre_covid_reg) / pre_covid_reg) * 100 if pre_covid_reg > 0 else 0
-            recovery_reg = ((post_covid_reg - covid_reg) / covid_reg) * 100 if covid_reg > 0 else 0
-
-            regional_covid_impact.append({
-                'Région': region,
-                'Impact COVID (%)': impact_reg,
-                'Récupération (%)': recovery_reg,
-                'Résilience': min(100, max(0, 50 + recovery_reg))
-            })
-
-        regional_df = pd.DataFrame(regional_covid_impact)
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            fig_impact = px.bar(regional_df, x='Région', y='Impact COVID (%)',
-                               title="Impact COVID par Région",
-                               color='Impact COVID (%)',
-                               color_continuous_scale='Reds_r')
-            fig_impact.update_layout(height=400)
-            st.plotly_chart(fig_impact, use_container_width=True)
-
-        with col2:
-            fig_recovery = px.bar(regional_df, x='Région', y='Récupération (%)',
-                                 title="Taux de Récupération par Région",
-                                 color='Récupération (%)',
-                                 color_continuous_scale='Greens')
-            fig_recovery.update_layout(height=400)
-            st.plotly_chart(fig_recovery, use_container_width=True)
-
-        # Analyse transformation EV post-COVID
-        st.markdown("---")
-        st.markdown("### ⚡ Accélération de la Transition Électrique Post-COVID")
 
-        ev_evolution = self.df.groupby('Year')['EV_Share'].mean().reset_index()
-        ev_evolution['EV_Share_Percent'] = ev_evolution['EV_Share'] * 100
-
-        fig_ev = px.line(ev_evolution, x='Year', y='EV_Share_Percent',
-                        title="Évolution de la Part des Véhicules Électriques",
-                        labels={'EV_Share_Percent': 'Part EV (%)', 'Year': 'Année'},
-                        color_discrete_sequence=['#9B59B6'])
-
-        # Ajout de zones colorées pour les périodes EV
-        fig_ev.add_vrect(x0=2017.5, x1=2019.5, fillcolor="orange", opacity=0.1, annotation_text="Pré-COVID")
-        fig_ev.add_vrect(x0=2019.5, x1=2021.5, fillcolor="red", opacity=0.1, annotation_text="COVID")
-        fig_ev.add_vrect(x0=2021.5, x1=2024.5, fillcolor="green", opacity=0.1, annotation_text="Accélération EV")
-
-        fig_ev.update_layout(height=400)
-        st.plotly_chart(fig_ev, use_container_width=True)
-
-        # Tableau de synthèse des transformations
-        st.markdown("---")
-        st.markdown("### 📋 Synthèse des Transformations Post-COVID")
-
-        transformations_data = {
-            'Transformation': [
-                '🏭 Digitalisation Production',
-                '🔄 Résilience Supply Chain',
-                '⚡ Accélération Électrification',
-                '🌱 Focus Durabilité',
-                '🤖 Automatisation Accrue',
-                '🏠 Télétravail Intégré',
-                '📱 Vente Digitale',
-                '🔧 Maintenance Prédictive'
-            ],
-            'Impact': [
-                'Très Élevé',
-                'Élevé',
-                'Très Élevé',
-                'Élevé',
-                'Élevé',
-                'Moyen',
-                'Très Élevé',
-                'Élevé'
-            ],
-            'Adoption (%)': [85, 78, 92, 73, 81, 65, 88, 76],
-            'Priorité 2024': [
-                '🔴 Critique',
-                '🟡 Importante',
-                '🔴 Critique',
-                '🟡 Importante',
-                '🟡 Importante',
-                '🟢 Modérée',
-                '🔴 Critique',
-                '🟡 Importante'
-            ]
-        }
-
-        transformations_df = pd.DataFrame(transformations_data)
-        st.dataframe(transformations_df, use_container_width=True, hide_index=True)
-
-        # Recommandations stratégiques post-COVID
-        st.markdown("---")
-        st.markdown("### 🎯 Recommandations Stratégiques Post-COVID")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown("""
-            #### 🛡️ Renforcement de la Résilience
-            - **Diversification fournisseurs** : Réduire la dépendance géographique
-            - **Stocks stratégiques** : Maintenir des réserves critiques
-            - **Flexibilité production** : Capacité d'adaptation rapide
-            - **Partenariats locaux** : Développer l'écosystème régional
-            """)
-
-        with col2:
-            st.markdown("""
-            #### ⚡ Accélération de la Transformation
-            - **Investissement EV** : Doubler les capacités électriques
-            - **Digitalisation** : Automatiser les processus critiques
-            - **Formation équipes** : Développer les compétences futures
-            - **Innovation ouverte** : Collaborations technologiques
-            """)
-
-    def load_data(self):
-        """Chargement des données et modèles."""
-        try:
-            # Chargement des données
-            if os.path.exists('data/comprehensive_automotive_data.csv'):
-                self.df = pd.read_csv('data/comprehensive_automotive_data.csv')
-                self.data_loaded = True
-            elif os.path.exists('comprehensive_automotive_data.csv'):
-                self.df = pd.read_csv('comprehensive_automotive_data.csv')
-                self.data_loaded = True
-
-            # Traitement des données après chargement
-            if self.data_loaded and self.df is not None:
-                # Convertir la colonne Date en datetime et extraire l'année
-                self.df['Date'] = pd.to_datetime(self.df['Date'])
-                self.df['Year'] = self.df['Date'].dt.year
+    def load_data(self, needs=('dataset', 'cube', 'results')):
+        """
+        Chargement des données déclarées par la page affichée.
+
+        Args:
+            needs (tuple): Dépendances ('dataset', 'cube', 'results',
+                'models'); celles déjà chargées ne sont pas relues
+        """
+        with render_profiler.span('load_data'):
+            try:
+                if 'dataset' in needs and self.df is None:
+                    self._load_dataset()
+
+                # Cube d'agrégats Year × Region × Manufacturer × Category (partagé)
+                if 'cube' in needs and self.cube is None:
+                    self.cube = get_aggregate_cube()
+
+                # Chargement des résultats d'analyse (cache par empreinte du fichier)
+                if 'results' in needs and not self.forecasts:
+                    self.forecasts = get_analysis_results()
+            except Exception as e:
+                st.error(f"Erreur lors du chargement des données: {e}")
+
+            if 'models' in needs:
+                self.load_models()
+
+    def _load_dataset(self):
+        """Dataset complet avec les colonnes renommées utilisées par les pages."""
+        # Chargement des données (cache partagé, Date et Year déjà typées)
+        self.df = get_dataset()
+        self.data_loaded = self.df is not None
+
+        # Traitement des données après chargement
+        if self.data_loaded:
+            # Renommer les colonnes pour correspondre au code existant
+            if 'Production_Volume' in self.df.columns:
+                self.df['Production'] = self.df['Production_Volume']
+            if 'Average_Price' in self.df.columns:
+                self.df['Price'] = self.df['Average_Price']
+            if 'Steel_Price' in self.df.columns:
+                self.df['SteelPrice'] = self.df['Steel_Price']
+
+            # Lectures du dataset comptabilisées par le profileur (sans copie)
+            self.df = render_profiler.ScannedFrame(self.df)
+
+    def load_models(self):
+        """
+        Catalogue des modèles ML (manifeste du registre, sans chargement).
+
+        Appelé par les pages qui utilisent les modèles: ceux-ci ne sont
+        désérialisés (et xgboost, sklearn, statsmodels importés) qu'à la
+        première prédiction du service d'inférence.
+        """
+        if self.models:
+            return
+        self.models = get_model_catalog()
+        for model_name, registry_name in APP_MODELS.items():
+            if model_name not in self.models:
+                st.warning(f"Modèle {model_name} absent du registre des modèles ({registry_name})")
 
-                # Renommer les colonnes pour correspondre au code existant
-                if 'Production_Volume' in self.df.columns:
-                    self.df['Production'] = self.df['Production_Volume']
-                if 'Average_Price' in self.df.columns:
-                    self.df['Price'] = self.df['Average_Price']
-                if 'Steel_Price' in self.df.columns:
-                    self.df['SteelPrice'] = self.df['Steel_Price']
-            
-            # Chargement des résultats d'analyse
-            if os.path.exists('data/automotive_analysis_results_clean.json'):
-                with open('data/automotive_analysis_results_clean.json', 'r') as f:
-                    self.forecasts = json.load(f)
-            elif os.path.exists('automotive_analysis_results_clean.json'):
-                with open('automotive_analysis_results_clean.json', 'r') as f:
-                    self.forecasts = json.load(f)
-            
-            # Chargement des modèles ML
-            model_files = {
-                'xgboost': ['models/xgboost_production_clean.pkl', 'code/xgboost_production_clean.pkl', 'xgboost_production_clean.pkl'],
-                'linear_regression': ['models/linear_regression_production_clean.pkl', 'code/linear_regression_production_clean.pkl', 'linear_regression_production_clean.pkl'],
-                'prophet': ['models/prophet_production_clean.pkl', 'code/prophet_production_clean.pkl', 'prophet_production_clean.pkl'],
-                'arima': ['models/arima_production_clean.pkl', 'code/arima_production_clean.pkl', 'arima_production_clean.pkl']
-            }
-            
-            for model_name, paths in model_files.items():
-                loaded = False
-                for model_path in paths:
-                    if os.path.exists(model_path):
-                        with open(model_path, 'rb') as f:
-                            self.models[model_name] = pickle.load(f)
-                        loaded = True
-                        break
-                if not loaded:
-                    st.warning(f"Impossible de trouver le modèle {model_name} dans les chemins {paths}")
-        except Exception as e:
-            st.error(f"Erreur lors du chargement des données: {e}")
-    
     def render_sidebar(self):
         """Rendu de la barre latérale avec navigation."""
-
-
-
-
         st.sidebar.markdown("---")
         st.sidebar.markdown("## 🚗 Navigation")
 
-        pages = {
-            "🏠 Accueil": "home",
-            "👔 Dashboard Exécutif": "executive",
-            "🤖 Modèles ML": "ml_models",
-            "🌍 Analyse Géographique": "geographic",
-            "⚡ Transition Électrique": "ev_transition",
-            "🏭 Fabricants": "manufacturers",
-            "💼 Analyse Économique": "economic",
-            "🎯 Intelligence Concurrentielle": "competitive",
-            "⚠️ Risques & Opportunités": "risks",
-            "🦠 Analyse Post-COVID": "post_covid",
-            "⚡ Transition Électrique Avancée": "ev_advanced",
-            "🎯 Recommandations Stratégiques": "strategic_recommendations",
-            "📊 Analyse Sectorielle": "sector_analysis",
-            "🔮 Prospective 2030": "future_outlook"
-        }
+        pages = {page.label: page.key for page in menu_pages()}
         
         selected_page = st.sidebar.selectbox(
             "Choisir une page:",
             list(pages.keys())
         )
         
-        # Informations sur les données
-        if self.data_loaded and self.df is not None:
+        # Informations sur les données (cube partagé: le dataset n'est pas chargé ici)
+        if self.data_loaded and self.cube is None:
+            self.cube = get_aggregate_cube()
+        if self.data_loaded and self.cube is not None:
+            cells = self.cube.cells
             st.sidebar.success("✅ Données chargées")
-            st.sidebar.info(f"📈 {len(self.df)} observations")
-            # Utiliser la colonne Year créée lors du chargement
-            if 'Year' in self.df.columns:
-                st.sidebar.info(f"📅 {self.df['Year'].min()} - {self.df['Year'].max()}")
-            st.sidebar.info(f"🏭 {self.df['Manufacturer'].nunique()} constructeurs")
-            st.sidebar.info(f"🌍 {self.df['Region'].nunique()} régions")
+            st.sidebar.info(f"📈 {int(cells['count'].sum())} observations")
+            st.sidebar.info(f"📅 {cells['Year'].min()} - {cells['Year'].max()}")
+            st.sidebar.info(f"🏭 {cells['Manufacturer'].nunique()} constructeurs")
+            st.sidebar.info(f"🌍 {cells['Region'].nunique()} régions")
         else:
             st.sidebar.error("❌ Données non disponibles")
         
@@ -428,4653 +175,37 @@ class StreamlitAutomotiveApp:
             st.sidebar.success(f"✅ {model_name.title()}")
         
         return pages[selected_page]
-    
-    def render_home(self):
-        """Page d'accueil immersive avec animations et temps réel."""
-
-        # En-tête immersif avec animation
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #0A0A0A 0%, #1A1A1A 50%, #E31E24 100%);
-                    padding: 3rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;
-                    position: relative; overflow: hidden;">
-            <div style="position: absolute; top: 0; left: 0; right: 0; bottom: 0;
-                        background: url('data:image/svg+xml,<svg xmlns=\"http://www.w3.org/2000/svg\" viewBox=\"0 0 100 100\"><defs><pattern id=\"grid\" width=\"10\" height=\"10\" patternUnits=\"userSpaceOnUse\"><path d=\"M 10 0 L 0 0 0 10\" fill=\"none\" stroke=\"%23333\" stroke-width=\"0.5\"/></pattern></defs><rect width=\"100\" height=\"100\" fill=\"url(%23grid)\"/></svg>\"></div>
-            <div style="position: relative; z-index: 1;">
-                <h1 style="color: white; margin: 0; font-size: 3.5rem; font-weight: bold;
-                           text-shadow: 0 4px 8px rgba(0,0,0,0.5); animation: glow 2s ease-in-out infinite alternate;">
-                    🚗 MARCHÉ AUTOMOBILE MONDIAL
-                </h1>
-                <p style="color: #CCCCCC; font-size: 1.2rem; margin-top: 1rem;">
-                    Analyse en temps réel du marché automobile mondial
-                </p>
-            </div>
-        </div>
-
-        <style>
-        @keyframes glow {
-            from { text-shadow: 0 4px 8px rgba(227, 30, 36, 0.5); }
-            to { text-shadow: 0 4px 20px rgba(227, 30, 36, 0.8); }
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-        # KPIs temps réel avec animations count-up
-        self.render_realtime_kpis()
-
-        # Mini carrousel constructeurs
-        self.render_manufacturer_carousel()
-
-        # Faits marquants
-        self.render_key_events()
-
-        # Chatbot intégré
-        self.render_chatbot()
-
-    def render_realtime_kpis(self):
-        """KPIs temps réel avec animations count-up."""
-        st.markdown("### 📊 **MÉTRIQUES TEMPS RÉEL**")
-
-        # Simulation temps réel
-        current_time = datetime.now()
-        base_production = 95000000  # Production annuelle de base
-
-        # Calcul production "temps réel" (simulation)
-        daily_production = base_production / 365
-        hourly_production = daily_production / 24
-        current_hour_production = int(hourly_production * (current_time.hour + 1))
-
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            # Production aujourd'hui (simulée)
-            st.markdown(f"""
-            <div class="metric-card-premium" style="background: linear-gradient(135deg, #E31E24 0%, #B71C1C 100%);
-                        color: white; text-align: center; animation: pulse 2s infinite;">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🏭 Production Aujourd'hui</div>
-                <div class="kpi-value" style="font-size: 2.5rem; font-weight: bold;">
-                    {current_hour_production:,}
-                </div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">véhicules</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            # Véhicules EV produits (simulation)
-            ev_today = int(current_hour_production * 0.18)  # 18% EV
-            st.markdown(f"""
-            <div class="metric-card-premium" style="background: linear-gradient(135deg, #00D563 0%, #00A651 100%);
-                        color: white; text-align: center; animation: pulse 2s infinite 0.5s;">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚡ Véhicules EV</div>
-                <div class="kpi-value" style="font-size: 2.5rem; font-weight: bold;">
-                    {ev_today:,}
-                </div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">électriques</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            # Valeur marchée (simulation)
-            market_value = current_hour_production * 35000  # Prix moyen 35k€
-            st.markdown(f"""
-            <div class="metric-card-premium" style="background: linear-gradient(135deg, #D4AF37 0%, #B8860B 100%);
-                        color: white; text-align: center; animation: pulse 2s infinite 1s;">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">💰 Valeur Marché</div>
-                <div class="kpi-value" style="font-size: 2.5rem; font-weight: bold;">
-                    {market_value/1e9:.1f}Md€
-                </div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">aujourd'hui</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col4:
-            # Statut marché
-            market_status = "🟢 ACTIF" if 6 <= current_time.hour <= 22 else "🟡 RALENTI"
-            st.markdown(f"""
-            <div class="metric-card-premium" style="background: linear-gradient(135deg, #42A5F5 0%, #1976D2 100%);
-                        color: white; text-align: center; animation: pulse 2s infinite 1.5s;">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📈 Statut Marché</div>
-                <div class="kpi-value" style="font-size: 2rem; font-weight: bold;">
-                    {market_status}
-                </div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">
-                    {current_time.strftime('%H:%M')} UTC
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # CSS pour animations
-        st.markdown("""
-        <style>
-        @keyframes pulse {
-            0% { transform: scale(1); }
-            50% { transform: scale(1.05); }
-            100% { transform: scale(1); }
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-    def render_manufacturer_carousel(self):
-        """Mini carrousel des constructeurs avec stats clés."""
-        st.markdown("---")
-        st.markdown("### 🏭 **CONSTRUCTEURS LEADERS**")
-
-        # Données des constructeurs avec logos (émojis)
-        manufacturers = [
-            {"name": "Toyota", "logo": "🇯🇵", "production": "11.2M", "ev_share": "12%", "color": "#E31E24"},
-            {"name": "Volkswagen", "logo": "🇩🇪", "production": "9.8M", "ev_share": "8%", "color": "#1976D2"},
-            {"name": "General Motors", "logo": "🇺🇸", "production": "6.2M", "ev_share": "15%", "color": "#FF9800"},
-            {"name": "Ford", "logo": "🇺🇸", "production": "4.2M", "ev_share": "7%", "color": "#4CAF50"},
-            {"name": "Hyundai-Kia", "logo": "🇰🇷", "production": "7.1M", "ev_share": "9%", "color": "#9C27B0"},
-            {"name": "Stellantis", "logo": "🇮🇹", "production": "6.1M", "ev_share": "6%", "color": "#FF5722"}
-        ]
-
-        # Affichage en carrousel
-        cols = st.columns(len(manufacturers))
-
-        for i, (col, manu) in enumerate(zip(cols, manufacturers)):
-            with col:
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, {manu['color']}20 0%, {manu['color']}40 100%);
-                            border: 2px solid {manu['color']};
-                            border-radius: 15px; padding: 1rem; text-align: center;
-                            transition: all 0.3s ease; cursor: pointer;
-                            animation: slideIn 0.8s ease-out {i*0.1}s both;">
-                    <div style="font-size: 2rem; margin-bottom: 0.5rem;">{manu['logo']}</div>
-                    <div style="font-weight: bold; color: {manu['color']}; margin-bottom: 0.5rem;">
-                        {manu['name']}
-                    </div>
-                    <div style="font-size: 0.9rem; color: #666;">
-                        📊 {manu['production']}<br>
-                        ⚡ {manu['ev_share']} EV
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-
-        # CSS pour animation slideIn
-        st.markdown("""
-        <style>
-        @keyframes slideIn {
-            from { opacity: 0; transform: translateY(30px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-    def render_key_events(self):
-        """Page Faits marquants avec timeline."""
-        st.markdown("---")
-        st.markdown("### 📰 **FAITS MARQUANTS**")
-
-        # Événements clés
-        events = [
-            {
-                "year": "2020",
-                "title": "🦠 Pandémie COVID-19",
-                "description": "Chute de 15% de la production mondiale",
-                "impact": "Négatif",
-                "color": "#E31E24"
-            },
-            {
-                "year": "2021",
-                "title": "💰 Plan Biden Infrastructure",
-                "description": "500Md$ pour véhicules électriques",
-                "impact": "Positif",
-                "color": "#00D563"
-            },
-            {
-                "year": "2022",
-                "title": "⚡ Boom Tesla",
-                "description": "Tesla dépasse 1M véhicules/an",
-                "impact": "Positif",
-                "color": "#00D563"
-            },
-            {
-                "year": "2023",
-                "title": "🔋 Guerre des batteries",
-                "description": "Course aux batteries solides",
-                "impact": "Neutre",
-                "color": "#FF9800"
-            },
-            {
-                "year": "2024",
-                "title": "🇨🇳 Expansion BYD",
-                "description": "BYD devient n°2 mondial EV",
-                "impact": "Positif",
-                "color": "#00D563"
-            }
-        ]
-
-        # Timeline interactive
-        for i, event in enumerate(events):
-            col1, col2 = st.columns([1, 4])
-
-            with col1:
-                st.markdown(f"""
-                <div style="background: {event['color']}; color: white;
-                            border-radius: 50%; width: 60px; height: 60px;
-                            display: flex; align-items: center; justify-content: center;
-                            font-weight: bold; font-size: 1.1rem; margin: 0 auto;">
-                    {event['year']}
-                </div>
-                """, unsafe_allow_html=True)
-
-            with col2:
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, {event['color']}10 0%, {event['color']}20 100%);
-                            border-left: 4px solid {event['color']};
-                            padding: 1rem; border-radius: 10px; margin-bottom: 1rem;">
-                    <h4 style="margin: 0; color: {event['color']};">{event['title']}</h4>
-                    <p style="margin: 0.5rem 0; color: #666;">{event['description']}</p>
-                    <span style="background: {event['color']}; color: white;
-                                 padding: 0.2rem 0.5rem; border-radius: 15px; font-size: 0.8rem;">
-                        Impact {event['impact']}
-                    </span>
-                </div>
-                """, unsafe_allow_html=True)
-
-
-
-        with col1:
-            # Production mondiale temps réel
-            current_production = 95000000 + random.randint(-1000000, 1000000)
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #E31E24 0%, #B71C1C 100%);
-                        color: white; padding: 3rem; border-radius: 20px; text-align: center;
-                        box-shadow: 0 0 30px rgba(227, 30, 36, 0.3); margin-bottom: 2rem;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">🏭 PRODUCTION MONDIALE</div>
-                <div style="font-size: 6rem; font-weight: bold; line-height: 1;">
-                    {current_production/1e6:.1f}M
-                </div>
-                <div style="font-size: 1.5rem; opacity: 0.9;">véhicules/an</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            # Part EV temps réel
-            ev_share = 18.5 + random.uniform(-0.5, 0.5)
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #00D563 0%, #00A651 100%);
-                        color: white; padding: 3rem; border-radius: 20px; text-align: center;
-                        box-shadow: 0 0 30px rgba(0, 213, 99, 0.3); margin-bottom: 2rem;">
-                <div style="font-size: 2rem; margin-bottom: 1rem;">⚡ VÉHICULES ÉLECTRIQUES</div>
-                <div style="font-size: 6rem; font-weight: bold; line-height: 1;">
-                    {ev_share:.1f}%
-                </div>
-                <div style="font-size: 1.5rem; opacity: 0.9;">du marché mondial</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Graphique temps réel simulé
-        st.markdown("### 📊 **ÉVOLUTION TEMPS RÉEL**")
-
-        # Données simulées temps réel
-        hours = list(range(24))
-        production_hourly = [random.randint(8000, 12000) for _ in hours]
-
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=hours, y=production_hourly,
-            mode='lines+markers',
-            name='Production Horaire',
-            line=dict(color='#E31E24', width=4),
-            marker=dict(size=8)
-        ))
-
-        fig.update_layout(
-            title="Production Horaire Mondiale (Simulation Temps Réel)",
-            xaxis_title="Heure (UTC)",
-            yaxis_title="Véhicules/heure",
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white', size=16),
-            height=400
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
-
-        # Auto-refresh pour mode TV
-        time.sleep(2)
-        st.rerun()
-
-    def render_chatbot(self):
-        """Chatbot intégré pour exploration des données."""
-        st.markdown("### 🤖 **ASSISTANT DATA EXPLORER**")
-
-        # Interface chatbot
-        with st.container():
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #1A1A1A 0%, #2C2C2C 100%);
-                        border-radius: 15px; padding: 2rem; margin-bottom: 2rem;">
-                <h4 style="color: #E31E24; margin: 0 0 1rem 0;">🤖 Assistant IA Automobile</h4>
-                <p style="color: #CCCCCC; margin: 0;">
-                    Posez vos questions sur les données automobiles. Exemples :<br>
-                    • "Montre-moi la production de Toyota en 2022"<br>
-                    • "Quelle est la part EV en Europe ?"<br>
-                    • "Compare Ford et GM"
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-
-            # Zone de chat
-            user_question = st.text_input(
-                "💬 Votre question :",
-                placeholder="Ex: Montre-moi l'évolution des véhicules électriques...",
-                key="chatbot_input"
-            )
-
-            if user_question:
-                # Simulation de réponse IA
-                response = self.process_chatbot_query(user_question)
-
-                st.markdown(f"""
-                <div style="background: #E31E24; color: white; padding: 1rem;
-                            border-radius: 10px; margin: 1rem 0;">
-                    <strong>🤖 Assistant :</strong><br>
-                    {response}
-                </div>
-                """, unsafe_allow_html=True)
-    def process_chatbot_query(self, query):
-        """Traitement des requêtes chatbot (simulation)."""
-        query_lower = query.lower()
-
-        # Réponses préprogrammées basées sur mots-clés
-        if "toyota" in query_lower:
-            return "Toyota est le leader mondial avec 11.2M véhicules produits en 2023, soit 23.5% du marché. Sa part EV est de 12%."
-
-        elif "électrique" in query_lower or "ev" in query_lower:
-            return "Les véhicules électriques représentent 18.5% du marché mondial en 2024, avec une croissance de +45% vs 2023. Tesla et BYD dominent ce segment."
-
-        elif "europe" in query_lower:
-            return "L'Europe produit 18.2M véhicules/an (19% mondial). Leaders : Volkswagen, Stellantis, BMW. Part EV : 22%."
-
-        elif "ford" in query_lower and "gm" in query_lower:
-            return "Ford : 4.2M véhicules (7% EV) vs GM : 6.2M véhicules (15% EV). GM investit plus massivement dans l'électrique."
-
-        elif "2030" in query_lower:
-            return "Projections 2030 : 120M véhicules/an (+26%), 45% seront électriques. Chine dominera avec 35% de la production mondiale."
-
-        else:
-            return f"Analyse en cours de votre question : '{query}'. Consultez les dashboards spécialisés pour plus de détails sur ce sujet."
-
-        # En-tête avec style Power BI
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #6B46C1 0%, #9333EA 100%);
-                    padding: 2rem; border-radius: 15px; margin-bottom: 2rem; text-align: center;">
-            <h2 style="color: white; margin: 0; font-size: 2rem;">
-                📊 Analyse du marché automobile mondial
-            </h2>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # KPIs avec design Power BI authentique
-        if self.data_loaded:
-            # Calculs des métriques
-            num_regions = self.df['Region'].nunique()
-            num_manufacturers = self.df['Manufacturer'].nunique()
-            total_production = self.df['Production'].sum()
-            avg_price = self.df['Price'].mean()
-            avg_steel_price = self.df['SteelPrice'].mean()
-            num_years = self.df['Year'].nunique()
-
-            col1, col2, col3, col4 = st.columns(4)
-
-            with col1:
-                # Croissance moyenne
-                growth_rate = ((self.df.groupby('Year')['Production'].sum().iloc[-1] /
-                               self.df.groupby('Year')['Production'].sum().iloc[0]) ** (1/num_years) - 1) * 100
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
-                            padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                            box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                    <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📈 Taux de croissance annuel</div>
-                    <div style="font-size: 3rem; font-weight: bold;">{growth_rate:.1f}%</div>
-                </div>
-                """, unsafe_allow_html=True)
-
-            with col2:
-                # Part de marché du leader
-                top_manufacturer = self.df.groupby('Manufacturer')['Production'].sum().idxmax()
-                market_share = (self.df.groupby('Manufacturer')['Production'].sum().max() /
-                               self.df['Production'].sum()) * 100
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
-                            padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                            box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                    <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🏆 Part de marché leader</div>
-                    <div style="font-size: 3rem; font-weight: bold;">{market_share:.1f}%</div>
-                    <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">{top_manufacturer}</div>
-                </div>
-                """, unsafe_allow_html=True)
-
-            with col3:
-                # Concentration du marché (HHI)
-                market_shares = self.df.groupby('Manufacturer')['Production'].sum()
-                market_shares_pct = (market_shares / market_shares.sum()) * 100
-                hhi = (market_shares_pct ** 2).sum()
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, #8B5CF6 0%, #7C3AED 100%);
-                            padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                            box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                    <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📊 Concentration marché</div>
-                    <div style="font-size: 3rem; font-weight: bold;">{hhi:.0f}</div>
-                    <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">HHI Index</div>
-                </div>
-                """, unsafe_allow_html=True)
-
-            with col4:
-                # Prix moyen global
-                avg_price = self.df['Price'].mean()
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, #EF4444 0%, #DC2626 100%);
-                            padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                            box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                    <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">💰 Prix moyen global</div>
-                    <div style="font-size: 3rem; font-weight: bold;">{avg_price/1000:.1f}K</div>
-                    <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">€ par véhicule</div>
-                </div>
-                """, unsafe_allow_html=True)
-
-        # KPIs complémentaires essentiels
-        st.markdown("---")
-
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            # Production totale
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #06B6D4 0%, #0891B2 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🏭 Production totale</div>
-                <div style="font-size: 3rem; font-weight: bold;">{total_production/1e6:.0f}M</div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">unités</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            # Sélecteur de source pour constructeurs
-            use_powerbi_data = st.checkbox("📊 Utiliser chiffres Power BI", value=True, key="constructeurs")
-
-            if use_powerbi_data:
-                # Données Power BI complètes
-                constructeurs_count = 37
-                constructeurs_label = "acteurs mondiaux"
-            else:
-                # Données CSV actuelles
-                constructeurs_count = num_manufacturers
-                constructeurs_label = "dans les données"
-
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #EC4899 0%, #BE185D 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🚗 Constructeurs</div>
-                <div style="font-size: 3rem; font-weight: bold;">{constructeurs_count}</div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">{constructeurs_label}</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            # Sélecteur de source pour pays
-            use_powerbi_countries = st.checkbox("🌍 Utiliser chiffres Power BI", value=True, key="pays")
-
-            if use_powerbi_countries:
-                # Données Power BI complètes (basées sur votre liste)
-                pays_count = 11
-                pays_label = "nations"
-                pays_title = "Pays producteurs"
-            else:
-                # Données CSV actuelles (régions)
-                pays_count = num_regions
-                pays_label = "zones"
-                pays_title = "Régions"
-
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #14B8A6 0%, #0D9488 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🌍 {pays_title}</div>
-                <div style="font-size: 3rem; font-weight: bold;">{pays_count}</div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">{pays_label}</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col4:
-            # Années d'analyse
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #84CC16 0%, #65A30D 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📅 Période d'analyse</div>
-                <div style="font-size: 3rem; font-weight: bold;">{num_years}</div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">années</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-
-
-        # Section Excellence du Projet
-        st.markdown("---")
-        st.markdown("## 🏆 **EXCELLENCE DU PROJET**")
-
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📊 Dashboards Créés</div>
-                <div style="font-size: 3rem; font-weight: bold;">24</div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">pages d'analyse</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #8B5CF6 0%, #7C3AED 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🤖 Modèles ML</div>
-                <div style="font-size: 3rem; font-weight: bold;">4</div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">algorithmes avancés</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🎯 Scénarios Analysés</div>
-                <div style="font-size: 3rem; font-weight: bold;">9</div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">cas d'usage</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col4:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #EF4444 0%, #DC2626 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📈 Prévisions</div>
-                <div style="font-size: 3rem; font-weight: bold;">2030</div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">horizon temporel</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Section Chiffres Power BI
-        st.markdown("---")
-        st.markdown("### 📊 **CHIFFRES POWER BI**")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown("""
-            **🌍 Couverture Géographique**
-            - **11 pays** : Germany, Italy, UK, Japan, USA, France, China, India, Czech Republic, South Korea, Sweden
-            - **4 régions** : North America, Europe, Asia Pacific, China
-            """)
 
-        with col2:
-            st.markdown("""
-            **🚗 Constructeurs Analysés**
-            - **37+ constructeurs** : Toyota, Volkswagen, BMW, Mercedes-Benz, Ford, Tesla, Hyundai, BYD, etc.
-            - **6 groupes principaux** : Données détaillées disponibles
-            """)
-
-        # Section explicative sur les données
-        st.markdown("---")
-        with st.expander("ℹ️ Explication des sources de données", expanded=False):
-            col1, col2 = st.columns(2)
-
-            with col1:
-                st.markdown("""
-                **📊 Dataset Power BI Complet**
-
-                Basé sur votre liste complète :
-                - **11 pays** : Germany, Italy, UK, Japan, USA, France, China, India, Czech Republic, South Korea, Sweden
-                - **37+ constructeurs** : Porsche, Ferrari, Lamborghini, Aston Martin, McLaren, Mazda, Subaru, Toyota, Honda, Nissan, Volkswagen, BMW, Mercedes-Benz, Audi, General Motors, Ford, Tesla, Hyundai, Kia, Renault, Peugeot, BYD, Volvo, Chrysler, Citroën, Fiat, Geely, SAIC, Great Wall, Chery, Tata Motors, Mahindra, Maruti Suzuki, Jaguar Land Rover, Škoda, etc.
-                """)
-
-            with col2:
-                st.markdown("""
-                **📈 Dataset CSV Actuel**
-
-                Données disponibles localement :
-                - **4 régions** : North America, Europe, Asia Pacific, China
-                - **6 constructeurs** : Toyota, Volkswagen, Ford, Hyundai-Kia, Stellantis, GM
-                - **Période** : 2010-2023 (14 années)
-                - **12,096 enregistrements** au total
-                """)
-
-            st.info("💡 **Recommandation** : Utilisez les chiffres Power BI pour une vue globale du marché, et les données CSV pour les analyses détaillées et graphiques.")
-
-        # Aperçu des fonctionnalités
-        st.markdown("## 🚀 Fonctionnalités Principales")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            ### 📊 Dashboards Interactifs
-            - **Dashboard Principal**: Vue d'ensemble complète
-            - **Analyse Géographique**: Tendances par région
-            - **Transition Électrique**: Évolution vers l'électrique
-            - **Fabricants**: Comparaison des constructeurs
-            """)
-        
-        with col2:
-            st.markdown("""
-            ### 🤖 Intelligence Artificielle
-            - **4 Modèles ML**: XGBoost, Prophet, ARIMA, Régression
-            - **Prédictions 2030**: Scénarios multiples
-            - **Analyse Prédictive**: Tendances futures
-            - **Optimisation**: Recommandations stratégiques
-            """)
-        
-        # Graphique d'aperçu
-        if self.data_loaded:
-            st.markdown("## 📈 Aperçu des Tendances")
-            
-            # Graphique de production par année
-            yearly_production = self.df.groupby('Year')['Production'].sum().reset_index()
-            
-            fig = px.line(yearly_production, x='Year', y='Production',
-                         title="Évolution de la Production Automobile Mondiale",
-                         labels={'Production': 'Production (unités)', 'Year': 'Année'})
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
-
-
-
-    def render_ml_models(self):
-        """Page des modèles ML."""
-        st.markdown('<h1 class="main-header">🤖 Modèles de Machine Learning</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Données non disponibles")
-            return
-
-        st.markdown("## 📊 Performance des Modèles")
-
-        # Informations sur les modèles
-        model_info = {
-            'XGBoost': {
-                'description': 'Modèle de gradient boosting pour relations complexes',
-                'use_case': 'Prédictions haute précision avec variables multiples',
-                'accuracy': '94.2%'
-            },
-            'Prophet': {
-                'description': 'Modèle Facebook spécialisé pour séries temporelles',
-                'use_case': 'Tendances saisonnières et cycles temporels',
-                'accuracy': '91.8%'
-            },
-            'ARIMA': {
-                'description': 'Modèle classique d\'analyse temporelle',
-                'use_case': 'Prédictions basées sur l\'historique',
-                'accuracy': '88.5%'
-            },
-            'Régression Linéaire': {
-                'description': 'Modèle de base pour relations linéaires',
-                'use_case': 'Analyse des tendances générales',
-                'accuracy': '85.3%'
-            }
-        }
-
-        # Affichage des modèles
-        for model_name, info in model_info.items():
-            with st.expander(f"🔍 {model_name} - {info['accuracy']}"):
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write(f"**Description:** {info['description']}")
-                    st.write(f"**Cas d'usage:** {info['use_case']}")
-                with col2:
-                    st.metric("Précision", info['accuracy'])
-                    if model_name.lower().replace(' ', '_').replace('é', 'e') in self.models:
-                        st.success("✅ Modèle chargé")
-                    else:
-                        st.error("❌ Modèle non disponible")
-
-        # Prédictions interactives
-        st.markdown("## 🔮 Prédictions Interactives")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            prediction_year = st.selectbox(
-                "Année de prédiction:",
-                options=list(range(2024, 2031))
-            )
-
-        with col2:
-            scenario = st.selectbox(
-                "Scénario:",
-                options=[
-                    "Status Quo",
-                    "Politiques Protectionnistes US",
-                    "Accélération Véhicules Électriques",
-                    "Crise Matières Premières",
-                    "Percée Technologique"
-                ]
-            )
-
-        if st.button("🚀 Générer Prédiction"):
-            self._generate_prediction(prediction_year, scenario)
-
-    def _generate_prediction(self, year, scenario):
-        """Génère une prédiction pour l'année et le scénario donnés."""
-        st.markdown("### 📈 Résultats de Prédiction")
-
-        # Simulation de prédiction (à remplacer par les vrais modèles)
-        base_production = 85000000  # Production de base
-
-        # Facteurs de scénario
-        scenario_factors = {
-            "Status Quo": 1.02,
-            "Politiques Protectionnistes US": 0.95,
-            "Accélération Véhicules Électriques": 1.15,
-            "Crise Matières Premières": 0.88,
-            "Percée Technologique": 1.25
-        }
-
-        factor = scenario_factors.get(scenario, 1.0)
-        years_from_2023 = year - 2023
-        predicted_production = base_production * (factor ** years_from_2023)
-
-        # Affichage des résultats
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            st.metric("🏭 Production Prédite", f"{predicted_production:,.0f}")
-
-        with col2:
-            change_pct = (factor - 1) * 100
-            st.metric("📊 Variation Annuelle", f"{change_pct:+.1f}%")
-
-        with col3:
-            confidence = np.random.uniform(85, 95)
-            st.metric("🎯 Confiance", f"{confidence:.1f}%")
-
-        # Graphique de prédiction
-        years = list(range(2020, year + 1))
-        historical_years = [y for y in years if y <= 2023]
-        future_years = [y for y in years if y > 2023]
-
-        # Données historiques simulées
-        historical_production = [base_production * (1.02 ** (y - 2023)) for y in historical_years]
-
-        # Données futures
-        future_production = [base_production * (factor ** (y - 2023)) for y in future_years]
-
-        fig = go.Figure()
-
-        # Ligne historique
-        fig.add_trace(go.Scatter(
-            x=historical_years,
-            y=historical_production,
-            mode='lines+markers',
-            name='Historique',
-            line=dict(color='blue')
-        ))
-
-        # Ligne prédiction
-        if future_years:
-            fig.add_trace(go.Scatter(
-                x=[2023] + future_years,
-                y=[historical_production[-1]] + future_production,
-                mode='lines+markers',
-                name='Prédiction',
-                line=dict(color='red', dash='dash')
-            ))
-
-        fig.update_layout(
-            title=f"Prédiction Production Automobile - {scenario}",
-            xaxis_title="Année",
-            yaxis_title="Production (unités)",
-            height=400
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
-
-
-
-    def render_geographic_analysis(self):
-        """Page d'analyse géographique."""
-        st.markdown('<h1 class="main-header">🌍 Analyse Géographique</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Données non disponibles")
-            return
-
-        # Métriques par région
-        st.markdown("## 📊 Performance par Région")
-
-        region_stats = self.df.groupby('Region').agg({
-            'Production': ['sum', 'mean'],
-            'SteelPrice': 'mean',
-            'Manufacturer': 'nunique'
-        }).round(2)
-
-        region_stats.columns = ['Production Totale', 'Production Moyenne', 'Prix Acier Moyen', 'Nb Fabricants']
-
-        st.dataframe(region_stats, use_container_width=True)
-
-        # Métriques géographiques clés
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            top_region = region_stats.nlargest(1, 'Production Totale').index[0]
-            top_production = region_stats.loc[top_region, 'Production Totale']
-            st.metric("🏆 Région Leader", top_region, f"{top_production/1e6:.1f}M unités")
-
-        with col2:
-            total_regions = len(region_stats)
-            st.metric("🌍 Régions Actives", total_regions, "marchés")
-
-        with col3:
-            avg_price_by_region = self.df.groupby('Region')['Price'].mean()
-            highest_price_region = avg_price_by_region.idxmax()
-            st.metric("💰 Prix le Plus Élevé", highest_price_region, f"{avg_price_by_region.max():,.0f}€")
-
-        with col4:
-            total_manufacturers = self.df['Manufacturer'].nunique()
-            st.metric("🏭 Constructeurs Globaux", total_manufacturers, "fabricants")
-
-        # Graphiques géographiques avancés
-        st.markdown("## 🗺️ Cartographie et Analyses Régionales")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Production par région et année - style de vos dashboards
-            region_year = self.df.groupby(['Region', 'Year'])['Production'].sum().reset_index()
-            fig1 = px.line(region_year, x='Year', y='Production', color='Region',
-                          title="Évolution Production par Région",
-                          markers=True)
-            fig1.update_layout(
-                hovermode='x unified',
-                legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-            )
-            st.plotly_chart(fig1, use_container_width=True)
-
-        with col2:
-            # Heatmap production par région et année
-            pivot_data = self.df.pivot_table(values='Production', index='Region', columns='Year', aggfunc='sum', fill_value=0)
-            fig2 = px.imshow(
-                pivot_data,
-                title="Heatmap Production par Région/Année",
-                color_continuous_scale='Blues',
-                aspect='auto'
-            )
-            fig2.update_layout(
-                xaxis_title="Année",
-                yaxis_title="Région"
-            )
-            st.plotly_chart(fig2, use_container_width=True)
-
-        # Analyse comparative régionale
-        st.markdown("## 📊 Analyse Comparative Régionale")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Graphique en barres comparatif - inspiré de vos dashboards
-            region_comparison = self.df.groupby('Region').agg({
-                'Production': 'sum',
-                'Price': 'mean',
-                'SteelPrice': 'mean'
-            }).round(2)
-
-            fig3 = go.Figure()
-
-            # Barres de production
-            fig3.add_trace(go.Bar(
-                name='Production (M unités)',
-                x=region_comparison.index,
-                y=region_comparison['Production']/1e6,
-                yaxis='y',
-                offsetgroup=1,
-                marker_color='lightblue'
-            ))
-
-            # Ligne de prix moyen
-            fig3.add_trace(go.Scatter(
-                name='Prix Moyen (K€)',
-                x=region_comparison.index,
-                y=region_comparison['Price']/1000,
-                yaxis='y2',
-                mode='lines+markers',
-                line=dict(color='red', width=3),
-                marker=dict(size=8)
-            ))
-
-            fig3.update_layout(
-                title="Production vs Prix Moyen par Région",
-                xaxis_title="Région",
-                yaxis=dict(title="Production (M unités)", side="left"),
-                yaxis2=dict(title="Prix Moyen (K€)", side="right", overlaying="y"),
-                hovermode='x unified'
-            )
-            fig3.update_layout(xaxis_tickangle=45)
-            st.plotly_chart(fig3, use_container_width=True)
-
-        with col2:
-            # Parts de marché avec détails - style de vos dashboards
-            region_total = self.df.groupby('Region')['Production'].sum().reset_index()
-            region_total['Percentage'] = (region_total['Production'] / region_total['Production'].sum() * 100).round(1)
-
-            fig4 = px.pie(
-                region_total,
-                values='Production',
-                names='Region',
-                title="Parts de Marché par Région",
-                color_discrete_sequence=px.colors.qualitative.Set3
-            )
-            fig4.update_traces(
-                textposition='inside',
-                textinfo='percent+label',
-                hovertemplate='<b>%{label}</b><br>Production: %{value:,.0f}<br>Part: %{percent}<extra></extra>'
-            )
-            st.plotly_chart(fig4, use_container_width=True)
-
-        # Analyse des constructeurs par région
-        st.markdown("## 🏭 Constructeurs par Région")
-
-        # Matrice constructeurs x régions
-        manufacturer_region = self.df.pivot_table(
-            values='Production',
-            index='Manufacturer',
-            columns='Region',
-            aggfunc='sum',
-            fill_value=0
-        )
-
-        # Prendre les top 10 constructeurs
-        top_manufacturers = self.df.groupby('Manufacturer')['Production'].sum().nlargest(10).index
-        manufacturer_region_top = manufacturer_region.loc[top_manufacturers]
-
-        fig5 = px.imshow(
-            manufacturer_region_top,
-            title="Matrice Constructeurs x Régions (Top 10)",
-            color_continuous_scale='Viridis',
-            aspect='auto'
-        )
-        fig5.update_layout(
-            xaxis_title="Région",
-            yaxis_title="Constructeur",
-            height=500
-        )
-        st.plotly_chart(fig5, use_container_width=True)
-
-        # Analyse des tendances régionales
-        st.markdown("## 📈 Tendances et Croissance Régionales")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Taux de croissance par région
-            growth_by_region = []
-            for region in self.df['Region'].unique():
-                region_data = self.df[self.df['Region'] == region]
-                growth_rate = self._calculate_growth_rate(region_data)
-                growth_by_region.append({'Region': region, 'Croissance': growth_rate})
-
-            growth_df = pd.DataFrame(growth_by_region)
-
-            fig6 = px.bar(
-                growth_df,
-                x='Region',
-                y='Croissance',
-                title="Taux de Croissance par Région",
-                color='Croissance',
-                color_continuous_scale='RdYlGn'
-            )
-            fig6.update_layout(xaxis_tickangle=45)
-            fig6.add_hline(y=0, line_dash="dash", line_color="black", annotation_text="Seuil de croissance")
-            st.plotly_chart(fig6, use_container_width=True)
-
-        with col2:
-            # Évolution de la diversité des constructeurs par région
-            diversity_by_year = []
-            for year in sorted(self.df['Year'].unique()):
-                year_data = self.df[self.df['Year'] == year]
-                for region in year_data['Region'].unique():
-                    region_year_data = year_data[year_data['Region'] == region]
-                    num_manufacturers = region_year_data['Manufacturer'].nunique()
-                    diversity_by_year.append({
-                        'Year': year,
-                        'Region': region,
-                        'Nb_Constructeurs': num_manufacturers
-                    })
-
-            diversity_df = pd.DataFrame(diversity_by_year)
-
-            fig7 = px.line(
-                diversity_df,
-                x='Year',
-                y='Nb_Constructeurs',
-                color='Region',
-                title="Évolution Diversité Constructeurs par Région",
-                markers=True
-            )
-            st.plotly_chart(fig7, use_container_width=True)
-
-        # Tableau de synthèse régionale
-        st.markdown("## 📋 Synthèse Régionale Détaillée")
-
-        # Enrichir les statistiques régionales
-        detailed_region_stats = self.df.groupby('Region').agg({
-            'Production': ['sum', 'mean', 'std'],
-            'Price': ['mean', 'min', 'max'],
-            'SteelPrice': 'mean',
-            'Manufacturer': 'nunique',
-            'Year': ['min', 'max']
-        }).round(2)
-
-        # Aplatir les colonnes multi-niveaux
-        detailed_region_stats.columns = [
-            'Production_Totale', 'Production_Moyenne', 'Production_StdDev',
-            'Prix_Moyen', 'Prix_Min', 'Prix_Max', 'Prix_Acier_Moyen',
-            'Nb_Constructeurs', 'Premiere_Annee', 'Derniere_Annee'
-        ]
-
-        # Ajouter des métriques calculées
-        detailed_region_stats['Part_Marche_%'] = (
-            detailed_region_stats['Production_Totale'] / detailed_region_stats['Production_Totale'].sum() * 100
-        ).round(2)
-
-        # Calculer la croissance pour chaque région
-        detailed_region_stats['Croissance_%'] = [
-            self._calculate_growth_rate(self.df[self.df['Region'] == region])
-            for region in detailed_region_stats.index
-        ]
-
-        # Formater pour l'affichage
-        display_stats = detailed_region_stats.copy()
-        display_stats['Production_Totale'] = (display_stats['Production_Totale'] / 1e6).round(2)
-        display_stats['Production_Moyenne'] = (display_stats['Production_Moyenne'] / 1e3).round(1)
-        display_stats['Production_StdDev'] = (display_stats['Production_StdDev'] / 1e3).round(1)
-
-        # Renommer pour l'affichage
-        display_stats.columns = [
-            'Prod. Totale (M)', 'Prod. Moy. (K)', 'Écart-Type (K)',
-            'Prix Moyen (€)', 'Prix Min (€)', 'Prix Max (€)', 'Prix Acier Moy.',
-            'Nb Constructeurs', 'Première Année', 'Dernière Année',
-            'Part Marché (%)', 'Croissance (%)'
-        ]
-
-        st.dataframe(
-            display_stats.sort_values('Part Marché (%)', ascending=False),
-            use_container_width=True
-        )
-
-
-
-    def render_ev_transition(self):
-        """Page transition électrique."""
-        st.markdown('<h1 class="main-header">⚡ Transition Électrique</h1>',
-                   unsafe_allow_html=True)
-
-        st.markdown("""
-        ## 🔋 Analyse de la Transition vers l'Électrique
-
-        Cette section analyse l'évolution vers les véhicules électriques et hybrides.
-        """)
-
-        # Simulation de données EV (à remplacer par vraies données)
-        if self.data_loaded:
-            # Créer des données simulées pour les véhicules électriques
-            ev_data = []
-            for year in range(2015, 2024):
-                ev_percentage = min(2 * (year - 2015) + 1, 15)  # Croissance simulée
-                ev_data.append({'Year': year, 'EV_Percentage': ev_percentage})
-
-            ev_df = pd.DataFrame(ev_data)
-
-            col1, col2 = st.columns(2)
-
-            with col1:
-                # Évolution du pourcentage EV
-                fig1 = px.line(ev_df, x='Year', y='EV_Percentage',
-                              title="Évolution du Pourcentage de Véhicules Électriques")
-                fig1.update_layout(yaxis_title="Pourcentage (%)")
-                st.plotly_chart(fig1, use_container_width=True)
-
-            with col2:
-                # Prédictions EV
-                future_years = list(range(2024, 2031))
-                future_ev = [15 + 5 * (year - 2023) for year in future_years]
-
-                fig2 = go.Figure()
-                fig2.add_trace(go.Scatter(x=ev_df['Year'], y=ev_df['EV_Percentage'],
-                                        mode='lines+markers', name='Historique'))
-                fig2.add_trace(go.Scatter(x=future_years, y=future_ev,
-                                        mode='lines+markers', name='Prédiction',
-                                        line=dict(dash='dash')))
-                fig2.update_layout(title="Prédiction Transition Électrique",
-                                  xaxis_title="Année", yaxis_title="Pourcentage EV (%)")
-                st.plotly_chart(fig2, use_container_width=True)
-    def render_manufacturers(self):
-        """Page fabricants."""
-        st.markdown('<h1 class="main-header">🏭 Analyse des Fabricants</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Données non disponibles")
-            return
-
-        # Top fabricants
-        st.markdown("## 🏆 Top Fabricants")
-
-        manu_stats = self.df.groupby('Manufacturer').agg({
-            'Production': ['sum', 'mean'],
-            'SteelPrice': 'mean',
-            'Year': ['min', 'max']
-        }).round(2)
-
-        manu_stats.columns = ['Production Totale', 'Production Moyenne', 'Prix Acier Moyen', 'Première Année', 'Dernière Année']
-        manu_stats = manu_stats.sort_values('Production Totale', ascending=False)
-
-        st.dataframe(manu_stats.head(15), use_container_width=True)
-
-        # Graphiques fabricants
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Top 10 fabricants
-            top_manu = manu_stats.head(10).reset_index()
-            fig1 = px.bar(top_manu, x='Manufacturer', y='Production Totale',
-                         title="Top 10 Fabricants par Production")
-            fig1.update_xaxes(tickangle=45)
-            st.plotly_chart(fig1, use_container_width=True)
-
-        with col2:
-            # Évolution des top 5
-            top_5_names = manu_stats.head(5).index.tolist()
-            top_5_evolution = self.df[self.df['Manufacturer'].isin(top_5_names)]
-            top_5_yearly = top_5_evolution.groupby(['Year', 'Manufacturer'])['Production'].sum().reset_index()
-
-            fig2 = px.line(top_5_yearly, x='Year', y='Production', color='Manufacturer',
-                          title="Évolution Top 5 Fabricants")
-            st.plotly_chart(fig2, use_container_width=True)
-
-    def render_economic_analysis(self):
-        """Page analyse économique."""
-        st.markdown('<h1 class="main-header">💼 Analyse Économique</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Données non disponibles")
-            return
-
-        # Indicateurs économiques clés
-        st.markdown("## 💰 Indicateurs Économiques Clés")
-
-        # Calculs des métriques économiques
-        current_year = self.df['Year'].max()
-        current_data = self.df[self.df['Year'] == current_year]
+    def _calculate_market_concentration(self, filters=None):
+        """Calcule l'indice de concentration du marché (Herfindahl) sur le cube filtré."""
+        market_shares = self.cube.rollup('Manufacturer', 'Production_Volume', filters=filters)
+        total_production = market_shares.sum()
+        if total_production > 0:
+            market_shares_pct = (market_shares / total_production * 100)
+            return (market_shares_pct ** 2).sum()
+        return 0
 
-        total_market_value = (current_data['Production'] * current_data['Price']).sum()
-        avg_steel_price = current_data['SteelPrice'].mean()
-        price_volatility = self.df.groupby('Year')['Price'].std().mean()
-        steel_correlation = self.df['SteelPrice'].corr(self.df['Production'])
 
-        col1, col2, col3, col4 = st.columns(4)
+def main():
+    """Fonction principale de l'application."""
+    with render_profiler.run() as profile:
+        app = StreamlitAutomotiveApp()
 
-        with col1:
-            st.metric("💼 Valeur Marché Total", f"{total_market_value/1e12:.2f}T€", "estimation")
+        # Pages hors menu (ex: diagnostic): ?page=<clé>, sans barre latérale
+        page = get_page(st.query_params.get("page"))
+        if page is None:
+            # Navigation
+            page = get_page(app.render_sidebar())
+        profile.page = page.key
 
-        with col2:
-            st.metric("⚙️ Prix Acier Moyen", f"{avg_steel_price:.0f}€", "par tonne")
-
-        with col3:
-            volatility_trend = "📈" if price_volatility > 3000 else "📊" if price_volatility > 1500 else "📉"
-            st.metric("📊 Volatilité Prix", f"{price_volatility:.0f}€", volatility_trend)
-
-        with col4:
-            correlation_strength = "🔴 Forte" if abs(steel_correlation) > 0.7 else "🟡 Modérée" if abs(steel_correlation) > 0.3 else "🟢 Faible"
-            st.metric("🔗 Corrélation Acier", f"{steel_correlation:.3f}", correlation_strength)
-
-        # Analyses de corrélation avancées
-        st.markdown("## 📊 Analyses de Corrélation Économique")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Matrice de corrélation complète
-            correlation_vars = ['Production', 'Price', 'SteelPrice']
-            if 'GDP_Growth' in self.df.columns:
-                correlation_vars.append('GDP_Growth')
-            if 'Interest_Rate' in self.df.columns:
-                correlation_vars.append('Interest_Rate')
-
-            correlation_matrix = self.df[correlation_vars].corr()
-
-            fig1 = px.imshow(
-                correlation_matrix,
-                title="Matrice de Corrélation Économique",
-                color_continuous_scale='RdBu',
-                aspect='auto',
-                text_auto=True
-            )
-            fig1.update_layout(
-                xaxis_title="Variables Économiques",
-                yaxis_title="Variables Économiques"
-            )
-            st.plotly_chart(fig1, use_container_width=True)
-
-        with col2:
-            # Scatter plot prix acier vs production avec tendance
-            fig2 = px.scatter(
-                self.df,
-                x='SteelPrice',
-                y='Production',
-                color='Year',
-                size='Price',
-                title="Prix Acier vs Production (par année)",
-                trendline="ols",
-                hover_data=['Manufacturer', 'Region']
-            )
-            fig2.update_layout(
-                xaxis_title="Prix Acier (€/tonne)",
-                yaxis_title="Production (unités)"
-            )
-            st.plotly_chart(fig2, use_container_width=True)
-
-        # Évolution des indicateurs économiques
-        st.markdown("## 📈 Évolution des Indicateurs Économiques")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Évolution multi-variables
-            yearly_economics = self.df.groupby('Year').agg({
-                'Price': 'mean',
-                'SteelPrice': 'mean',
-                'Production': 'sum'
-            }).reset_index()
-
-            fig3 = go.Figure()
-
-            # Prix véhicules (échelle principale)
-            fig3.add_trace(go.Scatter(
-                x=yearly_economics['Year'],
-                y=yearly_economics['Price'],
-                mode='lines+markers',
-                name='Prix Moyen Véhicules (€)',
-                line=dict(color='blue', width=3),
-                yaxis='y'
-            ))
-
-            # Prix acier (échelle secondaire)
-            fig3.add_trace(go.Scatter(
-                x=yearly_economics['Year'],
-                y=yearly_economics['SteelPrice'],
-                mode='lines+markers',
-                name='Prix Acier (€/tonne)',
-                line=dict(color='red', width=3),
-                yaxis='y2'
-            ))
-
-            fig3.update_layout(
-                title="Évolution Prix Véhicules vs Prix Acier",
-                xaxis_title="Année",
-                yaxis=dict(title="Prix Véhicules (€)", side="left"),
-                yaxis2=dict(title="Prix Acier (€/tonne)", side="right", overlaying="y"),
-                hovermode='x unified'
-            )
-            st.plotly_chart(fig3, use_container_width=True)
-
-        with col2:
-            # Analyse de la volatilité par année
-            yearly_volatility = self.df.groupby('Year').agg({
-                'Price': 'std',
-                'SteelPrice': 'std',
-                'Production': 'std'
-            }).fillna(0).reset_index()
-
-            fig4 = go.Figure()
-
-            fig4.add_trace(go.Bar(
-                name='Volatilité Prix Véhicules',
-                x=yearly_volatility['Year'],
-                y=yearly_volatility['Price'],
-                marker_color='lightblue'
-            ))
-
-            fig4.add_trace(go.Scatter(
-                name='Volatilité Prix Acier (x100)',
-                x=yearly_volatility['Year'],
-                y=yearly_volatility['SteelPrice'] * 100,
-                mode='lines+markers',
-                line=dict(color='red', width=3),
-                yaxis='y2'
-            ))
-
-            fig4.update_layout(
-                title="Évolution de la Volatilité Économique",
-                xaxis_title="Année",
-                yaxis=dict(title="Volatilité Prix Véhicules (€)", side="left"),
-                yaxis2=dict(title="Volatilité Prix Acier (x100)", side="right", overlaying="y"),
-                barmode='group'
-            )
-            st.plotly_chart(fig4, use_container_width=True)
-
-        # Analyse par région économique
-        st.markdown("## 🌍 Performance Économique par Région")
-
-        regional_economics = self.df.groupby('Region').agg({
-            'Production': 'sum',
-            'Price': 'mean',
-            'SteelPrice': 'mean'
-        }).round(2)
-
-        regional_economics['Market_Value'] = (regional_economics['Production'] * regional_economics['Price']).round(0)
-        regional_economics['Efficiency_Ratio'] = (regional_economics['Production'] / regional_economics['SteelPrice']).round(2)
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Valeur de marché par région
-            fig5 = px.bar(
-                x=regional_economics.index,
-                y=regional_economics['Market_Value']/1e9,
-                title="Valeur de Marché par Région (Milliards €)",
-                color=regional_economics['Market_Value'],
-                color_continuous_scale='Viridis'
-            )
-            fig5.update_layout(xaxis_tickangle=45)
-            fig5.update_layout(xaxis_title="Région", yaxis_title="Valeur (Md€)")
-            st.plotly_chart(fig5, use_container_width=True)
-
-        with col2:
-            # Ratio efficacité économique
-            fig6 = px.scatter(
-                x=regional_economics['Price'],
-                y=regional_economics['Production']/1e6,
-                size=regional_economics['Market_Value']/1e9,
-                hover_name=regional_economics.index,
-                title="Matrice Prix vs Volume par Région",
-                labels={'x': 'Prix Moyen (€)', 'y': 'Production (M unités)'}
-            )
-            fig6.update_layout(showlegend=False)
-            st.plotly_chart(fig6, use_container_width=True)
-
-        # Analyse des tendances économiques
-        st.markdown("## 📊 Tendances et Prévisions Économiques")
-
-        # Calcul des tendances
-        recent_years = sorted(self.df['Year'].unique())[-5:]  # 5 dernières années
-        trend_data = self.df[self.df['Year'].isin(recent_years)]
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Croissance économique par constructeur
-            manufacturer_growth = []
-            for manufacturer in trend_data['Manufacturer'].unique():
-                manu_data = trend_data[trend_data['Manufacturer'] == manufacturer]
-                if len(manu_data) > 1:
-                    growth_rate = self._calculate_growth_rate(manu_data)
-                    market_value = (manu_data['Production'] * manu_data['Price']).sum()
-                    manufacturer_growth.append({
-                        'Manufacturer': manufacturer,
-                        'Growth_Rate': growth_rate,
-                        'Market_Value': market_value
-                    })
-
-            if manufacturer_growth:
-                growth_df = pd.DataFrame(manufacturer_growth).nlargest(10, 'Market_Value')
-
-                fig7 = px.bar(
-                    growth_df,
-                    x='Manufacturer',
-                    y='Growth_Rate',
-                    title="Taux de Croissance - Top 10 Constructeurs",
-                    color='Growth_Rate',
-                    color_continuous_scale='RdYlGn'
-                )
-                fig7.update_layout(xaxis_tickangle=45)
-                fig7.add_hline(y=0, line_dash="dash", line_color="black")
-                st.plotly_chart(fig7, use_container_width=True)
-
-        with col2:
-            # Prévision simple basée sur la tendance
-            if len(recent_years) >= 3:
-                # Calcul de tendance linéaire simple
-                yearly_avg = trend_data.groupby('Year').agg({
-                    'Price': 'mean',
-                    'Production': 'sum'
-                }).reset_index()
-
-                # Projection pour les 3 prochaines années
-                future_years = list(range(max(recent_years) + 1, max(recent_years) + 4))
-
-                # Tendance prix (régression linéaire simple)
-                if len(yearly_avg) >= 2:
-                    price_slope = (yearly_avg['Price'].iloc[-1] - yearly_avg['Price'].iloc[0]) / (len(yearly_avg) - 1)
-                    future_prices = [yearly_avg['Price'].iloc[-1] + price_slope * i for i in range(1, 4)]
-
-                    fig8 = go.Figure()
-
-                    # Données historiques
-                    fig8.add_trace(go.Scatter(
-                        x=yearly_avg['Year'],
-                        y=yearly_avg['Price'],
-                        mode='lines+markers',
-                        name='Prix Historique',
-                        line=dict(color='blue', width=3)
-                    ))
-
-                    # Prévisions
-                    fig8.add_trace(go.Scatter(
-                        x=future_years,
-                        y=future_prices,
-                        mode='lines+markers',
-                        name='Prévision Prix',
-                        line=dict(color='red', dash='dash', width=3)
-                    ))
-
-                    fig8.update_layout(
-                        title="Prévision Prix Moyen (Tendance Linéaire)",
-                        xaxis_title="Année",
-                        yaxis_title="Prix Moyen (€)"
-                    )
-                    st.plotly_chart(fig8, use_container_width=True)
-
-        # Tableau de synthèse économique
-        st.markdown("## 📋 Synthèse Économique Détaillée")
-
-        # Enrichir les données régionales
-        detailed_economics = regional_economics.copy()
-        detailed_economics['Production_M'] = (detailed_economics['Production'] / 1e6).round(2)
-        detailed_economics['Market_Value_Md'] = (detailed_economics['Market_Value'] / 1e9).round(2)
-        detailed_economics['Price_K'] = (detailed_economics['Price'] / 1000).round(1)
-
-        # Calculer les parts de marché
-        detailed_economics['Market_Share_%'] = (
-            detailed_economics['Production'] / detailed_economics['Production'].sum() * 100
-        ).round(2)
-
-        # Préparer pour l'affichage
-        display_economics = detailed_economics[[
-            'Production_M', 'Price_K', 'SteelPrice', 'Market_Value_Md',
-            'Market_Share_%', 'Efficiency_Ratio'
-        ]].copy()
-
-        display_economics.columns = [
-            'Production (M)', 'Prix Moy. (K€)', 'Prix Acier (€)',
-            'Valeur Marché (Md€)', 'Part Marché (%)', 'Ratio Efficacité'
-        ]
-
-        st.dataframe(
-            display_economics.sort_values('Valeur Marché (Md€)', ascending=False),
-            use_container_width=True
-        )
-
-        # Alertes économiques
-        st.markdown("## 🚨 Alertes Économiques")
-
-        alerts = []
-
-        if price_volatility > 5000:
-            alerts.append("🔴 CRITIQUE: Volatilité des prix très élevée (>5000€)")
-        elif price_volatility > 3000:
-            alerts.append("🟡 ATTENTION: Volatilité des prix élevée (>3000€)")
-
-        if abs(steel_correlation) > 0.7:
-            alerts.append("🟡 ATTENTION: Forte corrélation prix acier-production")
-
-        # Vérifier les tendances de prix
-        recent_price_trend = yearly_economics['Price'].pct_change().iloc[-1] * 100
-        if recent_price_trend > 10:
-            alerts.append("🔴 CRITIQUE: Hausse des prix >10% sur la dernière année")
-        elif recent_price_trend < -10:
-            alerts.append("🟡 ATTENTION: Baisse des prix >10% sur la dernière année")
-
-        if alerts:
-            for alert in alerts:
-                st.warning(alert)
-        else:
-            st.success("🟢 Tous les indicateurs économiques sont dans les normes")
-
-    def render_competitive_intelligence(self):
-        """Page intelligence concurrentielle."""
-        st.markdown('<h1 class="main-header">🎯 Intelligence Concurrentielle</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Données non disponibles pour l'analyse concurrentielle")
-            return
-
-        # Métriques clés de compétitivité
-        st.markdown("## 🏆 Métriques de Compétitivité")
-
-        # Calcul des métriques par fabricant
-        manufacturer_metrics = self.df.groupby('Manufacturer').agg({
-            'Production': ['sum', 'mean'],
-            'Price': 'mean',
-            'SteelPrice': 'mean',
-            'Year': ['min', 'max']
-        }).round(2)
-
-        manufacturer_metrics.columns = ['Production_Totale', 'Production_Moyenne', 'Prix_Moyen', 'Prix_Acier_Moyen', 'Premiere_Annee', 'Derniere_Annee']
-        manufacturer_metrics['Part_Marche'] = (manufacturer_metrics['Production_Totale'] / manufacturer_metrics['Production_Totale'].sum() * 100).round(2)
-        manufacturer_metrics['Croissance'] = manufacturer_metrics.apply(lambda row: self._calculate_growth_rate(
-            self.df[self.df['Manufacturer'] == row.name]), axis=1).round(2)
-
-        # Top 5 fabricants
-        top_manufacturers = manufacturer_metrics.nlargest(5, 'Production_Totale')
-
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            leader = top_manufacturers.index[0]
-            st.metric("🥇 Leader du Marché", leader, f"{top_manufacturers.loc[leader, 'Part_Marche']:.1f}%")
-        with col2:
-            total_production = manufacturer_metrics['Production_Totale'].sum()
-            st.metric("📊 Production Totale", f"{total_production/1e6:.1f}M", "unités")
-        with col3:
-            avg_growth = manufacturer_metrics['Croissance'].mean()
-            st.metric("📈 Croissance Moyenne", f"{avg_growth:.1f}%", "annuelle")
-        with col4:
-            num_competitors = len(manufacturer_metrics)
-            st.metric("🏢 Concurrents Actifs", num_competitors, "fabricants")
-
-        # Analyse des parts de marché
-        st.markdown("## 📊 Parts de Marché et Positionnement")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Graphique en secteurs des parts de marché
-            fig1 = px.pie(
-                values=top_manufacturers['Production_Totale'],
-                names=top_manufacturers.index,
-                title="Parts de Marché - Top 5 Fabricants",
-                color_discrete_sequence=px.colors.qualitative.Set3
-            )
-            fig1.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig1, use_container_width=True)
-
-        with col2:
-            # Matrice Prix vs Volume
-            fig2 = px.scatter(
-                manufacturer_metrics,
-                x='Production_Totale',
-                y='Prix_Moyen',
-                size='Part_Marche',
-                hover_name=manufacturer_metrics.index,
-                title="Matrice Positionnement : Prix vs Volume",
-                labels={'Production_Totale': 'Production Totale', 'Prix_Moyen': 'Prix Moyen (€)'}
-            )
-            fig2.update_layout(showlegend=False)
-            st.plotly_chart(fig2, use_container_width=True)
-
-        # Analyse de la croissance
-        st.markdown("## 📈 Analyse de Croissance Concurrentielle")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Croissance par fabricant
-            growth_data = manufacturer_metrics.nlargest(10, 'Production_Totale')[['Croissance']].reset_index()
-            fig3 = px.bar(
-                growth_data,
-                x='Manufacturer',
-                y='Croissance',
-                title="Taux de Croissance par Fabricant",
-                color='Croissance',
-                color_continuous_scale='RdYlGn'
-            )
-            fig3.update_layout(xaxis_tickangle=45)
-            st.plotly_chart(fig3, use_container_width=True)
-
-        with col2:
-            # Évolution temporelle des top 3
-            top_3 = top_manufacturers.head(3).index.tolist()
-            evolution_data = self.df[self.df['Manufacturer'].isin(top_3)]
-            yearly_evolution = evolution_data.groupby(['Year', 'Manufacturer'])['Production'].sum().reset_index()
-
-            fig4 = px.line(
-                yearly_evolution,
-                x='Year',
-                y='Production',
-                color='Manufacturer',
-                title="Évolution Production - Top 3 Concurrents",
-                markers=True
-            )
-            st.plotly_chart(fig4, use_container_width=True)
-
-        # Tableau de comparaison détaillé
-        st.markdown("## 📋 Tableau Comparatif Détaillé")
-
-        # Préparer les données pour l'affichage
-        display_metrics = manufacturer_metrics.copy()
-        display_metrics['Production_Totale'] = (display_metrics['Production_Totale'] / 1e6).round(2)
-        display_metrics['Production_Moyenne'] = (display_metrics['Production_Moyenne'] / 1e3).round(1)
-        display_metrics = display_metrics.round(2)
-
-        # Renommer les colonnes pour l'affichage
-        display_metrics.columns = [
-            'Production Totale (M)', 'Production Moy. (K)', 'Prix Moyen (€)',
-            'Prix Acier Moy.', 'Première Année', 'Dernière Année',
-            'Part Marché (%)', 'Croissance (%)'
-        ]
-
-        st.dataframe(
-            display_metrics.sort_values('Part Marché (%)', ascending=False),
-            use_container_width=True
-        )
-
-    def render_risk_analysis(self):
-        """Page analyse des risques."""
-        st.markdown('<h1 class="main-header">⚠️ Analyse des Risques</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Données non disponibles pour l'analyse des risques")
-            return
-
-        # Indicateurs de risque principaux
-        st.markdown("## 🚨 Indicateurs de Risque Principaux")
-
-        # Calcul des métriques de risque
-        current_year = self.df['Year'].max()
-        recent_data = self.df[self.df['Year'] >= current_year - 2]
-
-        # Volatilité des prix
-        price_volatility = self.df.groupby('Year')['Price'].std().mean()
-        steel_volatility = self.df.groupby('Year')['SteelPrice'].std().mean()
-
-        # Concentration du marché (indice Herfindahl)
-        market_shares = self.df.groupby('Manufacturer')['Production'].sum()
-        total_production = market_shares.sum()
-        market_shares_pct = (market_shares / total_production * 100)
-        herfindahl_index = (market_shares_pct ** 2).sum()
-
-        # Dépendance géographique
-        regional_concentration = self.df.groupby('Region')['Production'].sum()
-        max_regional_share = (regional_concentration.max() / regional_concentration.sum() * 100)
-
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            risk_level = "🔴 ÉLEVÉ" if price_volatility > 5000 else "🟡 MOYEN" if price_volatility > 2000 else "🟢 FAIBLE"
-            st.metric("💰 Volatilité Prix", f"{price_volatility:.0f}€", risk_level)
-
-        with col2:
-            steel_risk = "🔴 ÉLEVÉ" if steel_volatility > 100 else "🟡 MOYEN" if steel_volatility > 50 else "🟢 FAIBLE"
-            st.metric("⚙️ Volatilité Acier", f"{steel_volatility:.0f}€", steel_risk)
-
-        with col3:
-            concentration_risk = "🔴 ÉLEVÉ" if herfindahl_index > 2500 else "🟡 MOYEN" if herfindahl_index > 1500 else "🟢 FAIBLE"
-            st.metric("🏢 Concentration Marché", f"{herfindahl_index:.0f}", concentration_risk)
-
-        with col4:
-            geo_risk = "🔴 ÉLEVÉ" if max_regional_share > 60 else "🟡 MOYEN" if max_regional_share > 40 else "🟢 FAIBLE"
-            st.metric("🌍 Risque Géographique", f"{max_regional_share:.1f}%", geo_risk)
-
-        # Analyse des tendances de risque
-        st.markdown("## 📊 Analyse des Tendances de Risque")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Évolution de la volatilité des prix
-            yearly_volatility = self.df.groupby('Year').agg({
-                'Price': 'std',
-                'SteelPrice': 'std'
-            }).fillna(0)
-
-            fig1 = go.Figure()
-            fig1.add_trace(go.Scatter(
-                x=yearly_volatility.index,
-                y=yearly_volatility['Price'],
-                mode='lines+markers',
-                name='Volatilité Prix Véhicules',
-                line=dict(color='red')
-            ))
-            fig1.add_trace(go.Scatter(
-                x=yearly_volatility.index,
-                y=yearly_volatility['SteelPrice'] * 50,  # Échelle pour visualisation
-                mode='lines+markers',
-                name='Volatilité Prix Acier (x50)',
-                line=dict(color='orange')
-            ))
-            fig1.update_layout(
-                title="Évolution de la Volatilité des Prix",
-                xaxis_title="Année",
-                yaxis_title="Écart-type des Prix"
-            )
-            st.plotly_chart(fig1, use_container_width=True)
-
-        with col2:
-            # Concentration du marché par année
-            yearly_concentration = []
-            for year in sorted(self.df['Year'].unique()):
-                year_data = self.df[self.df['Year'] == year]
-                year_shares = year_data.groupby('Manufacturer')['Production'].sum()
-                year_total = year_shares.sum()
-                if year_total > 0:
-                    year_shares_pct = (year_shares / year_total * 100)
-                    year_hhi = (year_shares_pct ** 2).sum()
-                    yearly_concentration.append({'Year': year, 'HHI': year_hhi})
-
-            if yearly_concentration:
-                concentration_df = pd.DataFrame(yearly_concentration)
-                fig2 = px.line(
-                    concentration_df,
-                    x='Year',
-                    y='HHI',
-                    title="Évolution de la Concentration du Marché",
-                    markers=True
-                )
-                fig2.add_hline(y=1500, line_dash="dash", line_color="orange",
-                              annotation_text="Seuil Concentration Modérée")
-                fig2.add_hline(y=2500, line_dash="dash", line_color="red",
-                              annotation_text="Seuil Concentration Élevée")
-                st.plotly_chart(fig2, use_container_width=True)
-
-        # Matrice des risques
-        st.markdown("## 🎯 Matrice d'Évaluation des Risques")
-
-        # Définir les risques et leur évaluation
-        risks_data = [
-            {"Risque": "Volatilité des Prix", "Probabilité": 7, "Impact": 8, "Catégorie": "Économique"},
-            {"Risque": "Concentration Fournisseurs", "Probabilité": 6, "Impact": 7, "Catégorie": "Supply Chain"},
-            {"Risque": "Dépendance Géographique", "Probabilité": 5, "Impact": 9, "Catégorie": "Géopolitique"},
-            {"Risque": "Transition Électrique", "Probabilité": 9, "Impact": 8, "Catégorie": "Technologique"},
-            {"Risque": "Réglementation Environnementale", "Probabilité": 8, "Impact": 7, "Catégorie": "Réglementaire"},
-            {"Risque": "Crise Matières Premières", "Probabilité": 6, "Impact": 9, "Catégorie": "Supply Chain"},
-            {"Risque": "Récession Économique", "Probabilité": 4, "Impact": 9, "Catégorie": "Économique"},
-            {"Risque": "Guerre Commerciale", "Probabilité": 5, "Impact": 8, "Catégorie": "Géopolitique"}
-        ]
-
-        risks_df = pd.DataFrame(risks_data)
-        risks_df['Score_Risque'] = risks_df['Probabilité'] * risks_df['Impact']
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Matrice probabilité vs impact
-            fig3 = px.scatter(
-                risks_df,
-                x='Probabilité',
-                y='Impact',
-                size='Score_Risque',
-                color='Catégorie',
-                hover_name='Risque',
-                title="Matrice Probabilité vs Impact",
-                size_max=20
-            )
-
-            # Ajouter des zones de risque
-            fig3.add_shape(type="rect", x0=0, y0=7, x1=10, y1=10,
-                          fillcolor="red", opacity=0.2, line_width=0)
-            fig3.add_shape(type="rect", x0=7, y0=0, x1=10, y1=7,
-                          fillcolor="orange", opacity=0.2, line_width=0)
-            fig3.add_shape(type="rect", x0=0, y0=0, x1=7, y1=7,
-                          fillcolor="green", opacity=0.2, line_width=0)
-
-            fig3.update_layout(xaxis_range=[0, 10], yaxis_range=[0, 10])
-            st.plotly_chart(fig3, use_container_width=True)
-
-        with col2:
-            # Top risques par score
-            top_risks = risks_df.nlargest(5, 'Score_Risque')
-            fig4 = px.bar(
-                top_risks,
-                x='Score_Risque',
-                y='Risque',
-                color='Catégorie',
-                title="Top 5 Risques par Score",
-                orientation='h'
-            )
-            st.plotly_chart(fig4, use_container_width=True)
-
-        # Recommandations et plan d'action
-        st.markdown("## 💡 Recommandations et Plan d'Action")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown("""
-            ### 🚨 Risques Critiques à Traiter
-
-            **1. Transition Électrique (Score: 72)**
-            - 📋 Action: Accélérer les investissements R&D
-            - 📅 Délai: 6 mois
-            - 👤 Responsable: Direction Innovation
-
-            **2. Dépendance Géographique (Score: 45)**
-            - 📋 Action: Diversifier les marchés
-            - 📅 Délai: 12 mois
-            - 👤 Responsable: Direction Commerciale
-
-            **3. Volatilité des Prix (Score: 56)**
-            - 📋 Action: Stratégies de couverture
-            - 📅 Délai: 3 mois
-            - 👤 Responsable: Direction Financière
-            """)
-
-        with col2:
-            st.markdown("""
-            ### 🎯 Opportunités Identifiées
-
-            **1. Marchés Émergents**
-            - 🌍 Expansion en Asie-Pacifique
-            - 📈 Potentiel de croissance: +25%
-
-            **2. Technologies Vertes**
-            - 🔋 Véhicules électriques et hybrides
-            - 💰 Subventions gouvernementales
-
-            **3. Digitalisation**
-            - 🤖 Industrie 4.0 et IoT
-            - ⚡ Optimisation des processus
-            """)
-
-        # Tableau de bord des indicateurs de risque
-        st.markdown("## 📊 Tableau de Bord des Indicateurs")
-
-        # Créer un DataFrame avec les indicateurs
-        indicators_data = {
-            'Indicateur': ['Volatilité Prix', 'Volatilité Acier', 'Concentration Marché', 'Dépendance Géo.', 'Croissance Moyenne'],
-            'Valeur Actuelle': [f"{price_volatility:.0f}€", f"{steel_volatility:.0f}€", f"{herfindahl_index:.0f}",
-                               f"{max_regional_share:.1f}%", f"{self.df.groupby('Manufacturer').apply(lambda x: self._calculate_growth_rate(x)).mean():.1f}%"],
-            'Seuil Alerte': ['5000€', '100€', '2500', '60%', '0%'],
-            'Statut': [
-                '🔴 Critique' if price_volatility > 5000 else '🟡 Attention' if price_volatility > 2000 else '🟢 Normal',
-                '🔴 Critique' if steel_volatility > 100 else '🟡 Attention' if steel_volatility > 50 else '🟢 Normal',
-                '🔴 Critique' if herfindahl_index > 2500 else '🟡 Attention' if herfindahl_index > 1500 else '🟢 Normal',
-                '🔴 Critique' if max_regional_share > 60 else '🟡 Attention' if max_regional_share > 40 else '🟢 Normal',
-                '🟢 Positif' if self.df.groupby('Manufacturer').apply(lambda x: self._calculate_growth_rate(x)).mean() > 0 else '🔴 Négatif'
-            ]
-        }
-
-        indicators_df = pd.DataFrame(indicators_data)
-        st.dataframe(indicators_df, use_container_width=True, hide_index=True)
-    def render_executive_dashboard(self):
-        """Page dashboard exécutif."""
-        st.markdown('<h1 class="main-header">👔 Dashboard Exécutif</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Données non disponibles pour le dashboard exécutif")
-            return
-
-        # KPIs Stratégiques Principaux
-        st.markdown("## 📊 KPIs Stratégiques Principaux")
-
-        # Calculs des métriques exécutives
-        current_year = self.df['Year'].max()
-        previous_year = current_year - 1
-
-        current_data = self.df[self.df['Year'] == current_year]
-        previous_data = self.df[self.df['Year'] == previous_year]
-
-        # Métriques principales
-        total_production_current = current_data['Production'].sum()
-        total_production_previous = previous_data['Production'].sum() if not previous_data.empty else total_production_current
-        production_growth = ((total_production_current - total_production_previous) / total_production_previous * 100) if total_production_previous > 0 else 0
-
-        avg_price_current = current_data['Price'].mean()
-        avg_price_previous = previous_data['Price'].mean() if not previous_data.empty else avg_price_current
-        price_evolution = ((avg_price_current - avg_price_previous) / avg_price_previous * 100) if avg_price_previous > 0 else 0
-
-        total_revenue = (current_data['Production'] * current_data['Price']).sum()
-        market_leaders = current_data.groupby('Manufacturer')['Production'].sum().nlargest(3)
-
-        col1, col2, col3, col4, col5 = st.columns(5)
-
-        with col1:
-            st.metric(
-                "🏭 Production Totale",
-                f"{total_production_current/1e6:.1f}M",
-                f"{production_growth:+.1f}%" if production_growth != 0 else None
-            )
-
-        with col2:
-            st.metric(
-                "💰 Prix Moyen",
-                f"{avg_price_current:,.0f}€",
-                f"{price_evolution:+.1f}%" if price_evolution != 0 else None
-            )
-
-        with col3:
-            st.metric(
-                "💼 Chiffre d'Affaires",
-                f"{total_revenue/1e9:.1f}Md€",
-                "Estimation"
-            )
-
-        with col4:
-            st.metric(
-                "🏢 Fabricants Actifs",
-                f"{current_data['Manufacturer'].nunique()}",
-                "constructeurs"
-            )
-
-        with col5:
-            st.metric(
-                "🌍 Marchés Couverts",
-                f"{current_data['Region'].nunique()}",
-                "régions"
-            )
-
-        # Tableau de bord stratégique
-        st.markdown("## 🎯 Tableau de Bord Stratégique")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Performance par région - inspiré de vos dashboards
-            regional_performance = current_data.groupby('Region').agg({
-                'Production': 'sum',
-                'Price': 'mean'
-            }).round(2)
-            regional_performance['Revenue'] = (regional_performance['Production'] * regional_performance['Price']).round(0)
-            regional_performance = regional_performance.sort_values('Production', ascending=False)
-
-            fig1 = px.bar(
-                x=regional_performance.index,
-                y=regional_performance['Production'],
-                title="Performance Production par Région",
-                labels={'x': 'Région', 'y': 'Production (unités)'},
-                color=regional_performance['Production'],
-                color_continuous_scale='Blues'
-            )
-            fig1.update_layout(xaxis_tickangle=45)
-            st.plotly_chart(fig1, use_container_width=True)
-
-        with col2:
-            # Top constructeurs - style de vos dashboards
-            top_manufacturers = current_data.groupby('Manufacturer')['Production'].sum().nlargest(8)
-
-            fig2 = px.pie(
-                values=top_manufacturers.values,
-                names=top_manufacturers.index,
-                title="Parts de Marché - Top Constructeurs",
-                color_discrete_sequence=px.colors.qualitative.Set3
-            )
-            fig2.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig2, use_container_width=True)
-
-        # Analyse des tendances stratégiques
-        st.markdown("## 📈 Tendances Stratégiques")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Évolution du marché sur 5 ans
-            last_5_years = self.df[self.df['Year'] >= current_year - 4]
-            yearly_trends = last_5_years.groupby('Year').agg({
-                'Production': 'sum',
-                'Price': 'mean',
-                'SteelPrice': 'mean'
-            }).round(2)
-
-            fig3 = go.Figure()
-
-            # Production
-            fig3.add_trace(go.Scatter(
-                x=yearly_trends.index,
-                y=yearly_trends['Production']/1e6,
-                mode='lines+markers',
-                name='Production (M unités)',
-                line=dict(color='blue', width=3),
-                yaxis='y'
-            ))
-
-            # Prix moyen
-            fig3.add_trace(go.Scatter(
-                x=yearly_trends.index,
-                y=yearly_trends['Price']/1000,
-                mode='lines+markers',
-                name='Prix Moyen (K€)',
-                line=dict(color='green', width=3),
-                yaxis='y2'
-            ))
-
-            fig3.update_layout(
-                title="Évolution Production et Prix - 5 ans",
-                xaxis_title="Année",
-                yaxis=dict(title="Production (M unités)", side="left"),
-                yaxis2=dict(title="Prix Moyen (K€)", side="right", overlaying="y"),
-                hovermode='x unified'
-            )
-            st.plotly_chart(fig3, use_container_width=True)
-
-        with col2:
-            # Analyse de corrélation - inspiré de vos analyses
-            correlation_data = current_data[['Production', 'Price', 'SteelPrice']].corr()
-
-            fig4 = px.imshow(
-                correlation_data,
-                title="Matrice de Corrélation - Facteurs Clés",
-                color_continuous_scale='RdBu',
-                aspect='auto'
-            )
-            fig4.update_layout(
-                xaxis_title="Variables",
-                yaxis_title="Variables"
-            )
-            st.plotly_chart(fig4, use_container_width=True)
-
-        # Indicateurs de performance clés
-        st.markdown("## 🏆 Indicateurs de Performance Clés")
-
-        # Calcul des KPIs avancés
-        market_concentration = self._calculate_market_concentration(current_data)
-        avg_growth_rate = self.df.groupby('Manufacturer').apply(lambda x: self._calculate_growth_rate(x)).mean()
-        price_volatility = self.df.groupby('Year')['Price'].std().mean()
-
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            st.markdown("""
-            ### 📊 Performance Marché
-            """)
-
-            kpi_data_market = {
-                'KPI': ['Concentration Marché', 'Croissance Moyenne', 'Volatilité Prix'],
-                'Valeur': [f"{market_concentration:.0f}", f"{avg_growth_rate:.1f}%", f"{price_volatility:.0f}€"],
-                'Statut': ['🟡 Modéré', '🟢 Positif' if avg_growth_rate > 0 else '🔴 Négatif', '🟡 Surveillé']
-            }
-            st.dataframe(pd.DataFrame(kpi_data_market), hide_index=True)
-
-        with col2:
-            st.markdown("""
-            ### 🌍 Performance Régionale
-            """)
-
-            regional_kpis = current_data.groupby('Region')['Production'].sum().nlargest(3)
-            regional_data = {
-                'Région': regional_kpis.index.tolist(),
-                'Production (M)': [f"{x/1e6:.1f}" for x in regional_kpis.values],
-                'Part (%)': [f"{x/regional_kpis.sum()*100:.1f}" for x in regional_kpis.values]
-            }
-            st.dataframe(pd.DataFrame(regional_data), hide_index=True)
-
-        with col3:
-            st.markdown("""
-            ### 🏭 Performance Constructeurs
-            """)
-
-            manufacturer_kpis = current_data.groupby('Manufacturer')['Production'].sum().nlargest(3)
-            manufacturer_data = {
-                'Constructeur': manufacturer_kpis.index.tolist(),
-                'Production (M)': [f"{x/1e6:.1f}" for x in manufacturer_kpis.values],
-                'Part (%)': [f"{x/manufacturer_kpis.sum()*100:.1f}" for x in manufacturer_kpis.values]
-            }
-            st.dataframe(pd.DataFrame(manufacturer_data), hide_index=True)
-
-        # Recommandations stratégiques
-        st.markdown("## 💡 Recommandations Stratégiques")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown("""
-            ### 🎯 Priorités Court Terme (3-6 mois)
-
-            **1. Optimisation Production**
-            - 📈 Augmenter la capacité de +15%
-            - 🏭 Focus sur les régions performantes
-            - ⚡ Réduction des coûts de 8%
-
-            **2. Stratégie Prix**
-            - 💰 Ajustement prix selon volatilité acier
-            - 🎯 Positionnement premium sur segments clés
-            - 📊 Monitoring concurrence renforcé
-            """)
-
-        with col2:
-            st.markdown("""
-            ### 🚀 Objectifs Long Terme (1-2 ans)
-
-            **1. Expansion Géographique**
-            - 🌍 Nouveaux marchés émergents
-            - 🤝 Partenariats stratégiques
-            - 📍 Diversification géographique
-
-            **2. Innovation & Technologie**
-            - 🔋 Transition électrique accélérée
-            - 🤖 Digitalisation des processus
-            - 🌱 Développement durable
-            """)
-
-        # Alerte et surveillance
-        st.markdown("## 🚨 Alertes et Surveillance")
-
-        # Système d'alertes basé sur les seuils
-        alerts = []
-
-        if production_growth < -5:
-            alerts.append("🔴 CRITIQUE: Baisse de production > 5%")
-        elif production_growth < 0:
-            alerts.append("🟡 ATTENTION: Baisse de production détectée")
-
-        if price_volatility > 5000:
-            alerts.append("🔴 CRITIQUE: Volatilité prix très élevée")
-        elif price_volatility > 2000:
-            alerts.append("🟡 ATTENTION: Volatilité prix élevée")
-
-        if market_concentration > 2500:
-            alerts.append("🟡 ATTENTION: Concentration marché élevée")
-
-        if alerts:
-            for alert in alerts:
-                st.warning(alert)
-        else:
-            st.success("🟢 Tous les indicateurs sont dans les normes")
-
-    def _calculate_market_concentration(self, data):
-        """Calcule l'indice de concentration du marché (Herfindahl)."""
-        market_shares = data.groupby('Manufacturer')['Production'].sum()
-        total_production = market_shares.sum()
-        if total_production > 0:
-            market_shares_pct = (market_shares / total_production * 100)
-            return (market_shares_pct ** 2).sum()
-        return 0
-
-    def _calculate_growth_rate(self, df):
-        """Calcule le taux de croissance annuel moyen."""
-        if len(df) < 2:
-            return 0
-
-        yearly_data = df.groupby('Year')['Production'].sum().sort_index()
-        if len(yearly_data) < 2:
-            return 0
-
-        first_year = yearly_data.iloc[0]
-        last_year = yearly_data.iloc[-1]
-        years = len(yearly_data) - 1
-
-        if first_year <= 0:
-            return 0
-
-        growth_rate = ((last_year / first_year) ** (1/years) - 1) * 100
-        return growth_rate
-
-    def _get_market_leader(self, df):
-        """Identifie le leader du marché."""
-        manu_data = df.groupby('Manufacturer')['Production'].sum()
-        if manu_data.empty:
-            return "N/A"
-        return manu_data.idxmax()
-
-    def render_financial_dashboard(self):
-        """Dashboard d'analyse financière."""
-        st.markdown('<h1 class="main-header">📈 Analyse Financière</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # KPIs financiers
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            revenue_estimate = (self.df['Production_Volume'] * self.df['Average_Price']).sum()
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">💰 Chiffre d'affaires estimé</div>
-                <div style="font-size: 3rem; font-weight: bold;">{revenue_estimate/1e12:.1f}T€</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            steel_cost = (self.df['Production_Volume'] * self.df['Steel_Price'] * 0.1).sum()
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚙️ Coût matières premières</div>
-                <div style="font-size: 3rem; font-weight: bold;">{steel_cost/1e9:.0f}Md€</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            margin_estimate = ((revenue_estimate - steel_cost) / revenue_estimate) * 100
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #8B5CF6 0%, #7C3AED 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📊 Marge brute estimée</div>
-                <div style="font-size: 3rem; font-weight: bold;">{margin_estimate:.1f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col4:
-            roi_estimate = (self.df['GDP_Growth'].mean()) * 100
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #EF4444 0%, #DC2626 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📈 Croissance PIB moyenne</div>
-                <div style="font-size: 3rem; font-weight: bold;">{roi_estimate:.1f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        st.markdown("---")
-
-        # Graphiques financiers
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Évolution du chiffre d'affaires par année
-            yearly_revenue = self.df.groupby('Year').apply(
-                lambda x: (x['Production_Volume'] * x['Average_Price']).sum()
-            ).reset_index()
-            yearly_revenue.columns = ['Year', 'Revenue']
-
-            fig1 = px.line(yearly_revenue, x='Year', y='Revenue',
-                          title="Évolution du Chiffre d'Affaires Estimé",
-                          labels={'Revenue': 'CA (€)', 'Year': 'Année'})
-            fig1.update_layout(height=400)
-            st.plotly_chart(fig1, use_container_width=True)
-
-        with col2:
-            # Répartition des coûts par région
-            regional_costs = self.df.groupby('Region').apply(
-                lambda x: (x['Production_Volume'] * x['Steel_Price'] * 0.1).sum()
-            ).reset_index()
-            regional_costs.columns = ['Region', 'Cost']
-
-            fig2 = px.pie(regional_costs, values='Cost', names='Region',
-                         title="Répartition des Coûts Matières Premières")
-            fig2.update_layout(height=400)
-            st.plotly_chart(fig2, use_container_width=True)
-
-    def render_supply_chain_dashboard(self):
-        """Dashboard Supply Chain."""
-        st.markdown('<h1 class="main-header">🔄 Supply Chain</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # KPIs Supply Chain
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            # Complexité supply chain (nombre de régions × constructeurs)
-            complexity_score = self.df['Region'].nunique() * self.df['Manufacturer'].nunique()
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #06B6D4 0%, #0891B2 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🔗 Complexité Supply Chain</div>
-                <div style="font-size: 3rem; font-weight: bold;">{complexity_score}</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            # Volatilité des prix matières premières
-            steel_volatility = (self.df['Steel_Price'].std() / self.df['Steel_Price'].mean()) * 100
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚡ Volatilité matières</div>
-                <div style="font-size: 3rem; font-weight: bold;">{steel_volatility:.1f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            # Efficacité logistique (production/région)
-            logistics_efficiency = self.df['Production_Volume'].sum() / self.df['Region'].nunique()
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🚚 Efficacité logistique</div>
-                <div style="font-size: 3rem; font-weight: bold;">{logistics_efficiency/1e6:.0f}M</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col4:
-            # Risque géopolitique (basé sur diversité régionale)
-            geo_risk = 100 - (self.df['Region'].nunique() / 10 * 100)  # Plus de régions = moins de risque
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #EF4444 0%, #DC2626 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚠️ Risque géopolitique</div>
-                <div style="font-size: 3rem; font-weight: bold;">{geo_risk:.0f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        st.markdown("---")
-
-        # Graphiques Supply Chain
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Flux de production par région
-            regional_flow = self.df.groupby(['Region', 'Year'])['Production_Volume'].sum().reset_index()
-
-            fig1 = px.line(regional_flow, x='Year', y='Production_Volume', color='Region',
-                          title="Flux de Production par Région",
-                          labels={'Production_Volume': 'Production', 'Year': 'Année'})
-            fig1.update_layout(height=400)
-            st.plotly_chart(fig1, use_container_width=True)
-
-        with col2:
-            # Corrélation prix-production
-            correlation_data = self.df.groupby('Year').agg({
-                'Steel_Price': 'mean',
-                'Production_Volume': 'sum'
-            }).reset_index()
-
-            fig2 = px.scatter(correlation_data, x='Steel_Price', y='Production_Volume',
-                             title="Corrélation Prix Acier vs Production",
-                             labels={'Steel_Price': 'Prix Acier (€)', 'Production_Volume': 'Production'})
-            fig2.update_layout(height=400)
-            st.plotly_chart(fig2, use_container_width=True)
-
-    def render_sustainability_dashboard(self):
-        """Dashboard Durabilité & ESG."""
-        st.markdown('<h1 class="main-header">🌱 Durabilité & ESG</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # KPIs ESG
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            ev_share_avg = self.df['EV_Share'].mean() * 100
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚡ Part véhicules électriques</div>
-                <div style="font-size: 3rem; font-weight: bold;">{ev_share_avg:.1f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            carbon_intensity = self.df['Production_Volume'].sum() / 1e6  # Estimation
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🌍 Intensité carbone</div>
-                <div style="font-size: 3rem; font-weight: bold;">{carbon_intensity:.0f}</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            sustainability_score = ev_share_avg * 2  # Score composite
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #8B5CF6 0%, #7C3AED 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🌱 Score durabilité</div>
-                <div style="font-size: 3rem; font-weight: bold;">{sustainability_score:.0f}</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col4:
-            regulatory_compliance = 85  # Score fixe pour l'exemple
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #EF4444 0%, #DC2626 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📋 Conformité réglementaire</div>
-                <div style="font-size: 3rem; font-weight: bold;">{regulatory_compliance}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Graphique évolution EV
-        st.markdown("---")
-        ev_evolution = self.df.groupby('Year')['EV_Share'].mean().reset_index()
-        ev_evolution['EV_Share'] = ev_evolution['EV_Share'] * 100
-
-        fig = px.line(ev_evolution, x='Year', y='EV_Share',
-                     title="Évolution de la Part des Véhicules Électriques",
-                     labels={'EV_Share': 'Part EV (%)', 'Year': 'Année'})
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
-
-    def render_benchmarking_dashboard(self):
-        """Dashboard Benchmarking."""
-        st.markdown('<h1 class="main-header">📊 Benchmarking</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # Comparaison des constructeurs
-        manufacturer_stats = self.df.groupby('Manufacturer').agg({
-            'Production_Volume': 'sum',
-            'Average_Price': 'mean',
-            'EV_Share': 'mean'
-        }).reset_index()
-
-        manufacturer_stats['EV_Share'] = manufacturer_stats['EV_Share'] * 100
-        manufacturer_stats = manufacturer_stats.sort_values('Production_Volume', ascending=False)
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            fig1 = px.bar(manufacturer_stats, x='Manufacturer', y='Production_Volume',
-                         title="Production par Constructeur",
-                         labels={'Production_Volume': 'Production', 'Manufacturer': 'Constructeur'})
-            fig1.update_layout(height=400, xaxis_tickangle=45)
-            st.plotly_chart(fig1, use_container_width=True)
-
-        with col2:
-            fig2 = px.scatter(manufacturer_stats, x='Average_Price', y='EV_Share',
-                             size='Production_Volume', hover_name='Manufacturer',
-                             title="Prix vs Part EV (taille = production)",
-                             labels={'Average_Price': 'Prix Moyen (€)', 'EV_Share': 'Part EV (%)'})
-            fig2.update_layout(height=400)
-            st.plotly_chart(fig2, use_container_width=True)
-
-    def render_predictive_dashboard(self):
-        """Dashboard Analyse Prédictive."""
-        st.markdown('<h1 class="main-header">🎯 Analyse Prédictive</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # Prédictions simples basées sur les tendances
-        yearly_data = self.df.groupby('Year').agg({
-            'Production_Volume': 'sum',
-            'Average_Price': 'mean',
-            'EV_Share': 'mean'
-        }).reset_index()
-
-        # Projection simple pour 2024-2026
-        last_year = yearly_data['Year'].max()
-        growth_rate = (yearly_data['Production_Volume'].iloc[-1] / yearly_data['Production_Volume'].iloc[0]) ** (1/len(yearly_data)) - 1
-
-        predictions = []
-        for year in range(last_year + 1, last_year + 4):
-            pred_production = yearly_data['Production_Volume'].iloc[-1] * ((1 + growth_rate) ** (year - last_year))
-            predictions.append({'Year': year, 'Production_Volume': pred_production, 'Type': 'Prédiction'})
-
-        # Graphique avec prédictions
-        historical = yearly_data.copy()
-        historical['Type'] = 'Historique'
-
-        combined_data = pd.concat([
-            historical[['Year', 'Production_Volume', 'Type']],
-            pd.DataFrame(predictions)
-        ])
-
-        fig = px.line(combined_data, x='Year', y='Production_Volume', color='Type',
-                     title="Production Historique et Prédictions",
-                     labels={'Production_Volume': 'Production', 'Year': 'Année'})
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
-
-        # KPIs prédictifs
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            pred_2024 = predictions[0]['Production_Volume']
-            st.metric("🔮 Production prédite 2024", f"{pred_2024/1e6:.0f}M unités")
-
-        with col2:
-            growth_2024 = ((pred_2024 / yearly_data['Production_Volume'].iloc[-1]) - 1) * 100
-            st.metric("📈 Croissance prédite 2024", f"{growth_2024:.1f}%")
-
-        with col3:
-            confidence = 75  # Score de confiance fixe
-            st.metric("🎯 Confiance prédiction", f"{confidence}%")
-
-    def render_market_strategy_dashboard(self):
-        """Dashboard Stratégie Marché."""
-        st.markdown('<h1 class="main-header">🎯 Stratégie Marché</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # KPIs Stratégiques
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            # Indice d'attractivité du marché
-            market_growth = self.df.groupby('Year')['Production_Volume'].sum().pct_change().mean() * 100
-            attractiveness = min(100, max(0, 50 + market_growth * 10))
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🎯 Attractivité Marché</div>
-                <div style="font-size: 3rem; font-weight: bold;">{attractiveness:.0f}</div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">/100</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            # Potentiel de croissance
-            recent_growth = self.df[self.df['Year'] >= 2020].groupby('Year')['Production_Volume'].sum().pct_change().mean() * 100
-            growth_potential = min(100, max(0, 50 + recent_growth * 5))
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📈 Potentiel Croissance</div>
-                <div style="font-size: 3rem; font-weight: bold;">{growth_potential:.0f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            # Niveau de saturation
-            avg_production = self.df['Production_Volume'].mean()
-            max_production = self.df['Production_Volume'].max()
-            saturation = (avg_production / max_production) * 100
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #8B5CF6 0%, #7C3AED 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📊 Niveau Saturation</div>
-                <div style="font-size: 3rem; font-weight: bold;">{saturation:.0f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col4:
-            # Score d'opportunité stratégique
-            opportunity_score = (attractiveness + growth_potential + (100 - saturation)) / 3
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #EF4444 0%, #DC2626 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🚀 Score Opportunité</div>
-                <div style="font-size: 3rem; font-weight: bold;">{opportunity_score:.0f}</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        st.markdown("---")
-
-        # Analyses stratégiques
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Matrice BCG simplifiée
-            bcg_data = self.df.groupby('Manufacturer').agg({
-                'Production_Volume': 'sum',
-                'Average_Price': 'mean'
-            }).reset_index()
-
-            bcg_data['Market_Share'] = (bcg_data['Production_Volume'] / bcg_data['Production_Volume'].sum()) * 100
-            bcg_data['Growth_Rate'] = bcg_data['Production_Volume'].pct_change().fillna(0) * 100
-
-            fig1 = px.scatter(bcg_data, x='Market_Share', y='Average_Price',
-                             size='Production_Volume', hover_name='Manufacturer',
-                             title="Matrice Stratégique : Part de Marché vs Prix",
-                             labels={'Market_Share': 'Part de Marché (%)', 'Average_Price': 'Prix Moyen (€)'})
-
-            # Ajouter des quadrants
-            fig1.add_hline(y=bcg_data['Average_Price'].median(), line_dash="dash", line_color="gray")
-            fig1.add_vline(x=bcg_data['Market_Share'].median(), line_dash="dash", line_color="gray")
-
-            fig1.update_layout(height=400)
-            st.plotly_chart(fig1, use_container_width=True)
-
-        with col2:
-            # Évolution des parts de marché
-            market_evolution = self.df.groupby(['Year', 'Manufacturer'])['Production_Volume'].sum().reset_index()
-            market_evolution['Total_Year'] = market_evolution.groupby('Year')['Production_Volume'].transform('sum')
-            market_evolution['Market_Share'] = (market_evolution['Production_Volume'] / market_evolution['Total_Year']) * 100
-
-            fig2 = px.line(market_evolution, x='Year', y='Market_Share', color='Manufacturer',
-                          title="Évolution des Parts de Marché",
-                          labels={'Market_Share': 'Part de Marché (%)', 'Year': 'Année'})
-            fig2.update_layout(height=400)
-            st.plotly_chart(fig2, use_container_width=True)
-    def render_innovation_dashboard(self):
-        """Dashboard Innovation & R&D."""
-        st.markdown('<h1 class="main-header">💡 Innovation & R&D</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # KPIs Innovation
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            # Indice d'innovation (basé sur part EV)
-            innovation_index = self.df['EV_Share'].mean() * 100
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #06B6D4 0%, #0891B2 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🔬 Indice Innovation</div>
-                <div style="font-size: 3rem; font-weight: bold;">{innovation_index:.1f}</div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">Score EV</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            # Vitesse d'adoption technologique
-            ev_growth = self.df.groupby('Year')['EV_Share'].mean().pct_change().mean() * 100
-            adoption_speed = min(100, max(0, 50 + ev_growth * 20))
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚡ Vitesse Adoption</div>
-                <div style="font-size: 3rem; font-weight: bold;">{adoption_speed:.0f}</div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">/100</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            # Diversité technologique
-            tech_diversity = self.df['Category'].nunique() * 33.33  # 3 catégories max
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #8B5CF6 0%, #7C3AED 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🎯 Diversité Tech</div>
-                <div style="font-size: 3rem; font-weight: bold;">{tech_diversity:.0f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col4:
-            # Potentiel R&D (basé sur prix premium)
-            price_premium = (self.df['Average_Price'].std() / self.df['Average_Price'].mean()) * 100
-            rd_potential = min(100, price_premium * 2)
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🧪 Potentiel R&D</div>
-                <div style="font-size: 3rem; font-weight: bold;">{rd_potential:.0f}</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        st.markdown("---")
-
-        # Analyses Innovation
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Courbe d'adoption EV par constructeur
-            ev_by_manufacturer = self.df.groupby(['Manufacturer', 'Year'])['EV_Share'].mean().reset_index()
-            ev_by_manufacturer['EV_Share'] = ev_by_manufacturer['EV_Share'] * 100
-
-            fig1 = px.line(ev_by_manufacturer, x='Year', y='EV_Share', color='Manufacturer',
-                          title="Courbe d'Adoption Véhicules Électriques",
-                          labels={'EV_Share': 'Part EV (%)', 'Year': 'Année'})
-            fig1.update_layout(height=400)
-            st.plotly_chart(fig1, use_container_width=True)
-
-        with col2:
-            # Innovation vs Performance (Prix vs EV Share)
-            innovation_perf = self.df.groupby('Manufacturer').agg({
-                'Average_Price': 'mean',
-                'EV_Share': 'mean',
-                'Production_Volume': 'sum'
-            }).reset_index()
-
-            innovation_perf['EV_Share'] = innovation_perf['EV_Share'] * 100
-
-            fig2 = px.scatter(innovation_perf, x='EV_Share', y='Average_Price',
-                             size='Production_Volume', hover_name='Manufacturer',
-                             title="Innovation vs Performance (EV vs Prix)",
-                             labels={'EV_Share': 'Part EV (%)', 'Average_Price': 'Prix Moyen (€)'})
-            fig2.update_layout(height=400)
-            st.plotly_chart(fig2, use_container_width=True)
-
-
-
-
-
-    def render_operational_dashboard(self):
-        """Dashboard Performance Opérationnelle."""
-        st.markdown('<h1 class="main-header">📈 Performance Opérationnelle</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # KPIs Opérationnels
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            # Efficacité opérationnelle
-            operational_efficiency = (self.df['Production_Volume'].sum() / self.df['Manufacturer'].nunique()) / 1e6
-            st.metric("⚙️ Efficacité Opérationnelle", f"{operational_efficiency:.1f}M/constructeur")
-
-        with col2:
-            # Utilisation des capacités
-            capacity_utilization = min(100, (self.df['Production_Volume'].mean() / self.df['Production_Volume'].max()) * 100)
-            st.metric("📊 Utilisation Capacités", f"{capacity_utilization:.0f}%")
-
-        with col3:
-            # Stabilité opérationnelle
-            operational_stability = 100 - (self.df['Production_Volume'].std() / self.df['Production_Volume'].mean() * 100)
-            st.metric("🎯 Stabilité Opérationnelle", f"{operational_stability:.0f}%")
-
-        with col4:
-            # Score performance globale
-            performance_score = (operational_efficiency * 10 + capacity_utilization + operational_stability) / 3
-            st.metric("🏆 Performance Globale", f"{performance_score:.0f}/100")
-
-        # Graphiques opérationnels
-        st.markdown("---")
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Évolution de l'efficacité
-            efficiency_evolution = self.df.groupby('Year')['Production_Volume'].sum().reset_index()
-            efficiency_evolution['Efficiency'] = efficiency_evolution['Production_Volume'] / 1e6
-
-            fig1 = px.line(efficiency_evolution, x='Year', y='Efficiency',
-                          title="Évolution de l'Efficacité Opérationnelle",
-                          labels={'Efficiency': 'Efficacité (M unités)', 'Year': 'Année'})
-            fig1.update_layout(height=400)
-            st.plotly_chart(fig1, use_container_width=True)
-
-        with col2:
-            # Performance par constructeur
-            manufacturer_performance = self.df.groupby('Manufacturer').agg({
-                'Production_Volume': ['mean', 'std']
-            }).reset_index()
-
-            manufacturer_performance.columns = ['Manufacturer', 'Mean_Production', 'Std_Production']
-            manufacturer_performance['Stability'] = 100 - (manufacturer_performance['Std_Production'] /
-                                                          manufacturer_performance['Mean_Production'] * 100)
-
-            fig2 = px.bar(manufacturer_performance, x='Manufacturer', y='Stability',
-                         title="Stabilité Opérationnelle par Constructeur",
-                         labels={'Stability': 'Stabilité (%)', 'Manufacturer': 'Constructeur'})
-            fig2.update_layout(height=400, xaxis_tickangle=45)
-            st.plotly_chart(fig2, use_container_width=True)
-
-    def render_post_covid_dashboard(self):
-        """Dashboard Analyse Post-COVID (2020-2023)."""
-        st.markdown('<h1 class="main-header">🦠 Analyse Post-COVID (2020-2023)</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # Filtrer les données COVID (2020-2023)
-        covid_data = self.df[self.df['Year'] >= 2020].copy()
-        pre_covid_data = self.df[self.df['Year'] < 2020].copy()
-
-        # KPIs Impact COVID
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            # Impact sur la production (2020 vs 2019)
-            prod_2019 = self.df[self.df['Year'] == 2019]['Production_Volume'].sum()
-            prod_2020 = self.df[self.df['Year'] == 2020]['Production_Volume'].sum()
-            covid_impact = ((prod_2020 - prod_2019) / prod_2019) * 100
-
-            color = "#EF4444" if covid_impact < 0 else "#10B981"
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, {color} 0%, #DC2626 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📉 Impact Production 2020</div>
-                <div style="font-size: 3rem; font-weight: bold;">{covid_impact:.1f}%</div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">vs 2019</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            # Vitesse de récupération (2021-2023)
-            recovery_rate = covid_data.groupby('Year')['Production_Volume'].sum().pct_change().mean() * 100
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🚀 Vitesse Récupération</div>
-                <div style="font-size: 3rem; font-weight: bold;">{recovery_rate:.1f}%</div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">par an</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            # Accélération transition EV post-COVID
-            ev_pre_covid = pre_covid_data['EV_Share'].mean() * 100
-            ev_post_covid = covid_data['EV_Share'].mean() * 100
-            ev_acceleration = ev_post_covid - ev_pre_covid
-
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #8B5CF6 0%, #7C3AED 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚡ Accélération EV</div>
-                <div style="font-size: 3rem; font-weight: bold;">+{ev_acceleration:.1f}%</div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">post-COVID</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col4:
-            # Résilience par région (coefficient de variation)
-            regional_resilience = 100 - (covid_data.groupby('Region')['Production_Volume'].std() /
-                                        covid_data.groupby('Region')['Production_Volume'].mean()).mean() * 100
-
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🛡️ Résilience Régionale</div>
-                <div style="font-size: 3rem; font-weight: bold;">{regional_resilience:.0f}</div>
-                <div style="font-size: 0.8rem; opacity: 0.9; margin-top: 0.5rem;">/100</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        st.markdown("---")
-
-        # Analyses détaillées COVID
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Comparaison Pré/Post COVID par région
-            comparison_data = []
-            for region in self.df['Region'].unique():
-                pre_covid_avg = pre_covid_data[pre_covid_data['Region'] == region]['Production_Volume'].mean()
-                post_covid_avg = covid_data[covid_data['Region'] == region]['Production_Volume'].mean()
-
-                comparison_data.append({
-                    'Region': region,
-                    'Pre_COVID': pre_covid_avg,
-                    'Post_COVID': post_covid_avg,
-                    'Impact': ((post_covid_avg - pre_covid_avg) / pre_covid_avg) * 100
-                })
-
-            comparison_df = pd.DataFrame(comparison_data)
-
-            fig1 = px.bar(comparison_df, x='Region', y=['Pre_COVID', 'Post_COVID'],
-                         title="Production Moyenne : Pré vs Post-COVID",
-                         labels={'value': 'Production Moyenne', 'variable': 'Période'},
-                         barmode='group')
-            fig1.update_layout(height=400)
-            st.plotly_chart(fig1, use_container_width=True)
-
-        with col2:
-            # Évolution annuelle 2019-2023 (focus crise)
-            yearly_evolution = self.df[self.df['Year'] >= 2019].groupby('Year')['Production_Volume'].sum().reset_index()
-
-            fig2 = px.line(yearly_evolution, x='Year', y='Production_Volume',
-                          title="Évolution Production 2019-2023 (Impact COVID)",
-                          labels={'Production_Volume': 'Production', 'Year': 'Année'})
-
-            # Ajouter ligne verticale pour début COVID (2020)
-            fig2.add_vline(x=2020, line_dash="dash", line_color="red",
-                          annotation_text="Début COVID-19")
-
-            fig2.update_layout(height=400)
-            st.plotly_chart(fig2, use_container_width=True)
-
-        # Section insights COVID
-        st.markdown("---")
-        st.markdown("### 🔍 **Insights Clés Post-COVID**")
-
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            st.markdown("""
-            **🦠 Impact Immédiat (2020)**
-            - Chute brutale de production
-            - Perturbation chaînes d'approvisionnement
-            - Fermetures d'usines mondiales
-            - Report d'achats consommateurs
-            """)
-
-        with col2:
-            st.markdown("""
-            **🚀 Récupération (2021-2022)**
-            - Rebond rapide de la demande
-            - Adaptation des processus
-            - Digitalisation accélérée
-            - Nouvelles habitudes mobilité
-            """)
-
-        with col3:
-            st.markdown("""
-            **⚡ Transformation (2023+)**
-            - Accélération transition EV
-            - Résilience renforcée
-            - Diversification géographique
-            - Innovation technologique
-            """)
-
-    def render_ev_advanced_dashboard(self):
-        """Dashboard Transition Électrique Avancée."""
-        st.markdown('<h1 class="main-header">⚡ Transition Électrique Avancée</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # KPIs Transition Électrique
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            # Taux d'adoption EV actuel
-            current_ev_rate = self.df[self.df['Year'] == 2023]['EV_Share'].mean() * 100
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">⚡ Taux Adoption EV 2023</div>
-                <div style="font-size: 3rem; font-weight: bold;">{current_ev_rate:.1f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            # Croissance annuelle EV
-            ev_growth = self.df.groupby('Year')['EV_Share'].mean().pct_change().mean() * 100
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">📈 Croissance EV Annuelle</div>
-                <div style="font-size: 3rem; font-weight: bold;">{ev_growth:.1f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col3:
-            # Projection EV 2030 (extrapolation simple)
-            ev_2030_projection = min(100, current_ev_rate * (1 + ev_growth/100)**7)
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #8B5CF6 0%, #7C3AED 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🔮 Projection EV 2030</div>
-                <div style="font-size: 3rem; font-weight: bold;">{ev_2030_projection:.0f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col4:
-            # Impact subventions EV
-            subsidy_impact = (self.df['US_EV_Subsidy'].corr(self.df['EV_Share']) * 100)
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #EF4444 0%, #DC2626 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">💰 Impact Subventions</div>
-                <div style="font-size: 3rem; font-weight: bold;">{subsidy_impact:.0f}%</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        st.markdown("---")
-
-        # Analyses EV avancées
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # Courbe S d'adoption EV par région
-            ev_by_region = self.df.groupby(['Region', 'Year'])['EV_Share'].mean().reset_index()
-            ev_by_region['EV_Share'] = ev_by_region['EV_Share'] * 100
-
-            fig1 = px.line(ev_by_region, x='Year', y='EV_Share', color='Region',
-                          title="Courbe d'Adoption EV par Région",
-                          labels={'EV_Share': 'Part EV (%)', 'Year': 'Année'})
-
-            # Ajouter ligne de tendance
-            fig1.add_hline(y=50, line_dash="dash", line_color="gray",
-                          annotation_text="Seuil Majorité (50%)")
-
-            fig1.update_layout(height=400)
-            st.plotly_chart(fig1, use_container_width=True)
-
-        with col2:
-            # Matrice EV : Prix vs Adoption
-            ev_price_matrix = self.df.groupby('Manufacturer').agg({
-                'EV_Share': 'mean',
-                'Average_Price': 'mean',
-                'Production_Volume': 'sum'
-            }).reset_index()
-
-            ev_price_matrix['EV_Share'] = ev_price_matrix['EV_Share'] * 100
-
-            fig2 = px.scatter(ev_price_matrix, x='EV_Share', y='Average_Price',
-                             size='Production_Volume', hover_name='Manufacturer',
-                             title="Matrice EV : Adoption vs Prix Premium",
-                             labels={'EV_Share': 'Part EV (%)', 'Average_Price': 'Prix Moyen (€)'})
-
-            # Ajouter quadrants
-            fig2.add_hline(y=ev_price_matrix['Average_Price'].median(), line_dash="dash", line_color="gray")
-            fig2.add_vline(x=ev_price_matrix['EV_Share'].median(), line_dash="dash", line_color="gray")
-
-            fig2.update_layout(height=400)
-            st.plotly_chart(fig2, use_container_width=True)
-
-        # Section stratégies EV
-        st.markdown("---")
-        st.markdown("### ⚡ **Stratégies de Transition Électrique**")
-
-        # Analyse des leaders et retardataires
-        ev_leaders = ev_price_matrix.nlargest(3, 'EV_Share')
-        ev_laggards = ev_price_matrix.nsmallest(3, 'EV_Share')
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown("**🏆 Leaders EV**")
-            for _, leader in ev_leaders.iterrows():
-                st.markdown(f"- **{leader['Manufacturer']}** : {leader['EV_Share']:.1f}% EV")
-
-        with col2:
-            st.markdown("**⚠️ Retardataires EV**")
-            for _, laggard in ev_laggards.iterrows():
-                st.markdown(f"- **{laggard['Manufacturer']}** : {laggard['EV_Share']:.1f}% EV")
-
-    def render_strategic_recommendations_dashboard(self):
-        """Dashboard Recommandations Stratégiques."""
-        st.markdown('<h1 class="main-header">🎯 Recommandations Stratégiques</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # Analyse pour générer des recommandations intelligentes
-        latest_year = self.df['Year'].max()
-        latest_data = self.df[self.df['Year'] == latest_year]
-
-        # Calculs pour recommandations
-        growth_by_region = self.df.groupby(['Region', 'Year'])['Production_Volume'].sum().reset_index()
-        regional_growth = growth_by_region.groupby('Region')['Production_Volume'].apply(
-            lambda x: x.pct_change().mean()
-        ).sort_values(ascending=False)
-
-        ev_by_manufacturer = latest_data.groupby('Manufacturer')['EV_Share'].mean().sort_values(ascending=False)
-
-        # Section 1: Recommandations Prioritaires
-        st.markdown("## 🚀 **RECOMMANDATIONS PRIORITAIRES**")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #EF4444 0%, #DC2626 100%);
-                        padding: 2rem; border-radius: 15px; color: white; margin-bottom: 1rem;">
-                <h3 style="margin: 0; color: white;">🔥 ACTIONS IMMÉDIATES (0-6 mois)</h3>
-            </div>
-            """, unsafe_allow_html=True)
-
-            best_region = regional_growth.index[0]
-            best_ev_manufacturer = ev_by_manufacturer.index[0]
-
-            st.markdown(f"""
-            **1. 🌍 Expansion Géographique**
-            - **Priorité** : Région {best_region}
-            - **Croissance** : {regional_growth.iloc[0]*100:.1f}% annuelle
-            - **Action** : Augmenter capacités de production
-
-            **2. ⚡ Transition Électrique**
-            - **Benchmark** : {best_ev_manufacturer} ({ev_by_manufacturer.iloc[0]*100:.1f}% EV)
-            - **Action** : Accélérer développement EV
-
-            **3. 💰 Optimisation Coûts**
-            - **Focus** : Matières premières (acier)
-            - **Action** : Diversifier fournisseurs
-            """)
-
-        with col2:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
-                        padding: 2rem; border-radius: 15px; color: white; margin-bottom: 1rem;">
-                <h3 style="margin: 0; color: white;">📈 STRATÉGIES MOYEN TERME (6-18 mois)</h3>
-            </div>
-            """, unsafe_allow_html=True)
-
-            st.markdown(f"""
-            **1. 🔬 Innovation & R&D**
-            - **Budget** : +25% investissement R&D
-            - **Focus** : Technologies batteries
-            - **Partenariats** : Startups tech
-
-            **2. 🌐 Diversification**
-            - **Marchés** : Émergents (Asie-Pacifique)
-            - **Produits** : Véhicules hybrides
-            - **Canaux** : Vente directe
-
-            **3. 🤝 Alliances Stratégiques**
-            - **Constructeurs** : Partage technologies
-            - **Gouvernements** : Subventions EV
-            """)
-
-        # Section 2: Matrice de Priorisation
-        st.markdown("---")
-        st.markdown("## 📊 **MATRICE DE PRIORISATION STRATÉGIQUE**")
-
-        # Créer une matrice impact/effort
-        strategies = [
-            {"Strategy": "Expansion Chine", "Impact": 9, "Effort": 7, "ROI": 8.5},
-            {"Strategy": "Développement EV", "Impact": 10, "Effort": 8, "ROI": 9.0},
-            {"Strategy": "Optimisation Supply Chain", "Impact": 7, "Effort": 4, "ROI": 8.0},
-            {"Strategy": "Partenariats Tech", "Impact": 8, "Effort": 5, "ROI": 7.5},
-            {"Strategy": "Diversification Produits", "Impact": 6, "Effort": 6, "ROI": 6.5},
-            {"Strategy": "Digitalisation Processus", "Impact": 7, "Effort": 3, "ROI": 8.5}
-        ]
-
-        strategy_df = pd.DataFrame(strategies)
-
-        fig = px.scatter(strategy_df, x='Effort', y='Impact', size='ROI',
-                        hover_name='Strategy', color='ROI',
-                        title="Matrice Impact vs Effort (Taille = ROI)",
-                        labels={'Effort': 'Effort Requis (1-10)', 'Impact': 'Impact Potentiel (1-10)'})
-
-        # Ajouter quadrants
-        fig.add_hline(y=7, line_dash="dash", line_color="gray")
-        fig.add_vline(x=6, line_dash="dash", line_color="gray")
-
-        # Annotations quadrants
-        fig.add_annotation(x=3, y=9, text="Quick Wins", showarrow=False,
-                          bgcolor="lightgreen", bordercolor="green")
-        fig.add_annotation(x=8, y=9, text="Major Projects", showarrow=False,
-                          bgcolor="lightblue", bordercolor="blue")
-
-        fig.update_layout(height=500)
-        st.plotly_chart(fig, use_container_width=True)
-
-    def render_sector_analysis_dashboard(self):
-        """Dashboard Analyse Sectorielle."""
-        st.markdown('<h1 class="main-header">📊 Analyse Sectorielle</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # Analyse par catégorie de véhicules
-        category_analysis = self.df.groupby('Category').agg({
-            'Production_Volume': 'sum',
-            'Average_Price': 'mean',
-            'EV_Share': 'mean'
-        }).reset_index()
-
-        # KPIs Sectoriels
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            dominant_category = category_analysis.loc[category_analysis['Production_Volume'].idxmax(), 'Category']
-            dominant_share = (category_analysis['Production_Volume'].max() / category_analysis['Production_Volume'].sum()) * 100
-
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #10B981 0%, #059669 100%);
-                        padding: 1.5rem; border-radius: 10px; text-align: center; color: white;
-                        box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <div style="font-size: 0.9rem; margin-bottom: 0.5rem;">🏆 Segment Dominant</div>
-                <div style="font-size: 2rem; font-weight: bold;">{dominant_category}</div>
-                <div style="font-size: 1rem; opacity: 0.9; margin-top: 0.5rem;">{dominant_share:.1f}% du marché</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            price_premium = category_analysis['Average_Price'].max() - category_analysis['Average_Price'].min()
-            st.metric("💰 Écart Prix Premium", f"{price_premium:,.0f}€")
-
-        with col3:
-            ev_penetration = category_analysis['EV_Share'].mean() * 100
-            st.metric("⚡ Pénétration EV Moyenne", f"{ev_penetration:.1f}%")
-
-        # Graphiques sectoriels
-        st.markdown("---")
-        col1, col2 = st.columns(2)
-
-        with col1:
-            fig1 = px.pie(category_analysis, values='Production_Volume', names='Category',
-                         title="Répartition Production par Segment")
-            fig1.update_layout(height=400)
-            st.plotly_chart(fig1, use_container_width=True)
-
-        with col2:
-            fig2 = px.bar(category_analysis, x='Category', y='Average_Price',
-                         title="Prix Moyen par Segment",
-                         labels={'Average_Price': 'Prix Moyen (€)', 'Category': 'Segment'})
-            fig2.update_layout(height=400)
-            st.plotly_chart(fig2, use_container_width=True)
-
-    def render_future_outlook_dashboard(self):
-        """Dashboard Prospective 2030."""
-        st.markdown('<h1 class="main-header">🔮 Prospective 2030</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # Projections basées sur tendances actuelles
-        latest_year = self.df['Year'].max()
-        years_to_project = 2030 - latest_year
-
-        # Calcul des tendances
-        production_trend = self.df.groupby('Year')['Production_Volume'].sum().pct_change().mean()
-        ev_trend = self.df.groupby('Year')['EV_Share'].mean().pct_change().mean()
-        price_trend = self.df.groupby('Year')['Average_Price'].mean().pct_change().mean()
-
-        # Projections 2030
-        current_production = self.df[self.df['Year'] == latest_year]['Production_Volume'].sum()
-        current_ev_share = self.df[self.df['Year'] == latest_year]['EV_Share'].mean() * 100
-        current_price = self.df[self.df['Year'] == latest_year]['Average_Price'].mean()
-
-        projected_production = current_production * ((1 + production_trend) ** years_to_project)
-        projected_ev_share = min(100, current_ev_share * ((1 + ev_trend) ** years_to_project))
-        projected_price = current_price * ((1 + price_trend) ** years_to_project)
-
-        # KPIs Prospectifs
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            st.metric("🚗 Production 2030", f"{projected_production/1e6:.0f}M unités",
-                     f"{((projected_production/current_production - 1)*100):+.1f}%")
-
-        with col2:
-            st.metric("⚡ Part EV 2030", f"{projected_ev_share:.0f}%",
-                     f"{(projected_ev_share - current_ev_share):+.1f}pp")
-
-        with col3:
-            st.metric("💰 Prix Moyen 2030", f"{projected_price:,.0f}€",
-                     f"{((projected_price/current_price - 1)*100):+.1f}%")
-
-        with col4:
-            market_size_2030 = (projected_production * projected_price) / 1e12
-            st.metric("📊 Taille Marché 2030", f"{market_size_2030:.1f}T€")
-
-        # Scénarios prospectifs
-        st.markdown("---")
-        st.markdown("### 🎯 **Scénarios 2030**")
-
-        scenarios_2030 = {
-            "🚀 Optimiste": {"Production": projected_production * 1.2, "EV": min(100, projected_ev_share * 1.3)},
-            "📊 Réaliste": {"Production": projected_production, "EV": projected_ev_share},
-            "⚠️ Pessimiste": {"Production": projected_production * 0.8, "EV": projected_ev_share * 0.7}
-        }
-
-        col1, col2, col3 = st.columns(3)
-
-        for i, (scenario, values) in enumerate(scenarios_2030.items()):
-            with [col1, col2, col3][i]:
-                st.markdown(f"""
-                **{scenario}**
-                - Production : {values['Production']/1e6:.0f}M unités
-                - Part EV : {values['EV']:.0f}%
-                - Probabilité : {[70, 60, 30][i]}%
-                """)
-    def render_data_storytelling(self):
-        """Page Data Storytelling avec narration automatique."""
-        st.markdown('<h1 class="main-header">🎬 Data Storytelling</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # Contrôles storytelling
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            auto_play = st.checkbox("▶️ Lecture automatique", value=False)
-
-        with col2:
-            story_speed = st.slider("⏱️ Vitesse", 1, 5, 3)
-
-        with col3:
-            voice_narration = st.checkbox("🔊 Narration vocale", value=False)
-
-        # Chapitres de l'histoire
-        chapters = [
-            {
-                "title": "📈 L'Âge d'Or (2010-2019)",
-                "content": "De 2010 à 2019, l'industrie automobile connaît une croissance stable. Toyota domine le marché avec une production constante, tandis que les véhicules électriques restent marginaux.",
-                "data_focus": "production_growth"
-            },
-            {
-                "title": "🦠 La Grande Disruption (2020-2021)",
-                "content": "2020 marque un tournant historique. La pandémie COVID-19 provoque une chute brutale de 15% de la production mondiale. Les chaînes d'approvisionnement s'effondrent.",
-                "data_focus": "covid_impact"
-            },
-            {
-                "title": "⚡ L'Émergence Électrique (2022-2024)",
-                "content": "2022 voit l'explosion des véhicules électriques. Tesla dépasse le million d'unités, BYD émerge comme rival chinois. La part EV passe de 3% à 18% en 3 ans.",
-                "data_focus": "ev_boom"
-            },
-            {
-                "title": "🔮 Vers l'Avenir (2025-2030)",
-                "content": "Les projections indiquent une transformation radicale : 45% de véhicules électriques en 2030, consolidation du marché, émergence de nouveaux acteurs tech.",
-                "data_focus": "future_projections"
-            }
-        ]
-
-        # Sélecteur de chapitre
-        chapter_index = st.selectbox(
-            "📖 Sélectionner un chapitre",
-            range(len(chapters)),
-            format_func=lambda x: chapters[x]["title"]
-        )
-
-        current_chapter = chapters[chapter_index]
-
-        # Affichage du chapitre
-        st.markdown(f"""
-        <div style="background: linear-gradient(135deg, #1A1A1A 0%, #2C2C2C 100%);
-                    padding: 2rem; border-radius: 15px; margin: 2rem 0;">
-            <h2 style="color: #E31E24; margin: 0 0 1rem 0;">{current_chapter['title']}</h2>
-            <p style="color: #CCCCCC; font-size: 1.1rem; line-height: 1.6;">
-                {current_chapter['content']}
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # Visualisation selon le chapitre
-        if current_chapter["data_focus"] == "production_growth":
-            # Graphique croissance 2010-2019
-            historical_data = self.df[self.df['Year'] <= 2019].groupby('Year')['Production_Volume'].sum().reset_index()
-
-            fig = px.line(historical_data, x='Year', y='Production_Volume',
-                         title="Croissance Stable 2010-2019",
-                         labels={'Production_Volume': 'Production', 'Year': 'Année'})
-            fig.update_traces(line=dict(color='#1976D2', width=4))
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
-
-        elif current_chapter["data_focus"] == "covid_impact":
-            # Graphique impact COVID
-            covid_comparison = self.df[self.df['Year'].isin([2019, 2020, 2021])].groupby('Year')['Production_Volume'].sum().reset_index()
-
-            fig = px.bar(covid_comparison, x='Year', y='Production_Volume',
-                        title="Impact COVID-19 sur la Production",
-                        color='Year',
-                        color_discrete_sequence=['#4CAF50', '#E31E24', '#FF9800'])
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
-
-        elif current_chapter["data_focus"] == "ev_boom":
-            # Graphique boom EV
-            ev_evolution = self.df.groupby('Year')['EV_Share'].mean().reset_index()
-            ev_evolution['EV_Share'] = ev_evolution['EV_Share'] * 100
-
-            fig = px.area(ev_evolution, x='Year', y='EV_Share',
-                         title="Explosion des Véhicules Électriques",
-                         labels={'EV_Share': 'Part EV (%)', 'Year': 'Année'})
-            fig.update_traces(fill='tonexty', fillcolor='rgba(0, 213, 99, 0.3)', line=dict(color='#00D563', width=4))
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
-
-        # Narration vocale simulée
-        if voice_narration:
-            st.markdown(f"""
-            <div style="background: #E31E24; color: white; padding: 1rem;
-                        border-radius: 10px; margin: 1rem 0; text-align: center;">
-                🔊 <strong>Narration en cours...</strong><br>
-                <em>"{current_chapter['content'][:100]}..."</em>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Navigation chapitres
-        col1, col2, col3 = st.columns([1, 2, 1])
-
-        with col1:
-            if chapter_index > 0:
-                if st.button("⬅️ Chapitre Précédent"):
-                    st.rerun()
-
-        with col3:
-            if chapter_index < len(chapters) - 1:
-                if st.button("Chapitre Suivant ➡️"):
-                    st.rerun()
-
-    def render_car_shop(self):
-        """Comparateur mode Car Shop."""
-        st.markdown('<h1 class="main-header">🛒 Car Shop - Comparateur</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #1A1A1A 0%, #E31E24 100%);
-                    padding: 2rem; border-radius: 15px; margin-bottom: 2rem; text-align: center;">
-            <h2 style="color: white; margin: 0;">🚗 Comparateur Constructeurs Premium</h2>
-            <p style="color: #CCCCCC; margin-top: 1rem;">
-                Comparez les performances des constructeurs automobiles
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # Sélecteurs de constructeurs
-        col1, col2 = st.columns(2)
-
-        manufacturers = sorted(self.df['Manufacturer'].unique())
-
-        with col1:
-            manu1 = st.selectbox("🏭 Constructeur 1", manufacturers, index=0)
-
-        with col2:
-            manu2 = st.selectbox("🏭 Constructeur 2", manufacturers, index=1)
-
-        # Données des constructeurs
-        data1 = self.df[self.df['Manufacturer'] == manu1].agg({
-            'Production_Volume': 'sum',
-            'Average_Price': 'mean',
-            'EV_Share': 'mean'
-        })
-
-        data2 = self.df[self.df['Manufacturer'] == manu2].agg({
-            'Production_Volume': 'sum',
-            'Average_Price': 'mean',
-            'EV_Share': 'mean'
-        })
-
-        # Comparaison visuelle
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #1976D2 0%, #1565C0 100%);
-                        color: white; padding: 2rem; border-radius: 15px; text-align: center;">
-                <h3 style="margin: 0 0 1rem 0;">{manu1}</h3>
-                <div style="margin: 1rem 0;">
-                    <div style="font-size: 0.9rem;">🏭 Production</div>
-                    <div style="font-size: 2rem; font-weight: bold;">{data1['Production_Volume']/1e6:.1f}M</div>
-                </div>
-                <div style="margin: 1rem 0;">
-                    <div style="font-size: 0.9rem;">💰 Prix Moyen</div>
-                    <div style="font-size: 2rem; font-weight: bold;">{data1['Average_Price']:,.0f}€</div>
-                </div>
-                <div style="margin: 1rem 0;">
-                    <div style="font-size: 0.9rem;">⚡ Part EV</div>
-                    <div style="font-size: 2rem; font-weight: bold;">{data1['EV_Share']*100:.1f}%</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with col2:
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #E31E24 0%, #C62828 100%);
-                        color: white; padding: 2rem; border-radius: 15px; text-align: center;">
-                <h3 style="margin: 0 0 1rem 0;">{manu2}</h3>
-                <div style="margin: 1rem 0;">
-                    <div style="font-size: 0.9rem;">🏭 Production</div>
-                    <div style="font-size: 2rem; font-weight: bold;">{data2['Production_Volume']/1e6:.1f}M</div>
-                </div>
-                <div style="margin: 1rem 0;">
-                    <div style="font-size: 0.9rem;">💰 Prix Moyen</div>
-                    <div style="font-size: 2rem; font-weight: bold;">{data2['Average_Price']:,.0f}€</div>
-                </div>
-                <div style="margin: 1rem 0;">
-                    <div style="font-size: 0.9rem;">⚡ Part EV</div>
-                    <div style="font-size: 2rem; font-weight: bold;">{data2['EV_Share']*100:.1f}%</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Graphique comparatif radar
-        st.markdown("### 📊 **Comparaison Radar**")
-
-        categories = ['Production', 'Prix Premium', 'Innovation EV']
-
-        # Normalisation des données pour le radar
-        prod_max = self.df.groupby('Manufacturer')['Production_Volume'].sum().max()
-        price_max = self.df.groupby('Manufacturer')['Average_Price'].mean().max()
-        ev_max = self.df.groupby('Manufacturer')['EV_Share'].mean().max()
-
-        values1 = [
-            (data1['Production_Volume'] / prod_max) * 100,
-            (data1['Average_Price'] / price_max) * 100,
-            (data1['EV_Share'] / ev_max) * 100
-        ]
-
-        values2 = [
-            (data2['Production_Volume'] / prod_max) * 100,
-            (data2['Average_Price'] / price_max) * 100,
-            (data2['EV_Share'] / ev_max) * 100
-        ]
-
-        fig = go.Figure()
-
-        fig.add_trace(go.Scatterpolar(
-            r=values1 + [values1[0]],
-            theta=categories + [categories[0]],
-            fill='toself',
-            name=manu1,
-            line_color='#1976D2'
-        ))
-
-        fig.add_trace(go.Scatterpolar(
-            r=values2 + [values2[0]],
-            theta=categories + [categories[0]],
-            fill='toself',
-            name=manu2,
-            line_color='#E31E24'
-        ))
-
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 100]
-                )),
-            showlegend=True,
-            height=500
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
-
-    def render_geospatial_3d(self):
-        """Analyse géospatiale 3D avancée."""
-        st.markdown('<h1 class="main-header">🗺️ Analyse Géospatiale 3D</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #0A0A0A 0%, #1A1A1A 100%);
-                    padding: 2rem; border-radius: 15px; margin-bottom: 2rem; text-align: center;">
-            <h2 style="color: #E31E24; margin: 0;">🌍 Visualisation 3D Interactive</h2>
-            <p style="color: #CCCCCC; margin-top: 1rem;">
-                Exploration géospatiale avancée de la production automobile mondiale
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # Simulation de données géospatiales
-        geo_data = {
-            'North America': {'lat': 45.0, 'lon': -100.0, 'production': 25000000, 'ev_share': 0.15},
-            'Europe': {'lat': 50.0, 'lon': 10.0, 'production': 18000000, 'ev_share': 0.22},
-            'Asia Pacific': {'lat': 35.0, 'lon': 105.0, 'production': 35000000, 'ev_share': 0.25},
-            'China': {'lat': 35.0, 'lon': 105.0, 'production': 27000000, 'ev_share': 0.30}
-        }
-
-        # Graphique 3D scatter
-        fig = go.Figure(data=go.Scatter3d(
-            x=[data['lon'] for data in geo_data.values()],
-            y=[data['lat'] for data in geo_data.values()],
-            z=[data['production']/1e6 for data in geo_data.values()],
-            mode='markers+text',
-            marker=dict(
-                size=[data['production']/1e6 for data in geo_data.values()],
-                color=[data['ev_share']*100 for data in geo_data.values()],
-                colorscale='Viridis',
-                showscale=True,
-                colorbar=dict(title="Part EV (%)")
-            ),
-            text=list(geo_data.keys()),
-            textposition="top center"
-        ))
-
-        fig.update_layout(
-            title="Production Automobile Mondiale 3D",
-            scene=dict(
-                xaxis_title="Longitude",
-                yaxis_title="Latitude",
-                zaxis_title="Production (M)",
-                bgcolor="rgba(0,0,0,0)"
-            ),
-            height=600
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
-
-        # Carte choroplèthe simulée
-        st.markdown("### 🗺️ **Carte de Densité**")
-
-        # Données pour choroplèthe
-        choropleth_data = pd.DataFrame({
-            'Region': list(geo_data.keys()),
-            'Production': [data['production'] for data in geo_data.values()],
-            'EV_Share': [data['ev_share']*100 for data in geo_data.values()]
-        })
-
-        fig2 = px.bar(choropleth_data, x='Region', y='Production',
-                     color='EV_Share',
-                     title="Densité de Production par Région",
-                     color_continuous_scale='Viridis')
-        fig2.update_layout(height=400)
-        st.plotly_chart(fig2, use_container_width=True)
-
-    def render_report_generator(self):
-        """Générateur de rapports automatique."""
-        st.markdown('<h1 class="main-header">📊 Générateur de Rapports</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #1976D2 0%, #1565C0 100%);
-                    padding: 2rem; border-radius: 15px; margin-bottom: 2rem; text-align: center;">
-            <h2 style="color: white; margin: 0;">📋 Générateur Automatique</h2>
-            <p style="color: #E3F2FD; margin-top: 1rem;">
-                Créez des rapports personnalisés en quelques clics
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # Configuration du rapport
-        col1, col2 = st.columns(2)
-
-        with col1:
-            report_type = st.selectbox(
-                "📊 Type de rapport",
-                ["Exécutif", "Technique", "Financier", "Stratégique"]
-            )
-
-            time_period = st.selectbox(
-                "📅 Période",
-                ["2023", "2022-2023", "2020-2023", "Toutes années"]
-            )
-
-        with col2:
-            focus_area = st.multiselect(
-                "🎯 Domaines d'analyse",
-                ["Production", "Véhicules EV", "Prix", "Régions", "Constructeurs"],
-                default=["Production", "Véhicules EV"]
-            )
-
-            export_format = st.selectbox(
-                "📄 Format d'export",
-                ["PDF", "Excel", "PowerPoint", "Word"]
-            )
-
-        # Génération du rapport
-        if st.button("🚀 Générer le Rapport", type="primary"):
-            with st.spinner("Génération en cours..."):
-                time.sleep(2)  # Simulation
-
-                # Contenu du rapport généré
-                st.success("✅ Rapport généré avec succès !")
-
-                # Aperçu du rapport
-                st.markdown("### 📋 **Aperçu du Rapport**")
-
-                report_content = f"""
-                <div style="background: white; color: black; padding: 2rem;
-                            border-radius: 10px; border: 1px solid #ddd;">
-                    <h2 style="color: #1976D2; text-align: center;">
-                        RAPPORT {report_type.upper()} - INDUSTRIE AUTOMOBILE
-                    </h2>
-                    <hr>
-
-                    <h3>📊 Résumé Exécutif</h3>
-                    <p>Ce rapport analyse l'industrie automobile pour la période {time_period}.
-                    Les domaines couverts incluent : {', '.join(focus_area)}.</p>
-
-                    <h3>🔍 Faits Saillants</h3>
-                    <ul>
-                        <li>Production mondiale : {self.df['Production_Volume'].sum()/1e6:.0f}M véhicules</li>
-                        <li>Part véhicules électriques : {self.df['EV_Share'].mean()*100:.1f}%</li>
-                        <li>Prix moyen : {self.df['Average_Price'].mean():,.0f}€</li>
-                        <li>Leader marché : Toyota (23.5% part de marché)</li>
-                    </ul>
-
-                    <h3>📈 Recommandations</h3>
-                    <ol>
-                        <li>Accélérer la transition vers l'électrique</li>
-                        <li>Investir dans les technologies de batteries</li>
-                        <li>Diversifier géographiquement</li>
-                        <li>Optimiser les chaînes d'approvisionnement</li>
-                    </ol>
-
-                    <hr>
-                    <p style="text-align: center; color: #666; font-size: 0.9rem;">
-                        Rapport généré automatiquement le {datetime.now().strftime('%d/%m/%Y à %H:%M')}
-                    </p>
-                </div>
-                """
-
-                st.markdown(report_content, unsafe_allow_html=True)
-
-                # Boutons de téléchargement simulés
-                col1, col2, col3, col4 = st.columns(4)
-
-                with col1:
-                    st.download_button(
-                        "📄 Télécharger PDF",
-                        data="Rapport PDF simulé",
-                        file_name=f"rapport_{report_type.lower()}_{datetime.now().strftime('%Y%m%d')}.pdf",
-                        mime="application/pdf"
-                    )
-
-                with col2:
-                    st.download_button(
-                        "📊 Télécharger Excel",
-                        data="Rapport Excel simulé",
-                        file_name=f"rapport_{report_type.lower()}_{datetime.now().strftime('%Y%m%d')}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    )
-
-                with col3:
-                    st.download_button(
-                        "📽️ Télécharger PPT",
-                        data="Rapport PowerPoint simulé",
-                        file_name=f"rapport_{report_type.lower()}_{datetime.now().strftime('%Y%m%d')}.pptx",
-                        mime="application/vnd.openxmlformats-officedocument.presentationml.presentation"
-                    )
-
-                with col4:
-                    st.download_button(
-                        "📝 Télécharger Word",
-                        data="Rapport Word simulé",
-                        file_name=f"rapport_{report_type.lower()}_{datetime.now().strftime('%Y%m%d')}.docx",
-                        mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-                    )
-
-    def render_gaming_mode(self):
-        """Mode Gaming - Dashboard comme un jeu vidéo."""
-        st.markdown('<h1 class="main-header">🎮 Mode Gaming - Auto Racing Dashboard</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # Interface gaming avec HUD
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #000000 0%, #1a0033 50%, #330066 100%);
-                    padding: 2rem; border-radius: 20px; margin-bottom: 2rem; position: relative;
-                    border: 2px solid #00ff00; box-shadow: 0 0 20px rgba(0,255,0,0.3);">
-            <div style="position: absolute; top: 10px; right: 10px; color: #00ff00; font-family: 'Courier New';">
-                🎮 LEVEL: EXPERT | 🏆 SCORE: 9,847 | ⚡ ENERGY: 100%
-            </div>
-            <h1 style="color: #00ff00; text-align: center; font-family: 'Courier New';
-                       text-shadow: 0 0 10px #00ff00; margin-top: 2rem;">
-                🏁 AUTOMOTIVE RACING COMMAND CENTER 🏁
-            </h1>
-            <p style="color: #cccccc; text-align: center; font-family: 'Courier New';">
-                >>> MISSION: DOMINER LE MARCHÉ AUTOMOBILE MONDIAL <<<
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # HUD Gaming avec constructeurs comme "joueurs"
-        st.markdown("### 🏆 **LEADERBOARD - CONSTRUCTEURS**")
-
-        # Calcul du "score" gaming pour chaque constructeur
-        leaderboard = self.df.groupby('Manufacturer').agg({
-            'Production_Volume': 'sum',
-            'Average_Price': 'mean',
-            'EV_Share': 'mean'
-        }).reset_index()
-
-        # Score gaming = Production + Prix premium + Innovation EV
-        leaderboard['Gaming_Score'] = (
-            (leaderboard['Production_Volume'] / 1e6) * 100 +
-            (leaderboard['Average_Price'] / 1000) * 10 +
-            (leaderboard['EV_Share'] * 1000)
-        ).round(0)
-
-        leaderboard = leaderboard.sort_values('Gaming_Score', ascending=False)
-
-        # Affichage leaderboard gaming
-        for i, row in leaderboard.head(6).iterrows():
-            rank_colors = ['#FFD700', '#C0C0C0', '#CD7F32', '#4169E1', '#32CD32', '#FF6347']
-            rank_emojis = ['👑', '🥈', '🥉', '🏅', '🎖️', '🏆']
-
-            col1, col2 = st.columns([1, 4])
-
-            with col1:
-                rank = list(leaderboard.index).index(i) + 1
-                st.markdown(f"""
-                <div style="background: {rank_colors[rank-1]}; color: black;
-                            border-radius: 50%; width: 80px; height: 80px;
-                            display: flex; align-items: center; justify-content: center;
-                            font-size: 2rem; font-weight: bold; margin: 0 auto;">
-                    {rank_emojis[rank-1]}
-                </div>
-                """, unsafe_allow_html=True)
-
-            with col2:
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, {rank_colors[rank-1]}20 0%, {rank_colors[rank-1]}40 100%);
-                            border: 2px solid {rank_colors[rank-1]}; border-radius: 15px; padding: 1rem;
-                            font-family: 'Courier New'; margin-bottom: 1rem;">
-                    <h3 style="color: {rank_colors[rank-1]}; margin: 0;">
-                        #{rank} {row['Manufacturer']} - SCORE: {row['Gaming_Score']:.0f}
-                    </h3>
-                    <div style="color: #666; margin-top: 0.5rem;">
-                        🏭 Production: {row['Production_Volume']/1e6:.1f}M |
-                        💰 Prix: {row['Average_Price']:,.0f}€ |
-                        ⚡ EV: {row['EV_Share']*100:.1f}%
-                    </div>
-                    <div style="background: {rank_colors[rank-1]}; height: 8px; border-radius: 4px;
-                                width: {min(100, row['Gaming_Score']/50)}%; margin-top: 0.5rem;"></div>
-                </div>
-                """, unsafe_allow_html=True)
-
-        # Mini-jeu : Prédiction de marché
-        st.markdown("---")
-        st.markdown("### 🎯 **MINI-JEU : PRÉDICTION DE MARCHÉ**")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown("""
-            <div style="background: #1a0033; border: 2px solid #00ff00; border-radius: 15px;
-                        padding: 2rem; color: #00ff00; font-family: 'Courier New';">
-                <h4>🎮 MISSION SPÉCIALE</h4>
-                <p>Prédisez la production Tesla en 2025 !</p>
-                <p>💡 Indice: Croissance actuelle +35%/an</p>
-                <p>🏆 Récompense: +500 points XP</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-            user_prediction = st.number_input(
-                "Votre prédiction (millions):",
-                min_value=0.0, max_value=20.0, value=5.0, step=0.1
-            )
-
-            if st.button("🚀 VALIDER PRÉDICTION"):
-                # Calcul "correct" basé sur données
-                tesla_current = 1.8  # Millions (estimation)
-                correct_prediction = tesla_current * (1.35 ** 2)  # 2 ans à +35%
-
-                difference = abs(user_prediction - correct_prediction)
-
-                if difference < 0.5:
-                    st.success("🏆 EXCELLENT ! +500 XP - Prédiction parfaite !")
-                elif difference < 1.0:
-                    st.info("🎯 BIEN JOUÉ ! +300 XP - Très proche !")
-                else:
-                    st.warning("💪 CONTINUEZ ! +100 XP - Réessayez !")
-
-                st.info(f"📊 Réponse correcte: {correct_prediction:.1f}M véhicules")
-
-        with col2:
-            # Graphique "gaming" avec effets néon
-            fig = go.Figure()
-
-            years = list(range(2020, 2026))
-            tesla_growth = [1.0, 1.35, 1.8, 2.4, 3.2, 4.3]  # Simulation croissance
-
-            fig.add_trace(go.Scatter(
-                x=years, y=tesla_growth,
-                mode='lines+markers',
-                name='Tesla Production',
-                line=dict(color='#00ff00', width=4, dash='solid'),
-                marker=dict(size=10, color='#00ff00', symbol='diamond')
-            ))
-
-            fig.update_layout(
-                title="🚀 Tesla Growth Trajectory",
-                xaxis_title="Année",
-                yaxis_title="Production (M)",
-                plot_bgcolor='rgba(0,0,0,0.8)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='#00ff00', family='Courier New'),
-                showlegend=False
-            )
-
-            # Effets néon sur le graphique
-            fig.update_xaxes(gridcolor='rgba(0,255,0,0.2)')
-            fig.update_yaxes(gridcolor='rgba(0,255,0,0.2)')
-
-            st.plotly_chart(fig, use_container_width=True)
-
-        # Achievements gaming
-        st.markdown("---")
-        st.markdown("### 🏅 **ACHIEVEMENTS DÉBLOQUÉS**")
-
-        achievements = [
-            {"name": "Data Explorer", "desc": "Consulté 10+ dashboards", "icon": "🔍", "unlocked": True},
-            {"name": "EV Pioneer", "desc": "Analysé transition électrique", "icon": "⚡", "unlocked": True},
-            {"name": "Market Guru", "desc": "Maîtrisé les prédictions", "icon": "🔮", "unlocked": False},
-            {"name": "Global Thinker", "desc": "Exploré tous les continents", "icon": "🌍", "unlocked": True},
-            {"name": "Time Traveler", "desc": "Voyagé de 2010 à 2030", "icon": "⏰", "unlocked": True},
-            {"name": "Gaming Master", "desc": "Découvert le mode gaming", "icon": "🎮", "unlocked": True}
-        ]
-
-        cols = st.columns(3)
-        for i, achievement in enumerate(achievements):
-            with cols[i % 3]:
-                status = "✅" if achievement["unlocked"] else "🔒"
-                opacity = "1.0" if achievement["unlocked"] else "0.3"
-
-                st.markdown(f"""
-                <div style="background: rgba(0,255,0,0.1); border: 1px solid #00ff00;
-                            border-radius: 10px; padding: 1rem; text-align: center;
-                            opacity: {opacity}; margin-bottom: 1rem;">
-                    <div style="font-size: 2rem;">{achievement['icon']}</div>
-                    <div style="color: #00ff00; font-weight: bold;">{status} {achievement['name']}</div>
-                    <div style="color: #cccccc; font-size: 0.8rem;">{achievement['desc']}</div>
-                </div>
-                """, unsafe_allow_html=True)
-    def render_musical_dashboard(self):
-        """Dashboard Musical - Les données chantent !"""
-        st.markdown('<h1 class="main-header">🎵 Dashboard Musical - Symphony of Data</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # Interface musicale
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #2E1065 0%, #7C3AED 50%, #EC4899 100%);
-                    padding: 3rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;
-                    position: relative; overflow: hidden;">
-            <div style="position: absolute; top: 0; left: 0; right: 0; bottom: 0;
-                        background: url('data:image/svg+xml,<svg xmlns=\"http://www.w3.org/2000/svg\" viewBox=\"0 0 100 100\"><defs><pattern id=\"music\" width=\"20\" height=\"20\" patternUnits=\"userSpaceOnUse\"><circle cx=\"10\" cy=\"10\" r=\"2\" fill=\"%23ffffff\" opacity=\"0.1\"/></pattern></defs><rect width=\"100\" height=\"100\" fill=\"url(%23music)\"/></svg>');"></div>
-            <div style="position: relative; z-index: 1;">
-                <h1 style="color: white; margin: 0; font-size: 3.5rem; font-weight: bold;
-                           text-shadow: 0 4px 8px rgba(0,0,0,0.5); animation: musicPulse 2s ease-in-out infinite;">
-                    🎼 AUTOMOTIVE SYMPHONY 🎼
-                </h1>
-                <p style="color: #E5E7EB; font-size: 1.2rem; margin-top: 1rem;">
-                    Quand les données automobiles deviennent musique...
-                </p>
-            </div>
-        </div>
-
-        <style>
-        @keyframes musicPulse {
-            0%, 100% { transform: scale(1); }
-            50% { transform: scale(1.05); }
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-        # Contrôles musicaux
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            tempo = st.slider("🎵 Tempo BPM", 60, 180, 120)
-
-        with col2:
-            key_signature = st.selectbox("🎼 Tonalité", ["C Major", "G Major", "D Major", "A Major"])
-
-        with col3:
-            instrument = st.selectbox("🎹 Instrument", ["Piano", "Violon", "Guitare", "Synthé"])
-
-        with col4:
-            play_mode = st.checkbox("▶️ Mode Lecture", value=False)
-
-        # Conversion des données en "notes musicales"
-        st.markdown("### 🎼 **PARTITION AUTOMOBILE**")
-
-        # Chaque constructeur = une note/accord
-        manufacturers = self.df['Manufacturer'].unique()
-        musical_notes = ['C', 'D', 'E', 'F', 'G', 'A', 'B']
-
-        # Assignation notes aux constructeurs
-        manu_notes = {}
-        for i, manu in enumerate(manufacturers):
-            manu_notes[manu] = musical_notes[i % len(musical_notes)]
-
-        # Visualisation partition
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.markdown("#### 🎹 **Composition Actuelle**")
-
-            for manu in manufacturers:
-                production = self.df[self.df['Manufacturer'] == manu]['Production_Volume'].sum()
-                note = manu_notes[manu]
-
-                # Volume détermine la "hauteur" de la note
-                volume = min(100, (production / 1e6) * 10)
-
-                # Couleur selon la note
-                note_colors = {
-                    'C': '#FF6B6B', 'D': '#4ECDC4', 'E': '#45B7D1', 'F': '#96CEB4',
-                    'G': '#FFEAA7', 'A': '#DDA0DD', 'B': '#98D8C8'
-                }
-
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, {note_colors[note]} 0%, {note_colors[note]}80 100%);
-                            border-radius: 15px; padding: 1rem; margin: 0.5rem 0;
-                            display: flex; align-items: center; justify-content: space-between;">
-                    <div>
-                        <strong style="color: white; font-size: 1.2rem;">🎵 {note} - {manu}</strong><br>
-                        <span style="color: white; opacity: 0.8;">Volume: {volume:.0f}/100</span>
-                    </div>
-                    <div style="background: white; border-radius: 50%; width: 50px; height: 50px;
-                                display: flex; align-items: center; justify-content: center;
-                                font-size: 1.5rem; font-weight: bold; color: {note_colors[note]};">
-                        {note}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-
-        with col2:
-            # Graphique "onde sonore" basé sur production
-            st.markdown("#### 🌊 **Onde Sonore des Données**")
-
-            # Simulation onde sonore
-            years = sorted(self.df['Year'].unique())
-            total_production = []
-
-            for year in years:
-                yearly_prod = self.df[self.df['Year'] == year]['Production_Volume'].sum()
-                total_production.append(yearly_prod)
-
-            # Création onde sinusoïdale basée sur données
-            import math
-            wave_x = []
-            wave_y = []
-
-            for i, (year, prod) in enumerate(zip(years, total_production)):
-                # Fréquence basée sur production
-                frequency = (prod / 1e8) * 2  # Normalisation
-                amplitude = (prod / max(total_production)) * 100
-
-                for t in range(10):  # 10 points par année
-                    x_val = i * 10 + t
-                    y_val = amplitude * math.sin(frequency * t * 0.5)
-                    wave_x.append(x_val)
-                    wave_y.append(y_val)
-
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=wave_x, y=wave_y,
-                mode='lines',
-                name='Onde Automobile',
-                line=dict(color='#7C3AED', width=3),
-                fill='tonexty',
-                fillcolor='rgba(124, 58, 237, 0.3)'
-            ))
-
-            fig.update_layout(
-                title="🎵 Onde Sonore de la Production",
-                xaxis_title="Temps (années × 10)",
-                yaxis_title="Amplitude",
-                plot_bgcolor='rgba(0,0,0,0.05)',
-                height=300
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
-
-        # Playlist automobile
-        st.markdown("---")
-        st.markdown("### 🎧 **PLAYLIST AUTOMOBILE GÉNÉRÉE**")
-
-        # Génération playlist basée sur données
-        playlist_songs = [
-            {"title": "Electric Dreams", "artist": "Tesla Motors", "genre": "Electro", "bpm": tempo},
-            {"title": "German Engineering", "artist": "Volkswagen Symphony", "genre": "Classical", "bpm": tempo-10},
-            {"title": "American Muscle", "artist": "Ford Blues Band", "genre": "Rock", "bpm": tempo+20},
-            {"title": "Rising Sun", "artist": "Toyota Ensemble", "genre": "Ambient", "bpm": tempo-5},
-            {"title": "Korean Wave", "artist": "Hyundai-Kia Collective", "genre": "K-Pop", "bpm": tempo+15},
-            {"title": "Italian Passion", "artist": "Stellantis Orchestra", "genre": "Opera", "bpm": tempo+10}
-        ]
-
-        for i, song in enumerate(playlist_songs):
-            col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
-
-            with col1:
-                st.markdown(f"**🎵 {song['title']}**")
-
-            with col2:
-                st.markdown(f"*{song['artist']}*")
-
-            with col3:
-                st.markdown(f"🎼 {song['genre']} | {song['bpm']} BPM")
-
-            with col4:
-                if play_mode:
-                    st.markdown("▶️")
-                else:
-                    st.markdown("⏸️")
-
-        # Visualiseur musical
-        st.markdown("---")
-        st.markdown("### 🎨 **VISUALISEUR MUSICAL**")
-
-        if play_mode:
-            # Simulation barres de fréquence
-            frequencies = [random.randint(10, 100) for _ in range(20)]
-
-            fig = go.Figure(data=go.Bar(
-                x=list(range(20)),
-                y=frequencies,
-                marker=dict(
-                    color=frequencies,
-                    colorscale='Viridis',
-                    showscale=False
-                )
-            ))
-
-            fig.update_layout(
-                title="🎵 Analyseur de Fréquences en Temps Réel",
-                xaxis_title="Fréquences",
-                yaxis_title="Amplitude",
-                showlegend=False,
-                height=300,
-                plot_bgcolor='rgba(0,0,0,0.8)',
-                paper_bgcolor='rgba(0,0,0,0)'
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
-
-            # Auto-refresh pour effet temps réel
-            time.sleep(0.5)
-            st.rerun()
-        else:
-            st.info("🎵 Activez le Mode Lecture pour voir le visualiseur en action !")
-
-    def render_ai_oracle(self):
-        """Oracle IA - Prédictions mystiques des données."""
-        st.markdown('<h1 class="main-header">🔮 Oracle IA - Prophéties Automobiles</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # Interface mystique
-        st.markdown("""
-        <div style="background: radial-gradient(circle, #1a0033 0%, #000000 70%);
-                    padding: 3rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;
-                    position: relative; border: 2px solid #9333EA;
-                    box-shadow: 0 0 30px rgba(147, 51, 234, 0.5);">
-            <div style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%);
-                        width: 200px; height: 200px; border: 2px solid #9333EA; border-radius: 50%;
-                        opacity: 0.3; animation: oracleRotate 10s linear infinite;"></div>
-            <div style="position: relative; z-index: 1;">
-                <h1 style="color: #9333EA; margin: 0; font-size: 3.5rem; font-weight: bold;
-                           text-shadow: 0 0 20px #9333EA; animation: oracleGlow 3s ease-in-out infinite alternate;">
-                    🔮 L'ORACLE AUTOMOBILE 🔮
-                </h1>
-                <p style="color: #C4B5FD; font-size: 1.2rem; margin-top: 1rem; font-style: italic;">
-                    "Les données révèlent leurs secrets à ceux qui savent les écouter..."
-                </p>
-            </div>
-        </div>
-
-        <style>
-        @keyframes oracleRotate {
-            from { transform: translate(-50%, -50%) rotate(0deg); }
-            to { transform: translate(-50%, -50%) rotate(360deg); }
-        }
-        @keyframes oracleGlow {
-            from { text-shadow: 0 0 20px #9333EA; }
-            to { text-shadow: 0 0 40px #9333EA, 0 0 60px #9333EA; }
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-        # Consultation de l'Oracle
-        st.markdown("### 🔮 **CONSULTATION DE L'ORACLE**")
-
-        col1, col2 = st.columns([2, 1])
-
-        with col1:
-            oracle_question = st.text_area(
-                "🗣️ Posez votre question à l'Oracle :",
-                placeholder="Ex: Quel constructeur dominera en 2030 ? Quand les EV dépasseront-ils 50% ?",
-                height=100
-            )
-
-        with col2:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #9333EA 0%, #7C3AED 100%);
-                        color: white; padding: 1.5rem; border-radius: 15px; text-align: center;">
-                <div style="font-size: 2rem; margin-bottom: 0.5rem;">🔮</div>
-                <div style="font-weight: bold;">ORACLE ACTIF</div>
-                <div style="font-size: 0.8rem; opacity: 0.8;">Prêt à révéler l'avenir</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        if st.button("🌟 CONSULTER L'ORACLE", type="primary"):
-            if oracle_question:
-                with st.spinner("🔮 L'Oracle consulte les données cosmiques..."):
-                    time.sleep(3)  # Effet dramatique
-
-                    # Génération de prophétie basée sur la question
-                    prophecy = self.generate_oracle_prophecy(oracle_question)
-
-                    st.markdown(f"""
-                    <div style="background: linear-gradient(135deg, #1a0033 0%, #2D1B69 100%);
-                                border: 2px solid #9333EA; border-radius: 20px; padding: 2rem;
-                                margin: 2rem 0; position: relative; overflow: hidden;">
-                        <div style="position: absolute; top: -50px; right: -50px; width: 100px; height: 100px;
-                                    background: radial-gradient(circle, #9333EA 0%, transparent 70%);
-                                    border-radius: 50%; opacity: 0.3; animation: oracleOrb 4s ease-in-out infinite;"></div>
-                        <h3 style="color: #9333EA; text-align: center; margin-bottom: 1.5rem;">
-                            ✨ PROPHÉTIE DE L'ORACLE ✨
-                        </h3>
-                        <div style="color: #E5E7EB; font-size: 1.1rem; line-height: 1.8; text-align: center;
-                                    font-style: italic; text-shadow: 0 2px 4px rgba(0,0,0,0.5);">
-                            {prophecy}
-                        </div>
-                        <div style="text-align: center; margin-top: 1.5rem; color: #9333EA; font-size: 0.9rem;">
-                            🌟 Prophétie révélée le {datetime.now().strftime('%d/%m/%Y à %H:%M')} 🌟
-                        </div>
-                    </div>
-
-                    <style>
-                    @keyframes oracleOrb {{
-                        0%, 100% {{ transform: scale(1) rotate(0deg); }}
-                        50% {{ transform: scale(1.2) rotate(180deg); }}
-                    }}
-                    </style>
-                    """, unsafe_allow_html=True)
-
-        # Prédictions mystiques automatiques
-        st.markdown("---")
-        st.markdown("### 🌟 **PRÉDICTIONS MYSTIQUES AUTOMATIQUES**")
-
-        predictions = [
-            {
-                "title": "🚗 Le Grand Changement",
-                "prediction": "En 2027, un constructeur inattendu bouleversera l'ordre établi. Les signes pointent vers l'Asie...",
-                "confidence": "87%",
-                "element": "🔥 Feu"
-            },
-            {
-                "title": "⚡ L'Éveil Électrique",
-                "prediction": "L'année 2026 marquera le point de bascule : 50% de véhicules électriques seront atteints plus tôt que prévu.",
-                "confidence": "92%",
-                "element": "⚡ Foudre"
-            },
-            {
-                "title": "🌍 La Révolution Géographique",
-                "prediction": "L'Afrique émergera comme nouveau continent automobile majeur d'ici 2029. Les étoiles s'alignent...",
-                "confidence": "73%",
-                "element": "🌍 Terre"
-            },
-            {
-                "title": "💎 L'Alliance Secrète",
-                "prediction": "Deux géants rivaux s'uniront en 2028 pour créer la plus grande alliance automobile de l'histoire.",
-                "confidence": "81%",
-                "element": "💎 Cristal"
-            }
-        ]
-
-        for pred in predictions:
-            col1, col2 = st.columns([3, 1])
-
-            with col1:
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, #2D1B69 0%, #1a0033 100%);
-                            border-left: 4px solid #9333EA; padding: 1.5rem; border-radius: 10px;
-                            margin-bottom: 1rem;">
-                    <h4 style="color: #9333EA; margin: 0 0 1rem 0;">{pred['title']}</h4>
-                    <p style="color: #E5E7EB; margin: 0; font-style: italic; line-height: 1.6;">
-                        "{pred['prediction']}"
-                    </p>
-                    <div style="margin-top: 1rem; color: #C4B5FD; font-size: 0.9rem;">
-                        Élément: {pred['element']} | Confiance: {pred['confidence']}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-
-            with col2:
-                # Cristal de confiance
-                confidence_val = int(pred['confidence'].replace('%', ''))
-                crystal_color = '#10B981' if confidence_val > 85 else '#F59E0B' if confidence_val > 75 else '#EF4444'
-
-                st.markdown(f"""
-                <div style="background: {crystal_color}; color: white;
-                            border-radius: 15px; padding: 1rem; text-align: center;
-                            box-shadow: 0 4px 15px rgba(147, 51, 234, 0.3);">
-                    <div style="font-size: 1.5rem;">💎</div>
-                    <div style="font-weight: bold;">{pred['confidence']}</div>
-                    <div style="font-size: 0.8rem;">Confiance</div>
-                </div>
-                """, unsafe_allow_html=True)
-
-        # Boule de cristal interactive
-        st.markdown("---")
-        st.markdown("### 🔮 **BOULE DE CRISTAL INTERACTIVE**")
-
-        if st.button("🌟 ACTIVER LA BOULE DE CRISTAL"):
-            # Animation de la boule de cristal
-            crystal_ball_placeholder = st.empty()
-
-            for i in range(5):
-                crystal_ball_placeholder.markdown(f"""
-                <div style="text-align: center; padding: 2rem;">
-                    <div style="font-size: 8rem; animation: crystalSpin 1s linear infinite;">🔮</div>
-                    <p style="color: #9333EA; font-size: 1.2rem; margin-top: 1rem;">
-                        Vision en cours... {i+1}/5
-                    </p>
-                </div>
-
-                <style>
-                @keyframes crystalSpin {{
-                    from {{ transform: rotate(0deg) scale(1); }}
-                    to {{ transform: rotate(360deg) scale(1.1); }}
-                }}
-                </style>
-                """, unsafe_allow_html=True)
-                time.sleep(1)
-
-            # Révélation finale
-            crystal_ball_placeholder.markdown(f"""
-            <div style="text-align: center; padding: 2rem; background: radial-gradient(circle, #9333EA20 0%, transparent 70%);
-                        border-radius: 20px;">
-                <div style="font-size: 6rem; margin-bottom: 1rem;">🔮</div>
-                <h3 style="color: #9333EA;">✨ VISION RÉVÉLÉE ✨</h3>
-                <p style="color: #E5E7EB; font-size: 1.2rem; font-style: italic; margin: 1rem 0;">
-                    "Je vois... un avenir où {random.choice(['Tesla', 'BYD', 'Toyota', 'Volkswagen'])}
-                    dominera {random.choice(['l\'Europe', 'l\'Asie', 'l\'Amérique', 'le monde'])}
-                    avec {random.choice(['45%', '52%', '38%', '61%'])} de part de marché..."
-                </p>
-                <div style="color: #9333EA; font-size: 0.9rem;">
-                    🌟 Vision du {datetime.now().strftime('%d/%m/%Y')} 🌟
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-
-    def generate_oracle_prophecy(self, question):
-        """Génère une prophétie basée sur la question et les données."""
-        question_lower = question.lower()
-
-        # Prophéties basées sur mots-clés
-        if "2030" in question_lower or "futur" in question_lower:
-            return "🌟 L'Oracle voit l'année 2030 baignée de lumière électrique. Les véhicules à essence ne seront plus que des reliques du passé. Un nouveau monde automobile naîtra, dominé par l'intelligence artificielle et l'énergie pure. 🌟"
-
-        elif "tesla" in question_lower:
-            return "⚡ Les étoiles murmurent le nom de Tesla... Je vois Elon Musk dans une vision, entouré d'éclairs dorés. Tesla atteindra des sommets inimaginables, mais attention aux rivaux qui émergent de l'ombre chinoise... ⚡"
-
-        elif "électrique" in question_lower or "ev" in question_lower:
-            return "🔋 L'Oracle révèle : L'année 2026 sera l'année de la Grande Transition. Les véhicules électriques franchiront le seuil sacré des 50%. Une révolution silencieuse mais puissante transformera à jamais l'industrie automobile. 🔋"
-
-        elif "chine" in question_lower or "byd" in question_lower:
-            return "🐉 Du Dragon de l'Est surgira une force nouvelle... BYD et ses alliés chinois conquériront l'Europe d'ici 2027. L'Oracle voit des usines s'élever comme des temples technologiques sur le continent européen. 🐉"
-
-        elif "prix" in question_lower or "coût" in question_lower:
-            return "💰 Les cristaux de données révèlent : Les prix des véhicules électriques chuteront drastiquement en 2025. L'égalité des prix avec les véhicules thermiques marquera le début d'une nouvelle ère. La prophétie s'accomplira. 💰"
-
-        elif "toyota" in question_lower:
-            return "🌸 L'esprit du Sakura guide Toyota... Le géant japonais, tel un samouraï patient, prépare sa contre-attaque hybride. En 2028, Toyota révélera sa véritable stratégie électrique et surprendra le monde entier. 🌸"
-
-        else:
-            return f"🔮 L'Oracle contemple votre question dans les brumes du temps... Les données cosmiques s'alignent pour révéler que l'avenir automobile sera façonné par trois forces : l'Innovation, la Durabilité et la Connectivité. Votre réponse se trouve à l'intersection de ces trois chemins sacrés. 🔮"
-
-    def render_aquarium_mode(self):
-        """Mode Aquarium - Les données nagent comme des poissons."""
-        st.markdown('<h1 class="main-header">🌊 Mode Aquarium - Écosystème Automobile</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # Interface aquarium
-        st.markdown("""
-        <div style="background: linear-gradient(180deg, #87CEEB 0%, #4682B4 50%, #191970 100%);
-                    padding: 3rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;
-                    position: relative; overflow: hidden;">
-            <div style="position: absolute; top: 20px; left: 20px; font-size: 2rem; animation: swim1 8s ease-in-out infinite;">🐠</div>
-            <div style="position: absolute; top: 60px; right: 30px; font-size: 1.5rem; animation: swim2 6s ease-in-out infinite reverse;">🐟</div>
-            <div style="position: absolute; bottom: 40px; left: 50%; font-size: 2.5rem; animation: swim3 10s ease-in-out infinite;">🐡</div>
-            <h1 style="color: white; margin: 0; font-size: 3rem; text-shadow: 0 4px 8px rgba(0,0,0,0.5);">
-                🌊 AQUARIUM AUTOMOBILE 🌊
-            </h1>
-            <p style="color: #E0F6FF; font-size: 1.2rem; margin-top: 1rem;">
-                Observez l'écosystème automobile dans son habitat naturel
-            </p>
-        </div>
-
-        <style>
-        @keyframes swim1 { 0%, 100% { transform: translateX(0px); } 50% { transform: translateX(50px); } }
-        @keyframes swim2 { 0%, 100% { transform: translateX(0px); } 50% { transform: translateX(-40px); } }
-        @keyframes swim3 { 0%, 100% { transform: translateX(-20px); } 50% { transform: translateX(20px); } }
-        </style>
-        """, unsafe_allow_html=True)
-
-        # Constructeurs comme poissons
-        st.markdown("### 🐠 **ESPÈCES AUTOMOBILES**")
-
-        fish_types = {
-            'Toyota': {'emoji': '🐋', 'type': 'Baleine (Géant)', 'habitat': 'Océan Mondial'},
-            'Volkswagen': {'emoji': '🦈', 'type': 'Requin (Prédateur)', 'habitat': 'Eaux Européennes'},
-            'Ford': {'emoji': '🐟', 'type': 'Poisson Robuste', 'habitat': 'Rivières Américaines'},
-            'Hyundai-Kia': {'emoji': '🐠', 'type': 'Poisson Coloré', 'habitat': 'Récifs Coréens'},
-            'Stellantis': {'emoji': '🐡', 'type': 'Poisson-Globe', 'habitat': 'Méditerranée'},
-            'GM': {'emoji': '🦑', 'type': 'Pieuvre (Tentacules)', 'habitat': 'Profondeurs US'}
-        }
-
-        cols = st.columns(3)
-        for i, (manu, fish) in enumerate(fish_types.items()):
-            with cols[i % 3]:
-                production = self.df[self.df['Manufacturer'] == manu]['Production_Volume'].sum() / 1e6
-
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, #4682B4 0%, #87CEEB 100%);
-                            border-radius: 15px; padding: 1.5rem; text-align: center; margin-bottom: 1rem;
-                            border: 2px solid #191970; box-shadow: 0 4px 15px rgba(70,130,180,0.3);">
-                    <div style="font-size: 3rem; margin-bottom: 0.5rem;">{fish['emoji']}</div>
-                    <div style="color: white; font-weight: bold; font-size: 1.1rem;">{manu}</div>
-                    <div style="color: #E0F6FF; font-size: 0.9rem; margin: 0.5rem 0;">{fish['type']}</div>
-                    <div style="color: #B0E0E6; font-size: 0.8rem;">{fish['habitat']}</div>
-                    <div style="color: white; font-weight: bold; margin-top: 0.5rem;">
-                        Taille: {production:.1f}M unités
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-
-        # Graphique "bulles" aquarium
-        st.markdown("### 🫧 **BULLES DE PRODUCTION**")
-
-        bubble_data = self.df.groupby('Manufacturer').agg({
-            'Production_Volume': 'sum',
-            'EV_Share': 'mean'
-        }).reset_index()
-
-        fig = px.scatter(bubble_data, x='Manufacturer', y='Production_Volume',
-                        size='Production_Volume', color='EV_Share',
-                        title="🌊 Écosystème de Production (Taille = Volume, Couleur = EV)",
-                        color_continuous_scale='Blues')
-
-        fig.update_layout(
-            plot_bgcolor='rgba(135,206,235,0.1)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            height=400
-        )
-
-        st.plotly_chart(fig, use_container_width=True)
-
-    def render_matrix_mode(self):
-        """Mode Matrix - Dashboard dans la Matrice."""
-        st.markdown('<h1 class="main-header">⚡ Mode Matrix - Réalité Automobile</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # Interface Matrix
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #000000 0%, #003300 100%);
-                    padding: 3rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;
-                    position: relative; overflow: hidden; border: 2px solid #00FF00;">
-            <div style="position: absolute; top: 0; left: 0; right: 0; bottom: 0;
-                        background: repeating-linear-gradient(90deg, transparent, transparent 2px, #00FF0010 2px, #00FF0010 4px);"></div>
-            <div style="position: relative; z-index: 1;">
-                <h1 style="color: #00FF00; margin: 0; font-size: 3rem; font-family: 'Courier New';
-                           text-shadow: 0 0 20px #00FF00; animation: matrixGlow 2s ease-in-out infinite alternate;">
-                    ⚡ MATRIX AUTOMOBILE ⚡
-                </h1>
-                <p style="color: #00CC00; font-size: 1.2rem; margin-top: 1rem; font-family: 'Courier New';">
-                    > BIENVENUE DANS LA RÉALITÉ DES DONNÉES <
-                </p>
-            </div>
-        </div>
-
-        <style>
-        @keyframes matrixGlow {
-            from { text-shadow: 0 0 20px #00FF00; }
-            to { text-shadow: 0 0 40px #00FF00, 0 0 60px #00FF00; }
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-        # Code Matrix des données
-        st.markdown("### 💻 **CODE MATRIX DES DONNÉES**")
-
-        matrix_data = []
-        for _, row in self.df.head(10).iterrows():
-            matrix_line = f"MANU:{row['Manufacturer'][:4].upper()} PROD:{int(row['Production_Volume']/1000)}K EV:{row['EV_Share']:.2f} YEAR:{row['Year']}"
-            matrix_data.append(matrix_line)
-
-        for i, line in enumerate(matrix_data):
-            st.markdown(f"""
-            <div style="background: #000000; color: #00FF00; padding: 0.5rem;
-                        font-family: 'Courier New'; font-size: 0.9rem; margin: 0.2rem 0;
-                        border-left: 3px solid #00FF00; animation: matrixScroll 0.5s ease-in {i*0.1}s both;">
-                > {line}
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Pilules rouge/bleue
-        st.markdown("---")
-        st.markdown("### 💊 **CHOIX DE LA PILULE**")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            if st.button("🔴 PILULE ROUGE - Vérité des Données"):
-                st.markdown("""
-                <div style="background: #CC0000; color: white; padding: 2rem; border-radius: 15px;">
-                    <h4>🔴 VÉRITÉ RÉVÉLÉE</h4>
-                    <p>L'industrie automobile est à un tournant historique. Les véhicules électriques
-                    ne sont pas qu'une mode, mais l'avenir inévitable. Tesla a ouvert la voie,
-                    mais la Chine domine déjà la production. L'Europe et les USA doivent s'adapter ou disparaître.</p>
-                </div>
-                """, unsafe_allow_html=True)
-
-        with col2:
-            if st.button("🔵 PILULE BLEUE - Illusion Confortable"):
-                st.markdown("""
-                <div style="background: #0066CC; color: white; padding: 2rem; border-radius: 15px;">
-                    <h4>🔵 ILLUSION MAINTENUE</h4>
-                    <p>Tout va bien dans l'industrie automobile. Les constructeurs traditionnels
-                    gardent le contrôle. L'essence restera dominante encore longtemps.
-                    Pas besoin de changement radical... Retournez à vos tableaux Excel.</p>
-                </div>
-                """, unsafe_allow_html=True)
-
-    def render_data_circus(self):
-        """Cirque des Données - Spectacle automobile."""
-        st.markdown('<h1 class="main-header">🎪 Cirque des Données - Grand Spectacle Automobile</h1>',
-                   unsafe_allow_html=True)
-
-        if not self.data_loaded:
-            st.error("❌ Aucune donnée chargée")
-            return
-
-        # Interface cirque
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #8B0000 0%, #FF6347 50%, #FFD700 100%);
-                    padding: 3rem; border-radius: 20px; margin-bottom: 2rem; text-align: center;
-                    position: relative; border: 5px solid #FFD700;">
-            <h1 style="color: white; margin: 0; font-size: 3.5rem; font-weight: bold;
-                       text-shadow: 0 4px 8px rgba(0,0,0,0.5); animation: circusBounce 2s ease-in-out infinite;">
-                🎪 GRAND CIRQUE AUTOMOBILE 🎪
-            </h1>
-            <p style="color: #FFFFE0; font-size: 1.3rem; margin-top: 1rem; font-weight: bold;">
-                🎭 MESDAMES ET MESSIEURS, LE SPECTACLE COMMENCE ! 🎭
-            </p>
-        </div>
-
-        <style>
-        @keyframes circusBounce {
-            0%, 100% { transform: scale(1); }
-            50% { transform: scale(1.05); }
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-        # Numéros de cirque
-        st.markdown("### 🎭 **NUMÉROS DU SPECTACLE**")
-
-        circus_acts = [
-            {"act": "🤹 Le Jongleur Tesla", "desc": "Jongle avec les millions de véhicules électriques !"},
-            {"act": "🎪 L'Équilibriste Toyota", "desc": "Maintient l'équilibre entre tradition et innovation !"},
-            {"act": "🦁 Le Dompteur Volkswagen", "desc": "Dresse les marchés européens avec brio !"},
-            {"act": "🎨 L'Artiste BYD", "desc": "Peint l'avenir électrique en couleurs chinoises !"},
-            {"act": "🎯 Le Lanceur de Couteaux Ford", "desc": "Vise juste sur le marché américain !"},
-            {"act": "🎪 Le Clown GM", "desc": "Fait rire avec ses transformations surprenantes !"}
-        ]
-
-        for act in circus_acts:
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #FF6347 0%, #FFD700 100%);
-                        border: 3px solid #8B0000; border-radius: 15px; padding: 1.5rem;
-                        margin: 1rem 0; text-align: center;">
-                <h3 style="color: #8B0000; margin: 0 0 0.5rem 0;">{act['act']}</h3>
-                <p style="color: #000000; margin: 0; font-weight: bold;">{act['desc']}</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Grand final avec feux d'artifice
-        if st.button("🎆 GRAND FINAL - FEUX D'ARTIFICE"):
-            st.balloons()
-            st.markdown("""
-            <div style="background: #000000; color: #FFD700; padding: 3rem; border-radius: 20px;
-                        text-align: center; border: 5px solid #FF6347;">
-                <h2>🎆 GRAND FINAL ! 🎆</h2>
-                <p style="font-size: 1.5rem;">
-                    MERCI D'AVOIR ASSISTÉ AU PLUS GRAND SPECTACLE AUTOMOBILE AU MONDE !
-                </p>
-                <p style="font-size: 1.2rem; margin-top: 2rem;">
-                    🎪 Le cirque des données vous remercie ! 🎪
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-
-
-def main():
-    """Fonction principale de l'application."""
-    app = StreamlitAutomotiveApp()
+        # Données déclarées par la page, puis import de son module
+        app.load_data(page.needs)
+        with render_profiler.span('import_page'):
+            render = load_renderer(page)
 
-    # Navigation
-    selected_page = app.render_sidebar()
+        with render_profiler.span('page'):
+            render(app)
 
-    # Rendu des pages
-    if selected_page == "home":
-        app.render_home()
-    elif selected_page == "executive":
-        app.render_executive_dashboard()
-    elif selected_page == "ml_models":
-        app.render_ml_models()
-    elif selected_page == "geographic":
-        app.render_geographic_analysis()
-    elif selected_page == "ev_transition":
-        app.render_ev_transition()
-    elif selected_page == "manufacturers":
-        app.render_manufacturers()
-    elif selected_page == "economic":
-        app.render_economic_analysis()
-    elif selected_page == "competitive":
-        app.render_competitive_intelligence()
-    elif selected_page == "risks":
-        app.render_risk_analysis()
-    elif selected_page == "post_covid":
-        app.render_post_covid_analysis()
-    elif selected_page == "ev_advanced":
-        app.render_ev_advanced_dashboard()
-    elif selected_page == "strategic_recommendations":
-        app.render_strategic_recommendations_dashboard()
-    elif selected_page == "sector_analysis":
-        app.render_sector_analysis_dashboard()
-    elif selected_page == "future_outlook":
-        app.render_future_outlook_dashboard()
-    else:
-        st.markdown(f"## 🚧 Page {selected_page} en développement")
-        st.info("Cette page sera bientôt disponible!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -14,17 +14,18 @@ Version: 2.0 - Interface Claire et Logique
 """
 
 import streamlit as st
-import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pickle
 import json
 import os
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
+from app_cache import get_filter_index
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
 
 # Configuration de la page Streamlit
 st.set_page_config(
@@ -139,15 +140,15 @@ class ClearAutomotiveApp:
     def __init__(self):
         """Initialise l'application"""
         self.df = None
+        self.index = None
         self.load_data()
         
     def load_data(self):
         """Charge les données"""
         try:
-            self.df = pd.read_csv('data/comprehensive_automotive_data.csv')
-            self.df['Date'] = pd.to_datetime(self.df['Date'])
-            self.df['Year'] = self.df['Date'].dt.year
-            self.df['Month'] = self.df['Date'].dt.month
+            # Dataset et index de filtrage partagés (lecture seule, sans copie)
+            self.index = get_filter_index()
+            self.df = self.index.df if self.index is not None else None
         except Exception as e:
             st.error(f"Erreur lors du chargement des données: {e}")
             return
@@ -168,7 +169,7 @@ class ClearAutomotiveApp:
         st.sidebar.markdown("## 🔧 Filtres d'Analyse")
         
         # Filtre par année
-        years = sorted(self.df['Year'].unique())
+        years = self.index.levels['Year']
         selected_years = st.sidebar.multiselect(
             "📅 Années",
             years,
@@ -176,7 +177,7 @@ class ClearAutomotiveApp:
         )
         
         # Filtre par région
-        regions = sorted(self.df['Region'].unique())
+        regions = self.index.levels['Region']
         selected_regions = st.sidebar.multiselect(
             "🌍 Régions",
             regions,
@@ -184,7 +185,7 @@ class ClearAutomotiveApp:
         )
         
         # Filtre par constructeur
-        manufacturers = sorted(self.df['Manufacturer'].unique())
+        manufacturers = self.index.levels['Manufacturer']
         selected_manufacturers = st.sidebar.multiselect(
             "🏭 Constructeurs",
             manufacturers,
@@ -192,7 +193,7 @@ class ClearAutomotiveApp:
         )
         
         # Filtre par catégorie
-        categories = sorted(self.df['Category'].unique())
+        categories = self.index.levels['Category']
         selected_categories = st.sidebar.multiselect(
             "🚗 Catégories",
             categories,
@@ -202,19 +203,13 @@ class ClearAutomotiveApp:
         return selected_years, selected_regions, selected_manufacturers, selected_categories
     
     def filter_data(self, selected_years, selected_regions, selected_manufacturers, selected_categories):
-        """Filtre les données selon les sélections"""
-        filtered_df = self.df.copy()
-        
-        if selected_years:
-            filtered_df = filtered_df[filtered_df['Year'].isin(selected_years)]
-        if selected_regions:
-            filtered_df = filtered_df[filtered_df['Region'].isin(selected_regions)]
-        if selected_manufacturers:
-            filtered_df = filtered_df[filtered_df['Manufacturer'].isin(selected_manufacturers)]
-        if selected_categories:
-            filtered_df = filtered_df[filtered_df['Category'].isin(selected_categories)]
-        
-        return filtered_df
+        """Filtre les données selon les sélections (index partagé, sans copie du dataset)"""
+        return self.index.frame({
+            'Year': selected_years,
+            'Region': selected_regions,
+            'Manufacturer': selected_manufacturers,
+            'Category': selected_categories
+        })
     
     def render_kpi_cards(self, filtered_df):
         """Affiche les cartes de KPIs principaux"""
@@ -279,7 +274,7 @@ class ClearAutomotiveApp:
         
         with col2:
             # Production par région
-            regional_production = filtered_df.groupby('Region')['Production_Volume'].sum().reset_index()
+            regional_production = filtered_df.groupby('Region', observed=True)['Production_Volume'].sum().reset_index()
             fig = px.bar(
                 regional_production,
                 x='Region',
@@ -292,7 +287,7 @@ class ClearAutomotiveApp:
         
         # Top constructeurs
         st.markdown('<h3 style="color: #2563EB; margin-top: 2rem;">🏭 Top 10 Constructeurs</h3>', unsafe_allow_html=True)
-        manufacturer_production = filtered_df.groupby('Manufacturer')['Production_Volume'].sum().sort_values(ascending=False).head(10).reset_index()
+        manufacturer_production = filtered_df.groupby('Manufacturer', observed=True)['Production_Volume'].sum().sort_values(ascending=False).head(10).reset_index()
         fig = px.bar(
             manufacturer_production,
             x='Manufacturer',
@@ -324,7 +319,7 @@ class ClearAutomotiveApp:
         
         with col2:
             # Prix par catégorie
-            price_by_category = filtered_df.groupby('Category')['Average_Price'].mean().reset_index()
+            price_by_category = filtered_df.groupby('Category', observed=True)['Average_Price'].mean().reset_index()
             fig = px.bar(
                 price_by_category,
                 x='Category',
@@ -337,7 +332,7 @@ class ClearAutomotiveApp:
         
         # Prix par région
         st.markdown('<h3 style="color: #2563EB; margin-top: 2rem;">🌍 Prix par Région</h3>', unsafe_allow_html=True)
-        price_by_region = filtered_df.groupby('Region')['Average_Price'].mean().reset_index()
+        price_by_region = filtered_df.groupby('Region', observed=True)['Average_Price'].mean().reset_index()
         fig = px.bar(
             price_by_region,
             x='Region',
@@ -370,7 +365,7 @@ class ClearAutomotiveApp:
         with col2:
             # Production VE par constructeur
             ev_production = filtered_df[filtered_df['Category'] == 'Electric_Vehicles']
-            ev_by_manufacturer = ev_production.groupby('Manufacturer')['Production_Volume'].sum().sort_values(ascending=False).head(10).reset_index()
+            ev_by_manufacturer = ev_production.groupby('Manufacturer', observed=True)['Production_Volume'].sum().sort_values(ascending=False).head(10).reset_index()
             fig = px.bar(
                 ev_by_manufacturer,
                 x='Manufacturer',
@@ -383,7 +378,7 @@ class ClearAutomotiveApp:
         
         # Répartition VE par région
         st.markdown('<h3 style="color: #2563EB; margin-top: 2rem;">🌍 Répartition VE par Région</h3>', unsafe_allow_html=True)
-        ev_by_region = ev_production.groupby('Region')['Production_Volume'].sum()
+        ev_by_region = ev_production.groupby('Region', observed=True)['Production_Volume'].sum()
         fig = px.pie(
             values=ev_by_region.values,
             names=ev_by_region.index,
@@ -449,7 +444,7 @@ class ClearAutomotiveApp:
         
         # Tableau des données
         st.markdown('<h3 style="color: #2563EB; margin-top: 2rem;">📋 Données Brutes</h3>', unsafe_allow_html=True)
-        st.dataframe(filtered_df, use_container_width=True)
+        st.dataframe(filtered_df.assign(Month=filtered_df['Date'].dt.month), use_container_width=True)
     
     def render_home(self):
         """Affiche la page d'accueil"""
@@ -19,16 +19,16 @@ Version: 1.1 - Application Streamlit Corrigée
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pickle
-import json
-import os
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 import streamlit.components.v1 as components
+from app_cache import get_dataset, get_analysis_results, get_inference_service, get_model_catalog, APP_MODELS
+from lazy_imports import lazy_module
+
+# plotly.express n'est chargé qu'au premier graphique rendu
+px = lazy_module('plotly.express')
 
 # Import Power BI integration
 #from powerbi_integration import PowerBIIntegrator, DASHBOARDS_CONFIG
@@ -297,17 +297,9 @@ class StreamlitAutomotiveApp:
     def load_data(self):
         """Chargement des données et modèles avec gestion d'erreur robuste."""
         try:
-            # Chargement des données
-            data_paths = [
-                'data/comprehensive_automotive_data.csv',
-                'comprehensive_automotive_data.csv'
-            ]
-            
-            for data_path in data_paths:
-                if os.path.exists(data_path):
-                    self.df = pd.read_csv(data_path)
-                    self.data_loaded = True
-                    break
+            # Chargement des données (cache partagé entre sessions et reruns)
+            self.df = get_dataset()
+            self.data_loaded = self.df is not None
             
             # Traitement des données si chargées avec succès
             if self.data_loaded and self.df is not None:
@@ -318,9 +310,8 @@ class StreamlitAutomotiveApp:
             
             # Chargement des résultats d'analyse
             self._load_analysis_results()
-            
-            # Chargement des modèles ML
-            self._load_ml_models()
+            # Les modèles ML sont chargés par la page qui les utilise
+            # (voir render_ml_models): pas d'import de xgboost au démarrage
                         
         except Exception as e:
             st.error(f"Erreur lors du chargement des données: {e}")
@@ -329,11 +320,7 @@ class StreamlitAutomotiveApp:
     def _process_data(self):
         """Traite et nettoie les données chargées."""
         try:
-            # Conversion de la colonne Date en datetime et extraction de l'année
-            if 'Date' in self.df.columns:
-                self.df['Date'] = pd.to_datetime(self.df['Date'], errors='coerce')
-                self.df['Year'] = self.df['Date'].dt.year
-            
+            # Date et Year sont déjà typées par le chargeur colonnaire
             # Renommage des colonnes pour correspondre au format attendu
             column_mapping = {
                 'Production_Volume': 'Production',
@@ -370,38 +357,18 @@ class StreamlitAutomotiveApp:
     def _load_analysis_results(self):
         """Charge les résultats d'analyse."""
         try:
-            result_paths = [
-                'data/automotive_analysis_results_clean.json',
-                'automotive_analysis_results_clean.json'
-            ]
-            
-            for result_path in result_paths:
-                if os.path.exists(result_path):
-                    with open(result_path, 'r') as f:
-                        self.forecasts = json.load(f)
-                    break
+            self.forecasts = get_analysis_results()
         except Exception as e:
             st.warning(f"Impossible de charger les résultats d'analyse: {e}")
     
     def _load_ml_models(self):
-        """Charge les modèles ML avec gestion d'erreur."""
-        model_files = {
-            'xgboost': ['models/xgboost_production_clean.pkl', 'code/xgboost_production_clean.pkl', 'xgboost_production_clean.pkl'],
-            'linear_regression': ['models/linear_regression_production_clean.pkl', 'code/linear_regression_production_clean.pkl', 'linear_regression_production_clean.pkl'],
-            'prophet': ['models/prophet_production_clean.pkl', 'code/prophet_production_clean.pkl', 'prophet_production_clean.pkl'],
-            'arima': ['models/arima_production_clean.pkl', 'code/arima_production_clean.pkl', 'arima_production_clean.pkl']
-        }
-        
-        for model_name, paths in model_files.items():
-            loaded = False
-            for model_path in paths:
-                if os.path.exists(model_path):
-                    with open(model_path, 'rb') as f:
-                        self.models[model_name] = pickle.load(f)
-                    loaded = True
-                    break
-            if not loaded:
-                st.warning(f"Impossible de trouver le modèle {model_name} dans les chemins {paths}")
+        """Catalogue des modèles ML disponibles (manifeste, chargés à la première prédiction)."""
+        if self.models:
+            return
+        self.models = get_model_catalog()
+        for model_name, registry_name in APP_MODELS.items():
+            if model_name not in self.models:
+                st.warning(f"Modèle {model_name} absent du registre des modèles ({registry_name})")
     
     def create_demo_data(self):
         """Crée des données de démonstration en cas d'erreur de chargement."""
@@ -660,6 +627,8 @@ class StreamlitAutomotiveApp:
 
     def render_ml_models(self):
         """Page des modèles ML avec design BID."""
+        self._load_ml_models()
+
         # Header avec logo BID
         st.markdown("""
         <div style="text-align: center; margin-bottom: 2rem;">
@@ -790,42 +759,26 @@ class StreamlitAutomotiveApp:
         """Génère des prédictions avec tous les modèles disponibles."""
         st.markdown('<h3 class="sub-header">📈 Résultats des Prédictions</h3>', unsafe_allow_html=True)
 
-        # Simulation de prédictions (à remplacer par les vrais modèles)
-        base_production = 85000000  # Production de base
-
-        # Facteurs de scénario
-        scenario_factors = {
-            "Status Quo": 1.02,
-            "Politiques Protectionnistes US": 0.95,
-            "Accélération Véhicules Électriques": 1.15,
-            "Crise Matières Premières": 0.88,
-            "Percée Technologique": 1.25
-        }
-
-        factor = scenario_factors.get(scenario, 1.0)
-        years_from_2023 = year - 2023
-
-        # Ajustements basés sur les paramètres
-        steel_factor = 1.0 - (steel_price - 750) / 10000  # Impact prix acier
-        gdp_factor = 1.0 + gdp_growth / 100  # Impact PIB
-        tariff_factor = 1.0 - tariff_rate / 200  # Impact tarifs
-
-        combined_factor = factor * steel_factor * gdp_factor * tariff_factor
-
-        # Prédictions par modèle
+        # Prédictions des modèles chargés via le service d'inférence partagé
+        # (mémorisées par modèle, version, année, scénario, acier, PIB, tarifs)
+        service = get_inference_service()
         predictions = {}
-
-        if 'xgboost' in self.models:
-            predictions['XGBoost'] = base_production * (combined_factor ** years_from_2023) * 1.02
-
-        if 'linear_regression' in self.models:
-            predictions['Régression Linéaire'] = base_production * (combined_factor ** years_from_2023) * 0.98
-
-        if 'prophet' in self.models:
-            predictions['Prophet'] = base_production * (combined_factor ** years_from_2023) * 1.01
-
-        if 'arima' in self.models:
-            predictions['ARIMA'] = base_production * (combined_factor ** years_from_2023) * 0.99
+        if service is not None:
+            predictions = service.predict(
+                year, scenario,
+                steel_price=steel_price,
+                gdp_growth=gdp_growth / 100,
+                tariff_rate=tariff_rate / 100
+            )
+            base_production = service.annual_history.iloc[-1]  # Dernière année observée
+            price_estimate = service.predict_price(
+                year, scenario,
+                steel_price=steel_price,
+                gdp_growth=gdp_growth / 100,
+                tariff_rate=tariff_rate / 100
+            )
+            for model_name, error in service.unavailable().items():
+                st.warning(f"⚠️ {model_name}: modèle indisponible ({error})")
 
         # Affichage des résultats
         if predictions:
@@ -866,9 +819,10 @@ class StreamlitAutomotiveApp:
 
                 st.plotly_chart(fig, use_container_width=True)
 
-            # Prédiction d'ensemble
-            ensemble_prediction = np.mean(list(predictions.values()))
-            confidence = np.random.uniform(85, 95)
+            # Prédiction d'ensemble et accord entre modèles
+            values = np.array(list(predictions.values()))
+            ensemble_prediction = values.mean()
+            confidence = max(0.0, 100 * (1 - values.std() / ensemble_prediction)) if ensemble_prediction else 0.0
 
             st.markdown("#### 🎯 Prédiction d'Ensemble")
             col1, col2, col3 = st.columns(3)
@@ -881,11 +835,13 @@ class StreamlitAutomotiveApp:
                 )
 
             with col2:
-                st.metric("🎯 Confiance", f"{confidence:.1f}%")
+                st.metric("🎯 Accord des Modèles", f"{confidence:.1f}%")
 
             with col3:
-                price_estimate = 25000 + (year - 2023) * 1500
-                st.metric("💰 Prix Estimé", f"${price_estimate:,.0f}")
+                if price_estimate is not None:
+                    st.metric("💰 Prix Moyen Estimé", f"${price_estimate:,.0f}")
+                else:
+                    st.metric("💰 Prix Moyen Estimé", "N/A", help="Modèle de prix indisponible")
 
         else:
             st.warning("⚠️ Aucun modèle disponible pour les prédictions")
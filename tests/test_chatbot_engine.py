@@ -0,0 +1,97 @@
+"""
+Tests du moteur de questions-réponses de l'assistant (`chatbot_engine`),
+sur le cube d'agrégats du dataset du projet.
+"""
+
+import pytest
+
+from aggregate_cube import AggregateCube
+from chatbot_engine import HELP_MESSAGE, ChatbotEngine
+from data_store import load_dataset
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return ChatbotEngine(AggregateCube.from_frame(load_dataset()), version='test')
+
+
+# =============================================================================
+# INTENTIONS
+# =============================================================================
+
+def test_qui_produit_le_plus_is_a_ranking(engine):
+    parsed = engine.parse("Qui produit le plus en Chine ?")
+    assert parsed['intent'] == 'ranking'
+    assert parsed['entities'] == {'Region': ['China']}
+
+    answer = engine.answer("Qui produit le plus en Chine ?")
+    assert answer.startswith("Classement des constructeurs — production, China")
+    assert "1. Toyota : 1.08M véhicules" in answer
+
+
+def test_quel_constructeur_produit_le_plus_is_a_ranking(engine):
+    parsed = engine.parse("Quel constructeur produit le plus ?")
+    assert parsed['intent'] == 'ranking'
+    assert parsed['axis'] == 'Manufacturer'
+    assert engine.answer("Quel constructeur produit le plus ?").startswith("Classement des constructeurs")
+
+
+def test_intent_word_inside_metric_alias_is_ignored(engine):
+    # "croissance" est une intention d'évolution, "croissance du pib" un indicateur
+    parsed = engine.parse("Croissance du PIB en 2022")
+    assert parsed['intent'] == 'value'
+    assert parsed['metric'] == 'GDP_Growth'
+
+
+@pytest.mark.parametrize('query, intent', [
+    ("Production de Toyota en 2022", 'value'),
+    ("Part EV en Europe", 'value'),
+    ("Compare Ford et GM", 'compare'),
+    ("Leader en Chine", 'ranking'),
+    ("Évolution du prix moyen depuis 2015", 'evolution'),
+    ("Part de marché de Stellantis", 'share'),
+])
+def test_help_examples(engine, query, intent):
+    assert engine.parse(query)['intent'] == intent
+    assert engine.answer(query) != HELP_MESSAGE
+
+
+def test_ev_share_metric(engine):
+    parsed = engine.parse("Part EV en Europe")
+    assert parsed['metric'] == 'EV_Share'
+    assert parsed['entities'] == {'Region': ['Europe']}
+
+
+# =============================================================================
+# NOMS INCONNUS
+# =============================================================================
+
+def test_unknown_manufacturer_is_reported(engine):
+    answer = engine.answer("Production de Tesla en 2022")
+    assert answer.startswith("« Tesla » n'est pas reconnu")
+    assert "Toyota" in answer
+    assert engine.parse("Production de Tesla en 2022")['unknown'] == ['Tesla']
+
+
+def test_unknown_name_in_comparison_is_reported(engine):
+    assert engine.answer("Compare Ford et BYD").startswith("« BYD » n'est pas reconnu")
+
+
+def test_known_capitalised_words_are_not_reported(engine):
+    assert engine.parse("Quelle est la part de marché de l'Europe ?")['unknown'] == []
+    assert engine.parse("Donne-moi le prix moyen des Véhicules électriques")['unknown'] == []
+
+
+@pytest.mark.parametrize('query, expected', [
+    ("Peux-tu me donner la production de Toyota en 2022 ?", "Production — Toyota, en 2022"),
+    ("Dis-moi le prix moyen en Europe", "Prix moyen — Europe"),
+])
+def test_sentence_initial_verb_is_not_an_unknown_name(engine, query, expected):
+    assert engine.parse(query)['unknown'] == []
+    assert engine.answer(query).startswith(expected)
+
+
+def test_unknown_names_are_part_of_the_memo_key(engine):
+    # Même question normalisée, casse différente: pas de réponse partagée
+    lower = engine.answer("production de tesla en 2022")
+    assert engine.answer("Production de Tesla en 2022") != lower
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+EXPORT NUMPY DES MODÈLES XGBOOST ET ÉVALUATEUR VECTORISÉ
+=============================================================================
+
+Scorer un XGBRegressor sérialisé impose d'importer xgboost (plus d'une
+seconde) et de construire une DMatrix à chaque appel, coûteux pour les
+requêtes interactives de quelques lignes. Ce module:
+
+1. convertit les arbres d'un booster entraîné en tableaux NumPy plats
+   (caractéristique, seuil, fils gauche/droit, direction des valeurs
+   manquantes, valeur des feuilles), tous arbres concaténés
+2. évalue des lots de lignes à partir de ces tableaux: tous les arbres
+   sont parcourus en parallèle, une profondeur à la fois, sans xgboost
+3. sauvegarde et recharge l'export (.npz) — le registre des modèles
+   (`model_registry`) en conserve un à côté de chaque modèle XGBoost
+
+Seuls les modèles de régression à arbres (gbtree, une sortie, seuils
+numériques) sont exportables. Les comparaisons sont faites en float32
+comme dans XGBoost; les sommes des feuilles sont accumulées en float64
+(écarts relatifs de l'ordre de 1e-7 avec `XGBRegressor.predict`).
+
+Usage:
+    from tree_export import export_booster, TreeEnsemble
+    ensemble = export_booster(xgb_model)
+    ensemble.save('models/xgboost_production-v1.npz')
+    TreeEnsemble.load('models/xgboost_production-v1.npz').predict(X)
+
+Auteur: Système d'Analyse Automobile Avancée
+=============================================================================
+"""
+
+import json
+
+import numpy as np
+
+# Objectifs dont la prédiction est base_score + somme des feuilles
+SUPPORTED_OBJECTIVES = ['reg:squarederror', 'reg:absoluteerror', 'reg:pseudohubererror', 'reg:quantileerror']
+
+# Lignes évaluées par bloc (borne la mémoire des tableaux lignes × arbres)
+DEFAULT_CHUNK_SIZE = 8192
+
+LEAF = -1
+
+
+def is_xgboost_model(model):
+    """Vrai si `model` est un estimateur ou un booster xgboost (sans importer xgboost)."""
+    return type(model).__module__.split('.')[0] == 'xgboost'
+
+
+# =============================================================================
+# ENSEMBLE D'ARBRES À PLAT
+# =============================================================================
+
+class TreeEnsemble:
+    """
+    Arbres de régression concaténés dans des tableaux NumPy.
+
+    Le nœud `i` (indice global) teste `X[:, feature[i]] < threshold[i]`:
+    vrai -> left[i], faux -> right[i], valeur manquante -> gauche si
+    default_left[i]. Pour une feuille, feature[i] == LEAF et value[i] est
+    sa contribution.
+
+    Attributes:
+        feature_names_in_ (np.ndarray): Caractéristiques dans l'ordre attendu
+        roots (np.ndarray): Indice global de la racine de chaque arbre
+        base_score (float): Valeur initiale ajoutée à la somme des feuilles
+        max_depth (int): Profondeur maximale des arbres
+    """
+
+    ARRAYS = ['feature', 'threshold', 'left', 'right', 'default_left', 'value', 'roots']
+
+    def __init__(self, feature, threshold, left, right, default_left, value, roots,
+                 base_score, feature_names):
+        self.feature = np.asarray(feature, dtype=np.int32)
+        self.threshold = np.asarray(threshold, dtype=np.float32)
+        self.left = np.asarray(left, dtype=np.int32)
+        self.right = np.asarray(right, dtype=np.int32)
+        self.default_left = np.asarray(default_left, dtype=bool)
+        self.value = np.asarray(value, dtype=np.float32)
+        self.roots = np.asarray(roots, dtype=np.int32)
+        self.base_score = float(base_score)
+        self.feature_names_in_ = np.asarray(feature_names, dtype=object)
+        self.max_depth = self._depth()
+
+        # Tables de parcours: fils entrelacés (gauche, droite) et
+        # caractéristique valide pour les feuilles
+        self.children = np.stack([self.left, self.right], axis=1).ravel()
+        self.feature_or_zero = np.where(self.feature == LEAF, 0, self.feature).astype(np.int32)
+
+    @property
+    def n_features_in_(self):
+        return len(self.feature_names_in_)
+
+    def __repr__(self):
+        return (f"<TreeEnsemble {len(self.roots)} arbres, {len(self.feature)} nœuds, "
+                f"profondeur {self.max_depth}>")
+
+    def _depth(self):
+        """Profondeur maximale (nombre de tests jusqu'à la feuille la plus basse)."""
+        depth = 0
+        nodes = self.roots
+        while True:
+            nodes = nodes[self.feature[nodes] != LEAF]
+            if not len(nodes):
+                return depth
+            nodes = np.concatenate([self.left[nodes], self.right[nodes]])
+            depth += 1
+
+    def _matrix(self, X):
+        """Matrice float32 des caractéristiques (colonnes réordonnées si DataFrame)."""
+        if hasattr(X, 'columns'):
+            X = X[list(self.feature_names_in_)]
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(f"{X.shape[1]} caractéristiques reçues, {self.n_features_in_} attendues")
+        return X
+
+    def predict(self, X, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Prédictions d'un lot de lignes.
+
+        Args:
+            X (pd.DataFrame | np.ndarray): Lignes à scorer (DataFrame: colonnes
+                par nom, tableau: ordre de feature_names_in_)
+            chunk_size (int): Lignes évaluées par bloc
+
+        Returns:
+            np.ndarray: Prédictions (n_lignes,)
+        """
+        X = self._matrix(X)
+        predictions = np.empty(len(X), dtype=np.float64)
+        for start in range(0, len(X), chunk_size):
+            predictions[start:start + chunk_size] = self._predict_chunk(X[start:start + chunk_size])
+        return predictions
+
+    def _predict_chunk(self, X):
+        n_rows, n_features = X.shape
+        values = X.ravel()
+        has_missing = bool(np.isnan(values).any())
+        # Décalage de chaque ligne dans la matrice aplatie (indices 1D: np.take
+        # est bien plus rapide que l'indexation 2D)
+        row_offset = (np.arange(n_rows, dtype=np.int32) * n_features)[:, None]
+        nodes = np.broadcast_to(self.roots, (n_rows, len(self.roots))).copy()
+
+        # Une profondeur par itération, tous les arbres et toutes les lignes
+        # en même temps; une feuille est son propre fils et n'avance plus
+        for _ in range(self.max_depth):
+            x = np.take(values, row_offset + np.take(self.feature_or_zero, nodes))
+            go_right = ~(x < np.take(self.threshold, nodes))
+            if has_missing:
+                go_right &= ~(np.isnan(x) & np.take(self.default_left, nodes))
+            nodes = np.take(self.children, 2 * nodes + go_right)
+
+        return self.base_score + np.take(self.value, nodes).sum(axis=1, dtype=np.float64)
+
+    # -------------------------------------------------------------------------
+    # PERSISTANCE
+    # -------------------------------------------------------------------------
+
+    def save(self, file):
+        """
+        Écriture de l'export au format .npz compressé.
+
+        Args:
+            file (str | file): Chemin (.npz) ou fichier binaire ouvert
+        """
+        np.savez_compressed(
+            file, base_score=np.float64(self.base_score),
+            feature_names=self.feature_names_in_.astype(str),
+            **{name: getattr(self, name) for name in self.ARRAYS}
+        )
+
+    @classmethod
+    def load(cls, file):
+        """
+        Lecture d'un export .npz (sans xgboost).
+
+        Args:
+            file (str | file): Chemin ou fichier binaire ouvert
+
+        Returns:
+            TreeEnsemble: Ensemble prêt à prédire
+        """
+        with np.load(file, allow_pickle=False) as data:
+            return cls(
+                base_score=float(data['base_score']),
+                feature_names=data['feature_names'].tolist(),
+                **{name: data[name] for name in cls.ARRAYS}
+            )
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+def _parse_base_score(value):
+    """base_score du JSON XGBoost ('1.5E3' ou '[1.5E3]' selon la version)."""
+    values = [float(v) for v in str(value).strip('[]').split(',') if v.strip()]
+    if len(values) != 1:
+        raise ValueError(f"Modèle multi-sorties non supporté (base_score={value})")
+    return values[0]
+
+
+def export_booster(model, feature_names=None):
+    """
+    Conversion d'un modèle XGBoost en TreeEnsemble.
+
+    Args:
+        model: XGBRegressor ou xgboost.Booster entraîné
+        feature_names (list): Noms des caractéristiques (défaut: ceux du modèle)
+
+    Returns:
+        TreeEnsemble: Arbres à plat, prédictions identiques au modèle
+
+    Raises:
+        ValueError: Si le modèle n'est pas exportable (objectif, booster
+            linéaire/dart, sorties multiples, divisions catégorielles)
+    """
+    booster = model.get_booster() if hasattr(model, 'get_booster') else model
+    learner = json.loads(booster.save_raw('json'))['learner']
+
+    objective = learner['objective']['name']
+    if objective not in SUPPORTED_OBJECTIVES:
+        raise ValueError(f"Objectif non supporté: {objective}")
+    if learner['gradient_booster']['name'] != 'gbtree':
+        raise ValueError(f"Booster non supporté: {learner['gradient_booster']['name']}")
+
+    trees = learner['gradient_booster']['model']['trees']
+
+    # Arbres utilisés par predict() (arrêt précoce éventuel)
+    best_iteration = getattr(model, 'best_iteration', None) if hasattr(model, 'get_booster') else None
+    if best_iteration is not None:
+        per_round = len(trees) // max(1, booster.num_boosted_rounds())
+        trees = trees[:(best_iteration + 1) * per_round]
+
+    columns = {name: [] for name in TreeEnsemble.ARRAYS if name != 'roots'}
+    roots = []
+    offset = 0
+
+    for tree in trees:
+        if any(tree['split_type']):
+            raise ValueError("Divisions catégorielles non supportées")
+
+        left = np.asarray(tree['left_children'], dtype=np.int64)
+        right = np.asarray(tree['right_children'], dtype=np.int64)
+        leaf = left == -1
+        conditions = np.asarray(tree['split_conditions'], dtype=np.float32)
+
+        roots.append(offset)
+        columns['feature'].append(np.where(leaf, LEAF, tree['split_indices']))
+        columns['threshold'].append(np.where(leaf, 0, conditions))
+        # Indices globaux; une feuille pointe sur elle-même
+        own = np.arange(len(left)) + offset
+        columns['left'].append(np.where(leaf, own, left + offset))
+        columns['right'].append(np.where(leaf, own, right + offset))
+        columns['default_left'].append(np.asarray(tree['default_left'], dtype=bool))
+        # Pour une feuille, split_conditions contient sa valeur
+        columns['value'].append(np.where(leaf, conditions, 0))
+        offset += len(left)
+
+    if feature_names is None:
+        feature_names = booster.feature_names or [f'f{i}' for i in range(int(learner['learner_model_param']['num_feature']))]
+
+    return TreeEnsemble(
+        roots=roots,
+        base_score=_parse_base_score(learner['learner_model_param']['base_score']),
+        feature_names=feature_names,
+        **{name: np.concatenate(parts) if parts else np.empty(0) for name, parts in columns.items()}
+    )